@@ -9,6 +9,9 @@ from openmdao.core.implicitcomponent import ImplicitComponent
 from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.core.analysis_error import AnalysisError
 
+# Processor Allocators
+from openmdao.proc_allocators.cost_model_allocator import CostModelAllocator
+
 # Components
 from openmdao.components.add_subtract_comp import AddSubtractComp
 from openmdao.components.balance_comp import BalanceComp
@@ -84,6 +87,7 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 
 # Recorders
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.hdf5_recorder import HDF5Recorder
 from openmdao.recorders.case_reader import CaseReader
 
 # Visualizations
@@ -120,6 +120,24 @@ class ApproximationScheme(object):
         """
         raise NotImplementedError()
 
+    def _use_batched_eval(self, system, total):
+        """
+        Return True if all approximation points can be evaluated in a single batched call.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        total : bool
+            If True total derivatives are being approximated, else partials.
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        return False
+
     def _init_colored_approximations(self, system):
         from openmdao.core.group import Group
         from openmdao.core.implicitcomponent import ImplicitComponent
@@ -315,6 +333,23 @@ class ApproximationScheme(object):
         approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
         do_rows_cols = self._j_colored is None
 
+        # if possible, evaluate all points at once and just look up the results below
+        batch_results = None
+        if not is_parallel and self._use_batched_eval(system, total):
+            points = []
+            if colored_approx_groups is not None:
+                points.extend((idx_info, data) for data, _, _, idx_info, _ in
+                              colored_approx_groups)
+            for wrt, data, col_idxs, tmpJ, idx_info, _ in approx_groups:
+                vec = idx_info[0][0]
+                if tmpJ[wrt]['vector'] is not None:
+                    app_data = self.apply_directional(data, tmpJ[wrt]['vector'])
+                else:
+                    app_data = data
+                points.extend((((vec, idxs),), app_data) for idxs in col_idxs)
+            if points:
+                batch_results = self._run_points_batched(system, points, total)
+
         # do colored solves first
         if colored_approx_groups is not None:
             for data, col_idxs, tmpJ, idx_info, nz_rows in colored_approx_groups:
@@ -322,7 +357,10 @@ class ApproximationScheme(object):
 
                 if fd_count % num_par_fd == system._par_fd_id:
                     # run the finite difference
-                    result = self._run_point(system, idx_info, data, results_array, total)
+                    if batch_results is None:
+                        result = self._run_point(system, idx_info, data, results_array, total)
+                    else:
+                        result = batch_results[fd_count]
                     if par_fd_w_serial_model or not is_parallel:
                         rowmap = tmpJ['@row_idx_map'] if '@row_idx_map' in tmpJ else None
                         if rowmap is not None:
@@ -362,8 +400,11 @@ class ApproximationScheme(object):
             for i_count, idxs in enumerate(col_idxs):
                 if fd_count % num_par_fd == system._par_fd_id:
                     # run the finite difference
-                    result = self._run_point(system, ((idx_info[0][0], idxs),),
-                                             app_data, results_array, total)
+                    if batch_results is None:
+                        result = self._run_point(system, ((idx_info[0][0], idxs),),
+                                                 app_data, results_array, total)
+                    else:
+                        result = batch_results[fd_count]
 
                     if is_parallel:
                         for of, (oview, out_idxs, _, _) in J['ofs'].items():
@@ -276,6 +276,86 @@ class FiniteDifference(ApproximationScheme):
 
         return results_array
 
+    def _use_batched_eval(self, system, total):
+        """
+        Return True if all approximation points can be evaluated in a single batched call.
+
+        This requires a component with the 'batched_fd' option set that has no scaling, no
+        discrete variables, and is not running under complex step.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        total : bool
+            If True total derivatives are being approximated, else partials.
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        from openmdao.core.component import Component
+
+        return (not total and isinstance(system, Component) and system.options['batched_fd'] and
+                not system._outputs._under_complex_step and
+                not (system._discrete_inputs or system._discrete_outputs) and
+                not (system._has_input_scaling or system._has_output_scaling or
+                     system._has_resid_scaling))
+
+    def _run_points_batched(self, system, points, total):
+        """
+        Run the system once for all of the given points and return the results.
+
+        All perturbed input and output data arrays are stacked into 2D arrays and passed to the
+        component in a single call.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        points : list of (idx_info, data)
+            Each entry contains the idx_info and approximation data for a single point.
+        total : bool
+            If True total derivatives are being approximated, else partials.
+
+        Returns
+        -------
+        ndarray
+            2D array where each row holds the results for the corresponding point.
+        """
+        inputs = system._inputs
+        outputs = system._outputs
+
+        nsub = sum(len(data[0]) for _, data in points)
+        ins = np.tile(self._starting_ins, (nsub, 1))
+        outs = np.tile(self._starting_outs, (nsub, 1))
+
+        i = 0
+        for idx_info, data in points:
+            for delta in data[0]:
+                for vec, idxs in idx_info:
+                    if vec is inputs:
+                        ins[i, idxs] += delta
+                    elif vec is outputs:
+                        outs[i, idxs] += delta
+                i += 1
+
+        sub_results = system._apply_nonlinear_batched(ins, outs)
+
+        results = np.empty((len(points), sub_results.shape[1]))
+        i = 0
+        for ipt, (_, (deltas, coeffs, current_coeff)) in enumerate(points):
+            if current_coeff:
+                results[ipt] = self._starting_resids * current_coeff
+            else:
+                results[ipt] = 0.
+            for coeff in coeffs:
+                results[ipt] += sub_results[i] * coeff
+                i += 1
+
+        return results
+
     def _run_sub_point(self, system, idx_info, delta, total):
         """
         Alter the specified inputs by the given delta, run the system, and return the results.
@@ -1,11 +1,17 @@
 """Define the ExecComp class, a component that evaluates an expression."""
 import re
+import sys
+import ast
+from bisect import bisect_right
 from itertools import product
+from textwrap import indent
 
 import numpy as np
 from numpy import ndarray, imag, complex as npcomplex
+from scipy.sparse import coo_matrix
 
 from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.utils.coloring import _compute_coloring
 from openmdao.utils.units import valid_units
 
 # regex to check for variable names.
@@ -62,8 +68,22 @@ class ExecComp(ExplicitComponent):
         Initial values of variables.
     _exprs : list
         List of expressions.
-    _codes : list
-        List of code objects.
+    _exec_func : function or None
+        Function that evaluates all of the expressions. Its arguments are the inputs followed by
+        the outputs, and it returns the values of the outputs.
+    _expr_lines : list of int
+        Line number in the source of _exec_func where each expression starts.
+    _in_names : list of str
+        Names of the inputs, in the order they are passed to _exec_func.
+    _out_names : list of str
+        Names of the outputs, in the order they are passed to and returned from _exec_func.
+    _cs_rows : ndarray
+        Output row of each nonzero partial derivative, in the concatenated outputs.
+    _cs_colors : list of tuple
+        For each complex step evaluation, the flat indices to perturb in each input and the
+        nonzero partials that the evaluation computes.
+    _cs_partials : list of tuple
+        Key, slice of the nonzero partials, and shape of each declared sub-jacobian.
     _has_diag_partials : bool
         If True, treat all array/array partials as diagonal if both arrays have size > 1.
         All arrays with size > 1 must have the same flattened size or an exception will be raised.
@@ -216,7 +236,13 @@ class ExecComp(ExplicitComponent):
             exprs = [exprs]
 
         self._exprs = exprs[:]
-        self._codes = None
+        self._exec_func = None
+        self._expr_lines = []
+        self._in_names = []
+        self._out_names = []
+        self._cs_rows = None
+        self._cs_colors = []
+        self._cs_partials = []
         self._kwargs = kwargs
 
     def setup(self):
@@ -313,13 +339,17 @@ class ExecComp(ExplicitComponent):
             else:
                 self.add_input(var, val, **meta)
 
+        self._in_names = sorted(self._var_rel_names['input'])
+        self._out_names = sorted(self._var_rel_names['output'])
+        self._compile_exprs(self._exprs)
+
         if self.options['has_diag_partials']:
             # check that sizes of any input/output vars match or one of them is size 1
-            osorted = sorted(self._var_rel_names['output'])
-            for inp in sorted(self._var_rel_names['input']):
+            structure = {}
+            for inp in self._in_names:
                 ival = init_vals[inp]
                 iarray = isinstance(ival, ndarray) and ival.size > 1
-                for out in osorted:
+                for out in self._out_names:
                     oval = init_vals[out]
                     if iarray and isinstance(oval, ndarray) and oval.size > 1:
                         if oval.size != ival.size:
@@ -327,25 +357,189 @@ class ExecComp(ExplicitComponent):
                                                "is not square (shape=(%d, %d))." %
                                                (self.msginfo, out, inp, oval.size, ival.size))
                         # partial will be declared as diagonal
-                        inds = np.arange(oval.size, dtype=int)
+                        structure[out, inp] = True
                     else:
-                        inds = None
-                    self.declare_partials(of=out, wrt=inp, rows=inds, cols=inds)
+                        structure[out, inp] = False
         else:
-            # All derivatives are defined as dense
-            self.declare_partials(of='*', wrt='*')
+            structure = self._get_partials_structure()
+
+        self._setup_cs_coloring(structure)
+
+    def _get_partials_structure(self):
+        """
+        Find the nonzero partials by following the dependencies through the expressions.
+
+        A partial is diagonal if the output is computed from the input using only arithmetic
+        operators and elementwise functions, and the input has the same shape as the output.
+
+        Returns
+        -------
+        dict
+            True for each diagonal partial and False for each dense partial, keyed by
+            (output, input). Partials that are always zero are not included.
+        """
+        meta = self._var_rel2meta
+        inputs = set(self._in_names)
+
+        # output name -> {input name: True if the partial is diagonal}
+        deps = {}
+
+        for expr in self._exprs:
+            for stmt in ast.parse(expr.strip()).body:
+                loads = [n.id for n in ast.walk(stmt)
+                         if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load) and
+                         n.id in meta]
+
+                if isinstance(stmt, ast.Assign):
+                    target_nodes = stmt.targets
+                elif isinstance(stmt, ast.AugAssign):
+                    target_nodes = [stmt.target]
+                else:
+                    target_nodes = [stmt]
+                targets = [n.id for t in target_nodes for n in ast.walk(t)
+                           if isinstance(n, ast.Name) and n.id in meta and n.id not in inputs]
+
+                whole = isinstance(stmt, ast.Assign) and \
+                    all(isinstance(t, ast.Name) for t in stmt.targets)
+                elementwise = whole and _is_elementwise(stmt.value)
+
+                for out in targets:
+                    shape = meta[out]['shape']
+                    # only part of the output is assigned, so the old dependencies remain
+                    new_deps = {} if whole else dict(deps.get(out, {}))
+                    for name in loads:
+                        if name in inputs:
+                            contrib = {name: elementwise and meta[name]['size'] > 1 and
+                                       meta[name]['shape'] == shape}
+                        else:
+                            same = elementwise and meta[name]['shape'] == shape
+                            contrib = {inp: diag and same
+                                       for inp, diag in deps.get(name, {}).items()}
+                        for inp, diag in contrib.items():
+                            new_deps[inp] = new_deps.get(inp, True) and diag
+                    deps[out] = new_deps
+
+        return {(out, inp): deps[out][inp]
+                for out in self._out_names if out in deps
+                for inp in self._in_names if inp in deps[out]}
+
+    def _setup_cs_coloring(self, structure):
+        """
+        Declare the partials and color their columns for the complex step.
+
+        Columns of the jacobian that don't share a nonzero row are perturbed together, so each
+        color takes a single evaluation of the expressions.
 
-        self._codes = self._compile_exprs(self._exprs)
+        Parameters
+        ----------
+        structure : dict
+            True for each diagonal partial and False for each dense partial, keyed by
+            (output, input).
+        """
+        meta = self._var_rel2meta
+
+        in_offsets = np.cumsum([0] + [meta[n]['size'] for n in self._in_names])
+        out_offsets = np.cumsum([0] + [meta[n]['size'] for n in self._out_names])
+        in_idx = {n: i for i, n in enumerate(self._in_names)}
+        out_idx = {n: i for i, n in enumerate(self._out_names)}
+
+        rows = []
+        cols = []
+        self._cs_partials = []
+        start = 0
+        for (out, inp), diag in structure.items():
+            osize = meta[out]['size']
+            isize = meta[inp]['size']
+            if diag:
+                inds = np.arange(osize, dtype=int)
+                self.declare_partials(of=out, wrt=inp, rows=inds, cols=inds)
+                r = c = inds
+                shape = (osize, )
+            else:
+                self.declare_partials(of=out, wrt=inp)
+                r, c = np.divmod(np.arange(osize * isize, dtype=int), isize)
+                shape = (osize, isize)
+            rows.append(r + out_offsets[out_idx[out]])
+            cols.append(c + in_offsets[in_idx[inp]])
+            self._cs_partials.append(((out, inp), slice(start, start + r.size), shape))
+            start += r.size
+
+        self._cs_colors = []
+        if start == 0:
+            self._cs_rows = np.zeros(0, dtype=int)
+            return
+
+        self._cs_rows = rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        J = coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)),
+                       shape=(out_offsets[-1], in_offsets[-1])).tocsc()
+
+        # indices of the nonzeros in each column
+        order = np.argsort(cols, kind='stable')
+        col_starts = np.searchsorted(cols[order], np.arange(in_offsets[-1] + 1))
+
+        coloring = _compute_coloring(J, 'fwd')
+        for color in coloring.color_iter('fwd'):
+            color = np.array([c for c in color if col_starts[c + 1] > col_starts[c]], dtype=int)
+            if color.size == 0:
+                continue
+            nz = np.concatenate([order[col_starts[c]:col_starts[c + 1]] for c in color])
+            ins = np.searchsorted(in_offsets, color, side='right') - 1
+            perturb = [(i, color[ins == i] - in_offsets[i]) for i in np.unique(ins)]
+            self._cs_colors.append((perturb, nz))
 
     def _compile_exprs(self, exprs):
-        compiled = []
+        """
+        Compile the expressions into a single function of the inputs and outputs.
+
+        Parameters
+        ----------
+        exprs : list of str
+            The expressions.
+        """
+        lines = ['def _exec_comp_func(%s):' % ', '.join(self._in_names + self._out_names)]
+        self._expr_lines = []
         for i, expr in enumerate(exprs):
             try:
-                compiled.append(compile(expr, expr, 'exec'))
+                compile(expr, expr, 'exec')
             except Exception:
                 raise RuntimeError("%s: failed to compile expression '%s'." %
                                    (self.msginfo, exprs[i]))
-        return compiled
+            self._expr_lines.append(len(lines) + 1)
+            lines.append(indent(expr.strip(), '    '))
+        lines.append('    return (%s, )' % ', '.join(self._out_names))
+
+        namespace = {}
+        exec(compile('\n'.join(lines), '<ExecComp>', 'exec'), _expr_dict, namespace)
+        self._exec_func = namespace['_exec_comp_func']
+
+    def _exec(self, args):
+        """
+        Evaluate all of the expressions.
+
+        Parameters
+        ----------
+        args : list
+            Values of the inputs followed by the values of the outputs.
+
+        Returns
+        -------
+        tuple
+            Values of the outputs.
+        """
+        try:
+            return self._exec_func(*args)
+        except Exception as err:
+            # find the expression that failed from the line number in the traceback
+            lineno = self._expr_lines[0]
+            tb = sys.exc_info()[2]
+            while tb is not None:
+                if tb.tb_frame.f_code is self._exec_func.__code__:
+                    lineno = tb.tb_lineno
+                tb = tb.tb_next
+            expr = self._exprs[bisect_right(self._expr_lines, lineno) - 1]
+            raise RuntimeError("%s: Error occurred evaluating '%s'\n%s"
+                               % (self.msginfo, expr, str(err)))
 
     def _parse_for_out_vars(self, s):
         vnames = set([x.strip() for x in re.findall(VAR_RGX, s)
@@ -385,7 +579,7 @@ class ExecComp(ExplicitComponent):
             State to get.
         """
         state = self.__dict__.copy()
-        del state['_codes']
+        del state['_exec_func']
         return state
 
     def __setstate__(self, state):
@@ -398,7 +592,9 @@ class ExecComp(ExplicitComponent):
             State to restore.
         """
         self.__dict__.update(state)
-        self._codes = self._compile_exprs(self._exprs)
+        self._exec_func = None
+        if self._out_names:
+            self._compile_exprs(self._exprs)
 
     def compute(self, inputs, outputs):
         """
@@ -412,12 +608,10 @@ class ExecComp(ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        for i, expr in enumerate(self._codes):
-            try:
-                exec(expr, _expr_dict, _IODict(outputs, inputs))
-            except Exception as err:
-                raise RuntimeError("%s: Error occurred evaluating '%s'\n%s"
-                                   % (self.msginfo, self._exprs[i], str(err)))
+        vals = self._exec([inputs[n] for n in self._in_names] +
+                          [outputs[n] for n in self._out_names])
+        for name, val in zip(self._out_names, vals):
+            outputs[name] = val
 
     def compute_partials(self, inputs, partials):
         """
@@ -432,155 +626,38 @@ class ExecComp(ExplicitComponent):
             Contains sub-jacobians.
         """
         step = self.complex_stepsize * 1j
-        out_names = self._var_allprocs_prom2abs_list['output']
         inv_stepsize = 1.0 / self.complex_stepsize
-        has_diag_partials = self.options['has_diag_partials']
-
-        for param in inputs:
-
-            pwrap = _TmpDict(inputs)
-            pval = inputs[param]
-            psize = pval.size
-            pwrap[param] = np.asarray(pval, npcomplex)
-
-            if has_diag_partials or psize == 1:
-                # set a complex param value
-                pwrap[param] += step
-
-                uwrap = _TmpDict(self._outputs, return_complex=True)
-
-                # solve with complex param value
-                self._residuals.set_const(0.0)
-                self.compute(pwrap, uwrap)
-
-                for u in out_names:
-                    partials[(u, param)] = imag(uwrap[u] * inv_stepsize).flat
-
-                # restore old param value
-                pwrap[param] -= step
-            else:
-                for i, idx in enumerate(array_idx_iter(pwrap[param].shape)):
-                    # set a complex param value
-                    pwrap[param][idx] += step
-
-                    uwrap = _TmpDict(self._outputs, return_complex=True)
-
-                    # solve with complex param value
-                    self._residuals.set_const(0.0)
-                    self.compute(pwrap, uwrap)
+        meta = self._var_rel2meta
 
-                    for u in out_names:
-                        # set the column in the Jacobian entry
-                        partials[(u, param)][:, i] = imag(uwrap[u] * inv_stepsize).flat
+        cinputs = [np.array(inputs[n], dtype=npcomplex) for n in self._in_names]
+        flat_inputs = [val.reshape(-1) for val in cinputs]
+        outputs = [self._outputs[n] for n in self._out_names]
+        out_shapes = [meta[n]['shape'] for n in self._out_names]
 
-                    # restore old param value
-                    pwrap[param][idx] -= step
+        doutputs = np.empty(sum(meta[n]['size'] for n in self._out_names))
+        nzvals = np.empty(self._cs_rows.size)
 
+        for perturb, nz in self._cs_colors:
+            # set complex param values for all columns of this color
+            for i, idx in perturb:
+                flat_inputs[i][idx] += step
 
-class _TmpDict(object):
-    """
-    Dict wrapper that allows modification without changing the wrapped dict.
-
-    It will allow getting of values
-    from its inner dict unless those values get modified via
-    __setitem__.  After values have been modified they are managed
-    thereafter by the wrapper.  This protects the inner dict from
-    modification.
-
-    Attributes
-    ----------
-    _inner : dict-like
-        The dictionary to be wrapped.
-    _changed : dict-like
-        The key names for the values that were changed.
-    _complex : bool
-        If True, return a complex version of values from __getitem__.
-    """
-
-    def __init__(self, inner, return_complex=False):
-        """
-        Construct the dictionary object.
-
-        Parameters
-        ----------
-        inner : dict-like
-            The dictionary to be wrapped.
-        return_complex : bool, optional
-            If True, return a complex version of values from __getitem__
-        """
-        self._inner = inner
-        self._changed = {}
-        self._complex = return_complex
-
-    def __getitem__(self, name):
-        if name in self._changed:
-            return self._changed[name]
-        elif self._complex:
-            val = self._inner[name]
-            if isinstance(val, ndarray):
-                self._changed[name] = np.asarray(val, dtype=npcomplex)
-            else:
-                self._changed[name] = npcomplex(val)
-            return self._changed[name]
-        else:
-            return self._inner[name]
+            vals = self._exec(cinputs + [np.array(val, dtype=npcomplex) for val in outputs])
 
-    def __setitem__(self, name, value):
-        self._changed[name] = value
+            start = 0
+            for val, shape in zip(vals, out_shapes):
+                val = np.broadcast_to(val, shape)
+                doutputs[start:start + val.size] = imag(val).flat
+                start += val.size
+            nzvals[nz] = doutputs[self._cs_rows[nz]]
 
-    def __contains__(self, name):
-        return name in self._inner or name in self._changed
-
-    def __getattr__(self, name):
-        return getattr(self._inner, name)
+            # restore old param values
+            for i, idx in perturb:
+                flat_inputs[i][idx] -= step
 
-
-class _IODict(object):
-    """
-    A dict wrapper that contains 2 different dicts.
-
-    Items are first looked for in the outputs
-    and then the inputs.
-
-    Attributes
-    ----------
-    _inputs : dict-like
-        The inputs object to be wrapped.
-    _outputs : dict-like
-        The outputs object to be wrapped.
-    """
-
-    def __init__(self, outputs, inputs):
-        """
-        Create the dict wrapper.
-
-        Parameters
-        ----------
-        outputs : dict-like
-            The outputs object to be wrapped.
-
-        inputs : dict-like
-            The inputs object to be wrapped.
-        """
-        self._outputs = outputs
-        self._inputs = inputs
-
-    def __getitem__(self, name):
-        if name in self._outputs:
-            return self._outputs[name]
-        else:
-            return self._inputs[name]
-
-    def __setitem__(self, name, value):
-        if name in self._outputs:
-            self._outputs[name] = value
-        elif name in self._inputs:
-            self._inputs[name] = value
-        else:
-            self._outputs[name] = value  # will raise KeyError
-
-    def __contains__(self, name):
-        return name in self._outputs or name in self._inputs
+        nzvals *= inv_stepsize
+        for key, slc, shape in self._cs_partials:
+            partials[key] = nzvals[slc].reshape(shape)
 
 
 def _import_functs(mod, dct, names=None):
@@ -652,6 +729,41 @@ def _cs_abs(x):
 _expr_dict['abs'] = _cs_abs
 
 
+def _is_elementwise(node):
+    """
+    Return True if the expression only uses arithmetic operators and elementwise functions.
+
+    Parameters
+    ----------
+    node : ast.AST
+        Parsed expression.
+
+    Returns
+    -------
+    bool
+        True if each element of the result only depends on the same element of each array.
+    """
+    for n in ast.walk(node):
+        if isinstance(n, (ast.BinOp, ast.UnaryOp)):
+            if not isinstance(n.op, _elementwise_ops):
+                return False
+        elif isinstance(n, ast.Call):
+            if n.keywords or not isinstance(n.func, ast.Name):
+                return False
+            func = _expr_dict.get(n.func.id)
+            # generalized ufuncs like matmul operate on whole sub-arrays
+            if not (isinstance(func, np.ufunc) and func.signature is None or func is _cs_abs):
+                return False
+        elif not isinstance(n, (ast.Name, ast.Num, ast.Constant, ast.expr_context,
+                                ast.operator, ast.unaryop)):
+            return False
+    return True
+
+
+_elementwise_ops = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+                    ast.UAdd, ast.USub)
+
+
 class _NumpyMsg(object):
     """
     A class that will raise an error if an attempt is made to access any attribute/function.
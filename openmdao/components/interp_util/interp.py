@@ -352,7 +352,7 @@ class InterpND(object):
                 result, _, derivs_val, _ = table.evaluate_vectorized(xi)
 
             else:
-                # Scipy implementation vectorized over lookups, but not over multiple table values.
+                # Vectorized over lookups, but not over multiple table values.
                 interp = self._interp
                 n_nodes, _ = values.shape
                 nx = np.prod(xi.shape)
@@ -363,10 +363,18 @@ class InterpND(object):
                 for j in range(n_nodes):
 
                     table = interp(self.grid, values[j, :], interp, **self._interp_options)
-                    table._compute_d_dvalues = False
+                    table._compute_d_dvalues = self._compute_d_dvalues
                     table._compute_d_dx = False
 
-                    result[j, :], _, _, _ = table.evaluate_vectorized(xi.reshape((nx, 1)))
+                    result[j, :], _, d_values, _ = table.evaluate_vectorized(xi.reshape((nx, 1)))
+
+                    # The scipy methods don't provide derivatives with respect to the values.
+                    if d_values is not None:
+                        if derivs_val is None:
+                            dv_shape = [n_nodes, nx]
+                            dv_shape.extend(values.shape[1:])
+                            derivs_val = np.zeros(dv_shape, dtype=values.dtype)
+                        derivs_val[j] = d_values
 
         else:
             interp = self._interp
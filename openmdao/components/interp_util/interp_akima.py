@@ -75,6 +75,37 @@ def dv_abs_smooth_complex(x, x_deriv, delta_x):
     return y, y_deriv
 
 
+def _abs_vectorized(x, delta_x):
+    """
+    Compute the (optionally smoothed) absolute value of an array and its derivative.
+
+    Parameters
+    ----------
+    x : ndarray
+        Input array.
+    delta_x : float
+        Half width of the rounded section, or 0 for no smoothing.
+
+    Returns
+    -------
+    ndarray
+        Absolute value of the array.
+    ndarray
+        Derivative of the absolute value with respect to x.
+    """
+    if delta_x > 0:
+        pos = x.real >= delta_x
+        neg = x.real <= -delta_x
+        y = np.where(pos, x, np.where(neg, -x, 0.5 * (x * x / delta_x + delta_x)))
+        dy = np.where(pos, 1.0, np.where(neg, -1.0, x / delta_x))
+    else:
+        neg = x.real < 0
+        y = np.where(neg, -x, x)
+        dy = np.where(neg, -1.0, 1.0)
+
+    return y, dy
+
+
 class InterpAkima(InterpAlgorithm):
     """
     Interpolate using an Akima polynomial.
@@ -98,6 +129,7 @@ class InterpAkima(InterpAlgorithm):
         super(InterpAkima, self).__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'akima'
+        self._vectorized = True
 
     def initialize(self):
         """
@@ -724,3 +756,167 @@ class InterpAkima(InterpAlgorithm):
 
         # Evaluate dependent value and exit
         return a + dx * (b + dx * (c + dx * d)), deriv_dx, deriv_dv, None
+
+    def stencil_vectorized(self, idx):
+        """
+        Compute the range of grid points used to interpolate in each interval.
+
+        Parameters
+        ----------
+        idx : ndarray of int
+            Interval index for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point used for each point.
+        int
+            Number of grid points used for each point.
+        """
+        ngrid = len(self.grid)
+        size = min(6, ngrid)
+
+        # Extrapolate high
+        idx = np.minimum(idx, ngrid - 2)
+
+        return np.clip(idx - 2, 0, ngrid - size), size
+
+    def interpolate_vectorized(self, x, idx, values):
+        """
+        Compute the interpolated values over this grid dimension for multiple points at once.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+        idx : ndarray of int
+            Interval index for each x.
+        values : ndarray
+            Values at the grid points given by stencil_vectorized for each x. The first axis is
+            the point and the last axis is the grid point in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        grid = self.grid
+        eps = self.options['eps']
+        delta_x = self.options['delta_x']
+        ngrid = len(grid)
+        n_pts = len(x)
+        arange = np.arange(n_pts)
+
+        start, size = self.stencil_vectorized(idx)
+
+        # Check for extrapolation conditions.
+        extrap = np.zeros(n_pts, dtype=int)
+        extrap[idx == ngrid - 1] = 1
+        extrap[np.logical_and(idx == 0, x.real < grid[0])] = -1
+        idx = np.minimum(idx, ngrid - 2)
+        pos = idx - start
+
+        # Slopes of the intervals in the stencil, as weights of the stencil values.
+        steps = np.diff(grid[start[:, np.newaxis] + np.arange(size)], axis=-1)
+        interval = np.arange(size - 1)
+        slope_coeffs = np.zeros((n_pts, size - 1, size))
+        slope_coeffs[:, interval, interval] = -1.0 / steps
+        slope_coeffs[:, interval, interval + 1] = 1.0 / steps
+
+        # Slopes m1 through m5 of the intervals around x, as weights of the stencil values.
+        # m3 is the slope of the interval that contains x.
+        coeffs = np.zeros((n_pts, 5, size))
+        available = [idx >= 2, idx >= 1, None, idx < ngrid - 2, idx < ngrid - 3]
+        for k in range(5):
+            coeffs[:, k, :] = slope_coeffs[arange, np.clip(pos + k - 2, 0, size - 2)]
+            if available[k] is not None:
+                coeffs[np.logical_not(available[k]), k, :] = 0.0
+
+        # The slopes that are off the end of the table are extrapolated.
+        low0 = idx == 0
+        low1 = idx == 1
+        high1 = np.logical_and(idx == ngrid - 3, np.logical_not(np.logical_or(low0, low1)))
+        high0 = np.logical_and(idx == ngrid - 2,
+                               np.logical_not(np.logical_or(np.logical_or(low0, low1), high1)))
+
+        coeffs[low0, 1] = 2.0 * coeffs[low0, 2] - coeffs[low0, 3]
+        coeffs[low0, 0] = 2.0 * coeffs[low0, 1] - coeffs[low0, 2]
+        coeffs[low1, 0] = 2.0 * coeffs[low1, 1] - coeffs[low1, 2]
+        coeffs[high1, 4] = 2.0 * coeffs[high1, 3] - coeffs[high1, 2]
+        coeffs[high0, 3] = 2.0 * coeffs[high0, 2] - coeffs[high0, 1]
+        coeffs[high0, 4] = 2.0 * coeffs[high0, 3] - coeffs[high0, 2]
+
+        slopes = np.einsum('n...j,nij->n...i', values, coeffs)
+        m1 = slopes[..., 0]
+        m2 = slopes[..., 1]
+        m3 = slopes[..., 2]
+        m4 = slopes[..., 3]
+        m5 = slopes[..., 4]
+
+        # Per-point quantities are broadcast against any remaining table dimensions.
+        shape = [n_pts] + [1] * (values.ndim - 2)
+        interior = (extrap == 0).reshape(shape)
+        high = (extrap == 1).reshape(shape)
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        dx = np.where(extrap == 1, x - grid[np.minimum(idx + 1, ngrid - 1)], x - grid[idx])
+        h = h.reshape(shape)
+        dx = dx.reshape(shape)
+
+        # Calculate cubic fit coefficients, and their derivatives with respect to the slopes.
+        w2, dw2 = _abs_vectorized(m4 - m3, delta_x)
+        w31, dw31 = _abs_vectorized(m2 - m1, delta_x)
+        wsum = w2 + w31
+        nonzero = wsum.real > eps
+        wsum = np.where(nonzero, wsum, 1.0)
+
+        b = np.where(nonzero, (m2 * w2 + m3 * w31) / wsum, 0.5 * (m2 + m3))
+        db_dm1 = np.where(nonzero, -(m3 - b) * dw31 / wsum, 0.0)
+        db_dm2 = np.where(nonzero, (w2 + (m3 - b) * dw31) / wsum, 0.5)
+        db_dm3 = np.where(nonzero, (w31 - (m2 - b) * dw2) / wsum, 0.5)
+        db_dm4 = np.where(nonzero, (m2 - b) * dw2 / wsum, 0.0)
+
+        w32, dw32 = _abs_vectorized(m5 - m4, delta_x)
+        w4, dw4 = _abs_vectorized(m3 - m2, delta_x)
+        wsum = w32 + w4
+        nonzero = wsum.real > eps
+        wsum = np.where(nonzero, wsum, 1.0)
+
+        bp1 = np.where(nonzero, (m3 * w32 + m4 * w4) / wsum, 0.5 * (m3 + m4))
+        dbp1_dm2 = np.where(nonzero, -(m4 - bp1) * dw4 / wsum, 0.0)
+        dbp1_dm3 = np.where(nonzero, (w32 + (m4 - bp1) * dw4) / wsum, 0.5)
+        dbp1_dm4 = np.where(nonzero, (w4 - (m3 - bp1) * dw32) / wsum, 0.5)
+        dbp1_dm5 = np.where(nonzero, (m3 - bp1) * dw32 / wsum, 0.0)
+
+        c = np.where(interior, (3 * m3 - 2 * b - bp1) * h, 0.0)
+        d = np.where(interior, (b + bp1 - 2 * m3) * h * h, 0.0)
+        b_used = np.where(high, bp1, b)
+
+        # Off the upper end, the value at the upper end of the interval is used.
+        a_weight = np.zeros((n_pts, size))
+        a_weight[arange, pos + (extrap == 1)] = 1.0
+        a_weight = a_weight.reshape(shape + [size])
+        a = np.sum(values * a_weight, axis=-1)
+
+        result = a + dx * (b_used + dx * (c + dx * d))
+        d_dx = b_used + dx * (2.0 * c + 3.0 * d * dx)
+
+        dx2 = dx * dx
+        dx3 = dx2 * dx
+        dresult_db = np.where(interior, dx - 2.0 * dx2 * h + dx3 * h * h,
+                              np.where(high, 0.0, dx))
+        dresult_dbp1 = np.where(interior, -dx2 * h + dx3 * h * h, np.where(high, dx, 0.0))
+        dresult_dm3 = np.where(interior, 3.0 * dx2 * h - 2.0 * dx3 * h * h, 0.0)
+
+        dresult_dslopes = np.stack([dresult_db * db_dm1,
+                                    dresult_db * db_dm2 + dresult_dbp1 * dbp1_dm2,
+                                    dresult_db * db_dm3 + dresult_dbp1 * dbp1_dm3 + dresult_dm3,
+                                    dresult_db * db_dm4 + dresult_dbp1 * dbp1_dm4,
+                                    dresult_dbp1 * dbp1_dm5], axis=-1)
+
+        d_values = np.einsum('n...i,nij->n...j', dresult_dslopes, coeffs) + a_weight
+
+        return result, d_dx, d_values
@@ -1,6 +1,8 @@
 """
 Base class for interpolation methods.  New methods should inherit from this class.
 """
+import numpy as np
+
 from openmdao.utils.options_dictionary import OptionsDictionary
 
 
@@ -162,6 +164,205 @@ class InterpAlgorithm(object):
 
         return last_index, 0
 
+    def bracket_vectorized(self, x):
+        """
+        Locate the intervals of multiple new independents at once.
+
+        The intervals are the same as the ones found by bracket for points that aren't exactly on
+        an interior grid location.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of new independents to interpolate.
+
+        Returns
+        -------
+        ndarray of int
+            Grid interval index that contains each x. Points above the last table element get the
+            index of the last table element.
+        """
+        grid = self.grid
+        n_p = len(grid)
+        x = x.real
+
+        idx = np.searchsorted(grid, x, side='right') - 1
+        np.clip(idx, 0, n_p - 2, out=idx)
+        idx[x > grid[-1]] = n_p - 1
+
+        return idx
+
+    def stencil_vectorized(self, idx):
+        """
+        Compute the range of grid points used to interpolate in each interval.
+
+        This method must be defined by child classes that use the default evaluate_vectorized.
+
+        Parameters
+        ----------
+        idx : ndarray of int
+            Interval index for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point used for each point.
+        int
+            Number of grid points used for each point.
+        """
+        pass
+
+    def interpolate_vectorized(self, x, idx, values):
+        """
+        Compute the interpolated values over this grid dimension for multiple points at once.
+
+        This method must be defined by child classes that use the default evaluate_vectorized.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+        idx : ndarray of int
+            Interval index for each x.
+        values : ndarray
+            Values at the grid points given by stencil_vectorized for each x. The first axis is
+            the point and the last axis is the grid point in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        pass
+
+    def evaluate_vectorized(self, x):
+        """
+        Interpolate across all table dimensions for all requested samples.
+
+        For each sample, the values at the grid points used by the interpolation are gathered
+        into a block, and then interpolated one dimension at a time, starting with the last.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at. Each row is a sample, and the first
+            column is the coordinate in this table dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        ndarray
+            Derivative of interpolated values with respect to grid.
+        """
+        x = np.atleast_2d(x)
+        n_pts, nx = x.shape
+
+        tables = []
+        table = self
+        while table is not None:
+            tables.append(table)
+            table = table.subtable
+
+        brackets = []
+        inds = []
+        for i, table in enumerate(tables):
+            idx = table.bracket_vectorized(x[:, i])
+            start, size = table.stencil_vectorized(idx)
+
+            shape = [n_pts] + [1] * nx
+            shape[i + 1] = size
+            inds.append((start[:, np.newaxis] + np.arange(size)).reshape(shape))
+            brackets.append(idx)
+
+        result = self.values[tuple(inds)]
+
+        d_dx = [None] * nx
+        d_dsub = [None] * nx
+        for i in range(nx - 1, -1, -1):
+            result, dresult_dx, dresult_dsub = \
+                tables[i].interpolate_vectorized(x[:, i], brackets[i], result)
+
+            # Chain rule for the dimensions that were already interpolated.
+            for j in range(i + 1, nx):
+                d_dx[j] = np.sum(dresult_dsub * d_dx[j], axis=-1)
+
+            d_dx[i] = dresult_dx
+            d_dsub[i] = dresult_dsub
+
+        d_values = None
+        if self._compute_d_dvalues:
+            d_block = d_dsub[0]
+            for i in range(1, nx):
+                d_block = d_block[..., np.newaxis] * d_dsub[i]
+
+            d_values = np.zeros((n_pts, ) + self.values.shape, dtype=d_block.dtype)
+            d_values[(np.arange(n_pts).reshape([n_pts] + [1] * nx), ) + tuple(inds)] = d_block
+
+        return result, np.stack(d_dx, axis=-1), d_values, None
+
+    def training_gradients(self, pt):
+        """
+        Compute the training gradient for the vector of training points.
+
+        Parameters
+        ----------
+        pt : ndarray
+            Training point values.
+
+        Returns
+        -------
+        ndarray
+            Gradient of output with respect to training point values.
+        """
+        compute_d_dvalues = self._compute_d_dvalues
+        self._compute_d_dvalues = True
+        try:
+            _, _, d_values, _ = self.evaluate_vectorized(np.atleast_2d(pt))
+        finally:
+            self._compute_d_dvalues = compute_d_dvalues
+
+        return d_values[0]
+
+    def _apply_weights(self, values, weights, d_weights):
+        """
+        Interpolate using weights that don't depend on the values.
+
+        Parameters
+        ----------
+        values : ndarray
+            Values at the grid points used for each point. The first axis is the point and the
+            last axis is the grid point in this dimension.
+        weights : ndarray
+            Weight of each grid point value for each point.
+        d_weights : ndarray
+            Derivative of the weights with respect to x.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        shape = [1] * values.ndim
+        shape[0], shape[-1] = weights.shape
+        weights = weights.reshape(shape)
+        d_weights = d_weights.reshape(shape)
+
+        return np.sum(values * weights, axis=-1), np.sum(values * d_weights, axis=-1), \
+            np.broadcast_to(weights, values.shape)
+
     def evaluate(self, x, slice_idx=None):
         """
         Interpolate across this and subsequent table dimensions.
@@ -20,6 +20,9 @@ class InterpCubic(InterpAlgorithm):
     ----------
     second_derivs : ndarray
         Cache of all second derivatives for the leaf table only.
+    _second_derivs_mtx : ndarray or None
+        Cache of the matrix that maps the values along this dimension to their second
+        derivatives.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
@@ -39,8 +42,10 @@ class InterpCubic(InterpAlgorithm):
         """
         super(InterpCubic, self).__init__(grid, values, interp)
         self.second_derivs = None
+        self._second_derivs_mtx = None
         self.k = 4
         self._name = 'cubic'
+        self._vectorized = True
 
     def compute_coeffs(self, grid, values, x):
         """
@@ -199,3 +204,137 @@ class InterpCubic(InterpAlgorithm):
              (3.0 * a * a - 1) * sec_deriv[..., idx]) * (step * fact)
 
         return val, deriv, None, None
+
+    def spline_weights(self, x):
+        """
+        Compute the weight of each value along this dimension in the spline at multiple points.
+
+        The natural spline is linear in the values, so its value at each point is the weighted
+        sum of all values along this dimension.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Weight of each value for each point.
+        ndarray
+            Derivative of the weights with respect to x.
+        """
+        grid = self.grid
+        ngrid = len(grid)
+
+        if self._second_derivs_mtx is None:
+            self._second_derivs_mtx = self.compute_coeffs(grid, np.eye(ngrid), grid)
+        sec_mtx = self._second_derivs_mtx
+
+        # Extrapolate high
+        idx = np.minimum(self.bracket_vectorized(x), ngrid - 2)
+
+        step = grid[idx + 1] - grid[idx]
+        r_step = 1.0 / step
+        a = (grid[idx + 1] - x) * r_step
+        b = (x - grid[idx]) * r_step
+        fact = 1.0 / 6.0
+
+        # Second derivatives at both ends of each interval, as weights of the values.
+        sec_low = sec_mtx[:, idx].T
+        sec_high = sec_mtx[:, idx + 1].T
+
+        coef = (step * step * fact)[:, np.newaxis]
+        weights = ((a * a * a - a)[:, np.newaxis] * sec_low +
+                   (b * b * b - b)[:, np.newaxis] * sec_high) * coef
+
+        coef = (step * fact)[:, np.newaxis]
+        d_weights = ((3.0 * b * b - 1)[:, np.newaxis] * sec_high -
+                     (3.0 * a * a - 1)[:, np.newaxis] * sec_low) * coef
+
+        arange = np.arange(len(x))
+        weights[arange, idx] += a
+        weights[arange, idx + 1] += b
+        d_weights[arange, idx] -= r_step
+        d_weights[arange, idx + 1] += r_step
+
+        return weights, d_weights
+
+    def evaluate_vectorized(self, x):
+        """
+        Interpolate across all table dimensions for all requested samples.
+
+        Every value in the table contributes to the spline at each point, so the table is
+        contracted with the spline weights one dimension at a time.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at. Each row is a sample, and the first
+            column is the coordinate in this table dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        ndarray
+            Derivative of interpolated values with respect to grid.
+        """
+        x = np.atleast_2d(x)
+        n_pts, nx = x.shape
+        values = self.values
+
+        weights = []
+        d_weights = []
+        table = self
+        for i in range(nx):
+            w, dw = table.spline_weights(x[:, i])
+            weights.append(w)
+            d_weights.append(dw)
+            table = table.subtable
+
+        last = np.tensordot(weights[-1], values, axes=([1], [nx - 1]))
+        result = _contract(last, weights[:-1])
+
+        d_dx = np.empty((n_pts, nx), dtype=result.dtype)
+        d_dx[:, -1] = _contract(np.tensordot(d_weights[-1], values, axes=([1], [nx - 1])),
+                                weights[:-1])
+        for i in range(nx - 1):
+            dim_weights = weights[:-1]
+            dim_weights[i] = d_weights[i]
+            d_dx[:, i] = _contract(last, dim_weights)
+
+        d_values = None
+        if self._compute_d_dvalues:
+            d_values = weights[0]
+            for i in range(1, nx):
+                shape = [n_pts] + [1] * i + [weights[i].shape[1]]
+                d_values = d_values[..., np.newaxis] * weights[i].reshape(shape)
+
+        return result, d_dx, d_values, None
+
+
+def _contract(tensor, weights):
+    """
+    Contract a tensor with the weights of each point, starting with the last dimension.
+
+    Parameters
+    ----------
+    tensor : ndarray
+        Tensor whose first axis is the point and whose remaining axes are table dimensions.
+    weights : list of ndarray
+        Weights of each point for each of the table dimensions in tensor.
+
+    Returns
+    -------
+    ndarray
+        Contracted value for each point.
+    """
+    for w in reversed(weights):
+        tensor = np.einsum('n...k,nk->n...', tensor, w)
+
+    return tensor
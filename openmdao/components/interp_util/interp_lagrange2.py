@@ -31,6 +31,7 @@ class InterpLagrange2(InterpAlgorithm):
         super(InterpLagrange2, self).__init__(grid, values, interp, **kwargs)
         self.k = 3
         self._name = 'lagrange2'
+        self._vectorized = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -127,3 +128,70 @@ class InterpLagrange2(InterpAlgorithm):
             q3 * (2.0 * x[0] - grid[idx] - grid[idx + 1])
 
         return xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2, derivs, None, None
+
+    def stencil_vectorized(self, idx):
+        """
+        Compute the range of grid points used to interpolate in each interval.
+
+        Parameters
+        ----------
+        idx : ndarray of int
+            Interval index for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point used for each point.
+        int
+            Number of grid points used for each point.
+        """
+        # Extrapolate high
+        return np.minimum(idx, len(self.grid) - 3), 3
+
+    def interpolate_vectorized(self, x, idx, values):
+        """
+        Compute the interpolated values over this grid dimension for multiple points at once.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+        idx : ndarray of int
+            Interval index for each x.
+        values : ndarray
+            Values at the grid points given by stencil_vectorized for each x. The first axis is
+            the point and the last axis is the grid point in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        grid = self.grid
+        idx, _ = self.stencil_vectorized(idx)
+
+        p1 = grid[idx]
+        p2 = grid[idx + 1]
+        p3 = grid[idx + 2]
+
+        xx1 = x - p1
+        xx2 = x - p2
+        xx3 = x - p3
+
+        c12 = p1 - p2
+        c13 = p1 - p3
+        c23 = p2 - p3
+
+        # Lagrange basis polynomials and their derivatives.
+        weights = np.stack([xx2 * xx3 / (c12 * c13),
+                            -xx1 * xx3 / (c12 * c23),
+                            xx1 * xx2 / (c13 * c23)], axis=-1)
+        d_weights = np.stack([(xx2 + xx3) / (c12 * c13),
+                              -(xx1 + xx3) / (c12 * c23),
+                              (xx1 + xx2) / (c13 * c23)], axis=-1)
+
+        return self._apply_weights(values, weights, d_weights)
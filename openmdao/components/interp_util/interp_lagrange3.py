@@ -31,6 +31,7 @@ class InterpLagrange3(InterpAlgorithm):
         super(InterpLagrange3, self).__init__(grid, values, interp, **kwargs)
         self.k = 4
         self._name = 'lagrange3'
+        self._vectorized = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -152,3 +153,82 @@ class InterpLagrange3(InterpAlgorithm):
 
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, None, None
+
+    def stencil_vectorized(self, idx):
+        """
+        Compute the range of grid points used to interpolate in each interval.
+
+        Parameters
+        ----------
+        idx : ndarray of int
+            Interval index for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point used for each point.
+        int
+            Number of grid points used for each point.
+        """
+        # Extrapolate high and low
+        return np.clip(idx, 1, len(self.grid) - 3) - 1, 4
+
+    def interpolate_vectorized(self, x, idx, values):
+        """
+        Compute the interpolated values over this grid dimension for multiple points at once.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+        idx : ndarray of int
+            Interval index for each x.
+        values : ndarray
+            Values at the grid points given by stencil_vectorized for each x. The first axis is
+            the point and the last axis is the grid point in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        grid = self.grid
+        idx, _ = self.stencil_vectorized(idx)
+
+        p1 = grid[idx]
+        p2 = grid[idx + 1]
+        p3 = grid[idx + 2]
+        p4 = grid[idx + 3]
+
+        xx1 = x - p1
+        xx2 = x - p2
+        xx3 = x - p3
+        xx4 = x - p4
+
+        c12 = p1 - p2
+        c13 = p1 - p3
+        c14 = p1 - p4
+        c23 = p2 - p3
+        c24 = p2 - p4
+        c34 = p3 - p4
+
+        d1 = 1.0 / (c12 * c13 * c14)
+        d2 = -1.0 / (c12 * c23 * c24)
+        d3 = 1.0 / (c13 * c23 * c34)
+        d4 = -1.0 / (c14 * c24 * c34)
+
+        # Lagrange basis polynomials and their derivatives.
+        weights = np.stack([xx2 * xx3 * xx4 * d1,
+                            xx1 * xx3 * xx4 * d2,
+                            xx1 * xx2 * xx4 * d3,
+                            xx1 * xx2 * xx3 * d4], axis=-1)
+        d_weights = np.stack([(xx3 * xx4 + xx2 * xx4 + xx2 * xx3) * d1,
+                              (xx3 * xx4 + xx1 * xx4 + xx1 * xx3) * d2,
+                              (xx2 * xx4 + xx1 * xx4 + xx1 * xx2) * d3,
+                              (xx2 * xx3 + xx1 * xx3 + xx1 * xx2) * d4], axis=-1)
+
+        return self._apply_weights(values, weights, d_weights)
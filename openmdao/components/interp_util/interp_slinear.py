@@ -31,6 +31,7 @@ class InterpLinear(InterpAlgorithm):
         super(InterpLinear, self).__init__(grid, values, interp, **kwargs)
         self.k = 2
         self._name = 'slinear'
+        self._vectorized = True
 
     def interpolate(self, x, idx, slice_idx):
         """
@@ -96,3 +97,57 @@ class InterpLinear(InterpAlgorithm):
 
             return values[..., idx] + (x - grid[idx]) * slope, np.expand_dims(slope, axis=-1), \
                 None, None
+
+    def stencil_vectorized(self, idx):
+        """
+        Compute the range of grid points used to interpolate in each interval.
+
+        Parameters
+        ----------
+        idx : ndarray of int
+            Interval index for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point used for each point.
+        int
+            Number of grid points used for each point.
+        """
+        return np.minimum(idx, len(self.grid) - 2), 2
+
+    def interpolate_vectorized(self, x, idx, values):
+        """
+        Compute the interpolated values over this grid dimension for multiple points at once.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at in this dimension.
+        idx : ndarray of int
+            Interval index for each x.
+        values : ndarray
+            Values at the grid points given by stencil_vectorized for each x. The first axis is
+            the point and the last axis is the grid point in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        ndarray
+            Derivative of interpolated values with respect to values.
+        """
+        grid = self.grid
+
+        # Extrapolate high
+        idx = np.minimum(idx, len(grid) - 2)
+
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        frac = (x - grid[idx]) * h
+
+        weights = np.stack([1.0 - frac, frac], axis=-1)
+        d_weights = np.stack([-h, h], axis=-1)
+
+        return self._apply_weights(values, weights, d_weights)
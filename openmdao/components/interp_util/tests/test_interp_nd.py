@@ -459,6 +459,53 @@ class TestInterpNDPython(unittest.TestCase):
 
         assert_near_equal(deriv, dy_dycp, tolerance=1e-6)
 
+    def test_vectorized_matches_scalar(self):
+        points, values = self._get_sample_4d_large()
+        points = points[:3]
+        values = values[:, :, :, 0]
+
+        np.random.seed(314)
+        x = np.random.uniform(-12, 12, (40, 3))
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            interp = InterpND(method=method, points=points, values=values, extrapolate=True)
+            self.assertTrue(interp.table._vectorized)
+            y, dy_dx = interp.interpolate(x, compute_derivative=True)
+
+            # Fall back to the scalar evaluation of one point at a time.
+            interp.table._vectorized = False
+            y_scalar, dy_dx_scalar = interp.interpolate(x, compute_derivative=True)
+
+            assert_near_equal(y, y_scalar, tolerance=1e-10)
+            assert_near_equal(dy_dx, dy_dx_scalar, tolerance=1e-10)
+
+    def test_vectorized_training_derivs(self):
+        points, values = self._get_sample_4d_large()
+        points = points[:2]
+        values = values[:, :, 0, 0]
+
+        np.random.seed(314)
+        x = np.random.uniform(-10, 10, (5, 2))
+        delta = 1e-6
+
+        for method in ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima']:
+            interp = InterpND(method=method, points=points, values=values)
+            interp._compute_d_dvalues = True
+            interp.interpolate(x)
+            d_dvalues = interp._d_dvalues
+
+            fd = np.zeros(d_dvalues.shape)
+            for idx in np.ndindex(*values.shape):
+                pvalues = values.copy()
+                pvalues[idx] += delta
+                mvalues = values.copy()
+                mvalues[idx] -= delta
+                yp = InterpND(method=method, points=points, values=pvalues).interpolate(x)
+                ym = InterpND(method=method, points=points, values=mvalues).interpolate(x)
+                fd[(slice(None), ) + idx] = (yp - ym) / (2.0 * delta)
+
+            assert_near_equal(d_dvalues, fd, tolerance=1e-5)
+
     def test_scipy_auto_reduce_spline_order(self):
         # if a spline method is used and spline_dim_error=False and a dimension
         # does not have enough points, the spline order for that dimension
@@ -344,6 +344,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         for name, shape in self._surrogate_output_names:
             surrogate = self._metadata(name).get('surrogate')
 
+            if isinstance(shape, tuple):
+                output_shape = (vec_size, ) + shape
+            else:
+                output_shape = (vec_size, )
+
             if vec_size == 1:
                 # Non vectorized.
                 predicted = surrogate.predict(flat_inputs)
@@ -354,19 +359,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, output_shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
-                if isinstance(shape, tuple):
-                    output_shape = (vec_size, ) + shape
-                else:
-                    output_shape = (vec_size, )
                 predicted = np.zeros(output_shape)
                 rmse = self._metadata(name)['rmse'] = []
                 for i in range(vec_size):
@@ -426,15 +426,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         arr = np.zeros((vec_size, self._input_size))
 
-        for row in range(vec_size):
-            idx = 0
-            for name, sz in self._surrogate_input_names:
-                val = vec[name]
-                if array_real and np.issubdtype(val.dtype, np.complexfloating):
-                    array_real = False
-                    arr = arr.astype(np.complexfloating)
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            val = vec[name]
+            if array_real and np.issubdtype(val.dtype, np.complexfloating):
+                array_real = False
+                arr = arr.astype(np.complexfloating)
+            arr[:, idx:idx + sz] = val.reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -508,7 +507,16 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                # Surrogate provides the jacobians at all points at once.
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+
+            elif vec_size > 1:
                 out_size = np.prod(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
@@ -558,46 +566,131 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                   str(missing_training_data)
             raise RuntimeError(msg)
 
+        self._training_input = self._assemble_training_inputs(num_sample)
+
+        # Assemble output data and train each output.
+        for name, shape in self._surrogate_output_names:
+            self._training_output[name] = outputs = self._assemble_training_data(name, shape)
+
+            surrogate = self._metadata(name).get('surrogate')
+            if surrogate is None:
+                raise RuntimeError("%s: No surrogate specified for output '%s'"
+                                   % (self.msginfo, name))
+            else:
+                surrogate.train(self._training_input, outputs)
+
+        self.train = False
+
+    def _assemble_training_data(self, name, shape, val=None):
+        """
+        Convert the training data for one variable to a 2d array with one row per point.
+
+        Parameters
+        ----------
+        name : str
+            Name of the surrogate input or output.
+        shape : int or tuple
+            Size of an input, or shape of an output, at a single point.
+        val : array-like or None
+            Training data. If None, the 'train:' option for the variable is used.
+
+        Returns
+        -------
+        ndarray
+            Training data with one row per point.
+        """
+        if val is None:
+            val = self.options['train:' + name]
+
+        return np.asarray(val, dtype=float).reshape((len(val), np.prod(shape)))
+
+    def _assemble_training_inputs(self, num_sample, data=None):
+        """
+        Assemble the training data for all inputs into a 2d array with one row per point.
+
+        Parameters
+        ----------
+        num_sample : int
+            Number of training points.
+        data : dict or None
+            Training data keyed by input name. If None, the 'train:' options are used.
+
+        Returns
+        -------
+        ndarray
+            Training inputs with one row per point.
+        """
         inputs = np.zeros((num_sample, self._input_size))
-        self._training_input = inputs
 
-        # Assemble input data.
         idx = 0
         for name, sz in self._surrogate_input_names:
-            val = self.options['train:' + name]
-            if isinstance(val[0], float):
-                inputs[:, idx] = val
-                idx += 1
-            else:
-                for row_idx, v in enumerate(val):
-                    v = np.asarray(v)
-                    inputs[row_idx, idx:idx + sz] = v.flat
+            val = None if data is None else data[name]
+            inputs[:, idx:idx + sz] = self._assemble_training_data(name, sz, val)
+            idx += sz
 
-        # Assemble output data and train each output.
-        for name, shape in self._surrogate_output_names:
-            output_size = np.prod(shape)
+        return inputs
 
-            outputs = np.zeros((num_sample, output_size))
-            self._training_output[name] = outputs
+    def append_training_data(self, training_data):
+        """
+        Add new training points to the metamodel.
 
-            val = self.options['train:' + name]
+        The new points are appended to the 'train:' options. If the metamodel has already been
+        trained, surrogates that support incremental updates are updated with only the new
+        points, and the other surrogates are retrained with all of the points. Otherwise, all of
+        the points are used when the metamodel is trained on its next execution.
+
+        Parameters
+        ----------
+        training_data : dict
+            New training data keyed by variable name, with an entry for every surrogate input
+            and output. Each entry must contain the same number of points.
+        """
+        missing_training_data = []
+        num_new = None
+        for name, _ in chain(self._surrogate_input_names, self._surrogate_output_names):
+            if name not in training_data:
+                missing_training_data.append(name)
+                continue
 
-            if isinstance(val[0], float):
-                outputs[:, 0] = val
+            if num_new is None:
+                num_new = len(training_data[name])
+            elif len(training_data[name]) != num_new:
+                msg = "{}: Each variable must have the same number"\
+                      " of new training points. Expected {} but found {} "\
+                      "points for '{}'."\
+                      .format(self.msginfo, num_new, len(training_data[name]), name)
+                raise RuntimeError(msg)
+
+        if len(missing_training_data) > 0:
+            msg = "%s: New training data must be provided for the following " \
+                  "variables: " % self.msginfo + str(missing_training_data)
+            raise RuntimeError(msg)
+
+        for name, _ in chain(self._surrogate_input_names, self._surrogate_output_names):
+            train_name = 'train:' + name
+            old_val = self.options[train_name]
+            new_val = np.asarray(training_data[name])
+            if old_val is None:
+                self.options[train_name] = new_val
             else:
-                for row_idx, v in enumerate(val):
-                    v = np.asarray(v)
-                    outputs[row_idx, :] = v.flat
+                self.options[train_name] = np.concatenate((np.asarray(old_val), new_val))
+
+        if self.train:
+            # Not trained yet, so all of the points will be used for training.
+            return
+
+        new_inputs = self._assemble_training_inputs(num_new, training_data)
+        self._training_input = np.vstack((self._training_input, new_inputs))
+
+        for name, shape in self._surrogate_output_names:
+            new_outputs = self._assemble_training_data(name, shape, training_data[name])
+            self._training_output[name] = np.vstack((self._training_output[name], new_outputs))
 
             surrogate = self._metadata(name).get('surrogate')
-            if surrogate is None:
-                raise RuntimeError("%s: No surrogate specified for output '%s'"
-                                   % (self.msginfo, name))
+            if overrides_method('update', surrogate, SurrogateModel):
+                surrogate.update(new_inputs, new_outputs)
             else:
-                surrogate.train(self._training_input,
-                                self._training_output[name])
-
-        self.train = False
+                surrogate.train(self._training_input, self._training_output[name])
 
     def _metadata(self, name):
         return self._var_rel2meta[name]
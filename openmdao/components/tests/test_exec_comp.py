@@ -777,22 +777,20 @@ class TestExecComp(unittest.TestCase):
         # any positive C1.x should give a 2.0 derivative for dy/dx
         C1._inputs['x'] = np.ones(3)*1.0e-10
         C1._linearize()
-        assert_near_equal(C1._jacobian['y', 'x'], np.eye(3)*2.0, 0.00001)
+        assert_near_equal(C1._jacobian['y', 'x'], np.ones(3)*2.0, 0.00001)
 
         C1._inputs['x'] = np.ones(3)*-3.0
         C1._linearize()
-        assert_near_equal(C1._jacobian['y', 'x'], np.eye(3)*-2.0, 0.00001)
+        assert_near_equal(C1._jacobian['y', 'x'], np.ones(3)*-2.0, 0.00001)
 
         C1._inputs['x'] = np.zeros(3)
         C1._linearize()
-        assert_near_equal(C1._jacobian['y', 'x'], np.eye(3)*2.0, 0.00001)
+        assert_near_equal(C1._jacobian['y', 'x'], np.ones(3)*2.0, 0.00001)
 
         C1._inputs['x'] = np.array([1.5, -0.6, 2.4])
         C1._linearize()
-        expect = np.zeros((3, 3))
-        expect[0, 0] = 2.0
-        expect[1, 1] = -2.0
-        expect[2, 2] = 2.0
+        # the partial is declared as diagonal, so only the diagonal is stored
+        expect = np.array([2.0, -2.0, 2.0])
 
         assert_near_equal(C1._jacobian['y', 'x'], expect, 0.00001)
 
@@ -827,6 +825,55 @@ class TestExecComp(unittest.TestCase):
 
         assert_almost_equal(J, np.eye(5)*3., decimal=6)
 
+    def test_sparse_partials(self):
+        p = om.Problem()
+        comp = p.model.add_subsystem('comp', om.ExecComp(['y = 3.0*x**2 + sin(z)*x',
+                                                          'w = y*2 + s',
+                                                          'q = sum(x)',
+                                                          'v = 2.0*z'],
+                                                         x=np.ones(5), z=np.ones(5), y=np.ones(5),
+                                                         w=np.ones(5), v=np.ones(5), s=2.0))
+        p.setup(force_alloc_complex=True)
+        p['comp.x'] = np.random.random(5)
+        p['comp.z'] = np.random.random(5)
+        p.run_model()
+
+        # elementwise partials are diagonal, and partials that are always zero aren't declared
+        diag = np.arange(5)
+        for of, wrt in [('y', 'x'), ('y', 'z'), ('w', 'x'), ('w', 'z'), ('v', 'z')]:
+            meta = comp._subjacs_info['comp.' + of, 'comp.' + wrt]
+            assert_near_equal(meta['rows'], diag)
+            assert_near_equal(meta['cols'], diag)
+        for of, wrt in [('w', 's'), ('q', 'x')]:
+            self.assertIsNone(comp._subjacs_info['comp.' + of, 'comp.' + wrt]['rows'])
+        for of, wrt in [('y', 's'), ('q', 'z'), ('v', 'x'), ('v', 's')]:
+            self.assertNotIn(('comp.' + of, 'comp.' + wrt), comp._subjacs_info)
+
+        data = p.check_partials(out_stream=None, method='cs')
+        assert_check_partials(data, atol=1e-8, rtol=1e-8)
+
+    def test_sparse_partials_coloring(self):
+        p = om.Problem()
+        comp = p.model.add_subsystem('comp', om.ExecComp(['y1 = x1*exp(x2)', 'y2 = abs(x3) - z',
+                                                          'y3 = y2[0]*x4'],
+                                                         x1=np.ones(10), x2=np.ones(10),
+                                                         x3=np.ones(3), y1=np.ones(10),
+                                                         y2=np.ones(3), y3=np.ones(4),
+                                                         x4=np.ones(4)))
+        p.setup(force_alloc_complex=True)
+        p['comp.x1'] = np.random.random(10)
+        p['comp.x2'] = np.random.random(10)
+        p['comp.x3'] = np.random.random(3) - 0.5
+        p['comp.x4'] = np.random.random(4)
+        p.run_model()
+
+        # y3 depends on every column of x3, z and x4, so each of them needs its own evaluation,
+        # but the columns of x1 and x2 are perturbed along with them: 8 evaluations instead of 28.
+        self.assertEqual(len(comp._cs_colors), 8)
+
+        data = p.check_partials(out_stream=None, method='cs')
+        assert_check_partials(data, atol=1e-8, rtol=1e-8)
+
     def test_tags(self):
         prob = om.Problem(model=om.Group())
         prob.model.add_subsystem('indep', om.IndepVarComp('x', 100.0, units='cm'))
@@ -538,6 +538,89 @@ class MetaModelTestCase(unittest.TestCase):
                          1e-4)
         self.assertEqual(len(prob.model.trig._metadata('y')['rmse']), 3)
 
+    def test_vectorized_surrogates(self):
+        size = 4
+        np.random.seed(11)
+        x_train = np.random.random((36, 2))
+
+        for surrogate in [om.KrigingSurrogate(), om.ResponseSurface(),
+                          om.NearestNeighbor(interpolant_type='rbf')]:
+            mm = om.MetaModelUnStructuredComp(vec_size=size, default_surrogate=surrogate)
+            mm.add_input('x', np.zeros((size, 2)), training_data=x_train)
+            mm.add_output('y', np.zeros((size, 2)),
+                          training_data=np.column_stack((x_train[:, 0] * x_train[:, 1],
+                                                         x_train[:, 0] - x_train[:, 1] ** 2)))
+
+            prob = om.Problem()
+            prob.model.add_subsystem('mm', mm)
+            prob.setup()
+
+            prob['mm.x'] = np.array([[0.1, 0.2], [0.35, 0.8], [0.9, 0.45], [0.6, 0.05]])
+            prob.run_model()
+
+            # The whole vector of points is predicted at once.
+            trained = mm._metadata('y')['surrogate']
+            expected = np.array([trained.predict(x.copy()) for x in prob['mm.x']])
+            assert_near_equal(prob['mm.y'], expected.reshape((size, 2)), 1e-12)
+
+            data = prob.check_partials(out_stream=None, form='central')
+            assert_check_partials(data, atol=1e-5, rtol=1e-5)
+
+    def test_append_training_data(self):
+        np.random.seed(11)
+        x_train = np.random.random((30, 1))
+        xx_train = np.random.random((30, 2))
+        y_train = np.column_stack((x_train[:, 0] * xx_train[:, 0], x_train[:, 0] - xx_train[:, 1]))
+        data = {'x': x_train[20:], 'xx': xx_train[20:], 'y': y_train[20:]}
+
+        def build(n):
+            mm = om.MetaModelUnStructuredComp(default_surrogate=om.ResponseSurface())
+            mm.add_input('x', 0., training_data=x_train[:n])
+            mm.add_input('xx', np.zeros(2), training_data=xx_train[:n])
+            mm.add_output('y', np.zeros(2), training_data=y_train[:n])
+
+            prob = om.Problem()
+            prob.model.add_subsystem('mm', mm)
+            prob.setup()
+            prob['mm.x'] = 0.4
+            prob['mm.xx'] = [0.25, 0.6]
+            return prob, mm
+
+        full, _ = build(30)
+        full.run_model()
+
+        # New points added after training update the surrogates.
+        prob, mm = build(20)
+        prob.run_model()
+        mm.append_training_data(data)
+        prob.run_model()
+
+        self.assertEqual(len(mm.options['train:x']), 30)
+        self.assertEqual(mm._training_input.shape, (30, 3))
+        assert_near_equal(prob['mm.y'], full['mm.y'], 1e-10)
+
+        # New points added before training are used when the metamodel is trained.
+        prob, mm = build(20)
+        mm.append_training_data(data)
+        prob.run_model()
+
+        assert_near_equal(prob['mm.y'], full['mm.y'], 1e-10)
+
+        with self.assertRaises(RuntimeError) as cm:
+            mm.append_training_data({'x': x_train[20:], 'y': y_train[20:]})
+
+        self.assertEqual(str(cm.exception),
+                         "MetaModelUnStructuredComp (mm): New training data must be "
+                         "provided for the following variables: ['xx']")
+
+        with self.assertRaises(RuntimeError) as cm:
+            mm.append_training_data({'x': x_train[20:], 'xx': xx_train[21:], 'y': y_train[20:]})
+
+        self.assertEqual(str(cm.exception),
+                         "MetaModelUnStructuredComp (mm): Each variable must have the "
+                         "same number of new training points. Expected 10 but found 9 points "
+                         "for 'xx'.")
+
     def test_derivatives_vectorized_multiD(self):
         vec_size = 5
 
@@ -114,6 +114,16 @@ class Component(System):
         self.options.declare('distributed', types=bool, default=False,
                              desc='True if the component has variables that are distributed '
                                   'across multiple processes.')
+        self.options.declare('batched_fd', types=bool, default=False,
+                             desc='If True, the compute (or apply_nonlinear) method of this '
+                                  'component accepts inputs and outputs having a leading batch '
+                                  'dimension, allowing finite difference to evaluate all of '
+                                  'its perturbed points, or SimpleGADriver all points of a '
+                                  'generation, in a single call.')
+        self.options.declare('mutates_inputs', types=bool, default=False,
+                             desc='Set to True if this component changes the values of its '
+                                  'inputs. This gives its connected inputs their own memory '
+                                  "when the 'alias_connected_inputs' Problem option is set.")
 
     def setup(self):
         """
@@ -1403,3 +1413,57 @@ class _DictValues(object):
     def iteritems(self):
         for key, val in self._dict.iteritems():
             yield key, val['value']
+
+
+class _BatchedVarDict(object):
+    """
+    A dict-like wrapper giving named access to a 2D array of stacked vector data.
+
+    Each row of the array is a full copy of the data array of the given vector, so every value
+    returned has a leading batch dimension.
+    """
+
+    def __init__(self, vec, data, read_only=False):
+        system = vec._system()
+        path = system.pathname
+        start = len(path) + 1 if path else 0
+        abs2meta = system._var_abs2meta
+        nbatch = data.shape[0]
+
+        self._kind = vec._kind
+        self._views = views = {}
+        for abs_name, slc in vec.get_slice_dict().items():
+            v = data[:, slc].view()
+            v.shape = (nbatch,) + abs2meta[abs_name]['shape']
+            views[abs_name[start:]] = v
+
+        self.read_only = read_only
+
+    def __getitem__(self, name):
+        try:
+            return self._views[name]
+        except KeyError:
+            raise KeyError('Variable name "{}" not found.'.format(name))
+
+    def __setitem__(self, name, value):
+        if name not in self._views:
+            raise KeyError('Variable name "{}" not found.'.format(name))
+        if self.read_only:
+            msg = "Attempt to set value of '{}' in {} vector when it is read only."
+            raise ValueError(msg.format(name, self._kind))
+        self._views[name][...] = value
+
+    def __contains__(self, name):
+        return name in self._views
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def __len__(self):
+        return len(self._views)
+
+    def keys(self):
+        return self._views.keys()
+
+    def items(self):
+        return self._views.items()
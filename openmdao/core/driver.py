@@ -4,6 +4,7 @@ import pprint
 import sys
 import os
 import weakref
+import multiprocessing
 
 import numpy as np
 
@@ -82,6 +83,9 @@ class Driver(object):
     _remote_objs : dict
         Dict of objectives that are remote on at least one proc. Values are
         (owning rank, size).
+    _voi_gather_plans : dict
+        Plans for gathering all remote and distributed design variables, constraints, or
+        objectives with a single Allgatherv, keyed by 'desvar', 'con', or 'obj'.
     _rec_mgr : <RecordingManager>
         Object that manages all recorders added to this driver.
     _coloring_info : dict
@@ -111,6 +115,7 @@ class Driver(object):
         self._cons = None
         self._objs = None
         self._responses = None
+        self._voi_gather_plans = {}
 
         # Driver options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
@@ -351,6 +356,12 @@ class Driver(object):
         self._remote_responses = self._remote_cons.copy()
         self._remote_responses.update(self._remote_objs)
 
+        self._voi_gather_plans = plans = {}
+        if model.comm.size > 1 and model._subsystems_allprocs:
+            plans['desvar'] = self._setup_voi_gather_plan(self._designvars, remote_dv_dict)
+            plans['con'] = self._setup_voi_gather_plan(self._cons, remote_con_dict)
+            plans['obj'] = self._setup_voi_gather_plan(self._objs, remote_obj_dict)
+
         # set up simultaneous deriv coloring
         if coloring_mod._use_total_sparsity:
             # reset the coloring
@@ -365,6 +376,119 @@ class Driver(object):
                     coloring._check_config_total(self)
                 self._setup_simul_coloring()
 
+    def _setup_voi_gather_plan(self, vois, remote_vois):
+        """
+        Compute the communication needed to gather the values of remote and distributed VOIs.
+
+        The local parts of all remote and distributed VOIs are packed into a single buffer on
+        each proc, and the buffers are gathered with one Allgatherv.  The gathered data is
+        ordered by rank, so it's permuted afterward so that each VOI occupies a contiguous slice.
+
+        Parameters
+        ----------
+        vois : dict
+            Metadata of the design variables, constraints, or objectives.
+        remote_vois : dict
+            Dict containing (owning_rank, size) for the remote VOIs in vois.
+
+        Returns
+        -------
+        tuple or None
+            The gather plan, or None if none of the VOIs need to be gathered.
+        """
+        comm = self._problem().model.comm
+        distributed_vars = self._distributed_resp
+
+        names = []
+        local_inds = []
+        sizes = []
+        for name, meta in vois.items():
+            if name in remote_vois:
+                owner, size = remote_vois[name]
+                # distributed VOIs that are remote are gathered individually
+                if owner is None:
+                    continue
+                inds = meta['indices']
+                if inds is not None:
+                    size = len(inds)
+                rank_sizes = np.zeros(comm.size, dtype=INT_DTYPE)
+                rank_sizes[owner] = size
+            elif name in distributed_vars:
+                inds, rank_sizes = distributed_vars[name]
+            else:
+                continue
+
+            names.append(name)
+            local_inds.append(inds)
+            sizes.append(rank_sizes)
+
+        if not names:
+            return None
+
+        # sizes[i, rank] is the size of the part of VOI i that is on the given rank
+        sizes = np.array(sizes, dtype=INT_DTYPE).reshape((len(names), comm.size))
+        counts = np.sum(sizes, axis=0)
+        offsets = np.zeros(comm.size, dtype=INT_DTYPE)
+        offsets[1:] = np.cumsum(counts[:-1])
+
+        # start of each part of each VOI in the gathered (rank ordered) data
+        starts = np.cumsum(sizes.T.ravel()).reshape(sizes.T.shape) - sizes.T
+
+        perm = []
+        slices = {}
+        start = 0
+        for i, name in enumerate(names):
+            for rank in range(comm.size):
+                if sizes[i, rank] > 0:
+                    perm.append(np.arange(starts[rank, i], starts[rank, i] + sizes[i, rank]))
+            end = start + np.sum(sizes[i])
+            slices[name] = slice(start, end)
+            start = end
+
+        local = []
+        start = 0
+        for i, name in enumerate(names):
+            size = sizes[i, comm.rank]
+            if size > 0:
+                local.append((name, local_inds[i], slice(start, start + size)))
+                start += size
+
+        perm = np.concatenate(perm) if perm else np.zeros(0, dtype=INT_DTYPE)
+
+        return (local, np.zeros(counts[comm.rank]), np.zeros(np.sum(counts)), counts, offsets,
+                perm, slices)
+
+    def _gather_vois(self, plan):
+        """
+        Gather the values of remote and distributed VOIs to all procs.
+
+        This must be called on all procs.
+
+        Parameters
+        ----------
+        plan : tuple or None
+            The gather plan computed by _setup_voi_gather_plan.
+
+        Returns
+        -------
+        dict or None
+            Unscaled values of the gathered VOIs keyed by name, or None if there was no plan.
+        """
+        if plan is None:
+            return None
+
+        local, send, recv, counts, offsets, perm, slices = plan
+        model = self._problem().model
+        vec = model._outputs._views_flat
+
+        for name, inds, slc in local:
+            send[slc] = vec[name] if inds is None else vec[name][inds]
+
+        model.comm.Allgatherv(send, [recv, counts, offsets, MPI.DOUBLE])
+
+        vals = recv[perm]
+        return {name: vals[slc] for name, slc in slices.items()}
+
     def _check_for_missing_objective(self):
         """
         Check for missing objective and raise error if no objectives found.
@@ -456,7 +580,8 @@ class Driver(object):
         for sub in self._problem().model.system_iter(recurse=True, include_self=True):
             self._rec_mgr.record_metadata(sub)
 
-    def _get_voi_val(self, name, meta, remote_vois, driver_scaling=True, rank=None):
+    def _get_voi_val(self, name, meta, remote_vois, driver_scaling=True, rank=None,
+                     gathered=None):
         """
         Get the value of a variable of interest (objective, constraint, or design var).
 
@@ -477,6 +602,8 @@ class Driver(object):
             add_constraint were called on the model. Default is True.
         rank : int or None
             If not None, gather value to this rank only.
+        gathered : dict or None
+            If not None, unscaled values of the VOIs that were already gathered by _gather_vois.
 
         Returns
         -------
@@ -494,7 +621,10 @@ class Driver(object):
         else:
             distributed = False
 
-        if name in remote_vois:
+        if gathered is not None and name in gathered:
+            val = gathered[name]
+
+        elif name in remote_vois:
             owner, size = remote_vois[name]
             # if var is distributed or only gathering to one rank
             # TODO - support distributed var under a parallel group.
@@ -566,7 +696,8 @@ class Driver(object):
         dict
            Dictionary containing values of each design variable.
         """
-        return {n: self._get_voi_val(n, dv, self._remote_dvs)
+        gathered = self._gather_vois(self._voi_gather_plans.get('desvar'))
+        return {n: self._get_voi_val(n, dv, self._remote_dvs, gathered=gathered)
                 for n, dv in self._designvars.items()}
 
     def set_design_var(self, name, value):
@@ -638,8 +769,9 @@ class Driver(object):
         dict
            Dictionary containing values of each objective.
         """
+        gathered = self._gather_vois(self._voi_gather_plans.get('obj'))
         return {n: self._get_voi_val(n, obj, self._remote_objs,
-                                     driver_scaling=driver_scaling)
+                                     driver_scaling=driver_scaling, gathered=gathered)
                 for n, obj in self._objs.items()}
 
     def get_constraint_values(self, ctype='all', lintype='all', driver_scaling=True):
@@ -664,6 +796,8 @@ class Driver(object):
         dict
            Dictionary containing values of each constraint.
         """
+        gathered = self._gather_vois(self._voi_gather_plans.get('con'))
+
         con_dict = {}
         for name, meta in self._cons.items():
             if lintype == 'linear' and not meta['linear']:
@@ -679,7 +813,7 @@ class Driver(object):
                 continue
 
             con_dict[name] = self._get_voi_val(name, meta, self._remote_cons,
-                                               driver_scaling=driver_scaling)
+                                               driver_scaling=driver_scaling, gathered=gathered)
 
         return con_dict
 
@@ -860,6 +994,112 @@ class Driver(object):
         """
         return create_local_meta(case_name)
 
+    def _get_model_recording_requesters(self):
+        """
+        Get all systems and solvers in the model that have recorders attached.
+
+        Returns
+        -------
+        list
+            The systems and solvers with recorders.
+        """
+        requesters = []
+        for system in self._problem().model.system_iter(recurse=True, include_self=True):
+            requesters.append(system)
+            solvers = [system.nonlinear_solver, system.linear_solver]
+            while solvers:
+                solver = solvers.pop()
+                if solver is not None:
+                    requesters.append(solver)
+                    solvers.extend(getattr(solver, name, None)
+                                   for name in ('linesearch', 'linear_solver', 'precon'))
+
+        return [req for req in requesters if req._rec_mgr.has_recorders()]
+
+    def _get_num_local_procs(self):
+        """
+        Get the number of local processes used to run cases.
+
+        This is used by drivers with 'run_parallel' and 'num_local_procs' options.  Local
+        processes are forked, so cases are run serially on platforms without the 'fork' start
+        method.
+
+        Returns
+        -------
+        int
+            The number of local processes. Cases are run in this process if this is 1.
+        """
+        if MPI or not self.options['run_parallel']:
+            return 1
+
+        num_procs = self.options['num_local_procs'] or os.cpu_count() or 1
+
+        if num_procs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            simple_warning("{}: Cases can't be run in local processes because the 'fork' start "
+                           "method is not available on this platform. Running cases "
+                           "serially.".format(self.msginfo))
+            return 1
+
+        return num_procs
+
+    def _setup_local_worker(self):
+        """
+        Prepare a forked local worker process to run cases for this driver.
+
+        Cases run by a worker are recorded by the parent process, so all recording and debug
+        printing is turned off in the worker.
+        """
+        for requester in [self, self._problem()] + self._get_model_recording_requesters():
+            requester._rec_mgr = RecordingManager()
+        self.options['debug_print'] = []
+
+    def _check_local_recording(self):
+        """
+        Warn if cases run by local worker processes won't be recorded by some recorders.
+        """
+        if self._get_model_recording_requesters():
+            simple_warning("{}: Cases run in local processes are only recorded by the recorders "
+                           "attached to the driver. Recorders attached to systems and solvers "
+                           "will not record them.".format(self.msginfo))
+
+    def _get_model_state(self):
+        """
+        Get a copy of the current values of all variables in the model.
+
+        Returns
+        -------
+        tuple
+            Copies of the input, output and residual data and dicts of the discrete input and
+            output values.
+        """
+        model = self._problem().model
+        return (model._inputs._data.copy(), model._outputs._data.copy(),
+                model._residuals._data.copy(),
+                dict(model._discrete_inputs.items()) if model._discrete_inputs else {},
+                dict(model._discrete_outputs.items()) if model._discrete_outputs else {})
+
+    def _set_model_state(self, state):
+        """
+        Set the values of all variables in the model, e.g. to those computed by a worker process.
+
+        Parameters
+        ----------
+        state : tuple
+            Values of the input, output and residual data and dicts of the discrete input and
+            output values, as returned by _get_model_state.
+        """
+        model = self._problem().model
+        inputs, outputs, residuals, discrete_inputs, discrete_outputs = state
+
+        model._inputs._data[:] = inputs
+        model._outputs._data[:] = outputs
+        model._residuals._data[:] = residuals
+
+        for name, val in discrete_inputs.items():
+            model._discrete_inputs[name] = val
+        for name, val in discrete_outputs.items():
+            model._discrete_outputs[name] = val
+
     def _get_name(self):
         """
         Get name of current Driver.
@@ -877,7 +1117,8 @@ class Driver(object):
                          perturb_size=coloring_mod._DEF_COMP_SPARSITY_ARGS['perturb_size'],
                          min_improve_pct=coloring_mod._DEF_COMP_SPARSITY_ARGS['min_improve_pct'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
-                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity']):
+                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
+                         sparsity_method='random'):
         """
         Set options for total deriv coloring.
 
@@ -898,7 +1139,15 @@ class Driver(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        sparsity_method : str
+            Method used to compute the total jacobian sparsity.  If 'random', the sparsity is
+            computed from 'num_full_jacs' total jacobians using randomized partials.  If
+            'structural', it is computed from the declared sparsity of the partials without
+            computing any total jacobians, which requires much less memory for large problems.
         """
+        if sparsity_method not in ('random', 'structural'):
+            raise ValueError("{}: sparsity_method must be 'random' or 'structural' but '{}' was "
+                             "given.".format(self.msginfo, sparsity_method))
         self._coloring_info['num_full_jacs'] = num_full_jacs
         self._coloring_info['tol'] = tol
         self._coloring_info['orders'] = orders
@@ -911,6 +1160,7 @@ class Driver(object):
         self._coloring_info['coloring'] = None
         self._coloring_info['show_summary'] = show_summary
         self._coloring_info['show_sparsity'] = show_sparsity
+        self._coloring_info['sparsity_method'] = sparsity_method
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from openmdao.core.component import Component, _full_slice
+from openmdao.core.component import Component, _full_slice, _BatchedVarDict
 from openmdao.utils.class_util import overrides_method
 from openmdao.utils.general_utils import ContainsAll
 from openmdao.recorders.recording_iteration_stack import Recording
@@ -244,6 +244,34 @@ class ExplicitComponent(Component):
                 residuals += outputs
                 outputs -= residuals
 
+    def _apply_nonlinear_batched(self, inputs, outputs):
+        """
+        Compute residuals for a batch of stacked input and output data arrays.
+
+        This is only valid when the 'batched_fd' option is True and the component has no
+        scaling, so the data arrays hold physical values.
+
+        Parameters
+        ----------
+        inputs : ndarray
+            2D array where each row is a full input data array.
+        outputs : ndarray
+            2D array where each row is a full output data array.
+
+        Returns
+        -------
+        ndarray
+            2D array where each row is the residual data array for the corresponding row of
+            inputs and outputs.
+        """
+        computed = outputs.copy()
+        self.compute(_BatchedVarDict(self._inputs, inputs, read_only=True),
+                     _BatchedVarDict(self._outputs, computed))
+
+        # Sign of the residual is minus the sign of the output vector.
+        computed -= outputs
+        return computed
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
@@ -394,8 +422,10 @@ class ExplicitComponent(Component):
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
             # Computing the approximation before the call to compute_partials allows users to
             # override FD'd values.
-            for approximation in self._approx_schemes.values():
-                approximation.compute_approximations(self, jac=self._jacobian)
+            if self._approx_schemes:
+                with self._inputs._unaliased_context():
+                    for approximation in self._approx_schemes.values():
+                        approximation.compute_approximations(self, jac=self._jacobian)
 
             if self._has_compute_partials:
                 self._inputs.read_only = True
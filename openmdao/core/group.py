@@ -392,10 +392,16 @@ class Group(System):
         if MPI:
             proc_info = [self._proc_info[s.name] for s in self._subsystems_allprocs]
 
-            # Call the load balancing algorithm
+            # Call the load balancing algorithm.  Only allocators that ask for it are given this
+            # group, since custom allocators may define __call__ without a system argument.
+            allocator = self._mpi_proc_allocator
+            nsubs = len(self._subsystems_allprocs)
             try:
-                sub_inds, sub_comm, sub_proc_range = self._mpi_proc_allocator(
-                    proc_info, len(self._subsystems_allprocs), comm)
+                if getattr(allocator, '_needs_system', False):
+                    sub_inds, sub_comm, sub_proc_range = allocator(proc_info, nsubs, comm,
+                                                                   system=self)
+                else:
+                    sub_inds, sub_comm, sub_proc_range = allocator(proc_info, nsubs, comm)
             except ProcAllocationError as err:
                 subs = self._subsystems_allprocs
                 if err.sub_inds is None:
@@ -434,6 +440,11 @@ class Group(System):
             inds[s.name] = i
             s.pathname = '.'.join((self.pathname, s.name)) if self.pathname else s.name
 
+        # custom allocators don't have to subclass ProcAllocator, so this hook may not exist
+        post_setup_procs = getattr(self._mpi_proc_allocator, '_post_setup_procs', None)
+        if post_setup_procs is not None:
+            post_setup_procs(self)
+
         self._local_system_set = set()
 
         # Perform recursion
@@ -576,6 +587,9 @@ class Group(System):
 
         allprocs_prom2abs_list = self._var_allprocs_prom2abs_list
 
+        # promoted names whose abs name lists were created by this group
+        owned_lists = {'input': set(), 'output': set()}
+
         group_inputs = []
         for n, meta in self._group_inputs.items():
             meta['path'] = self.pathname  # used for error reporting
@@ -618,12 +632,18 @@ class Group(System):
 
                     allprocs_abs2prom[type_][abs_name] = var_maps[type_][sub_proms[abs_name]]
 
-                # Assemble allprocs_prom2abs_list
+                # Assemble allprocs_prom2abs_list.  The lists of the subsystem are shared
+                # until another subsystem adds to them, at which point they're copied.
+                prom2abs_t = allprocs_prom2abs_list[type_]
                 for sub_prom, sub_abs in subsys._var_allprocs_prom2abs_list[type_].items():
                     prom_name = var_maps[type_][sub_prom]
-                    if prom_name not in allprocs_prom2abs_list[type_]:
-                        allprocs_prom2abs_list[type_][prom_name] = []
-                    allprocs_prom2abs_list[type_][prom_name].extend(sub_abs)
+                    if prom_name not in prom2abs_t:
+                        prom2abs_t[prom_name] = sub_abs
+                    elif prom_name in owned_lists[type_]:
+                        prom2abs_t[prom_name].extend(sub_abs)
+                    else:
+                        prom2abs_t[prom_name] = prom2abs_t[prom_name] + sub_abs
+                        owned_lists[type_].add(prom_name)
                     if type_ == 'input' and isinstance(subsys, Group):
                         if sub_prom in subsys._group_inputs:
                             group_inputs.append((prom_name, subsys._group_inputs[sub_prom]))
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from openmdao.core.component import Component
+from openmdao.core.component import Component, _BatchedVarDict
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.utils.class_util import overrides_method
 
@@ -77,6 +77,33 @@ class ImplicitComponent(Component):
                 finally:
                     self._inputs.read_only = self._outputs.read_only = False
 
+    def _apply_nonlinear_batched(self, inputs, outputs):
+        """
+        Compute residuals for a batch of stacked input and output data arrays.
+
+        This is only valid when the 'batched_fd' option is True and the component has no
+        scaling, so the data arrays hold physical values.
+
+        Parameters
+        ----------
+        inputs : ndarray
+            2D array where each row is a full input data array.
+        outputs : ndarray
+            2D array where each row is a full output data array.
+
+        Returns
+        -------
+        ndarray
+            2D array where each row is the residual data array for the corresponding row of
+            inputs and outputs.
+        """
+        residuals = np.zeros((outputs.shape[0], self._residuals._data.size),
+                             dtype=outputs.dtype)
+        self.apply_nonlinear(_BatchedVarDict(self._inputs, inputs, read_only=True),
+                             _BatchedVarDict(self._outputs, outputs, read_only=True),
+                             _BatchedVarDict(self._residuals, residuals))
+        return residuals
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
@@ -275,8 +302,10 @@ class ImplicitComponent(Component):
         with self._unscaled_context(outputs=[self._outputs]):
             # Computing the approximation before the call to compute_partials allows users to
             # override FD'd values.
-            for approximation in self._approx_schemes.values():
-                approximation.compute_approximations(self, jac=self._jacobian)
+            if self._approx_schemes:
+                with self._inputs._unaliased_context():
+                    for approximation in self._approx_schemes.values():
+                        approximation.compute_approximations(self, jac=self._jacobian)
 
             self._inputs.read_only = self._outputs.read_only = True
 
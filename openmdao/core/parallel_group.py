@@ -1,6 +1,7 @@
 """Define the ParallelGroup class."""
 
 from openmdao.core.group import Group
+from openmdao.proc_allocators.proc_allocator import ProcAllocator
 
 
 class ParallelGroup(Group):
@@ -20,3 +21,41 @@ class ParallelGroup(Group):
         """
         super(ParallelGroup, self).__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(ParallelGroup, self)._declare_options()
+
+        self.options.declare('proc_allocator', types=ProcAllocator, default=None,
+                             allow_none=True,
+                             desc='Object used to allocate MPI processes to the subsystems. If '
+                                  'None, processes are allocated using the proc_weight, '
+                                  'min_procs and max_procs given for each subsystem.')
+
+    def _setup_procs(self, pathname, comm, mode, prob_options):
+        """
+        Execute first phase of the setup process.
+
+        Distribute processors, assign pathnames, and call setup on the group. This method recurses
+        downward through the model.
+
+        Parameters
+        ----------
+        pathname : str
+            Global name of the system, including the path.
+        comm : MPI.Comm or <FakeComm>
+            MPI communicator object.
+        mode : string
+            Derivatives calculation mode, 'fwd' for forward, and 'rev' for
+            reverse (adjoint). Default is 'rev'.
+        prob_options : OptionsDictionary
+            Problem level options.
+        """
+        allocator = self.options['proc_allocator']
+        if allocator is not None:
+            allocator.parallel = True
+            self._mpi_proc_allocator = allocator
+
+        super(ParallelGroup, self)._setup_procs(pathname, comm, mode, prob_options)
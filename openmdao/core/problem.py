@@ -58,6 +58,15 @@ MagnitudeTuple = namedtuple('MagnitudeTuple', ['forward', 'reverse', 'fd'])
 
 _contains_all = ContainsAll()
 
+# Stages of an incremental re-setup, in increasing order of the work they repeat.
+_SETUP_DRIVER = 0  # only the driver and the recorders are set up again
+_SETUP_SOLVERS = 1  # the solvers, partials and jacobians of the model are also set up again
+_SETUP_RELEVANCE = 2  # the relevance is also updated for new design vars and responses
+_SETUP_FULL = 3  # the whole model is set up again
+
+# coloring metadata that is computed during setup or when the model runs
+_COMPUTED_COLORING_META = ('coloring', 'wrt_matches', 'wrt_matches_prom')
+
 
 CITATION = """@article{openmdao_2019,
     Author={Justin S. Gray and John T. Hwang and Joaquim R. R. A.
@@ -123,6 +132,13 @@ class Problem(object):
         after a reconfiguration) you may need to set this to True.
     _name : str
         Problem name.
+    _setup_args : tuple or None
+        The model, model comm and setup arguments used in the last call to setup.
+    _setup_state : list or None
+        The parts of each system that were set up in the last call to setup, used to determine
+        what has to be set up again when incremental_setup is True.
+    _setup_stage : int
+        The stage of the model setup that final_setup has to repeat.
     """
 
     def __init__(self, model=None, driver=None, comm=None, name=None, **options):
@@ -175,6 +191,10 @@ class Problem(object):
 
         self._initial_condition_cache = {}
 
+        self._setup_args = None
+        self._setup_state = None
+        self._setup_stage = _SETUP_FULL
+
         # Status of the setup of _model.
         # 0 -- Newly initialized problem or newly added model.
         # 1 -- The `setup` method has been called, but vectors not initialized.
@@ -188,6 +208,23 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('incremental_setup', types=bool, default=False,
+                             desc='If True, calling setup again only repeats the parts of the '
+                                  'model setup affected by changes made since the last setup. '
+                                  'Changes made to the model structure, options, solvers, '
+                                  'colorings, recorders, design vars and responses through the '
+                                  'OpenMDAO API are detected, but not changes to other attributes '
+                                  'that the setup methods of the model depend on.')
+        self.options.declare('alias_connected_inputs', types=bool, default=False,
+                             desc='If True, connected inputs that need no unit conversion, '
+                                  'scaling or src_indices share memory with their source outputs '
+                                  'in the nonlinear vectors instead of being filled by transfers. '
+                                  'This is only done when running on a single proc without '
+                                  'complex step. Inputs of components that mutate their inputs '
+                                  'or that are in a system that approximates its derivatives '
+                                  'are not aliased. Setting the value of an aliased input sets '
+                                  'the value of its source, and nonlinear block Jacobi '
+                                  'iterations see updated values of aliased inputs immediately.')
         self.options.update(options)
 
         # Case recording options
@@ -752,15 +789,33 @@ class Problem(object):
 
         self._mode = self._orig_mode = mode
 
-        # this will be shared by all Solvers in the model
-        model._solver_info = SolverInfo()
-        self._recording_iter = _RecIteration()
-        model._recording_iter = self._recording_iter
-
         model_comm = self.driver._setup_comm(comm)
 
-        model._setup(model_comm, mode, distributed_vector_class, local_vector_class,
-                     derivatives, self.options)
+        setup_args = (model, model_comm, mode, distributed_vector_class, local_vector_class,
+                      derivatives, force_alloc_complex, self.options['alias_connected_inputs'])
+
+        stage = _SETUP_FULL
+        if self.options['incremental_setup'] and self._setup_status > 0 and \
+                self._setup_args == setup_args:
+            stage = _get_setup_stage(self._setup_state, _get_setup_state(model))
+            if comm.size > 1:
+                stage = comm.allreduce(stage, op=MPI.MAX)
+
+        if stage == _SETUP_FULL:
+            # this will be shared by all Solvers in the model
+            model._solver_info = SolverInfo()
+            self._recording_iter = _RecIteration()
+            model._recording_iter = self._recording_iter
+
+            model._setup(model_comm, mode, distributed_vector_class, local_vector_class,
+                         derivatives, self.options)
+        elif stage == _SETUP_RELEVANCE:
+            model._update_vois(mode)
+
+        if self.options['incremental_setup']:
+            self._setup_args = setup_args
+            self._setup_state = _get_setup_state(model)
+        self._setup_stage = stage
 
         # Cache all args for final setup.
         self._check = check
@@ -794,7 +849,9 @@ class Problem(object):
 
         if self._setup_status < 2:
             self.model._final_setup(self.comm,
-                                    force_alloc_complex=self._force_alloc_complex)
+                                    force_alloc_complex=self._force_alloc_complex,
+                                    vectors=self._setup_stage == _SETUP_FULL,
+                                    solvers=self._setup_stage >= _SETUP_SOLVERS)
 
         driver._setup_driver(self)
 
@@ -1213,9 +1270,10 @@ class Problem(object):
                                                                        fd_options, vector=vector)
 
             approx_jac = {}
-            for approximation in approximations.values():
-                # Perform the FD here.
-                approximation.compute_approximations(comp, jac=approx_jac)
+            with comp._inputs._unaliased_context():
+                for approximation in approximations.values():
+                    # Perform the FD here.
+                    approximation.compute_approximations(comp, jac=approx_jac)
 
             for abs_key, partial in approx_jac.items():
                 rel_key = abs_key2rel_key(comp, abs_key)
@@ -2147,3 +2205,173 @@ class Slicer(object):
 
 # instance of the Slicer class to be used by users for the set_val and get_val methods of Problem
 slicer = Slicer()
+
+
+def _same_value(a, b):
+    """
+    Return True if the two values are the same.
+
+    Parameters
+    ----------
+    a : object
+        First value.
+    b : object
+        Second value.
+
+    Returns
+    -------
+    bool
+        True if a and b are the same object or are equal.
+    """
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same_value(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_same_value(v, w) for v, w in zip(a, b))
+    if isinstance(a, np.ndarray):
+        return a.shape == b.shape and bool(np.all(a == b))
+
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _option_values(options):
+    """
+    Return the values in an OptionsDictionary.
+
+    Parameters
+    ----------
+    options : <OptionsDictionary>
+        The options.
+
+    Returns
+    -------
+    dict
+        Option values keyed by option name.
+    """
+    return {name: meta['value'] for name, meta in options._dict.items()}
+
+
+def _solver_state(solver):
+    """
+    Return the parts of a solver, and of its line search and linear solver, that are set up.
+
+    Parameters
+    ----------
+    solver : <Solver> or None
+        The solver.
+
+    Returns
+    -------
+    tuple or None
+        The solver, its options, recording options, recorders, line search and linear solver.
+    """
+    if solver is None:
+        return None
+
+    return (solver, _option_values(solver.options), _option_values(solver.recording_options),
+            list(solver._rec_mgr._recorders), _solver_state(getattr(solver, 'linesearch', None)),
+            _solver_state(getattr(solver, 'linear_solver', None)))
+
+
+def _get_setup_state(model):
+    """
+    Return the parts of each local system that determine which setup stages must be repeated.
+
+    Option values and other mutable objects are referenced rather than copied, so changes made
+    to them in place aren't detected.
+
+    Parameters
+    ----------
+    model : <System>
+        The top-level system.
+
+    Returns
+    -------
+    list of tuple
+        For each system, the system itself, the parts that require a full setup, its design vars,
+        its responses, and the parts that require its solvers to be set up again.
+    """
+    state = []
+    for s in model.system_iter(recurse=True, include_self=True):
+        structure = [s, _option_values(s.options), s._owns_approx_jac,
+                     dict(s._owns_approx_jac_meta),
+                     {key: list(proms) for key, proms in s._var_promotes.items()},
+                     dict(s._var_promotes_src_indices)]
+
+        if isinstance(s, Group):
+            structure.extend([list(s._static_subsystems_allprocs),
+                              dict(s._static_manual_connections),
+                              {name: dict(meta) for name, meta in s._group_inputs.items()},
+                              dict(s._proc_info)])
+        else:
+            structure.append(list(s._static_var_rel2meta))
+
+        solvers = [_solver_state(s._nonlinear_solver), _solver_state(s._linear_solver),
+                   {key: val for key, val in s._coloring_info.items()
+                    if key not in _COMPUTED_COLORING_META},
+                   _option_values(s.recording_options), list(s._rec_mgr._recorders)]
+
+        state.append((s, structure, dict(s._static_design_vars), dict(s._static_responses),
+                      solvers))
+
+    return state
+
+
+def _get_setup_stage(old_state, new_state):
+    """
+    Determine which stage of the model setup has to be repeated.
+
+    The colorings of systems whose coloring options have changed are reset.
+
+    Parameters
+    ----------
+    old_state : list of tuple
+        State of the model at the end of the last setup.
+    new_state : list of tuple
+        Current state of the model.
+
+    Returns
+    -------
+    int
+        The setup stage to repeat.
+    """
+    if len(old_state) != len(new_state):
+        return _SETUP_FULL
+
+    stage = _SETUP_DRIVER
+    reset_colorings = []
+
+    for old, new in zip(old_state, new_state):
+        system, structure, design_vars, responses, solvers = new
+        _, old_structure, old_design_vars, old_responses, old_solvers = old
+
+        if not _same_value(old_structure, structure):
+            return _SETUP_FULL
+
+        for vois, old_vois in ((design_vars, old_design_vars), (responses, old_responses)):
+            if vois.keys() != old_vois.keys():
+                for name in vois.keys() - old_vois.keys():
+                    meta = vois[name]
+                    # these need their own vectors
+                    if meta.get('parallel_deriv_color') is not None or \
+                            meta.get('vectorize_derivs'):
+                        return _SETUP_FULL
+                stage = max(stage, _SETUP_RELEVANCE)
+
+        if not _same_value(old_solvers, solvers):
+            stage = max(stage, _SETUP_SOLVERS)
+            if not _same_value(old_solvers[2], solvers[2]):
+                reset_colorings.append(system)
+
+    for system in reset_colorings:
+        info = system._coloring_info
+        if info['dynamic'] or info['static'] is not None:
+            info['coloring'] = None
+
+    return stage
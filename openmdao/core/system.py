@@ -177,6 +177,9 @@ class System(object):
     _conn_global_abs_in2out : {'abs_in': 'abs_out'}
         Dictionary containing all explicit & implicit connections owned by this system
         or any descendant system. The data is the same across all processors.
+    _input_aliases : {'abs_in': 'abs_out'}
+        Connected inputs that share memory with their source outputs in the nonlinear vectors.
+        This is only defined in the top level System.
     _vec_names : [str, ...]
         List of names of all vectors, including the nonlinear vector.
     _lin_vec_names : [str, ...]
@@ -417,6 +420,7 @@ class System(object):
         self._rec_mgr = RecordingManager()
 
         self._conn_global_abs_in2out = {}
+        self._input_aliases = {}
 
         self._static_mode = True
         self._static_subsystems_allprocs = []
@@ -549,6 +553,8 @@ class System(object):
         else:
             self._scale_factors = {}
 
+        self._input_aliases = self._get_input_aliases(nl_alloc_complex)
+
         if self._vector_class is None:
             self._vector_class = self._local_vector_class
 
@@ -574,7 +580,8 @@ class System(object):
                     rdct, _ = relevant[vec_name]['@all']
                     rel = rdct['output']
 
-            for key in ['input', 'output', 'residual']:
+            # the output vector is created first so that inputs can be aliased to it
+            for key in ['output', 'input', 'residual']:
                 root_vectors[key][vec_name] = vector_class(vec_name, key, self,
                                                            alloc_complex=alloc_complex,
                                                            ncol=ncol, relevant=rel)
@@ -674,7 +681,7 @@ class System(object):
         """
         pass
 
-    def _final_setup(self, comm, force_alloc_complex=False):
+    def _final_setup(self, comm, force_alloc_complex=False, vectors=True, solvers=True):
         """
         Perform final setup for this system and its descendant systems.
 
@@ -688,20 +695,35 @@ class System(object):
             Force allocation of imaginary part in nonlinear vectors. OpenMDAO can generally
             detect when you need to do this, but in some cases (e.g., complex step is used
             after a reconfiguration) you may need to set this to True.
-        """
-        root_vectors = self._get_root_vectors(force_alloc_complex=force_alloc_complex)
-        self._setup_vectors(root_vectors)
-
-        # Transfers do not require recursion, but they have to be set up after the vector setup.
-        self._setup_transfers()
+        vectors : bool
+            If True, set up the vectors and transfers. Otherwise the existing ones are kept.
+        solvers : bool
+            If True, set up the solvers, partials and jacobians. Otherwise the existing ones
+            are kept.
+        """
+        if vectors:
+            root_vectors = self._get_root_vectors(force_alloc_complex=force_alloc_complex)
+            self._setup_vectors(root_vectors)
+
+            # Transfers do not require recursion, but they have to be set up after the vector
+            # setup.
+            self._setup_transfers()
+        else:
+            self._residuals.set_const(0.0)
 
         # Same situation with solvers, partials, and Jacobians.
         # If we're updating, we just need to re-run setup on these, but no recursion necessary.
-        self._setup_solvers()
-        self._setup_solver_print()
-        if self._use_derivatives:
-            self._setup_partials()
-            self._setup_jacobians()
+        if solvers:
+            if not vectors:
+                # partial sparsity from any coloring has to be applied to the new partials
+                for sub in self.system_iter(recurse=True, include_self=True):
+                    sub._first_call_to_linearize = True
+
+            self._setup_solvers()
+            self._setup_solver_print()
+            if self._use_derivatives:
+                self._setup_partials()
+                self._setup_jacobians()
 
         self._setup_recording()
 
@@ -1297,9 +1319,6 @@ class System(object):
         if self._use_derivatives:
             abs2idx['nonlinear'] = abs2idx['linear']
 
-        for subsys in self._subsystems_myproc:
-            subsys._setup_var_index_maps()
-
     def _setup_var_sizes(self):
         """
         Compute the arrays of local variable sizes for all variables/procs on this system.
@@ -1399,6 +1418,24 @@ class System(object):
             s._vec_names = vec_names
             s._lin_vec_names = self._lin_vec_names
 
+    def _update_vois(self, mode):
+        """
+        Add the design vars and responses declared since the last setup and update the relevance.
+
+        This is only valid at the top level, when none of the new design vars or responses need
+        their own vectors.
+
+        Parameters
+        ----------
+        mode : str
+            Derivative direction, either 'fwd' or 'rev'.
+        """
+        for s in self.system_iter(recurse=True, include_self=True):
+            s._design_vars.update(s._static_design_vars)
+            s._responses.update(s._static_responses)
+
+        self._setup_relevance(mode)
+
     def _init_relevance(self, mode):
         """
         Create the relevance dictionary.
@@ -1523,11 +1560,17 @@ class System(object):
             rel, relsys = relevant[vec_name]['@all']
             if self.pathname in relsys:
                 self._rel_vec_name_list.append(vec_name)
+            allprocs_names = self._var_allprocs_relevant_names[vec_name] = {}
+            names = self._var_relevant_names[vec_name] = {}
             for type_ in ('input', 'output'):
-                self._var_allprocs_relevant_names[vec_name][type_].extend(
-                    v for v in self._var_allprocs_abs_names[type_] if v in rel[type_])
-                self._var_relevant_names[vec_name][type_].extend(
-                    v for v in self._var_abs_names[type_] if v in rel[type_])
+                if isinstance(rel[type_], ContainsAll):
+                    # all variables are relevant, so share the name lists instead of copying
+                    allprocs_names[type_] = self._var_allprocs_abs_names[type_]
+                    names[type_] = self._var_abs_names[type_]
+                else:
+                    allprocs_names[type_] = [v for v in self._var_allprocs_abs_names[type_]
+                                             if v in rel[type_]]
+                    names[type_] = [v for v in self._var_abs_names[type_] if v in rel[type_]]
 
         self._rel_vec_names = frozenset(self._rel_vec_name_list)
         self._lin_rel_vec_name_list = self._rel_vec_name_list[1:]
@@ -1541,6 +1584,73 @@ class System(object):
         """
         pass
 
+    def _get_input_aliases(self, alloc_complex):
+        """
+        Find the connected inputs that can share memory with their source outputs.
+
+        This is only done if the 'alias_connected_inputs' problem option is set, when running
+        on a single proc without complex step.  An input is aliased if no unit conversion,
+        scaling or src_indices is applied to it, and if its component doesn't mutate its inputs,
+        doesn't own its source, and isn't in a system that approximates its derivatives.
+
+        Parameters
+        ----------
+        alloc_complex : bool
+            Whether imaginary storage is allocated in the nonlinear vectors.
+
+        Returns
+        -------
+        dict
+            Mapping of each aliased abs input name to the abs name of its source.
+        """
+        if self._problem_options is None or not self._problem_options['alias_connected_inputs']:
+            return {}
+
+        if alloc_complex or self.comm.size > 1:
+            return {}
+
+        from openmdao.core.component import Component
+
+        approx_paths = []
+        mutating = set()
+        for s in self.system_iter(include_self=True, recurse=True):
+            if s._has_approx:
+                approx_paths.append(s.pathname + '.' if s.pathname else '')
+            if isinstance(s, Component) and s.options['mutates_inputs']:
+                mutating.add(s.pathname)
+
+        abs2meta = self._var_abs2meta
+        aliases = {}
+        for abs_in, abs_out in self._conn_global_abs_in2out.items():
+            if abs_in not in abs2meta:  # discrete
+                continue
+
+            meta_in = abs2meta[abs_in]
+            meta_out = abs2meta[abs_out]
+            comp_path = abs_in.rsplit('.', 1)[0]
+
+            if meta_in['src_indices'] is not None or meta_in['distributed'] or \
+                    meta_out['distributed'] or meta_in['size'] != meta_out['size']:
+                continue
+
+            units_in = meta_in['units']
+            units_out = meta_out['units']
+            if not (units_in is None or units_out is None or units_in == units_out):
+                continue
+
+            if np.any(meta_out['ref'] != 1.0) or np.any(meta_out['ref0'] != 0.0):
+                continue
+
+            if comp_path in mutating or comp_path == abs_out.rsplit('.', 1)[0]:
+                continue
+
+            if any(abs_in.startswith(path) for path in approx_paths):
+                continue
+
+            aliases[abs_in] = abs_out
+
+        return aliases
+
     def _setup_vectors(self, root_vectors, alloc_complex=False):
         """
         Compute all vectors for all vec names and assign excluded variables lists.
@@ -1699,8 +1809,11 @@ class System(object):
         Set all input and output variables to their declared initial values.
         """
         abs2meta = self._var_abs2meta
+        aliased = self._inputs._aliased
         for abs_name in self._var_abs_names['input']:
-            self._inputs._views[abs_name][:] = abs2meta[abs_name]['value']
+            # aliased inputs get the value of their source
+            if abs_name not in aliased:
+                self._inputs._views[abs_name][:] = abs2meta[abs_name]['value']
 
         for abs_name in self._var_abs_names['output']:
             self._outputs._views[abs_name][:] = abs2meta[abs_name]['value']
@@ -3918,6 +4031,7 @@ class System(object):
         if kind is None:
             kind = typ
 
+        vec = None
         if not discrete:
             try:
                 vec = self._vectors[kind][vec_name]
@@ -3940,12 +4054,19 @@ class System(object):
                     offsets[1:] = np.cumsum(sizes[:-1])
                     val = np.zeros(np.sum(sizes))
                     self.comm.Allgatherv(loc_val, [val, sizes, offsets, MPI.DOUBLE])
-                else:
+                elif vec is None or vec_name not in ('nonlinear', 'linear'):
                     if owner != self.comm.rank:
                         val = None
-                    # TODO: use Bcast if not discrete for speed
                     new_val = self.comm.bcast(val, root=owner)
                     val = new_val
+                else:
+                    # the value is in a vector that contains all variables on the owning proc,
+                    # so it can be sent without pickling
+                    if owner == self.comm.rank:
+                        self.comm.Bcast(vec._views_flat[abs_name], root=owner)
+                    else:
+                        val = np.empty(meta['size'], dtype=vec._data.dtype)
+                        self.comm.Bcast(val, root=owner)
             else:   # retrieve to rank
                 if distrib:
                     idx = self._var_allprocs_abs2idx['nonlinear'][abs_name]
@@ -2334,5 +2334,104 @@ class CheckTotalsParallelGroup(unittest.TestCase):
         assert_near_equal(data[('pg.dc1.y', 'iv.x')]['abs error'][0], 0.0, 1e-6)
         assert_near_equal(data[('pg.dc3.y', 'iv.x')]['abs error'][0], 0.0, 1e-6)
 
+
+class BatchedComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('ref', default=1.0)
+
+    def setup(self):
+        self.ncompute = 0
+        self.add_input('x', np.arange(5, dtype=float) + 1.)
+        self.add_input('y', np.ones((2, 3)))
+        self.add_output('f', np.zeros(5), ref=self.options['ref'])
+        self.add_output('g', np.zeros((2, 3)))
+
+        self.declare_partials('*', '*', method='fd', form='central')
+
+    def compute(self, inputs, outputs):
+        self.ncompute += 1
+        x = inputs['x']
+        y = inputs['y']
+
+        # inputs may have a leading batch dimension, so index from the end
+        outputs['f'] = x ** 2 + np.sum(y, axis=(-2, -1))[..., np.newaxis]
+        outputs['g'] = 3.0 * y + x[..., :1, np.newaxis] ** 3
+
+
+class BatchedImplComp(om.ImplicitComponent):
+
+    def setup(self):
+        self.napply = 0
+        self.add_input('x', 2.0 * np.ones(3))
+        self.add_output('z', 0.5 * np.ones(3))
+
+        self.declare_partials('*', '*', method='fd')
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        self.napply += 1
+        residuals['z'] = outputs['z'] ** 2 - inputs['x'] * outputs['z']
+
+
+class TestBatchedFiniteDifference(unittest.TestCase):
+
+    def _build(self, batched, color=False):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', BatchedComp(batched_fd=batched))
+        prob.model.add_subsystem('icomp', BatchedImplComp(batched_fd=batched))
+        if color:
+            prob.model.comp.declare_coloring(wrt='*', method='fd', show_summary=False)
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+        return prob
+
+    def _check(self, prob):
+        data = prob.check_partials(method='cs', out_stream=None)
+        for comp in data:
+            for key, val in data[comp].items():
+                assert_near_equal(val['abs error'].forward, 0.0, 1e-5)
+
+    def test_batched(self):
+        prob = self._build(True)
+        prob.model.comp.ncompute = prob.model.icomp.napply = 0
+        prob.model.run_linearize()
+
+        self.assertEqual(prob.model.comp.ncompute, 1)
+        self.assertEqual(prob.model.icomp.napply, 1)
+        self._check(prob)
+
+    def test_batched_matches_unbatched(self):
+        jacs = []
+        for batched in (False, True):
+            prob = self._build(batched)
+            prob.model.run_linearize()
+            jacs.append({key: prob.model.comp._jacobian[key].copy()
+                         for key in prob.model.comp._subjacs_info})
+
+        for key in jacs[0]:
+            assert_near_equal(jacs[1][key], jacs[0][key], 1e-12)
+
+    def test_batched_colored(self):
+        prob = self._build(True, color=True)
+        prob.model.run_linearize()  # compute the dynamic coloring
+
+        prob.model.comp.ncompute = 0
+        prob.model.run_linearize()
+
+        self.assertEqual(prob.model.comp.ncompute, 1)
+        self._check(prob)
+
+    def test_batched_with_scaling_falls_back(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', BatchedComp(batched_fd=True, ref=10.0))
+        prob.setup()
+        prob.run_model()
+        comp.ncompute = 0
+        prob.model.run_linearize()
+
+        # central difference, one column per input entry
+        self.assertEqual(comp.ncompute, 2 * 11)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ import sys
 import shutil
 import tempfile
 import itertools
+import tracemalloc
 
 import unittest
 import numpy as np
@@ -22,10 +23,12 @@ except ImportError:
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import set_pyoptsparse_opt
-from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz, compute_total_coloring
+from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz, compute_total_coloring, \
+     _get_bool_total_jac
 from openmdao.utils.mpi import MPI
 from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
+from openmdao.test_suite.components.sellar import SellarStateConnection
 from openmdao.utils.general_utils import run_driver
 
 import openmdao.test_suite
@@ -931,6 +934,71 @@ class BidirectionalTestCase(unittest.TestCase):
 
         self.assertEqual(tot_colors, expected_colors)
 
+    @parameterized.expand(itertools.product(
+        [('n4c6-b15', 3), ('can_715', 21), ('lp_finnis', 14), ('ash608', 6), ('ash331', 6),
+         ('D_6', 28), ('Harvard500', 26), ('illc1033', 5)],
+        ), name_func=_test_func_name
+    )
+    @unittest.skipIf(load_npz is None, "scipy version too old")
+    def test_bidir_coloring_sparse(self, tup):
+        matname, expected_colors = tup
+        matdir = os.path.join(os.path.dirname(openmdao.test_suite.__file__), 'matrices')
+
+        matfile = os.path.join(matdir, matname + '.npz')
+        if not os.path.exists(matfile):
+            raise unittest.SkipTest("Matrix test file were not included.")
+
+        # pass the sparse matrix directly so the dense jacobian is never formed
+        coloring = _compute_coloring(load_npz(matfile), 'auto')
+
+        tot_size, tot_colors, fwd_solves, rev_solves, pct = coloring._solves_info()
+
+        self.assertEqual(tot_colors, expected_colors)
+
+    def test_sparse_matches_dense(self):
+        np.random.seed(11)
+        for i in range(20):
+            nrows, ncols = np.random.randint(1, 60, 2)
+            J = np.random.random((nrows, ncols)) < np.random.uniform(0.02, 0.4)
+            if i % 5 == 0:
+                J[np.random.randint(nrows)] = True  # add a dense row
+
+            for mode in ('fwd', 'rev', 'auto'):
+                dense = _compute_coloring(J, mode)
+                sparse = _compute_coloring(scipy.sparse.csc_matrix(J), mode)
+
+                self.assertEqual(dense.total_solves(), sparse.total_solves())
+                for direction in dense.modes():
+                    self.assertEqual([list(c) for c in dense.color_iter(direction)],
+                                     [list(c) for c in sparse.color_iter(direction)])
+                    for dcol, scol in zip(dense.get_row_col_map(direction),
+                                          sparse.get_row_col_map(direction)):
+                        if dcol is None or isinstance(dcol, slice):
+                            self.assertEqual(type(dcol), type(scol))
+                        else:
+                            np.testing.assert_array_equal(dcol, scol)
+
+    def test_sparse_dense_row_memory(self):
+        # A single dense row makes every pair of columns adjacent, so a column adjacency matrix
+        # (J.T * J) would have n**2 nonzeros.  Coloring should not need memory anywhere near that.
+        n = 3000
+        J = scipy.sparse.lil_matrix((n + 1, n), dtype=bool)
+        J.setdiag(True)
+        J[n, :] = True
+        J = J.tocsc()
+
+        tracemalloc.start()
+        try:
+            fwd = _compute_coloring(J, 'fwd')
+            rev = _compute_coloring(J, 'rev')
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(fwd.total_solves(), n)
+        self.assertEqual(rev.total_solves(), 2)
+        self.assertLess(peak, n * n // 4)
+
 
 def _get_random_mat(rows, cols):
     if MPI:
@@ -1270,5 +1338,150 @@ class SimulColoringConfigCheckTestCase(unittest.TestCase):
         self.assertEqual(str(ctx.exception), "DumbComp (comp): Current coloring configuration does not match the configuration of the current model.\n   The following variables have changed sizes: ['y', 'y_in'].\nMake sure you don't have different problems that have the same coloring directory. Set the coloring directory by setting the value of problem.options['coloring_dir'].")
 
 
+class MatFreeComp(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('x', np.ones(SIZE))
+        self.add_output('y', np.ones(SIZE))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 2.0 * inputs['x']
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        if mode == 'fwd':
+            if 'x' in d_inputs:
+                d_outputs['y'] += 2.0 * d_inputs['x']
+        else:
+            if 'x' in d_inputs:
+                d_inputs['x'] += 2.0 * d_outputs['y']
+
+
+@use_tempdirs
+class StructuralSparsityTestCase(unittest.TestCase):
+
+    def _check_structural(self, p):
+        J_rand, _ = _get_bool_total_jac(p)
+        J_struct, info = _get_bool_total_jac(p, sparsity_method='structural')
+
+        self.assertTrue(scipy.sparse.issparse(J_struct))
+        self.assertEqual(info['sparsity_method'], 'structural')
+        np.testing.assert_array_equal(J_struct.toarray(), J_rand)
+
+    def test_circle(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+        self._check_structural(p)
+
+    def test_circle_dense_partials(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    has_diag_partials=False)
+        self._check_structural(p)
+
+    def test_circle_partial_coloring(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    partial_coloring=True)
+        self._check_structural(p)
+
+    def test_sellar_state_connection(self):
+        p = om.Problem(model=SellarStateConnection(nonlinear_solver=om.NewtonSolver(solve_subsystems=False),
+                                                   linear_solver=om.DirectSolver()))
+        p.model.add_design_var('x')
+        p.model.add_design_var('z')
+        p.model.add_objective('obj')
+        p.model.add_constraint('con1', upper=0.)
+        p.model.add_constraint('con2', upper=0.)
+        p.setup(mode='fwd')
+        p.run_model()
+
+        self._check_structural(p)
+
+    def test_implicit_no_diagonal(self):
+        # the balance residual doesn't depend on its own output, so a row permutation is needed
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('indeps', om.IndepVarComp('target', np.arange(1., SIZE + 1.)))
+        model.add_subsystem('sq', om.ExecComp('y=x**2', has_diag_partials=True,
+                                              x=np.ones(SIZE), y=np.ones(SIZE)))
+        bal = model.add_subsystem('bal', om.BalanceComp())
+        bal.add_balance('x', val=np.ones(SIZE), use_mult=False)
+        model.add_subsystem('obj', om.ExecComp('f=sum(x)', x=np.ones(SIZE)))
+
+        model.connect('indeps.target', 'bal.rhs:x')
+        model.connect('bal.x', ['sq.x', 'obj.x'])
+        model.connect('sq.y', 'bal.lhs:x')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.DirectSolver()
+
+        model.add_design_var('indeps.target')
+        model.add_constraint('bal.x', indices=[1, 3, 5], upper=10.)
+        model.add_objective('obj.f')
+        p.setup(mode='rev')
+        p.run_model()
+
+        J, _ = _get_bool_total_jac(p, sparsity_method='structural')
+        # objective comes first, followed by the constraint
+        expected = np.zeros((4, SIZE), dtype=bool)
+        expected[0, :] = True
+        expected[[1, 2, 3], [1, 3, 5]] = True
+        np.testing.assert_array_equal(J.toarray(), expected)
+
+    def test_matrix_free(self):
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('indeps', om.IndepVarComp('x', np.ones(SIZE)))
+        model.add_subsystem('mf', MatFreeComp())
+        model.add_subsystem('diag', om.ExecComp('y=3.0*x', has_diag_partials=True,
+                                                x=np.ones(SIZE), y=np.ones(SIZE)))
+        model.connect('indeps.x', ['mf.x', 'diag.x'])
+        model.add_design_var('indeps.x')
+        model.add_constraint('mf.y', upper=0.)
+        model.add_constraint('diag.y', upper=0.)
+        p.setup(mode='fwd')
+        p.run_model()
+
+        J, _ = _get_bool_total_jac(p, sparsity_method='structural')
+        expected = np.vstack((np.ones((SIZE, SIZE), dtype=bool), np.eye(SIZE, dtype=bool)))
+        np.testing.assert_array_equal(J.toarray(), expected)
+
+    def test_fallback_approx_totals(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+        p.model._approx_schemes = {'fd': None}
+        with assert_warning(UserWarning, "Structural total jacobian sparsity can't be computed "
+                            "because the model approximates its total derivatives. Falling back "
+                            "to the 'random' method."):
+            J = _get_bool_total_jac(p, sparsity_method='structural')[0]
+        self.assertIsInstance(J, np.ndarray)
+
+    def test_dynamic_total_coloring_structural(self):
+        p_rand = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                         dynamic_total_coloring=True)
+
+        p = om.Problem()
+        p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+        p.driver.declare_coloring(sparsity_method='structural')
+        self.assertEqual(p.driver._coloring_info['sparsity_method'], 'structural')
+
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True)
+        p.driver.declare_coloring(sparsity_method='structural')
+        p.run_driver()
+
+        coloring = p.driver._coloring_info['coloring']
+        self.assertEqual(coloring._meta['sparsity_method'], 'structural')
+        np.testing.assert_array_equal(coloring.get_dense_sparsity(),
+                                      p_rand.driver._coloring_info['coloring'].get_dense_sparsity())
+        self.assertEqual(coloring.total_solves(),
+                         p_rand.driver._coloring_info['coloring'].total_solves())
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+
+    def test_bad_sparsity_method(self):
+        p = om.Problem()
+        p.driver = om.ScipyOptimizeDriver()
+        with self.assertRaises(ValueError) as ctx:
+            p.driver.declare_coloring(sparsity_method='foo')
+        self.assertEqual(str(ctx.exception),
+                         "ScipyOptimizeDriver: sparsity_method must be 'random' or 'structural' "
+                         "but 'foo' was given.")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1957,6 +1957,61 @@ class TestGroupAddInput(unittest.TestCase):
         self.assertEqual(cm.exception.args[0], "Groups 'G1' and 'G1.G2' added the input 'x' with conflicting 'value'.")
 
 
+class TestSharedVarData(unittest.TestCase):
+
+    def build_model(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('indep', om.IndepVarComp('x', 3.0), promotes=['x'])
+        sub = model.add_subsystem('sub', om.Group(), promotes_inputs=['x'])
+        sub.add_subsystem('c1', om.ExecComp('y = 2.0 * x'), promotes=['x'])
+        sub.add_subsystem('c2', om.ExecComp('y = 3.0 * x'), promotes=['x'])
+        model.add_subsystem('c3', om.ExecComp('y = 4.0 * x'), promotes=['x'])
+        return prob
+
+    def test_promoted_lists(self):
+        # abs name lists shared with subsystems must not be changed when other subsystems
+        # promote the same name in the parent group
+        prob = self.build_model()
+        prob.setup()
+        prob.run_model()
+
+        model = prob.model
+        sub = model.sub
+        self.assertEqual(model.c3._var_allprocs_prom2abs_list['input']['x'], ['c3.x'])
+        self.assertEqual(sub.c1._var_allprocs_prom2abs_list['input']['x'], ['sub.c1.x'])
+        self.assertEqual(sub._var_allprocs_prom2abs_list['input']['x'],
+                         ['sub.c1.x', 'sub.c2.x'])
+        self.assertEqual(model._var_allprocs_prom2abs_list['input']['x'],
+                         ['sub.c1.x', 'sub.c2.x', 'c3.x'])
+
+        assert_near_equal(prob['sub.c1.y'], 6.0)
+        assert_near_equal(prob['sub.c2.y'], 9.0)
+        assert_near_equal(prob['c3.y'], 12.0)
+
+        # setting up again must give the same result
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(model._var_allprocs_prom2abs_list['input']['x'],
+                         ['sub.c1.x', 'sub.c2.x', 'c3.x'])
+        assert_near_equal(prob['c3.y'], 12.0)
+
+    def test_relevant_names(self):
+        prob = self.build_model()
+        prob.setup()
+        prob.final_setup()
+
+        for system in prob.model.system_iter(include_self=True, recurse=True):
+            for vec_name in ('nonlinear', 'linear'):
+                for type_ in ('input', 'output'):
+                    self.assertEqual(system._var_allprocs_relevant_names[vec_name][type_],
+                                     system._var_allprocs_abs_names[type_])
+                    self.assertEqual(system._var_relevant_names[vec_name][type_],
+                                     system._var_abs_names[type_])
+                    for i, name in enumerate(system._var_allprocs_abs_names[type_]):
+                        self.assertEqual(system._var_allprocs_abs2idx[vec_name][name], i)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestGroupAddInputMPI(TestGroupAddInput):
     N_PROCS = 2
@@ -1894,6 +1894,119 @@ class NestedProblemTestCase(unittest.TestCase):
         p.run_model()
 
 
+class IncrementalSetupTestCase(unittest.TestCase):
+
+    def _build(self, incremental=True):
+        prob = om.Problem(model=SellarDerivatives(), incremental_setup=incremental)
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(maxiter=100, atol=1e-12, rtol=1e-12)
+        model.add_design_var('x', lower=0.0, upper=10.0)
+        model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0.0)
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        return prob
+
+    def test_driver_change(self):
+        prob = self._build()
+        outputs = prob.model._outputs
+        transfers = prob.model._transfers
+        solver = prob.model.nonlinear_solver
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.setup()
+        prob.final_setup()
+
+        self.assertIs(prob.model._outputs, outputs)
+        self.assertIs(prob.model._transfers, transfers)
+        self.assertIs(prob.model.nonlinear_solver, solver)
+
+        # values are reset as in a full setup
+        assert_near_equal(prob['y1'], 1.0)
+
+        prob.run_driver()
+
+        expected = self._build(incremental=False)
+        expected.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        expected.setup()
+        expected.run_driver()
+
+        for name in ('x', 'z', 'obj'):
+            assert_near_equal(prob[name], expected[name], 1e-10)
+
+    def test_new_response(self):
+        prob = self._build()
+        outputs = prob.model._outputs
+
+        prob.model.add_constraint('con2', upper=0.0)
+        prob.setup()
+        prob['x'] = 2.0
+        prob.run_model()
+
+        self.assertIs(prob.model._outputs, outputs)
+        self.assertEqual(list(prob.model.get_constraints()), ['con_cmp1.con1', 'con_cmp2.con2'])
+        assert_near_equal(prob['x'], 2.0)
+
+        expected = self._build(incremental=False)
+        expected.model.add_constraint('con2', upper=0.0)
+        expected.setup()
+        expected['x'] = 2.0
+        expected.run_model()
+
+        J = prob.compute_totals()
+        expected_J = expected.compute_totals()
+        self.assertEqual(sorted(J), sorted(expected_J))
+        for key, val in expected_J.items():
+            assert_near_equal(J[key], val, 1e-8)
+
+    def test_solver_change(self):
+        prob = self._build()
+        outputs = prob.model._outputs
+
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        prob.model.linear_solver = om.DirectSolver()
+        prob.setup()
+        prob.run_model()
+
+        self.assertIs(prob.model._outputs, outputs)
+        assert_near_equal(prob['y1'], 25.58830273, 1e-6)
+
+        prob.model.nonlinear_solver.options['maxiter'] = 2
+        prob.model.nonlinear_solver.options['err_on_non_converge'] = True
+        prob.setup()
+        with self.assertRaises(om.AnalysisError):
+            prob.run_model()
+
+    def test_full_setup(self):
+        prob = self._build()
+        outputs = prob.model._outputs
+
+        prob.model.options['assembled_jac_type'] = 'dense'
+        prob.setup()
+        prob.final_setup()
+        self.assertIsNot(prob.model._outputs, outputs)
+
+        outputs = prob.model._outputs
+        prob.model.add_design_var('y2', vectorize_derivs=True)
+        prob.setup()
+        prob.final_setup()
+        self.assertIsNot(prob.model._outputs, outputs)
+
+    def test_not_incremental(self):
+        prob = self._build(incremental=False)
+        outputs = prob.model._outputs
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.setup()
+        prob.final_setup()
+
+        self.assertIsNot(prob.model._outputs, outputs)
+
+
 class SystemInTwoProblemsTestCase(unittest.TestCase):
     def test_2problems(self):
         prob = om.Problem()
@@ -1,11 +1,15 @@
 
 import unittest
+import json
+import time
 
-from openmdao.api import Problem, Group, ExecComp
+from openmdao.api import Problem, Group, ExecComp, CostModelAllocator
 from openmdao.api import Group, ParallelGroup, Problem, IndepVarComp, LinearBlockGS, \
     ExecComp, ExplicitComponent, PETScVector, ScipyKrylov, NonlinearBlockGS
+from openmdao.proc_allocators.proc_allocator import ProcAllocator
 from openmdao.utils.mpi import MPI
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.api import PETScVector
@@ -13,7 +17,8 @@ except:
     PETScVector = None
 
 
-def _build_model(nsubs, min_procs=None, max_procs=None, weights=None, top=None, mode='fwd'):
+def _build_model(nsubs, min_procs=None, max_procs=None, weights=None, top=None, mode='fwd',
+                 allocator=None):
     p = Problem()
     if min_procs is None:
         min_procs = [1]*nsubs
@@ -25,7 +30,7 @@ def _build_model(nsubs, min_procs=None, max_procs=None, weights=None, top=None,
     model = p.model
 
     model.add_subsystem('indep', IndepVarComp('x', 1.0))
-    par = model.add_subsystem('par', ParallelGroup())
+    par = model.add_subsystem('par', ParallelGroup(proc_allocator=allocator))
     for i in range(nsubs):
         par.add_subsystem("C%d" % i, ExecComp("y=2.0*x"),
                           min_procs=min_procs[i], max_procs=max_procs[i], proc_weight=weights[i])
@@ -52,6 +57,160 @@ def _get_which_procs(group):
     return MPI.COMM_WORLD.allgather(sub_inds)
 
 
+class SlowComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('delay', types=float)
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+
+    def compute(self, inputs, outputs):
+        time.sleep(self.options['delay'])
+        outputs['y'] = 2.0 * inputs['x']
+
+
+class AllgatherComm(object):
+    """
+    Comm of the given size that acts as if every proc has the same data.
+    """
+
+    def __init__(self, size):
+        self.rank = 0
+        self.size = size
+
+    def allgather(self, obj):
+        return [obj] * self.size
+
+
+@use_tempdirs
+class CostModelAllocatorTestCase(unittest.TestCase):
+
+    def test_measure_and_save(self):
+        allocator = CostModelAllocator('profile.json')
+
+        p = Problem()
+        par = p.model.add_subsystem('par', ParallelGroup(proc_allocator=allocator))
+        par.add_subsystem('slow', SlowComp(delay=0.02))
+        par.add_subsystem('fast', SlowComp(delay=0.0))
+        p.setup()
+
+        for i in range(3):
+            p.run_model()
+
+        allocator.save_profile()
+
+        with open('profile.json') as f:
+            profile = json.load(f)
+
+        self.assertEqual(list(profile), ['par'])
+        costs = profile['par']['costs']
+        self.assertEqual(sorted(costs), ['fast', 'slow'])
+        self.assertTrue(costs['slow'] > 0.06)
+        self.assertTrue(costs['slow'] > 10 * costs['fast'])
+
+        # no processors were divided, so there is no allocation to save
+        self.assertFalse('procs' in profile['par'])
+
+        # setting up again starts a new measurement, but keeps the other entries of the file
+        p.setup()
+        p.run_model()
+        profile['other'] = {'costs': {'a': 1.0}}
+        with open('profile.json', 'w') as f:
+            json.dump(profile, f)
+
+        allocator.save_profile()
+        with open('profile.json') as f:
+            profile = json.load(f)
+        self.assertEqual(sorted(profile), ['other', 'par'])
+        self.assertTrue(0.02 < profile['par']['costs']['slow'] < costs['slow'])
+
+    def test_weights(self):
+        names = ['C0', 'C1', 'C2']
+        proc_info = [(1, None, 1.0), (1, None, 1.0), (1, 2, 1.0)]
+        comm = AllgatherComm(4)
+
+        with open('profile.json', 'w') as f:
+            json.dump({'par': {'costs': {'C0': 3.0, 'C1': 1.0}, 'nproc': 4,
+                               'procs': {'C0': 2, 'C1': 1, 'C2': 1}}}, f)
+
+        allocator = CostModelAllocator()
+        info, from_costs = allocator._get_proc_info('par', names, proc_info, comm)
+        self.assertEqual(info, proc_info)
+        self.assertFalse(from_costs)
+
+        # a saved allocation for the same number of procs is reused
+        allocator = CostModelAllocator('profile.json')
+        info, from_costs = allocator._get_proc_info('par', names, proc_info, comm)
+        self.assertEqual(info, [(2, 2, 2.0), (1, 1, 1.0), (1, 1, 1.0)])
+        self.assertTrue(from_costs)
+
+        # otherwise the costs are used, with the mean cost for subsystems that have none
+        info, from_costs = allocator._get_proc_info('par', names, proc_info, AllgatherComm(5))
+        self.assertEqual(info, [(1, None, 3.0), (1, None, 1.0), (1, 2, 2.0)])
+        self.assertTrue(from_costs)
+
+        # measured costs take precedence over the profile
+        allocator._times = {'C0': 1.0, 'C1': 2.0, 'C2': 3.0}
+        info, from_costs = allocator._get_proc_info('par', names, proc_info, comm)
+        self.assertEqual(info, [(1, None, 4.0), (1, None, 8.0), (1, 2, 12.0)])
+        self.assertTrue(from_costs)
+
+    def test_no_profile_file(self):
+        allocator = CostModelAllocator()
+        with self.assertRaises(ValueError) as cm:
+            allocator.save_profile()
+        self.assertEqual(str(cm.exception), "CostModelAllocator: no profile file name was given.")
+
+
+class LegacyAllocator(ProcAllocator):
+    """
+    Allocator that overrides __call__ without the system argument.
+    """
+
+    def __call__(self, proc_info, nsubs, comm):
+        return super(LegacyAllocator, self).__call__(proc_info, nsubs, comm)
+
+
+class CustomAllocator(object):
+    """
+    Allocator that doesn't subclass ProcAllocator.
+    """
+
+    def __init__(self):
+        self.parallel = False
+        self.ncalls = 0
+
+    def __call__(self, proc_info, nsubs, comm):
+        self.ncalls += 1
+        return list(range(nsubs)), comm, (0, comm.size)
+
+
+class CustomAllocatorTestCase(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_legacy_allocator(self):
+        p = _build_model(nsubs=4, allocator=LegacyAllocator())
+
+        p.run_model()
+        assert_near_equal(p['objective.y'], 8.0)
+
+    def test_custom_allocator(self):
+        p = Problem()
+        model = p.model
+        sub = model.add_subsystem('sub', Group())
+        sub.add_subsystem('C0', ExecComp('y=2.0*x'))
+        allocator = sub._mpi_proc_allocator = CustomAllocator()
+
+        p.setup()
+        p.run_model()
+
+        assert_near_equal(p['sub.C0.y'], 2.0)
+        self.assertEqual(allocator.ncalls, 1 if MPI else 0)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class ProcTestCase2(unittest.TestCase):
 
@@ -157,6 +316,39 @@ class ProcTestCase3(unittest.TestCase):
         assert_near_equal(J['objective.y']['indep.x'][0][0], 8.0, 1e-6)
 
 
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+@use_tempdirs
+class ProcTestCase4(unittest.TestCase):
+
+    N_PROCS = 4
+
+    def test_cost_model(self):
+        if MPI.COMM_WORLD.rank == 0:
+            with open('profile.json', 'w') as f:
+                json.dump({'par': {'costs': {'C0': 3.0, 'C1': 1.0}}}, f)
+        MPI.COMM_WORLD.barrier()
+
+        allocator = CostModelAllocator('profile.json')
+        p = _build_model(nsubs=2, allocator=allocator)
+        all_inds = _get_which_procs(p.model.par)
+        self.assertEqual(all_inds, [[0], [0], [0], [1]])
+
+        p.run_model()
+        assert_near_equal(p['objective.y'], 4.0)
+
+        allocator.save_profile()
+        MPI.COMM_WORLD.barrier()
+
+        with open('profile.json') as f:
+            profile = json.load(f)
+        self.assertEqual(profile['par']['nproc'], 4)
+        self.assertEqual(profile['par']['procs'], {'C0': 3, 'C1': 1})
+
+        # the saved allocation is reused
+        p = _build_model(nsubs=2, allocator=CostModelAllocator('profile.json'))
+        self.assertEqual(_get_which_procs(p.model.par), [[0], [0], [0], [1]])
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class ProcTestCase5(unittest.TestCase):
 
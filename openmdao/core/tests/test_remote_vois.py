@@ -7,6 +7,7 @@ import random
 import openmdao.api as om
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.utils.assert_utils import assert_near_equal
 
 if MPI:
@@ -74,6 +75,78 @@ class RemoteVOITestCase(unittest.TestCase):
         assert_near_equal(J['par.G2.c', 'par.G2.x'], np.array([[1.0]]), 1e-6)
 
 
+class ArrayGroup(om.Group):
+
+    def initialize(self):
+        self.options.declare('scale', types=float)
+
+    def setup(self):
+        scale = self.options['scale']
+        self.add_subsystem('indep_var_comp', om.IndepVarComp('x', scale * np.arange(1., 4.)),
+                           promotes=['*'])
+        self.add_subsystem('Cc', om.ExecComp('c=x*%g' % scale, c=np.ones(3), x=np.ones(3)),
+                           promotes=['*'])
+
+        self.add_design_var('x', indices=[2, 0])
+        self.add_constraint('c', indices=[1, 2], upper=100.)
+
+
+class DistribComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options['distributed'] = True
+
+    def setup(self):
+        sizes, offsets = evenly_distrib_idxs(self.comm.size, 7)
+        start = offsets[self.comm.rank]
+        self.add_output('y', np.arange(start, start + sizes[self.comm.rank], dtype=float))
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class RemoteVOIGatherTestCase(unittest.TestCase):
+
+    N_PROCS = 3
+
+    def test_gathered_values(self):
+        prob = om.Problem()
+        model = prob.model
+
+        par = model.add_subsystem('par', om.ParallelGroup())
+        for i in range(3):
+            par.add_subsystem('G%d' % i, ArrayGroup(scale=i + 1.))
+
+        model.add_subsystem('D', DistribComp())
+        model.add_subsystem('Obj', om.ExecComp('obj=y1+y2'))
+        model.connect('par.G1.c', 'Obj.y1', src_indices=[0])
+        model.connect('par.G2.c', 'Obj.y2', src_indices=[0])
+
+        model.add_objective('Obj.obj')
+        model.add_constraint('D.y', upper=10., indices=[6, 0, 3])
+        model.add_constraint('par.G0.x', upper=10., scaler=2.)
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(sorted(n for n, plan in prob.driver._voi_gather_plans.items()
+                                if plan is not None), ['con', 'desvar'])
+
+        dvs = prob.driver.get_design_var_values()
+        for i in range(3):
+            assert_near_equal(dvs['par.G%d.x' % i], (i + 1.) * np.array([3., 1.]), 1e-15)
+
+        cons = prob.driver.get_constraint_values()
+        for i in range(3):
+            assert_near_equal(cons['par.G%d.c' % i], (i + 1.) ** 2 * np.array([2., 3.]), 1e-15)
+        # the parts of a distributed constraint are ordered by rank
+        assert_near_equal(cons['D.y'], np.array([0., 3., 6.]), 1e-15)
+        assert_near_equal(cons['par.G0.x'], np.array([2., 4., 6.]), 1e-15)
+
+        objs = prob.driver.get_objective_values()
+        assert_near_equal(objs['Obj.obj'], 13., 1e-15)
+
+        assert_near_equal(prob.get_val('par.G2.c', get_remote=True), np.array([9., 18., 27.]))
+
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
@@ -250,6 +250,43 @@ class TestScaling(unittest.TestCase):
         assert_near_equal(prob['sys2.new_length'], 3.e-1)
         assert_near_equal(prob.model._outputs['sys2.new_length'], 3.e-1)
 
+    def test_simplified_scaling_arrays(self):
+        group = om.Group()
+        group.add_subsystem('sys1', om.IndepVarComp('old_length', 1.0, units='mm'))
+        group.add_subsystem('sys2', PassThroughLength())
+        group.connect('sys1.old_length', 'sys2.old_length')
+
+        prob = om.Problem(group)
+        prob.setup()
+        prob['sys1.old_length'] = 3.e5
+        prob.run_model()
+
+        # mm to cm has no offset, so only the input factors are applied
+        inputs = prob.model._inputs
+        for scale_to in ('phys', 'norm'):
+            adder, scaler = inputs._active_scaling[scale_to]
+            self.assertIsNone(adder)
+            self.assertIsNotNone(scaler)
+            adder, scaler = prob.model._vectors['input']['linear']._active_scaling[scale_to]
+            self.assertIsNone(adder)
+            self.assertIsNotNone(scaler)
+
+        # output scaling only exists because of the ref on new_length
+        adder, scaler = prob.model._outputs._active_scaling['phys']
+        self.assertIsNone(adder)
+        assert_near_equal(scaler, [1., 0.1])
+
+        # the scaling recorded with the system metadata still has every array
+        adder, scaler = inputs._scaling['phys']
+        assert_near_equal(adder, [0.])
+        assert_near_equal(scaler, [0.1])
+        adder, scaler = prob.model._outputs._scaling['phys']
+        assert_near_equal(adder, [0., 0.])
+        assert_near_equal(scaler, [1., 0.1])
+
+        assert_near_equal(prob['sys2.old_length'], 3.e4)
+        assert_near_equal(prob['sys2.new_length'], 3.e-1)
+
     def test_speed(self):
         comp = om.IndepVarComp()
         comp.add_output('distance', 1., units='km')
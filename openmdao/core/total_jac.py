@@ -14,6 +14,7 @@ from openmdao.vectors.vector import INT_DTYPE
 from openmdao.utils.general_utils import ContainsAll, simple_warning
 from openmdao.utils.mpi import MPI
 from openmdao.utils.coloring import _initialize_model_approx, Coloring
+from openmdao.solvers.linear.direct import DirectSolver
 
 # Attempt to import petsc4py.
 # If OPENMDAO_REQUIRE_MPI is set to a recognized positive value, attempt import
@@ -35,6 +36,9 @@ else:
 
 _contains_all = ContainsAll()
 
+# maximum number of entries in the right-hand side matrix of a single block solve
+_MAX_BLOCK_SOLVE_SIZE = 2 ** 22
+
 
 class _TotalJacInfo(object):
     """
@@ -1325,10 +1329,17 @@ class _TotalJacInfo(object):
         model._linear_solver._linearize()
         self.J[:] = 0.0
 
+        block_iters = self._get_block_solve_iters()
+
         # Main loop over columns (fwd) or rows (rev) of the jacobian
         for mode in self.idx_iter_dict:
             for key, idx_info in self.idx_iter_dict[mode].items():
                 imeta, idx_iter = idx_info
+
+                if idx_iter in block_iters and not any(tup[2] for tup in self.in_idx_map[mode]):
+                    self._block_solve(list(idx_iter(imeta, mode)), mode)
+                    continue
+
                 for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
                     rel_systems, vec_names, cache_key = input_setter(inds, itermeta, mode)
 
@@ -1381,6 +1392,100 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _get_block_solve_iters(self):
+        """
+        Return the outer loop iterators whose linear solves can be done as a single block solve.
+
+        This is only possible when the model's linear solver is a DirectSolver, since the
+        solution of all seeds can then be found with one LU back-substitution using a matrix
+        right-hand side.
+
+        Returns
+        -------
+        list
+            Iterator methods that can be replaced by a block solve.
+        """
+        model = self.model
+        solver = model._linear_solver
+
+        if (not isinstance(solver, DirectSolver) or not solver.options['multi_rhs_totals'] or
+                self.debug_print or self.comm.size > 1 or model._owns_approx_jac or
+                model._lin_vec_names != ['linear']):
+            return []
+
+        # The seeds and solutions would have to be converted between the scaled and unscaled
+        # spaces the way System._solve_linear does it, so use the per-seed solves instead.
+        if model._has_output_scaling or model._has_resid_scaling:
+            return []
+
+        return [self.single_index_iter, self.simul_coloring_iter]
+
+    def _block_solve(self, iters, mode):
+        """
+        Solve for multiple seeds at once and set the results into the total jacobian.
+
+        Parameters
+        ----------
+        iters : list
+            Tuples of the form (inds, input_setter, jac_setter, itermeta) for each seed.
+        mode : str
+            Direction of derivative solution.
+        """
+        solver = self.model._linear_solver
+        loc_idxs = self.in_loc_idxs[mode]
+        seeds = self.seeds[mode]
+        deriv_idxs, jac_idxs, _ = self.sol2jac_map[mode]
+        deriv_idxs = deriv_idxs['linear']
+        jac_inds = jac_idxs['linear']
+
+        if self.simul_coloring is not None:
+            row_col_map = self.simul_coloring.get_row_col_map(mode)
+
+        # in rev mode, the rows of J are set from the solution instead of the columns
+        J = self.J if mode == 'fwd' else self.J.T
+        nrows = J.shape[0]
+        size = self.input_vec[mode]['linear']._data.size
+        chunk = max(1, _MAX_BLOCK_SOLVE_SIZE // max(size, 1))
+
+        for start in range(0, len(iters), chunk):
+            chunk_iters = iters[start:start + chunk]
+
+            # stack the seeds of each solve into the columns of the right-hand side
+            rhs = np.zeros((size, len(chunk_iters)))
+            for j, (inds, _, _, itermeta) in enumerate(chunk_iters):
+                if itermeta is None:
+                    i = inds if np.isscalar(inds) else inds[0]
+                    if loc_idxs[i] >= 0:
+                        rhs[loc_idxs[i], j] = seeds[i]
+                else:
+                    rhs[itermeta['local_in_idxs'], j] = itermeta['seeds']
+
+            sol = solver._solve_block(rhs, mode)[deriv_idxs]
+
+            full_inds = []
+            full_cols = []
+            color_rows = []
+            color_inds = []
+            color_cols = []
+
+            for j, (inds, _, jac_setter, _) in enumerate(chunk_iters):
+                if jac_setter == self.single_jac_setter:
+                    full_inds.append(inds)
+                    full_cols.append(j)
+                else:
+                    for i in inds:
+                        rows = np.arange(nrows, dtype=INT_DTYPE)[row_col_map[i]]
+                        color_rows.append(rows)
+                        color_inds.append(np.full(rows.size, i, dtype=INT_DTYPE))
+                        color_cols.append(np.full(rows.size, j, dtype=INT_DTYPE))
+
+            if full_inds:
+                J[np.ix_(jac_inds, full_inds)] = sol[:, full_cols]
+
+            if color_rows:
+                rows = np.hstack(color_rows)
+                J[rows, np.hstack(color_inds)] = sol[rows, np.hstack(color_cols)]
+
     def compute_totals_approx(self, initialize=False):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
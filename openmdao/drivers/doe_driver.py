@@ -10,8 +10,10 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent import local_pool, concurrent_eval_pool
 
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.hdf5_recorder import HDF5Recorder
 
 
 class DOEDriver(Driver):
@@ -73,9 +75,14 @@ class DOEDriver(Driver):
         self.options.declare('generator', types=(DOEGenerator), default=DOEGenerator(),
                              desc='The case generator. If default, no cases are generated.')
         self.options.declare('run_parallel', types=bool, default=False,
-                             desc='Set to True to execute cases in parallel.')
+                             desc='Set to True to execute cases in parallel. When MPI is not '
+                             'active, cases are run in a pool of local processes.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('num_local_procs', types=int, default=1, lower=0,
+                             desc='Number of local processes used to run cases in parallel when '
+                             'run_parallel is True and MPI is not active. If 0, one process '
+                             'is used per CPU.')
 
     def _setup_comm(self, comm):
         """
@@ -161,12 +168,74 @@ class DOEDriver(Driver):
         else:
             case_gen = self.options['generator']
 
+        num_procs = self._get_num_local_procs()
+        if num_procs > 1:
+            self._run_local_cases(case_gen(self._designvars, self._problem().model), num_procs)
+            return False
+
         for case in case_gen(self._designvars, self._problem().model):
             self._run_case(case)
             self.iter_count += 1
 
+        if self._comm:
+            # procs may run different numbers of cases, so recorders that write collectively
+            # must wait for the other procs to finish
+            for recorder in self._recorders:
+                if isinstance(recorder, HDF5Recorder):
+                    recorder._finish_recording()
+
         return False
 
+    def _run_local_cases(self, cases, num_procs):
+        """
+        Run cases in a pool of local processes and record them as they complete.
+
+        Parameters
+        ----------
+        cases : iter of list
+            The cases, as lists of name, value tuples for the design variables.
+        num_procs : int
+            The number of local processes.
+        """
+        self._check_local_recording()
+
+        pool = local_pool(self._run_local_case, num_procs, self._setup_local_worker)
+        try:
+            for result, err in concurrent_eval_pool(pool, (((case,), None) for case in cases)):
+                if err is not None:
+                    raise RuntimeError("{}: A case failed in a local process:\n{}".format(
+                                       self.msginfo, err))
+
+                metadata, state = result
+                self._set_model_state(state)
+                with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+                    # save reference to metadata for use in record_iteration
+                    self._metadata = metadata
+
+                self.iter_count += 1
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _run_local_case(self, case):
+        """
+        Run case in a local worker process without recording it.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        dict
+            Metadata of the case, marking whether it failed.
+        tuple
+            The values of all variables in the model after running the case.
+        """
+        self._set_case(case)
+        return self._run_model(), self._get_model_state()
+
     def _run_case(self, case):
         """
         Run case, save exception info and mark the metadata if the case fails.
@@ -176,8 +245,21 @@ class DOEDriver(Driver):
         case : list
             list of name, value tuples for the design variables.
         """
-        metadata = {}
+        self._set_case(case)
 
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+            # save reference to metadata for use in record_iteration
+            self._metadata = self._run_model()
+
+    def _set_case(self, case):
+        """
+        Set the design variables to the values of a case.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
         for dv_name, dv_val in case:
             try:
                 msg = None
@@ -188,21 +270,30 @@ class DOEDriver(Driver):
                 if msg:
                     raise(ValueError(msg))
 
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-            try:
-                self._problem().model.run_solve_nonlinear()
-                metadata['success'] = 1
-                metadata['msg'] = ''
-            except AnalysisError:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-            except Exception:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-                print(metadata['msg'])
+    def _run_model(self):
+        """
+        Run the model, saving exception info if it fails.
 
-            # save reference to metadata for use in record_iteration
-            self._metadata = metadata
+        Returns
+        -------
+        dict
+            Metadata of the case, marking whether it failed.
+        """
+        metadata = {}
+
+        try:
+            self._problem().model.run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+
+        return metadata
 
     def _parallel_generator(self, design_vars, model=None):
         """
@@ -254,9 +345,9 @@ class DOEDriver(Driver):
             for recorder in self._recorders:
                 recorder._parallel = True
 
-                # if SqliteRecorder, write cases only on procs up to the number
-                # of parallel DOEs (i.e. on the root procs for the cases)
-                if isinstance(recorder, SqliteRecorder):
+                # if SqliteRecorder or HDF5Recorder, write cases only on procs up to the
+                # number of parallel DOEs (i.e. on the root procs for the cases)
+                if isinstance(recorder, (SqliteRecorder, HDF5Recorder)):
                     if procs_per_model == 1:
                         recorder._record_on_proc = True
                     else:
@@ -28,9 +28,16 @@ from pyDOE2 import lhs
 
 import openmdao
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.core.component import Component
+from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.core.indepvarcomp import IndepVarComp
+from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
+from openmdao.utils.array_utils import convert_neg, _flatten_src_indices
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb, local_pool, \
+    concurrent_eval_pool
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
+from openmdao.vectors.vector import INT_DTYPE
 
 
 class SimpleGADriver(Driver):
@@ -39,6 +46,10 @@ class SimpleGADriver(Driver):
 
     Attributes
     ----------
+    _batched_comps : list
+        For each component run in a batched evaluation of a generation, the component, the slices
+        of its inputs and outputs in the model data arrays, and the indices of the model data
+        transferred from outputs to its inputs.
     _concurrent_pop_size : int
         Number of points to run concurrently when model is a parallel one.
     _concurrent_color : int
@@ -48,6 +59,9 @@ class SimpleGADriver(Driver):
         design variables.
     _ga : <GeneticAlgorithm>
         Main genetic algorithm lies here.
+    _pool : multiprocessing.pool.Pool or None
+        Pool of local processes that evaluate the points of a generation when running in
+        parallel without MPI.
     _randomstate : np.random.RandomState, int
          Random state (or seed-number) which controls the seed and random draws.
     """
@@ -78,6 +92,8 @@ class SimpleGADriver(Driver):
 
         self._desvar_idx = {}
         self._ga = None
+        self._pool = None
+        self._batched_comps = None
 
         # random state can be set for predictability during testing
         if 'SimpleGADriver_seed' in os.environ:
@@ -113,9 +129,21 @@ class SimpleGADriver(Driver):
                              desc='Number of points in the GA. Set to 0 and it will be computed '
                              'as four times the number of bits.')
         self.options.declare('run_parallel', types=bool, default=False,
-                             desc='Set to True to execute the points in a generation in parallel.')
+                             desc='Set to True to execute the points in a generation in parallel. '
+                             'When MPI is not active, the points are run in a pool of local '
+                             'processes.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('num_local_procs', types=int, default=1, lower=0,
+                             desc='Number of local processes used to execute the points in a '
+                             'generation in parallel when run_parallel is True and MPI is not '
+                             'active. If 0, one process is used per CPU.')
+        self.options.declare('batched_population', types=bool, default=False,
+                             desc='If True, evaluate all points in a generation in a single '
+                             'batched run of the model. This requires a serial model without '
+                             'solvers whose components, other than IndepVarComps, are explicit '
+                             'components with the batched_fd option set. Points of a batched '
+                             'run are only recorded by the recorders attached to the driver.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -149,7 +177,8 @@ class SimpleGADriver(Driver):
         comm = problem.comm
         if self._concurrent_pop_size > 0:
             model_mpi = (self._concurrent_pop_size, self._concurrent_color)
-        elif not self.options['run_parallel']:
+        elif not (MPI and self.options['run_parallel']):
+            # without MPI, parallel points are run in a pool of local processes instead
             comm = None
 
         self._ga = GeneticAlgorithm(self.objective_callback, comm=comm, model_mpi=model_mpi)
@@ -293,9 +322,29 @@ class SimpleGADriver(Driver):
         if pop_size == 0:
             pop_size = 4 * np.sum(bits)
 
-        desvar_new, obj, nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
-                                              bits, pop_size, max_gen,
-                                              self._randomstate, Pm, Pc)
+        num_procs = self._get_num_local_procs()
+        if self.options['batched_population']:
+            if self.options['run_parallel']:
+                raise RuntimeError("{}: The 'batched_population' and 'run_parallel' options "
+                                   "can't both be True.".format(self.msginfo))
+            self._setup_batched_eval()
+            ga.pop_eval = self._eval_batched_cases
+        elif num_procs > 1:
+            self._check_local_recording()
+            self._pool = local_pool(self._run_local_case, num_procs, self._setup_local_worker)
+            ga.pop_eval = self._eval_local_cases
+
+        try:
+            desvar_new, obj, nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
+                                                  bits, pop_size, max_gen,
+                                                  self._randomstate, Pm, Pc)
+        finally:
+            ga.pop_eval = None
+            self._batched_comps = None
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
 
         # Pull optimal parameters back into framework and re-run, so that
         # framework is left in the right final state
@@ -312,6 +361,190 @@ class SimpleGADriver(Driver):
 
         return False
 
+    def _run_local_case(self, x, icase):
+        """
+        Evaluate the objective at the requested point in a local worker process.
+
+        Parameters
+        ----------
+        x : ndarray
+            Value of design variables.
+        icase : int
+            Case number, used for identification.
+
+        Returns
+        -------
+        tuple
+            The objective value, success flag and case number.
+        tuple
+            The values of all variables in the model after evaluating the point.
+        """
+        return self.objective_callback(x, icase), self._get_model_state()
+
+    def _eval_local_cases(self, cases):
+        """
+        Evaluate the objective at multiple points in the local process pool and record them.
+
+        Parameters
+        ----------
+        cases : list
+            Entries of the form ((x, icase), None).
+
+        Returns
+        -------
+        list
+            The objective value, success flag and case number, or None if the evaluation
+            failed, and the traceback of the failure, or None, for each case.
+        """
+        results = []
+        for result, err in concurrent_eval_pool(self._pool, cases):
+            if result is not None:
+                result, state = result
+                self._set_model_state(state)
+                with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+                    self.iter_count += 1
+                    rec.abs = 0.0
+                    rec.rel = 0.0
+            results.append((result, err))
+
+        return results
+
+    def _setup_batched_eval(self):
+        """
+        Check that the model can be run in batches and compute the transfers for a batched run.
+        """
+        model = self._problem().model
+
+        if model.comm.size > 1:
+            raise RuntimeError("{}: The 'batched_population' option requires a model that runs "
+                               "on a single process.".format(self.msginfo))
+
+        for system in model.system_iter(recurse=True, include_self=True):
+            if system._discrete_inputs or system._discrete_outputs:
+                raise RuntimeError("{}: The 'batched_population' option doesn't support discrete "
+                                   "variables, but '{}' has discrete variables."
+                                   .format(self.msginfo, system.pathname))
+            if not isinstance(system, Component):
+                if not isinstance(system.nonlinear_solver, NonlinearRunOnce):
+                    raise RuntimeError("{}: The 'batched_population' option requires all groups "
+                                       "to use NonlinearRunOnce, but '{}' uses {}."
+                                       .format(self.msginfo, system.pathname or '<model>',
+                                               type(system.nonlinear_solver).__name__))
+
+        in_slices = model._inputs.get_slice_dict()
+        out_slices = model._outputs.get_slice_dict()
+        abs2meta = model._var_abs2meta
+        allprocs_abs2meta = model._var_allprocs_abs2meta
+        conns = model._conn_global_abs_in2out
+
+        self._batched_comps = batched = []
+        for comp in model.system_iter(recurse=True, typ=Component):
+            if isinstance(comp, IndepVarComp):
+                continue
+            if not isinstance(comp, ExplicitComponent) or not comp.options['batched_fd']:
+                raise RuntimeError("{}: The 'batched_population' option requires explicit "
+                                   "components with the 'batched_fd' option set, but '{}' "
+                                   "doesn't support batched evaluation."
+                                   .format(self.msginfo, comp.pathname))
+            if comp._has_input_scaling or comp._has_output_scaling or comp._has_resid_scaling:
+                raise RuntimeError("{}: The 'batched_population' option doesn't support scaling "
+                                   "or unit conversion, but '{}' has scaled variables."
+                                   .format(self.msginfo, comp.pathname))
+
+            comp_ins = comp._var_abs_names['input']
+            comp_outs = comp._var_abs_names['output']
+            in_slice = slice(in_slices[comp_ins[0]].start, in_slices[comp_ins[-1]].stop) \
+                if comp_ins else slice(0, 0)
+            out_slice = slice(out_slices[comp_outs[0]].start, out_slices[comp_outs[-1]].stop)
+
+            xfer_in = []
+            xfer_out = []
+            for abs_in in comp_ins:
+                if abs_in not in conns:
+                    continue
+                abs_out = conns[abs_in]
+                meta_in = abs2meta[abs_in]
+                meta_out = allprocs_abs2meta[abs_out]
+
+                src_indices = meta_in['src_indices']
+                if src_indices is None:
+                    src_indices = np.arange(meta_in['size'], dtype=INT_DTYPE)
+                elif src_indices.ndim == 1:
+                    src_indices = convert_neg(src_indices, meta_out['global_size'])
+                else:
+                    src_indices = _flatten_src_indices(src_indices, meta_in['shape'],
+                                                       meta_out['global_shape'],
+                                                       meta_out['global_size'])
+
+                start = in_slices[abs_in].start
+                xfer_in.append(np.arange(start, start + meta_in['size'], dtype=INT_DTYPE))
+                xfer_out.append(src_indices + out_slices[abs_out].start)
+
+            if xfer_in:
+                xfer_in = np.concatenate(xfer_in)
+                xfer_out = np.concatenate(xfer_out)
+            else:
+                xfer_in = xfer_out = None
+
+            batched.append((comp, in_slice, out_slice, xfer_in, xfer_out))
+
+    def _eval_batched_cases(self, cases):
+        """
+        Evaluate the objective at multiple points in a single batched run of the model.
+
+        Each point is recorded afterwards as if it had been run on its own. If the batched run
+        fails, the points are evaluated one at a time.
+
+        Parameters
+        ----------
+        cases : list
+            Entries of the form ((x, icase), None).
+
+        Returns
+        -------
+        list
+            The objective value, success flag and case number for each case, along with a
+            traceback that is always None.
+        """
+        if not cases:
+            return []
+
+        model = self._problem().model
+        npts = len(cases)
+
+        # stack the model data for each point, with the design variables set
+        inputs = np.empty((npts, model._inputs._data.size))
+        outputs = np.empty((npts, model._outputs._data.size))
+        for k, ((x, icase), _) in enumerate(cases):
+            for name in self._designvars:
+                i, j = self._desvar_idx[name]
+                self.set_design_var(name, x[i:j])
+            inputs[k] = model._inputs._data
+            outputs[k] = model._outputs._data
+
+        try:
+            for comp, in_slice, out_slice, xfer_in, xfer_out in self._batched_comps:
+                if xfer_in is not None:
+                    inputs[:, xfer_in] = outputs[:, xfer_out]
+                outputs[:, out_slice] += comp._apply_nonlinear_batched(inputs[:, in_slice],
+                                                                       outputs[:, out_slice])
+        except AnalysisError:
+            # find out which points fail by running them separately
+            return [(self.objective_callback(x, icase), None) for (x, icase), _ in cases]
+
+        residuals = np.zeros(model._residuals._data.size)
+        results = []
+        for k, ((x, icase), _) in enumerate(cases):
+            self._set_model_state((inputs[k], outputs[k], residuals, {}, {}))
+            with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+                self.iter_count += 1
+                fun = self._get_fitness()
+                rec.abs = 0.0
+                rec.rel = 0.0
+            results.append(((fun, 1, icase), None))
+
+        return results
+
     def objective_callback(self, x, icase):
         r"""
         Evaluate problem objective at the requested point.
@@ -385,32 +618,10 @@ class SimpleGADriver(Driver):
         model = self._problem().model
         success = 1
 
-        objs = self.get_objective_values()
-        nr_objectives = len(objs)
-
-        # Single objective, if there is only one objective, which has only one element
-        if nr_objectives > 1:
-            is_single_objective = False
-        else:
-            for obj in objs.items():
-                is_single_objective = len(obj) == 1
-                break
-
-        obj_exponent = self.options['multi_obj_exponent']
-        if self.options['multi_obj_weights']:  # not empty
-            obj_weights = self.options['multi_obj_weights']
-        else:
-            # Same weight for all objectives, if not specified
-            obj_weights = {name: 1. for name in objs.keys()}
-        sum_weights = sum(obj_weights.values())
-
         for name in self._designvars:
             i, j = self._desvar_idx[name]
             self.set_design_var(name, x[i:j])
 
-        # a very large number, but smaller than the result of nan_to_num in Numpy
-        almost_inf = openmdao.INF_BOUND
-
         # Execute the model
         with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             self.iter_count += 1
@@ -422,57 +633,91 @@ class SimpleGADriver(Driver):
                 model._clear_iprint()
                 success = 0
 
-            obj_values = self.get_objective_values()
-            if is_single_objective:  # Single objective optimization
-                for i in obj_values.values():
-                    obj = i  # First and only key in the dict
-            else:  # Multi-objective optimization with weighted sums
-                weighted_objectives = np.array([])
-                for name, val in obj_values.items():
-                    # element-wise multiplication with scalar
-                    # takes the average, if an objective is a vector
-                    try:
-                        weighted_obj = val * obj_weights[name] / val.size
-                    except KeyError:
-                        msg = ('Name "{}" in "multi_obj_weights" option '
-                               'is not an absolute name of an objective.')
-                        raise KeyError(msg.format(name))
-                    weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
-
-                obj = sum(weighted_objectives / sum_weights)**obj_exponent
-
-            # Parameters of the penalty method
-            penalty = self.options['penalty_parameter']
-            exponent = self.options['penalty_exponent']
-
-            if penalty == 0:
-                fun = obj
-            else:
-                constraint_violations = np.array([])
-                for name, val in self.get_constraint_values().items():
-                    con = self._cons[name]
-                    # The not used fields will either None or a very large number
-                    if (con['lower'] is not None) and np.any(con['lower'] > -almost_inf):
-                        diff = val - con['lower']
-                        violation = np.array([0. if d >= 0 else abs(d) for d in diff])
-                    elif (con['upper'] is not None) and np.any(con['upper'] < almost_inf):
-                        diff = val - con['upper']
-                        violation = np.array([0. if d <= 0 else abs(d) for d in diff])
-                    elif (con['equals'] is not None) and np.any(np.abs(con['equals']) < almost_inf):
-                        diff = val - con['equals']
-                        violation = np.absolute(diff)
-                    constraint_violations = np.hstack((constraint_violations, violation))
-                fun = obj + penalty * sum(np.power(constraint_violations, exponent))
+            fun = self._get_fitness()
+
             # Record after getting obj to assure they have
             # been gathered in MPI.
             rec.abs = 0.0
             rec.rel = 0.0
 
-        # print("Functions calculated")
-        # print(x)
-        # print(obj)
         return fun, success, icase
 
+    def _get_fitness(self):
+        """
+        Compute the penalized objective from the current values of the model.
+
+        See objective_callback for the definition of the penalized objective.
+
+        Returns
+        -------
+        float
+            Penalized objective value.
+        """
+        obj_values = self.get_objective_values()
+        nr_objectives = len(obj_values)
+
+        # Single objective, if there is only one objective, which has only one element
+        if nr_objectives > 1:
+            is_single_objective = False
+        else:
+            for obj in obj_values.items():
+                is_single_objective = len(obj) == 1
+                break
+
+        obj_exponent = self.options['multi_obj_exponent']
+        if self.options['multi_obj_weights']:  # not empty
+            obj_weights = self.options['multi_obj_weights']
+        else:
+            # Same weight for all objectives, if not specified
+            obj_weights = {name: 1. for name in obj_values.keys()}
+        sum_weights = sum(obj_weights.values())
+
+        # a very large number, but smaller than the result of nan_to_num in Numpy
+        almost_inf = openmdao.INF_BOUND
+
+        if is_single_objective:  # Single objective optimization
+            for i in obj_values.values():
+                obj = i  # First and only key in the dict
+        else:  # Multi-objective optimization with weighted sums
+            weighted_objectives = np.array([])
+            for name, val in obj_values.items():
+                # element-wise multiplication with scalar
+                # takes the average, if an objective is a vector
+                try:
+                    weighted_obj = val * obj_weights[name] / val.size
+                except KeyError:
+                    msg = ('Name "{}" in "multi_obj_weights" option '
+                           'is not an absolute name of an objective.')
+                    raise KeyError(msg.format(name))
+                weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
+
+            obj = sum(weighted_objectives / sum_weights)**obj_exponent
+
+        # Parameters of the penalty method
+        penalty = self.options['penalty_parameter']
+        exponent = self.options['penalty_exponent']
+
+        if penalty == 0:
+            fun = obj
+        else:
+            constraint_violations = np.array([])
+            for name, val in self.get_constraint_values().items():
+                con = self._cons[name]
+                # The not used fields will either None or a very large number
+                if (con['lower'] is not None) and np.any(con['lower'] > -almost_inf):
+                    diff = val - con['lower']
+                    violation = np.array([0. if d >= 0 else abs(d) for d in diff])
+                elif (con['upper'] is not None) and np.any(con['upper'] < almost_inf):
+                    diff = val - con['upper']
+                    violation = np.array([0. if d <= 0 else abs(d) for d in diff])
+                elif (con['equals'] is not None) and np.any(np.abs(con['equals']) < almost_inf):
+                    diff = val - con['equals']
+                    violation = np.absolute(diff)
+                constraint_violations = np.hstack((constraint_violations, violation))
+            fun = obj + penalty * sum(np.power(constraint_violations, exponent))
+
+        return fun
+
 
 class GeneticAlgorithm(object):
     """
@@ -503,6 +748,10 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    pop_eval : function or None
+        If not None, a function that evaluates the objective for a list of cases at once, used
+        instead of objfun. Cases are of the form ((x, icase), None) and the results are returned
+        in the form (returns, traceback), as for concurrent_eval.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -529,6 +778,7 @@ class GeneticAlgorithm(object):
         self.gray_code = False
         self.cross_bits = False
         self.model_mpi = model_mpi
+        self.pop_eval = None
 
     def execute_ga(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state, Pm=None, Pc=0.5):
         """
@@ -593,25 +843,36 @@ class GeneticAlgorithm(object):
             x_pop = self.decode(old_gen, vlb, vub, bits)
 
             # Evaluate fitness of points in this generation.
-            if comm is not None:
+            if comm is not None or self.pop_eval is not None:
                 # Parallel
 
-                # Since GA is random, ranks generate different new populations, so just take one
-                # and use it on all.
-                x_pop = comm.bcast(x_pop, root=0)
+                if comm is not None:
+                    # Since GA is random, ranks generate different new populations, so just take
+                    # one and use it on all.
+                    x_pop = comm.bcast(x_pop, root=0)
 
                 cases = [((item, ii), None) for ii, item in enumerate(x_pop)
                          if np.all(item - vob <= 0)]
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
-
-                results = concurrent_eval(self.objfun, cases, comm, allgather=True,
-                                          model_mpi=self.model_mpi)
+                if self.pop_eval is not None:
+                    results = self.pop_eval(cases)
+                elif comm.size > 2 and (self.model_mpi is None or
+                                        self.model_mpi[0] == comm.size):
+                    # Every rank owns a whole model, so rank 0 can send a new point to each rank
+                    # as soon as it has finished its last one, and ranks aren't left idle when
+                    # evaluation times vary. Rank 0 doesn't evaluate points itself, which only
+                    # pays off with more than 2 procs.
+                    results = concurrent_eval_lb(self.objfun, cases, comm, broadcast=True)
+                else:
+                    # Pad the cases with some dummy cases to make the cases divisible amongst the
+                    # procs.
+                    extra = len(cases) % comm.size
+                    if extra > 0:
+                        for j in range(comm.size - extra):
+                            cases.append(cases[-1])
+
+                    results = concurrent_eval(self.objfun, cases, comm, allgather=True,
+                                              model_mpi=self.model_mpi)
 
                 fitness[:] = np.inf
                 for result in results:
@@ -8,6 +8,7 @@ import shutil
 import tempfile
 import csv
 import json
+import multiprocessing
 
 import numpy as np
 
@@ -17,7 +18,7 @@ from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.paraboloid_distributed import DistParab
 from openmdao.test_suite.groups.parallel_groups import FanInGrouped
 
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import run_driver, printoptions
 
 from openmdao.utils.mpi import MPI
@@ -1431,6 +1432,160 @@ class TestParallelDOE(unittest.TestCase):
         self.assertEqual(sum(num_cases), len(expected))
 
 
+@unittest.skipIf(MPI, "Local process pools are only used when MPI is not active.")
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "Local process pools require the 'fork' start method.")
+class TestLocalParallelDOE(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='TestDOEDriver-')
+        os.chdir(self.tempdir)
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def run_doe(self, run_parallel, filename):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=4),
+                                   run_parallel=run_parallel, num_local_procs=3)
+        prob.driver.add_recorder(om.SqliteRecorder(filename))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        return om.CaseReader(filename)
+
+    def test_local_procs(self):
+        expected = self.run_doe(False, 'serial.sql')
+        cr = self.run_doe(True, 'parallel.sql')
+
+        expected_cases = expected.get_cases()
+        cases = cr.get_cases()
+
+        # cases are recorded by this process, in the order they were generated
+        self.assertEqual(len(cases), 16)
+        self.assertEqual([case.name for case in cases], [case.name for case in expected_cases])
+        for case, expected_case in zip(cases, expected_cases):
+            for name in ('x', 'y', 'f_xy'):
+                assert_near_equal(case[name], expected_case[name], 1e-15)
+
+    def test_local_procs_failed_case(self):
+        class FailComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 0.0)
+                self.add_output('y', 0.0)
+
+            def compute(self, inputs, outputs):
+                if inputs['x'] > 0.5:
+                    raise om.AnalysisError('x is too large')
+                outputs['y'] = 2.0 * inputs['x']
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('comp', FailComp(), promotes=['x', 'y'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_objective('y')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=5),
+                                   run_parallel=True, num_local_procs=2)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cases = om.CaseReader('cases.sql').get_cases()
+        self.assertEqual([case.success for case in cases], [1, 1, 1, 0, 0])
+        self.assertTrue('x is too large' in cases[-1].msg)
+        assert_near_equal(cases[2]['y'], 1.0, 1e-15)
+
+    def test_model_recorder_warning(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+        model.add_recorder(om.SqliteRecorder('model_cases.sql'))
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=2),
+                                   run_parallel=True, num_local_procs=2)
+        prob.setup()
+
+        msg = ("DOEDriver: Cases run in local processes are only recorded by the recorders "
+               "attached to the driver. Recorders attached to systems and solvers will not "
+               "record them.")
+        with assert_warning(UserWarning, msg):
+            prob.run_driver()
+        prob.cleanup()
+
+    def test_local_procs_opt_in(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('comp', om.ExecComp('y = 2.0*x'), promotes=['x', 'y'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_objective('y')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), run_parallel=True)
+        prob.setup()
+
+        # cases are only run in local processes if num_local_procs is set
+        self.assertEqual(prob.driver._get_num_local_procs(), 1)
+
+        prob.driver.options['num_local_procs'] = 0
+        self.assertEqual(prob.driver._get_num_local_procs(), os.cpu_count() or 1)
+
+        prob.driver.options['num_local_procs'] = 2
+        self.assertEqual(prob.driver._get_num_local_procs(), 2)
+
+    def test_local_procs_no_fork(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('comp', om.ExecComp('y = 2.0*x'), promotes=['x', 'y'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_objective('y')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3),
+                                   run_parallel=True, num_local_procs=2)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+
+        msg = ("DOEDriver: Cases can't be run in local processes because the 'fork' start "
+               "method is not available on this platform. Running cases serially.")
+
+        get_all_start_methods = multiprocessing.get_all_start_methods
+        multiprocessing.get_all_start_methods = lambda: ['spawn']
+        try:
+            with assert_warning(UserWarning, msg):
+                prob.run_driver()
+        finally:
+            multiprocessing.get_all_start_methods = get_all_start_methods
+        prob.cleanup()
+
+        cases = om.CaseReader('cases.sql').get_cases()
+        assert_near_equal([case['y'][0] for case in cases], [0.0, 1.0, 2.0], 1e-15)
+
+
 class TestDOEDriverFeature(unittest.TestCase):
 
     def setUp(self):
@@ -2,6 +2,7 @@
 
 import unittest
 import os
+import multiprocessing
 
 import numpy as np
 
@@ -15,6 +16,7 @@ from openmdao.test_suite.components.three_bar_truss import ThreeBarTruss
 
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -769,6 +771,152 @@ class TestConstrainedSimpleGA(unittest.TestCase):
         self.assertAlmostEqual(prob['height'], 0.5, 1)  # it is going to the unconstrained optimum
 
 
+@use_tempdirs
+class TestBatchedPopulationSimpleGA(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def run_branin(self, batched, batched_fd=True):
+        np.random.seed(1)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('xC', 7.5))
+        model.add_subsystem('p2', om.IndepVarComp('xI', 0.0))
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('comp', Branin(batched_fd=batched_fd))
+        model.add_subsystem('scale', om.ExecComp('y = 2.0 * f + 1.0', f=np.zeros(2),
+                                                 y=np.zeros(2)))
+        model.scale.options['batched_fd'] = True
+
+        model.connect('p2.xI', 'sub.comp.x0')
+        model.connect('p1.xC', 'sub.comp.x1')
+        model.connect('sub.comp.f', 'scale.f', src_indices=[0, 0])
+
+        model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+        model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+        model.add_objective('scale.y', index=1)
+        model.add_constraint('sub.comp.f', upper=3.0)
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['bits'] = {'p1.xC': 8}
+        prob.driver.options['max_gen'] = 50
+        prob.driver.options['pop_size'] = 25
+        prob.driver.options['batched_population'] = batched
+
+        filename = 'batched.sql' if batched else 'serial.sql'
+        prob.driver.add_recorder(om.SqliteRecorder(filename))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        return prob, om.CaseReader(filename).get_cases()
+
+    def test_batched_branin(self):
+        prob, cases = self.run_branin(True)
+
+        # Optimal solution
+        assert_near_equal(prob['sub.comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['p2.xI']) in [3, -3])
+
+        # every point was recorded as if it had been run on its own
+        serial_prob, serial_cases = self.run_branin(False)
+        self.assertEqual(len(cases), len(serial_cases))
+        for case, serial_case in zip(cases, serial_cases):
+            self.assertEqual(case.name, serial_case.name)
+            for name in ('p1.xC', 'p2.xI', 'sub.comp.f', 'scale.y'):
+                assert_near_equal(case[name], serial_case[name], 1e-12)
+
+    def test_unbatched_component(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self.run_branin(True, batched_fd=False)
+
+        self.assertEqual(str(cm.exception),
+                         "SimpleGADriver: The 'batched_population' option requires explicit "
+                         "components with the 'batched_fd' option set, but 'sub.comp' doesn't "
+                         "support batched evaluation.")
+
+    def test_run_parallel(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0))
+        model.add_subsystem('comp', om.ExecComp('y = x**2'))
+        model.connect('p1.x', 'comp.x')
+        model.add_design_var('p1.x', lower=-1.0, upper=1.0)
+        model.add_objective('comp.y')
+
+        prob.driver = om.SimpleGADriver(bits={'p1.x': 4}, max_gen=2, batched_population=True,
+                                        run_parallel=True)
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_driver()
+
+        self.assertEqual(str(cm.exception),
+                         "SimpleGADriver: The 'batched_population' and 'run_parallel' options "
+                         "can't both be True.")
+
+
+@unittest.skipIf(MPI, "Local process pools are only used when MPI is not active.")
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "Local process pools require the 'fork' start method.")
+@use_tempdirs
+class TestLocalParallelSimpleGA(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def run_branin(self, run_parallel):
+        np.random.seed(1)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('xC', 7.5))
+        model.add_subsystem('p2', om.IndepVarComp('xI', 0.0))
+        model.add_subsystem('comp', Branin())
+
+        model.connect('p2.xI', 'comp.x0')
+        model.connect('p1.xC', 'comp.x1')
+
+        model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+        model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['bits'] = {'p1.xC': 8}
+        prob.driver.options['max_gen'] = 50
+        prob.driver.options['pop_size'] = 25
+        prob.driver.options['run_parallel'] = run_parallel
+        prob.driver.options['num_local_procs'] = 2
+
+        filename = 'parallel.sql' if run_parallel else 'serial.sql'
+        prob.driver.add_recorder(om.SqliteRecorder(filename))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        return prob, om.CaseReader(filename).get_cases()
+
+    def test_mixed_integer_branin(self):
+        prob, cases = self.run_branin(True)
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['p2.xI']) in [3, -3])
+
+        # every evaluated point was recorded by this process, in the same order as in serial
+        serial_prob, serial_cases = self.run_branin(False)
+        self.assertEqual(len(cases), len(serial_cases))
+        for case, serial_case in zip(cases, serial_cases):
+            self.assertEqual(case.name, serial_case.name)
+            assert_near_equal(case['comp.f'], serial_case['comp.f'], 1e-15)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class MPITestSimpleGA(unittest.TestCase):
 
@@ -1091,6 +1239,60 @@ class MPITestSimpleGA4Procs(unittest.TestCase):
         assert_near_equal(prob['comp.f'], 0.98799098, 1e-4)
         self.assertTrue(int(prob['p2.xI']) in [3, -3])
 
+    def test_load_balanced_single_proc_models(self):
+        from openmdao.drivers import genetic_algorithm_driver
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('xC', 7.5))
+        model.add_subsystem('p2', om.IndepVarComp('xI', 0.0))
+        model.add_subsystem('comp', Branin())
+
+        model.connect('p2.xI', 'comp.x0')
+        model.connect('p1.xC', 'comp.x1')
+
+        model.add_design_var('p2.xI', lower=-5.0, upper=10.0)
+        model.add_design_var('p1.xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['bits'] = {'p1.xC': 8}
+        prob.driver.options['max_gen'] = 50
+        prob.driver.options['pop_size'] = 25
+        prob.driver.options['run_parallel'] = True
+
+        prob.driver._randomstate = 1
+
+        prob.setup()
+
+        calls = []
+        orig_lb = genetic_algorithm_driver.concurrent_eval_lb
+        orig_eval = genetic_algorithm_driver.concurrent_eval
+
+        def count_lb(*args, **kwargs):
+            calls.append('lb')
+            return orig_lb(*args, **kwargs)
+
+        def count_eval(*args, **kwargs):
+            calls.append('static')
+            return orig_eval(*args, **kwargs)
+
+        genetic_algorithm_driver.concurrent_eval_lb = count_lb
+        genetic_algorithm_driver.concurrent_eval = count_eval
+        try:
+            prob.run_driver()
+        finally:
+            genetic_algorithm_driver.concurrent_eval_lb = orig_lb
+            genetic_algorithm_driver.concurrent_eval = orig_eval
+
+        # each rank owns a whole model, so every generation is load balanced
+        self.assertEqual(calls, ['lb'] * 51)
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
+        self.assertTrue(int(prob['p2.xI']) in [3, -3])
+
     def test_indivisible_error(self):
         prob = om.Problem()
         model = prob.model
@@ -910,6 +910,35 @@ class OverlappingPartialsTestCase(unittest.TestCase):
                                                  [ 0., -1.,  0.],
                                                  [ 0., 13., -1.]]))
 
+    def test_csc_update_in_place(self):
+        size = 2
+        p = Problem()
+        indeps = p.model.add_subsystem('indeps', IndepVarComp('x', np.ones(size)))
+
+        p.model.add_subsystem('C1', ExecComp('z=3.0*x[0]**3 + 2.0*x[1]**2', x=np.zeros(size)))
+
+        p.model.options['assembled_jac_type'] = 'csc'
+        p.model.linear_solver = DirectSolver(assemble_jac=True)
+
+        p.model.connect('indeps.x', 'C1.x', src_indices=[1,1])
+        p.setup()
+        p.run_model()
+
+        p.compute_totals(of=['C1.z'], wrt=['indeps.x'], return_format='array')
+        matrix = p.model._assembled_jac._int_mtx._matrix
+
+        p['indeps.x'] = 2.0
+        p.run_model()
+        J = p.compute_totals(of=['C1.z'], wrt=['indeps.x'], return_format='array')
+
+        # the same CSC matrix is updated with the new values, summing the repeated entries
+        self.assertIs(p.model._assembled_jac._int_mtx._matrix, matrix)
+        np.testing.assert_almost_equal(matrix.toarray(),
+                                       np.array([[-1.,  0.,  0.],
+                                                 [ 0., -1.,  0.],
+                                                 [ 0., 44., -1.]]))
+        np.testing.assert_almost_equal(J, np.array([[0., 44.]]))
+
     def test_repeated_src_indices_dense(self):
         size = 2
         p = Problem()
@@ -291,3 +291,68 @@ class COOMatrix(Matrix):
             The converted mask array.
         """
         return mask
+
+
+def _compressed_map(major, minor, num_major):
+    """
+    Compute the mapping from COO entries to the entries of a compressed (CSC or CSR) matrix.
+
+    Parameters
+    ----------
+    major : ndarray of int
+        Indices of the compressed dimension of each COO entry (cols for CSC, rows for CSR).
+    minor : ndarray of int
+        Indices of the other dimension of each COO entry.
+    num_major : int
+        Size of the compressed dimension.
+
+    Returns
+    -------
+    ndarray of int
+        Order of the COO entries sorted by major, then minor index.
+    ndarray of int or None
+        Start locations of each unique entry within the sorted COO entries, or None if there
+        are no duplicate entries.
+    ndarray of int
+        Minor indices of the compressed matrix.
+    ndarray of int
+        Index pointer of the compressed matrix.
+    """
+    order = np.lexsort((minor, major))
+    major = major[order]
+    minor = minor[order]
+
+    unique = np.ones(order.size, dtype=bool)
+    unique[1:] = (major[1:] != major[:-1]) | (minor[1:] != minor[:-1])
+    starts = np.nonzero(unique)[0]
+
+    indptr = np.zeros(num_major + 1, dtype=int)
+    np.cumsum(np.bincount(major[starts], minlength=num_major), out=indptr[1:])
+
+    indices = minor[starts]
+
+    if starts.size == order.size:
+        starts = None
+
+    return order, starts, indices, indptr
+
+
+def _update_compressed(data, order, starts, out):
+    """
+    Scatter COO data into the data array of a compressed matrix, summing duplicate entries.
+
+    Parameters
+    ----------
+    data : ndarray
+        Data of the COO matrix.
+    order : ndarray of int
+        Order of the COO entries in the compressed matrix.
+    starts : ndarray of int or None
+        Start locations of each unique entry within the ordered COO entries.
+    out : ndarray
+        Data array of the compressed matrix.
+    """
+    if starts is None:
+        np.take(data, order, out=out)
+    else:
+        out[:] = np.add.reduceat(data[order], starts)
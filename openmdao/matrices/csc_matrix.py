@@ -3,14 +3,44 @@
 import numpy as np
 from scipy.sparse import csc_matrix
 
-from openmdao.matrices.coo_matrix import COOMatrix
+from openmdao.matrices.coo_matrix import COOMatrix, _compressed_map, _update_compressed
 
 
 class CSCMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Col Storage format.
+
+    The sparsity pattern doesn't change after the matrix is built, so the mapping from COO
+    entries to CSC entries is computed once and each update just scatters the new values into
+    the data array of a persistent CSC matrix.
+
+    Attributes
+    ----------
+    _csc : csc_matrix or None
+        CSC matrix whose data is updated in place.
+    _order : ndarray of int or None
+        Order of the COO entries in the CSC matrix.
+    _starts : ndarray of int or None
+        Start locations of each unique CSC entry within the ordered COO entries, or None if
+        there are no duplicate entries.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        is_internal : bool
+            If True, this is the int_mtx of an AssembledJacobian.
+        """
+        super(CSCMatrix, self).__init__(comm, is_internal)
+        self._csc = None
+        self._order = None
+        self._starts = None
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -25,7 +55,12 @@ class CSCMatrix(COOMatrix):
             owning system.
         """
         super(CSCMatrix, self)._build(num_rows, num_cols, system)
-        self._coo = self._matrix
+        coo = self._coo = self._matrix
+
+        self._order, self._starts, indices, indptr = _compressed_map(coo.col, coo.row,
+                                                                     num_cols)
+
+        self._csc = csc_matrix((np.zeros(indices.size), indices, indptr), shape=coo.shape)
 
     def _pre_update(self):
         """
@@ -38,11 +73,15 @@ class CSCMatrix(COOMatrix):
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
         coo = self._coo
+        mtx = self._csc
+
+        # the dtype changes when complex step is turned on or off
+        if mtx.data.dtype != coo.data.dtype:
+            mtx.data = np.empty(mtx.data.size, dtype=coo.data.dtype)
+
         # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        _update_compressed(coo.data, self._order, self._starts, mtx.data)
+        self._matrix = mtx
 
     def _convert_mask(self, mask):
         """
@@ -58,6 +97,6 @@ class CSCMatrix(COOMatrix):
         ndarray
             The converted mask array.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        if self._starts is None:
+            return mask[self._order]
+        return np.logical_or.reduceat(mask[self._order], self._starts)
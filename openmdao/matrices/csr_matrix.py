@@ -1,15 +1,47 @@
 """Define the CSRmatrix class."""
-from scipy.sparse import coo_matrix
 
-from openmdao.matrices.coo_matrix import COOMatrix
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from openmdao.matrices.coo_matrix import COOMatrix, _compressed_map, _update_compressed
 
 
 class CSRMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Row Storage format.
+
+    The sparsity pattern doesn't change after the matrix is built, so the mapping from COO
+    entries to CSR entries is computed once and each update just scatters the new values into
+    the data array of a persistent CSR matrix.
+
+    Attributes
+    ----------
+    _csr : csr_matrix or None
+        CSR matrix whose data is updated in place.
+    _order : ndarray of int or None
+        Order of the COO entries in the CSR matrix.
+    _starts : ndarray of int or None
+        Start locations of each unique CSR entry within the ordered COO entries, or None if
+        there are no duplicate entries.
     """
 
-    def _build(self, num_rows, num_cols, in_ranges, out_ranges):
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        is_internal : bool
+            If True, this is the int_mtx of an AssembledJacobian.
+        """
+        super(CSRMatrix, self).__init__(comm, is_internal)
+        self._csr = None
+        self._order = None
+        self._starts = None
+
+    def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
 
@@ -19,18 +51,20 @@ class CSRMatrix(COOMatrix):
             number of rows in the matrix.
         num_cols : int
             number of cols in the matrix.
-        in_ranges : dict
-            Maps input var name to column range.
-        out_ranges : dict
-            Maps output var name to row range.
+        system : <System>
+            owning system.
         """
-        super(CSRMatrix, self)._build(num_rows, num_cols, in_ranges, out_ranges)
+        super(CSRMatrix, self)._build(num_rows, num_cols, system)
+        coo = self._coo = self._matrix
+
+        self._order, self._starts, indices, indptr = _compressed_map(coo.row, coo.col,
+                                                                     num_rows)
 
-        self._coo = self._matrix
+        self._csr = csr_matrix((np.zeros(indices.size), indices, indptr), shape=coo.shape)
 
     def _pre_update(self):
         """
-        Do anything that needs to be done at the end of AssembledJacobian._update.
+        Do anything that needs to be done at the start of AssembledJacobian._update.
         """
         self._matrix = self._coo
 
@@ -38,5 +72,31 @@ class CSRMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
+        coo = self._coo
+        mtx = self._csr
+
+        # the dtype changes when complex step is turned on or off
+        if mtx.data.dtype != coo.data.dtype:
+            mtx.data = np.empty(mtx.data.size, dtype=coo.data.dtype)
+
         # this will add any repeated entries together
-        self._matrix = self._coo.tocsc()
+        _update_compressed(coo.data, self._order, self._starts, mtx.data)
+        self._matrix = mtx
+
+    def _convert_mask(self, mask):
+        """
+        Convert the mask to the format of this sparse matrix (CSR, etc.) from COO.
+
+        Parameters
+        ----------
+        mask : ndarray
+            The mask of indices to zero out.
+
+        Returns
+        -------
+        ndarray
+            The converted mask array.
+        """
+        if self._starts is None:
+            return mask[self._order]
+        return np.logical_or.reduceat(mask[self._order], self._starts)
@@ -0,0 +1,311 @@
+"""Define the CostModelAllocator class."""
+import os
+import json
+from time import perf_counter
+
+import numpy as np
+
+from openmdao.proc_allocators.default_allocator import DefaultAllocator
+
+
+class CostModelAllocator(DefaultAllocator):
+    """
+    Processor allocator that weights subsystems by their measured cost.
+
+    The time spent executing each local subsystem is measured while the model runs.  The next
+    time the model is set up, the subsystem weights are computed from those measurements instead
+    of the proc_weight values given in add_subsystem.  The measured costs and the resulting
+    allocation can be saved to a profile file, which is used to allocate the processors in later
+    runs that haven't measured anything yet.
+
+    Attributes
+    ----------
+    profile_file : str or None
+        Name of the file that costs and allocations are loaded from and saved to.
+    measure : bool
+        If True, measure the execution time of the subsystems.
+    include_linear : bool
+        If True, include the time spent linearizing and solving the linear system in the
+        measured cost.
+    _times : dict
+        Execution time of each local subsystem, keyed by subsystem name, since the last setup.
+    _costs : dict or None
+        Costs of the subsystems used to compute the current allocation, keyed by subsystem name.
+    _allocation : dict or None
+        Number of procs allocated to each subsystem, keyed by subsystem name, if the current
+        allocation was computed from costs.
+    _nproc : int
+        Size of the comm that was divided among the subsystems.
+    _pathname : str
+        Pathname of the group whose subsystems are allocated.
+    _comm : MPI.Comm or <FakeComm>
+        Communicator of the group whose subsystems are allocated.
+    """
+
+    # tells the group to pass itself to __call__
+    _needs_system = True
+
+    def __init__(self, profile_file=None, measure=True, include_linear=True, parallel=True):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        profile_file : str or None
+            Name of the file that costs and allocations are loaded from and saved to.
+        measure : bool
+            If True, measure the execution time of the subsystems.
+        include_linear : bool
+            If True, include the time spent linearizing and solving the linear system in the
+            measured cost.
+        parallel : bool
+            If True, split subsystem comm.
+        """
+        super(CostModelAllocator, self).__init__(parallel)
+        self.profile_file = profile_file
+        self.measure = measure
+        self.include_linear = include_linear
+        self._times = {}
+        self._costs = None
+        self._allocation = None
+        self._nproc = 1
+        self._pathname = ''
+        self._comm = None
+
+    def __call__(self, proc_info, nsubs, comm, system=None):
+        """
+        Perform the allocation if parallel.
+
+        Parameters
+        ----------
+        proc_info : list of (min_procs, max_procs, weight)
+            Information used to determine MPI process allocation to subsystems.
+        nsubs : int
+            Number of subsystems.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning system.
+        system : <System> or None
+            The system whose subsystems are being allocated.
+
+        Returns
+        -------
+        isubs : [int, ...]
+            indices of the owned local subsystems.
+        sub_comm : MPI.Comm or <FakeComm>
+            communicator to pass to the subsystems.
+        sub_proc_range : (int, int)
+            The range of processors that the subcomm owns, among those of comm.
+        """
+        if system is None or not self.parallel or comm.size == 1:
+            return super(CostModelAllocator, self).__call__(proc_info, nsubs, comm)
+
+        names = [s.name for s in system._subsystems_allprocs]
+        proc_info, from_costs = self._get_proc_info(system.pathname, names, proc_info, comm)
+
+        isubs, sub_comm, sub_proc_range = \
+            super(CostModelAllocator, self).__call__(proc_info, nsubs, comm)
+
+        self._nproc = comm.size
+        self._allocation = None
+
+        if from_costs:
+            # the allocation can only be reused if each proc owns a single subsystem
+            gathered = comm.allgather(isubs)
+            if all(len(inds) == 1 for inds in gathered):
+                self._allocation = allocation = {name: 0 for name in names}
+                for inds in gathered:
+                    allocation[names[inds[0]]] += 1
+
+        return isubs, sub_comm, sub_proc_range
+
+    def _get_proc_info(self, pathname, names, proc_info, comm):
+        """
+        Replace the subsystem weights with their costs.
+
+        Costs measured since the last setup take precedence over the contents of the profile
+        file.  If the profile file contains an allocation for the same subsystems and the same
+        number of procs, that allocation is used directly.
+
+        Parameters
+        ----------
+        pathname : str
+            Pathname of the group whose subsystems are allocated.
+        names : list of str
+            Names of the subsystems.
+        proc_info : list of (min_procs, max_procs, weight)
+            Information used to determine MPI process allocation to subsystems.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning system.
+
+        Returns
+        -------
+        list of (min_procs, max_procs, weight)
+            Information used to determine MPI process allocation to subsystems.
+        bool
+            True if the weights were computed from costs.
+        """
+        costs = self._gather_costs(comm)
+
+        if costs is None:
+            entry = self._load_profile(self.profile_file).get(pathname, {})
+
+            allocation = entry.get('procs')
+            if allocation is not None and entry.get('nproc') == comm.size and \
+                    sorted(allocation) == sorted(names):
+                counts = [allocation[name] for name in names]
+                if all(minp <= n and (maxp is None or n <= maxp)
+                       for n, (minp, maxp, _) in zip(counts, proc_info)):
+                    self._costs = entry.get('costs')
+                    return [(n, n, float(n)) for n in counts], True
+
+            costs = entry.get('costs')
+
+        if not costs:
+            self._costs = None
+            return proc_info, False
+
+        # subsystems without a cost (e.g., added since the profile was saved) get the mean cost
+        default = np.mean(list(costs.values()))
+        weights = [max(costs.get(name, default), 1e-12) for name in names]
+
+        self._costs = costs
+        return [(minp, maxp, w) for (minp, maxp, _), w in zip(proc_info, weights)], True
+
+    def _gather_costs(self, comm):
+        """
+        Combine the execution times measured on all procs into subsystem costs.
+
+        The cost of a subsystem is the longest time measured on any of its procs, multiplied by
+        its number of procs.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning system.
+
+        Returns
+        -------
+        dict or None
+            Cost of each subsystem keyed by subsystem name, or None if nothing was measured.
+        """
+        if comm is None or comm.size == 1:
+            gathered = [self._times]
+        else:
+            gathered = comm.allgather(self._times)
+
+        times = {}
+        nprocs = {}
+        for proc_times in gathered:
+            for name, t in proc_times.items():
+                times[name] = max(times.get(name, 0.), t)
+                nprocs[name] = nprocs.get(name, 0) + 1
+
+        if sum(times.values()) == 0.:
+            return None
+
+        return {name: t * nprocs[name] for name, t in times.items()}
+
+    def _load_profile(self, filename):
+        """
+        Load the contents of a profile file.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name of the profile file.
+
+        Returns
+        -------
+        dict
+            Costs and allocations keyed by group pathname.
+        """
+        if filename is None or not os.path.isfile(filename):
+            return {}
+
+        with open(filename, 'r') as f:
+            return json.load(f)
+
+    def _post_setup_procs(self, system):
+        """
+        Start measuring the execution time of the local subsystems of the given system.
+
+        Parameters
+        ----------
+        system : <System>
+            The system whose subsystems were allocated.
+        """
+        self._pathname = system.pathname
+        self._comm = system.comm
+        self._times = times = {}
+
+        if not self.measure:
+            return
+
+        methods = ['_solve_nonlinear']
+        if self.include_linear:
+            methods.extend(['_linearize', '_solve_linear'])
+
+        for subsys in system._subsystems_myproc:
+            times[subsys.name] = 0.
+            for method in methods:
+                # remove the timer added during a previous setup
+                subsys.__dict__.pop(method, None)
+                setattr(subsys, method, _timed(getattr(subsys, method), subsys.name, times))
+
+    def save_profile(self, filename=None):
+        """
+        Save the subsystem costs and the current allocation to a profile file.
+
+        The costs measured since the last setup are saved if there are any, otherwise the costs
+        that the current allocation is based on are saved.  Entries for other groups in an
+        existing profile file are kept.  This must be called on all procs of the group.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name of the profile file. If None, the profile_file given at construction is used.
+        """
+        if filename is None:
+            filename = self.profile_file
+        if filename is None:
+            raise ValueError("CostModelAllocator: no profile file name was given.")
+
+        costs = self._gather_costs(self._comm)
+        entry = {'costs': self._costs if costs is None else costs}
+        if self._allocation is not None:
+            entry['nproc'] = self._nproc
+            entry['procs'] = self._allocation
+
+        if self._comm is None or self._comm.rank == 0:
+            profile = self._load_profile(filename)
+            profile[self._pathname] = entry
+            with open(filename, 'w') as f:
+                json.dump(profile, f, indent=2, sort_keys=True)
+
+
+def _timed(func, name, times):
+    """
+    Wrap a method so that its execution time is added to the given dict.
+
+    Parameters
+    ----------
+    func : method
+        The method to be timed.
+    name : str
+        Key of the execution time in times.
+    times : dict
+        Execution times keyed by name.
+
+    Returns
+    -------
+    function
+        The wrapped method.
+    """
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            times[name] += perf_counter() - start
+
+    return wrapper
@@ -91,6 +91,17 @@ class ProcAllocator(object):
             # This is a serial group - all procs get all subsystems
             return list(range(nsubs)), comm, (0, comm.size)
 
+    def _post_setup_procs(self, system):
+        """
+        Perform any allocator specific setup once the subsystems of the given system are allocated.
+
+        Parameters
+        ----------
+        system : <System>
+            The system whose subsystems were allocated.
+        """
+        pass
+
     def _split_proc_info(self, proc_info, comm):
         """
         Split proc_info into min_procs, max_procs, and weights.
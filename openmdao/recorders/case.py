@@ -66,7 +66,8 @@ class Case(object):
         A version number specifying the format of array data, if not numpy arrays.
     """
 
-    def __init__(self, source, data, prom2abs, abs2prom, abs2meta, var_info, data_format=None):
+    def __init__(self, source, data, prom2abs, abs2prom, abs2meta, var_info, data_format=None,
+                 var_layouts=None):
         """
         Initialize.
 
@@ -86,6 +87,8 @@ class Case(object):
             Dictionary with information about variables (scaling, indices, execution order).
         data_format : int
             A version number specifying the format of array data, if not numpy arrays.
+        var_layouts : dict or None
+            Dictionary mapping layout ids to structured dtypes for binary packed data.
         """
         self.source = source
         self._format_version = data_format
@@ -129,7 +132,7 @@ class Case(object):
 
         if 'inputs' in data.keys():
             if data_format >= 3:
-                inputs = deserialize(data['inputs'], abs2meta)
+                inputs = deserialize(data['inputs'], abs2meta, var_layouts)
             elif data_format in (1, 2):
                 inputs = blob_to_array(data['inputs'])
                 if type(inputs) is np.ndarray and not inputs.shape:
@@ -141,7 +144,7 @@ class Case(object):
 
         if 'outputs' in data.keys():
             if data_format >= 3:
-                outputs = deserialize(data['outputs'], abs2meta)
+                outputs = deserialize(data['outputs'], abs2meta, var_layouts)
             elif self._format_version in (1, 2):
                 outputs = blob_to_array(data['outputs'])
                 if type(outputs) is np.ndarray and not outputs.shape:
@@ -153,7 +156,7 @@ class Case(object):
 
         if 'residuals' in data.keys():
             if data_format >= 3:
-                residuals = deserialize(data['residuals'], abs2meta)
+                residuals = deserialize(data['residuals'], abs2meta, var_layouts)
             elif data_format in (1, 2):
                 residuals = blob_to_array(data['residuals'])
                 if type(residuals) is np.ndarray and not residuals.shape:
@@ -164,7 +167,9 @@ class Case(object):
                 self.residuals = PromAbsDict(residuals, prom2abs['output'], abs2prom['output'])
 
         if 'jacobian' in data.keys():
-            if data_format >= 2:
+            if isinstance(data['jacobian'], np.ndarray):
+                jacobian = data['jacobian']
+            elif data_format >= 2:
                 jacobian = blob_to_array(data['jacobian'])
                 if type(jacobian) is np.ndarray and not jacobian.shape:
                     jacobian = None
@@ -694,10 +699,11 @@ class Case(object):
                     if use_indices and meta['indices'] is not None:
                         val = val[meta['indices']]
                     if scaled:
+                        # don't scale in place, that would change the values of the case
                         if meta['total_adder'] is not None:
-                            val += meta['total_adder']
+                            val = val + meta['total_adder']
                         if meta['total_scaler'] is not None:
-                            val *= meta['total_scaler']
+                            val = val * meta['total_scaler']
                     ret_vars[name] = val
 
         return PromAbsDict(ret_vars, self._prom2abs['output'], self._abs2prom['output'])
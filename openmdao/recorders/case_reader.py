@@ -2,6 +2,7 @@
 CaseReader factory function.
 """
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.hdf5_reader import HDF5CaseReader, is_hdf5_file
 
 
 def CaseReader(filename, pre_load=True):
@@ -12,7 +13,8 @@ def CaseReader(filename, pre_load=True):
     ----------
     filename : str
         A path to the recorded file.
-        Currently only sqlite database files recorded via SqliteRecorder are supported.
+        Sqlite database files recorded via SqliteRecorder and HDF5 files recorded via
+        HDF5Recorder are supported.
     pre_load : bool
         If True, load all the data into memory during initialization.
 
@@ -21,4 +23,7 @@ def CaseReader(filename, pre_load=True):
     reader : BaseCaseReader
         An instance of a CaseReader.
     """
+    if is_hdf5_file(filename):
+        return HDF5CaseReader(filename, pre_load)
+
     return SqliteCaseReader(filename, pre_load)
@@ -1,6 +1,10 @@
 """
 Class definition for CaseRecorder, the base class for all recorders.
 """
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import chain
+
 from openmdao.core.system import System
 from openmdao.core.driver import Driver
 from openmdao.solvers.solver import Solver
@@ -8,6 +12,7 @@ from openmdao.core.problem import Problem
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.record_util import check_path
+from openmdao.utils.general_utils import make_serializable
 
 
 class CaseRecorder(object):
@@ -34,6 +39,13 @@ class CaseRecorder(object):
         The unique iteration coordinate of where an iteration originates.
     _parallel : bool
         Designates if the current recorder is parallel-recording-capable.
+    _abs2prom : {'input': dict, 'output': dict}
+        Dictionary mapping absolute names to promoted names.
+    _prom2abs : {'input': dict, 'output': dict}
+        Dictionary mapping promoted names to absolute names.
+    _abs2meta : {'name': {}}
+        Dictionary mapping absolute variable names to their metadata including units,
+        bounds, and scaling.
     """
 
     def __init__(self, record_viewer_data=True):
@@ -61,6 +73,11 @@ class CaseRecorder(object):
         # For Drivers, Systems, and Solvers
         self._iteration_coordinate = None
 
+        # variable name maps and metadata, merged across all recording requesters
+        self._abs2prom = {'input': {}, 'output': {}}
+        self._prom2abs = {'input': {}, 'output': {}}
+        self._abs2meta = {}
+
         # By default, this is False, but it should be set to True
         # if the recorder will record data on each process to avoid
         # unnecessary gathering.
@@ -77,6 +94,172 @@ class CaseRecorder(object):
         """
         self._counter = 0
 
+    def _get_system_and_driver(self, recording_requester):
+        """
+        Get the system and driver (if any) associated with a recording requester.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+
+        Returns
+        -------
+        System
+            The system whose variables are recorded.
+        Driver or None
+            The driver whose design variables and responses are recorded, if any.
+        """
+        driver = None
+
+        if isinstance(recording_requester, Driver):
+            system = recording_requester._problem().model
+            driver = recording_requester
+        elif isinstance(recording_requester, System):
+            system = recording_requester
+        elif isinstance(recording_requester, Problem):
+            system = recording_requester.model
+            driver = recording_requester.driver
+        elif isinstance(recording_requester, Solver):
+            system = recording_requester._system()
+        else:
+            raise ValueError('Driver encountered a recording_requester it cannot handle'
+                             ': {0}'.format(recording_requester))
+
+        return system, driver
+
+    def _update_var_metadata(self, system, driver, states):
+        """
+        Merge the variable name maps and metadata of the given system into those of the recorder.
+
+        Parameters
+        ----------
+        system : System
+            The system whose variables are recorded.
+        driver : Driver or None
+            The driver whose design variables and responses are recorded, if any.
+        states : list of str
+            Absolute names of all state variables in the system.
+
+        Returns
+        -------
+        dict
+            JSON compatible settings of the design variables, objectives and constraints, along
+            with the execution order of the variables.
+        """
+        if driver is None:
+            desvars = system.get_design_vars(True, get_sizes=False)
+            responses = system.get_responses(True, get_sizes=False)
+            objectives = OrderedDict()
+            constraints = OrderedDict()
+            for name, data in responses.items():
+                if data['type'] == 'con':
+                    constraints[name] = data
+                else:
+                    objectives[name] = data
+        else:
+            desvars = driver._designvars
+            constraints = driver._cons
+            objectives = driver._objs
+            responses = driver._responses
+
+        inputs = system._var_allprocs_abs_names['input'] + \
+            system._var_allprocs_abs_names_discrete['input']
+
+        outputs = system._var_allprocs_abs_names['output'] + \
+            system._var_allprocs_abs_names_discrete['output']
+
+        var_order = system._get_vars_exec_order(inputs=True, outputs=True)
+
+        full_var_set = [(outputs, 'output'),
+                        (desvars, 'desvar'), (responses, 'response'),
+                        (objectives, 'objective'), (constraints, 'constraint')]
+
+        # merge current abs2prom and prom2abs with this system's version
+        self._abs2prom['input'].update(system._var_abs2prom['input'])
+        self._abs2prom['output'].update(system._var_abs2prom['output'])
+        for v, abs_names in system._var_allprocs_prom2abs_list['input'].items():
+            if v not in self._prom2abs['input']:
+                self._prom2abs['input'][v] = abs_names
+            else:
+                self._prom2abs['input'][v] = list(set(chain(self._prom2abs['input'][v],
+                                                            abs_names)))
+
+        # for outputs, there can be only one abs name per promoted name
+        for v, abs_names in system._var_allprocs_prom2abs_list['output'].items():
+            self._prom2abs['output'][v] = abs_names
+
+        # absolute pathname to metadata mappings for continuous & discrete variables
+        # discrete mapping is sub-keyed on 'output' & 'input'
+        real_meta = system._var_allprocs_abs2meta
+        disc_meta = system._var_allprocs_discrete
+
+        for var_set, var_type in full_var_set:
+            for name in var_set:
+                if name not in self._abs2meta:
+                    try:
+                        self._abs2meta[name] = real_meta[name].copy()
+                    except KeyError:
+                        self._abs2meta[name] = disc_meta['output'][name].copy()
+                    self._abs2meta[name]['type'] = []
+                    self._abs2meta[name]['explicit'] = name not in states
+
+                if var_type not in self._abs2meta[name]['type']:
+                    self._abs2meta[name]['type'].append(var_type)
+
+        for name in inputs:
+            try:
+                self._abs2meta[name] = real_meta[name].copy()
+            except KeyError:
+                self._abs2meta[name] = disc_meta['input'][name].copy()
+            self._abs2meta[name]['type'] = ['input']
+            self._abs2meta[name]['explicit'] = True
+
+        # merge current abs2meta with this system's version
+        for name, meta in self._abs2meta.items():
+            if name in system._var_abs2meta:
+                meta.update(system._var_abs2meta[name])
+
+        self._cleanup_abs2meta()
+
+        var_settings = {}
+        var_settings.update(desvars)
+        var_settings.update(objectives)
+        var_settings.update(constraints)
+        var_settings = self._cleanup_var_settings(var_settings)
+        var_settings['execution_order'] = var_order
+
+        return var_settings
+
+    def _cleanup_abs2meta(self):
+        """
+        Convert all abs2meta variable properties to a form that can be dumped as JSON.
+        """
+        for name in self._abs2meta:
+            for prop in self._abs2meta[name]:
+                self._abs2meta[name][prop] = make_serializable(self._abs2meta[name][prop])
+
+    def _cleanup_var_settings(self, var_settings):
+        """
+        Convert all var_settings variable properties to a form that can be dumped as JSON.
+
+        Parameters
+        ----------
+        var_settings : dict
+            Dictionary mapping absolute variable names to variable settings.
+
+        Returns
+        -------
+        var_settings : dict
+            Dictionary mapping absolute variable names to var settings that are JSON compatible.
+        """
+        # otherwise we trample on values that are used elsewhere
+        var_settings = deepcopy(var_settings)
+        for name in var_settings:
+            for prop in var_settings[name]:
+                var_settings[name][prop] = make_serializable(var_settings[name][prop])
+        return var_settings
+
     def record_metadata(self, recording_requester):
         """
         Route the record_metadata call to the proper method.
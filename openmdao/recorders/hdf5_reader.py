@@ -0,0 +1,473 @@
+"""
+Definition of the HDF5CaseReader.
+"""
+from collections import OrderedDict
+
+import pickle
+from json import loads as json_loads
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+from openmdao.recorders.base_case_reader import BaseCaseReader
+from openmdao.recorders.case import PromAbsDict
+from openmdao.recorders.hdf5_recorder import decode_strings, format_version
+from openmdao.recorders.sqlite_reader import SqliteCaseReader, CaseTable, DriverCases, \
+    SystemCases, SolverCases, ProblemCases
+from openmdao.utils.record_util import dict_to_structured_array
+
+# signature at the start of every HDF5 file
+_HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+# number of cases read at a time when iterating over all cases of a table
+_READ_BLOCK_SIZE = 1000
+
+
+def is_hdf5_file(filename):
+    """
+    Determine if a file is an HDF5 file.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file.
+
+    Returns
+    -------
+    bool
+        True if the file exists and starts with the HDF5 signature.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(_HDF5_SIGNATURE)) == _HDF5_SIGNATURE
+    except (IOError, OSError):
+        return False
+
+
+class HDF5CaseReader(SqliteCaseReader):
+    """
+    A CaseReader specific to files created with HDF5Recorder.
+
+    Cases are accessed through the same API as for files created with SqliteRecorder.
+
+    Attributes
+    ----------
+    _hdf5_format_version : int
+        The version of the HDF5 file layout.
+    """
+
+    def __init__(self, filename, pre_load=False):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the filename containing the recorded data.
+        pre_load : bool
+            If True, load all the data into memory during initialization.
+        """
+        BaseCaseReader.__init__(self, filename, pre_load)
+
+        if h5py is None:
+            raise RuntimeError('HDF5CaseReader is not available, h5py is not installed.')
+
+        if not is_hdf5_file(filename):
+            raise IOError('File does not contain a valid HDF5 case file ({0})'.format(filename))
+
+        self._filename = filename
+        self._con = f = h5py.File(filename, 'r')
+
+        self._hdf5_format_version = version = int(f.attrs.get('format_version', 0))
+        if version not in range(1, format_version + 1):
+            raise ValueError('HDF5CaseReader encountered an unhandled '
+                             'format version: {0}'.format(version))
+
+        # case data is decoded to the same form as the latest sqlite format
+        self._format_version = int(f.attrs['case_format_version'])
+
+        self._collect_metadata(f)
+
+        self._global_iterations = []
+        if 'global_iterations' in f:
+            group = f['global_iterations']
+            self._global_iterations = list(zip(range(1, len(group['rowid']) + 1),
+                                               decode_strings(group['record_type'][:]),
+                                               group['rowid'][:].tolist(),
+                                               decode_strings(group['source'][:])))
+
+        # create maps to facilitate accessing variable metadata using absolute or promoted name
+        self._output2meta = PromAbsDict(self._abs2meta, self._prom2abs['output'],
+                                        self._abs2prom['output'])
+        self._input2meta = PromAbsDict(self._abs2meta, self._prom2abs['input'],
+                                       self._abs2prom['input'])
+
+        # create helper objects for accessing cases from the case tables
+        var_info = self.problem_metadata['variables']
+        args = (filename, self._format_version, self._global_iterations,
+                self._prom2abs, self._abs2prom, self._abs2meta, var_info, f)
+        self._driver_cases = HDF5DriverCases(*args)
+        self._system_cases = HDF5SystemCases(*args)
+        self._solver_cases = HDF5SolverCases(*args)
+        self._problem_cases = HDF5ProblemCases(*args)
+
+        # if requested, load all the iteration data into memory
+        if pre_load:
+            self._load_cases()
+
+    def _collect_metadata(self, f):
+        """
+        Load the variable, driver, system and solver metadata.
+
+        Parameters
+        ----------
+        f : h5py.File
+            The case file.
+        """
+        def load_json(path, default=None):
+            if path in f:
+                return json_loads(f[path][()].tobytes().decode('utf-8'))
+            return default
+
+        self._abs2prom = load_json('metadata/abs2prom', {'input': {}, 'output': {}})
+        self._prom2abs = load_json('metadata/prom2abs', {'input': {}, 'output': {}})
+        self._abs2meta = load_json('metadata/abs2meta', {})
+
+        # need to convert bounds to numpy arrays
+        for name, meta in self._abs2meta.items():
+            if 'lower' in meta and meta['lower'] is not None:
+                meta['lower'] = np.resize(np.array(meta['lower']), meta['shape'])
+            if 'upper' in meta and meta['upper'] is not None:
+                meta['upper'] = np.resize(np.array(meta['upper']), meta['shape'])
+
+        self.problem_metadata['variables'] = load_json('metadata/var_settings')
+        self.problem_metadata['abs2prom'] = self._abs2prom
+
+        if 'driver_metadata' in f:
+            for key in f['driver_metadata']:
+                self.problem_metadata.update(load_json('driver_metadata/' + key))
+
+        if 'system_metadata' in f:
+            for path, group in f['system_metadata'].items():
+                self.system_options[path] = {
+                    'scaling_factors': pickle.loads(group['scaling_factors'][()].tobytes()),
+                    'component_options': pickle.loads(group['component_options'][()].tobytes()),
+                }
+
+        if 'solver_metadata' in f:
+            for id, ds in f['solver_metadata'].items():
+                self.solver_metadata[id] = {
+                    'solver_options': pickle.loads(ds[()].tobytes()),
+                    'solver_class': ds.attrs['solver_class'],
+                }
+
+
+class _HDF5CaseTable(CaseTable):
+    """
+    Base class that reads the cases of a case table from an HDF5 case file.
+
+    It comes after the specific case table in the MRO of the HDF5 case tables, so that they can
+    extend the rows it reads.  The `_con` attribute of the case table holds the open h5py.File.
+    """
+
+    def _get_group(self, table=None):
+        """
+        Get the group holding a case table.
+
+        Parameters
+        ----------
+        table : str or None
+            The name of the table. Defaults to this table.
+
+        Returns
+        -------
+        h5py.Group or None
+            The group, or None if no cases were recorded to the table.
+        """
+        return self._con.get(self._table_name if table is None else table)
+
+    def _get_var_layouts(self):
+        """
+        Get the recorded variable layouts, loading them if necessary.
+
+        Returns
+        -------
+        list
+            The names of the numeric variables in each layout.
+        """
+        if self._var_layouts is None:
+            self._var_layouts = []
+            if 'var_layouts' in self._con:
+                self._var_layouts = [json_loads(layout) for layout in
+                                     decode_strings(self._con['var_layouts'][:])]
+        return self._var_layouts
+
+    def count(self):
+        """
+        Get the number of cases recorded in the table.
+
+        Returns
+        -------
+        int
+            The number of cases recorded in the table.
+        """
+        group = self._get_group()
+        return 0 if group is None else len(group['counter'])
+
+    def _read_keys(self):
+        """
+        Read the keys of all cases in the table, in the order they were recorded.
+
+        Returns
+        -------
+        list
+            The keys of the cases.
+        """
+        group = self._get_group()
+        return [] if group is None else decode_strings(group[self._index_name][:])
+
+    def _get_row_indices(self, keys):
+        """
+        Get the sorted row indices of the cases with the given keys.
+
+        Parameters
+        ----------
+        keys : list of str
+            The keys of the cases.
+
+        Returns
+        -------
+        ndarray
+            The row indices of the cases that were found.
+        """
+        rows = {}
+        for i, key in enumerate(self.list_cases()):
+            rows.setdefault(key, i)
+        return np.array(sorted(rows[key] for key in set(keys) if key in rows), dtype=int)
+
+    def _read_rows(self, idx, table=None):
+        """
+        Read the rows with the given indices from a case table.
+
+        Parameters
+        ----------
+        idx : ndarray
+            Sorted indices of the rows.
+        table : str or None
+            The name of the table. Defaults to this table.
+
+        Returns
+        -------
+        list of dict
+            The recorded data for each case, with decoded variable values.
+        """
+        group = self._get_group(table)
+        n = len(idx)
+        if group is None or n == 0:
+            return []
+
+        # read contiguous rows as a single slice
+        if idx[-1] - idx[0] == n - 1:
+            sel = slice(int(idx[0]), int(idx[-1]) + 1)
+        else:
+            sel = list(idx)
+
+        rows = [{'id': int(i) + 1} for i in idx]
+        layouts = self._get_var_layouts()
+        abs2meta = self._abs2meta
+
+        for col, ds in group.items():
+            if not isinstance(ds, h5py.Dataset) or col.endswith('_json'):
+                continue
+
+            if col.endswith('_layout'):
+                kind = col[:-len('_layout')]
+                layout_ids = ds[sel]
+                jsons = decode_strings(group[kind + '_json'][sel])
+
+                names = set()
+                for layout_id in set(layout_ids.tolist()):
+                    if layout_id >= 0:
+                        names.update(layouts[layout_id])
+                vals = {name: group[kind][name][sel] for name in names}
+
+                for j, row in enumerate(rows):
+                    layout_id = layout_ids[j]
+                    values = OrderedDict()
+                    if layout_id >= 0:
+                        for name in layouts[layout_id]:
+                            values[name] = vals[name][j]
+                    if jsons[j]:
+                        # some values aren't numeric, so return a dict of all values
+                        for name, val in json_loads(jsons[j]).items():
+                            if isinstance(val, list) and 'shape' in abs2meta.get(name, {}):
+                                val = np.asarray(val)
+                            values[name] = val
+                        row[kind] = values
+                    elif values or kind != 'jacobian':
+                        row[kind] = dict_to_structured_array(values)
+            elif ds.ndim == 2:
+                for row, val in zip(rows, decode_strings(ds[sel])):
+                    row[col] = val
+            else:
+                for row, val in zip(rows, ds[sel].tolist()):
+                    row[col] = val
+
+        return rows
+
+    def _load_rows(self, keys):
+        """
+        Fetch the rows for the given case keys.
+
+        Parameters
+        ----------
+        keys : list of str
+            The string-identifiers of the cases to be retrieved.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping case keys to rows of the table.
+        """
+        return {row[self._index_name]: row
+                for row in self._read_rows(self._get_row_indices(keys))}
+
+    def _iter_rows(self):
+        """
+        Iterate over all rows of the table in the order they were recorded.
+
+        Yields
+        ------
+        dict
+            The recorded data for each case.
+        """
+        count = self.count()
+        for start in range(0, count, _READ_BLOCK_SIZE):
+            for row in self._read_rows(np.arange(start, min(count, start + _READ_BLOCK_SIZE))):
+                yield row
+
+    def get_val_history(self, var_names, source=None):
+        """
+        Get the recorded values of one or more variables over the cases in this table.
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables. Outputs take precedence over inputs.
+        source : str, optional
+            If not None, only cases whose source or iteration coordinate is exactly the
+            specified one are included.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (number of cases, total size of the variables).
+        """
+        var_specs, ncols = self._get_var_specs(var_names)
+
+        keys = self._list_source_cases(source) if source else self.list_cases()
+        idx = self._get_row_indices(keys)
+        n = len(idx)
+        hist = np.empty((n, ncols))
+        if n == 0:
+            return hist
+
+        group = self._get_group()
+        if idx[-1] - idx[0] == n - 1:
+            sel = slice(int(idx[0]), int(idx[-1]) + 1)
+        else:
+            sel = list(idx)
+
+        layouts = [set(layout) for layout in self._get_var_layouts()]
+        layout_ids = {}
+        jsons = {}
+
+        for column, abs_name, prom_name, start, size in var_specs:
+            if column not in layout_ids:
+                layout_ids[column] = group[column + '_layout'][sel]
+
+            path = '%s/%s' % (column, abs_name)
+            if path in group:
+                hist[:, start:start + size] = group[path][sel].reshape((n, size))
+
+            # values of cases that don't hold the variable in their numeric data
+            for j, layout_id in enumerate(layout_ids[column]):
+                if layout_id < 0 or abs_name not in layouts[layout_id]:
+                    if column not in jsons:
+                        jsons[column] = decode_strings(group[column + '_json'][sel])
+                    values = json_loads(jsons[column][j]) if jsons[column][j] else {}
+                    if abs_name in values:
+                        val = values[abs_name]
+                    elif prom_name in values:
+                        val = values[prom_name]
+                    else:
+                        raise KeyError("Variable '%s' not found in case '%s'." %
+                                       (abs_name, self._keys[idx[j]]))
+                    hist[j, start:start + size] = np.ravel(val)
+
+        return hist
+
+
+class HDF5DriverCases(DriverCases, _HDF5CaseTable):
+    """
+    Cases recorded by a Driver in an HDF5 case file.
+    """
+
+    def _get_derivatives(self, keys=None):
+        """
+        Fetch the recorded derivatives for the given iteration coordinates.
+
+        Parameters
+        ----------
+        keys : list of str or None
+            The iteration coordinates. If None, derivatives for all cases are fetched.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping iteration coordinates to recorded derivatives.
+        """
+        group = self._get_group('driver_derivatives')
+        if group is None:
+            return {}
+
+        coords = decode_strings(group['iteration_coordinate'][:])
+        if keys is None:
+            idx = np.arange(len(coords))
+        else:
+            keys = set(keys)
+            idx = np.array([i for i, coord in enumerate(coords) if coord in keys], dtype=int)
+
+        derivs = {}
+        for row in self._read_rows(idx, 'driver_derivatives'):
+            if row['derivatives'] is not None:
+                derivs.setdefault(row['iteration_coordinate'], row['derivatives'])
+        return derivs
+
+
+class HDF5SystemCases(SystemCases, _HDF5CaseTable):
+    """
+    Cases recorded by a System in an HDF5 case file.
+    """
+
+    pass
+
+
+class HDF5SolverCases(SolverCases, _HDF5CaseTable):
+    """
+    Cases recorded by a Solver in an HDF5 case file.
+    """
+
+    pass
+
+
+class HDF5ProblemCases(ProblemCases, _HDF5CaseTable):
+    """
+    Cases recorded by a Problem in an HDF5 case file.
+    """
+
+    pass
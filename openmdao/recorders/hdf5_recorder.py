@@ -0,0 +1,992 @@
+"""
+Class definition for HDF5Recorder, which records cases to a chunked, compressed HDF5 file.
+"""
+from collections import OrderedDict
+
+import atexit
+import weakref
+import json
+import pickle
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+from openmdao.recorders.case_recorder import CaseRecorder
+from openmdao.recorders.sqlite_recorder import format_version as case_format_version
+from openmdao.utils.mpi import MPI
+from openmdao.utils.options_dictionary import OptionsDictionary
+from openmdao.utils.general_utils import simple_warning, make_serializable
+
+
+"""
+HDF5 case file version history.
+-------------------------------
+1 -- OpenMDAO 3.2
+     Original implementation.
+"""
+format_version = 1
+
+# kinds of variable data recorded with the cases of each table
+_table_kinds = OrderedDict([
+    ('driver_iterations', ('inputs', 'outputs', 'residuals')),
+    ('driver_derivatives', ('derivatives',)),
+    ('problem_cases', ('inputs', 'outputs', 'residuals', 'jacobian')),
+    ('system_iterations', ('inputs', 'outputs', 'residuals')),
+    ('solver_iterations', ('inputs', 'outputs', 'residuals')),
+    ('global_iterations', ()),
+])
+
+# numeric columns of the case tables, all other columns hold strings
+_column_dtypes = {
+    'counter': np.int64,
+    'timestamp': np.float64,
+    'success': np.int64,
+    'abs_err': np.float64,
+    'rel_err': np.float64,
+    'rowid': np.int64,
+}
+
+# kinds of data that are keyed on derivative names rather than variable names
+_deriv_kinds = ('derivatives', 'jacobian')
+
+# target size in bytes of a chunk of variable data when the chunk size isn't given
+_auto_chunk_bytes = 65536
+
+# serial recorders whose buffered cases still have to be written at exit. Using a WeakSet
+# lets recorders that are never shut down be garbage collected.
+_open_recorders = weakref.WeakSet()
+
+
+def _flush_open_recorders():
+    """
+    Write the buffered cases of all serial recorders that haven't been shut down.
+    """
+    for recorder in list(_open_recorders):
+        recorder._flush()
+
+
+# make sure buffered cases make it to disk even if cleanup is never called
+atexit.register(_flush_open_recorders)
+
+
+def encode_strings(strings):
+    """
+    Encode strings as the rows of a zero padded uint8 array.
+
+    Strings are stored this way rather than as HDF5 variable length strings so they can be
+    written in parallel.
+
+    Parameters
+    ----------
+    strings : list of str
+        The strings to encode.
+
+    Returns
+    -------
+    ndarray
+        Array of shape (len(strings), length of longest encoded string).
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+    width = max([len(b) for b in encoded] + [1])
+    array = np.zeros((len(encoded), width), dtype=np.uint8)
+    for i, b in enumerate(encoded):
+        array[i, :len(b)] = np.frombuffer(b, dtype=np.uint8)
+    return array
+
+
+def decode_strings(array):
+    """
+    Decode strings stored as the rows of a zero padded uint8 array.
+
+    Parameters
+    ----------
+    array : ndarray
+        Array of encoded strings, one per row.
+
+    Returns
+    -------
+    list of str
+        The decoded strings.
+    """
+    return [row.tobytes().rstrip(b'\0').decode('utf-8') for row in array]
+
+
+class HDF5Recorder(CaseRecorder):
+    """
+    Recorder that saves cases in a chunked, compressed HDF5 file.
+
+    Each table of cases is an HDF5 group holding one extendable dataset per column and, for each
+    kind of recorded data (inputs, outputs, ...), one extendable dataset per variable with a row
+    for every case in the table.  Numeric values are stored in the variable datasets, while any
+    other values are stored as JSON along with the case.
+
+    Cases are buffered in memory and appended to the file in blocks.  When recording in parallel
+    under MPI with a build of h5py that supports MPI, all processes write their cases to a single
+    file.  In that case the buffered cases of all processes are written collectively whenever the
+    buffer of any process is full.
+
+    Attributes
+    ----------
+    _filepath : str
+        Path to the recorder file.
+    _pickle_version : int
+        The pickle protocol version to use when pickling metadata.
+    _buffer_size : int
+        Number of cases to buffer in memory before writing them to the file.
+    _chunk_size : int or None
+        Number of cases in each chunk of variable data, or None to size chunks automatically.
+    _compression : str or None
+        Compression filter applied to variable data.
+    _compression_opts : object
+        Options of the compression filter.
+    _file : h5py.File or None
+        The open case file, or None if this process doesn't write to a file.
+    _comm : MPI.Comm or None
+        Communicator over which cases are gathered into a single file, if writing in parallel.
+    _record_on_proc : bool
+        Flag indicating whether to record on this processor when running in parallel.
+    _file_initialized : bool
+        Flag indicating whether or not the file has been initialized.
+    _pending : OrderedDict
+        Buffered cases waiting to be written, keyed by table name.
+    _num_pending : int
+        Number of buffered cases waiting to be written.
+    _pending_meta : list
+        Buffered system, solver and viewer metadata waiting to be written.
+    _var_settings : dict
+        Settings of the design variables, objectives and constraints.
+    _meta_changed : bool
+        Flag indicating that the variable metadata changed since it was last written.
+    _var_shapes : dict
+        Shapes of the numeric variables recorded in each table, keyed by (table, kind, name).
+    _layouts : dict
+        Mapping of variable layouts, as tuples of names, to their ids in the file.
+    _num_rows : dict
+        Number of rows written to each table.
+    _table_vars : dict
+        Paths of the variable datasets in each table.
+    """
+
+    def __init__(self, filepath, pickle_version=2, record_viewer_data=True, buffer_size=100,
+                 chunk_size=None, compression='gzip', compression_opts=4):
+        """
+        Initialize the HDF5Recorder.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the recorder file.
+        pickle_version : int, optional
+            The pickle protocol version to use when pickling metadata.
+        record_viewer_data : bool, optional
+            If True, record data needed for visualization.
+        buffer_size : int, optional
+            Number of cases to buffer in memory before appending them to the file.
+        chunk_size : int or None, optional
+            Number of cases in each chunk of variable data. If None, chunks of about 64 KiB
+            are used.
+        compression : str or None, optional
+            Compression filter for variable data, e.g. 'gzip' or 'lzf'. If None, data is not
+            compressed.
+        compression_opts : object, optional
+            Options of the compression filter, e.g. the gzip compression level.
+        """
+        if h5py is None:
+            raise RuntimeError('HDF5Recorder is not available, h5py is not installed.')
+
+        if buffer_size < 1:
+            raise ValueError("HDF5Recorder buffer_size must be at least 1 but %s was given." %
+                             buffer_size)
+
+        self._filepath = filepath
+        self._pickle_version = pickle_version
+        self._buffer_size = buffer_size
+        self._chunk_size = chunk_size
+        self._compression = compression
+        self._compression_opts = compression_opts if compression == 'gzip' else None
+
+        self._file = None
+        self._comm = None
+        self._file_initialized = False
+
+        # default to record on all procs when running in parallel
+        self._record_on_proc = True
+
+        self._pending = OrderedDict()
+        self._num_pending = 0
+        self._pending_meta = []
+        self._var_settings = {}
+        self._meta_changed = False
+        self._var_shapes = {}
+        self._layouts = {}
+        self._num_rows = {}
+        self._table_vars = {}
+
+        super(HDF5Recorder, self).__init__(record_viewer_data)
+
+    def _initialize_file(self, comm):
+        """
+        Create the case file.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm> or None
+            The communicator of the object to which this recorder is attached.
+        """
+        filepath = self._filepath
+
+        if MPI:
+            rank = comm.rank
+            if self._parallel:
+                if h5py.get_config().mpi:
+                    # all procs write to the same file
+                    self._comm = comm
+                elif self._record_on_proc:
+                    filepath = '%s_%d' % (self._filepath, rank)
+                    print("Note: HDF5Recorder is running on multiple processors without MPI "
+                          "support in h5py. Cases from rank %d are being written to %s." %
+                          (rank, filepath))
+                else:
+                    filepath = None
+            elif rank > 0:
+                filepath = None
+
+        if self._comm is not None:
+            self._file = h5py.File(filepath, 'w', driver='mpio', comm=self._comm)
+        elif filepath:
+            self._file = h5py.File(filepath, 'w')
+
+        if self._file is not None:
+            self._file.attrs['format_version'] = format_version
+            self._file.attrs['case_format_version'] = case_format_version
+
+            # a collective flush can't be done at exit, so only serial recorders are tracked
+            if self._comm is None:
+                _open_recorders.add(self)
+
+        self._file_initialized = True
+
+    def startup(self, recording_requester):
+        """
+        Prepare for a new run and update the variable name maps and metadata.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        """
+        super(HDF5Recorder, self).startup(recording_requester)
+
+        system, driver = self._get_system_and_driver(recording_requester)
+
+        if not self._file_initialized:
+            # a driver's model may only run on some of the procs of its problem
+            self._initialize_file(system.comm if driver is None else driver._problem().comm)
+
+        states = system._list_states_allprocs()
+
+        if self._file is not None:
+            self._var_settings = self._update_var_metadata(system, driver, states)
+            self._meta_changed = True
+
+    def record_iteration_driver(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._record_case('driver_iterations',
+                          (('counter', self._counter),
+                           ('iteration_coordinate', self._iteration_coordinate),
+                           ('timestamp', metadata['timestamp']),
+                           ('success', metadata['success']),
+                           ('msg', metadata['msg'])),
+                          (('inputs', data['input']), ('outputs', data['output']),
+                           ('residuals', data['residual'])),
+                          'driver', recording_requester._get_name())
+
+    def record_iteration_problem(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        driver = recording_requester.driver
+        if recording_requester.recording_options['record_derivatives'] and \
+                driver._designvars and driver._responses:
+            totals = data['totals']
+        else:
+            totals = None
+
+        self._record_case('problem_cases',
+                          (('counter', self._counter),
+                           ('case_name', metadata['name']),
+                           ('timestamp', metadata['timestamp']),
+                           ('success', metadata['success']),
+                           ('msg', metadata['msg']),
+                           ('abs_err', data['abs']),
+                           ('rel_err', data['rel'])),
+                          (('inputs', data['input']), ('outputs', data['output']),
+                           ('residuals', data['residual']), ('jacobian', totals)),
+                          'problem', metadata['name'])
+
+    def record_iteration_system(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        recording_requester : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        # get the pathname of the source system
+        source_system = recording_requester.pathname
+        if source_system == '':
+            source_system = 'root'
+
+        self._record_case('system_iterations',
+                          (('counter', self._counter),
+                           ('iteration_coordinate', self._iteration_coordinate),
+                           ('timestamp', metadata['timestamp']),
+                           ('success', metadata['success']),
+                           ('msg', metadata['msg'])),
+                          (('inputs', data['input']), ('outputs', data['output']),
+                           ('residuals', data['residual'])),
+                          'system', source_system)
+
+    def record_iteration_solver(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        recording_requester : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        # get the pathname of the source system
+        source_system = recording_requester._system().pathname
+        if source_system == '':
+            source_system = 'root'
+
+        # get solver type from SOLVER class attribute to determine the solver pathname
+        solver_type = recording_requester.SOLVER[0:2]
+        if solver_type == 'NL':
+            source_solver = source_system + '.nonlinear_solver'
+        elif solver_type == 'LS':
+            source_solver = source_system + '.nonlinear_solver.linesearch'
+        else:
+            raise RuntimeError("Solver type '%s' not recognized during recording. "
+                               "Expecting NL or LS" % recording_requester.SOLVER)
+
+        self._record_case('solver_iterations',
+                          (('counter', self._counter),
+                           ('iteration_coordinate', self._iteration_coordinate),
+                           ('timestamp', metadata['timestamp']),
+                           ('success', metadata['success']),
+                           ('msg', metadata['msg']),
+                           ('abs_err', data['abs']),
+                           ('rel_err', data['rel'])),
+                          (('inputs', data['input']), ('outputs', data['output']),
+                           ('residuals', data['residual'])),
+                          'solver', source_solver)
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._record_case('driver_derivatives',
+                          (('counter', self._counter),
+                           ('iteration_coordinate', self._iteration_coordinate),
+                           ('timestamp', metadata['timestamp']),
+                           ('success', metadata['success']),
+                           ('msg', metadata['msg'])),
+                          (('derivatives', data),))
+
+    def record_viewer_data(self, model_viewer_data, key='Driver'):
+        """
+        Record model viewer data.
+
+        Parameters
+        ----------
+        model_viewer_data : dict
+            Data required to visualize the model.
+        key : str, optional
+            The unique ID to use for this data in the file.
+        """
+        if self._file is not None:
+            json_data = json.dumps(model_viewer_data, default=make_serializable)
+            self._pending_meta.append(('driver_metadata/' + key, json_data.encode('utf-8'), {}))
+
+    def record_metadata_system(self, recording_requester):
+        """
+        Record system metadata.
+
+        Parameters
+        ----------
+        recording_requester : System
+            The System that would like to record its metadata.
+        """
+        if self._file is not None:
+            scaling_vecs, user_options = self._get_metadata_system(recording_requester)
+
+            if scaling_vecs is None:
+                return
+
+            scaling_factors = pickle.dumps(scaling_vecs, self._pickle_version)
+
+            # try to pickle the metadata, report if it failed
+            try:
+                pickled_metadata = pickle.dumps(user_options, self._pickle_version)
+            except Exception:
+                try:
+                    for key, values in user_options._dict.items():
+                        pickle.dumps(values, self._pickle_version)
+                except Exception:
+                    pickled_metadata = pickle.dumps(OptionsDictionary(), self._pickle_version)
+                    simple_warning("Trying to record option '%s' which cannot be pickled on system "
+                                   "%s. Set 'recordable' to False. Skipping recording options for "
+                                   "this system." % (key, recording_requester.msginfo))
+
+            path = recording_requester.pathname
+            if not path:
+                path = 'root'
+
+            self._pending_meta.append(('system_metadata/%s/scaling_factors' % path,
+                                       scaling_factors, {}))
+            self._pending_meta.append(('system_metadata/%s/component_options' % path,
+                                       pickled_metadata, {}))
+
+    def record_metadata_solver(self, recording_requester):
+        """
+        Record solver metadata.
+
+        Parameters
+        ----------
+        recording_requester : Solver
+            The Solver that would like to record its metadata.
+        """
+        if self._file is not None:
+            path = recording_requester._system().pathname
+            solver_class = type(recording_requester).__name__
+            if not path:
+                path = 'root'
+            id = "{}.{}".format(path, solver_class)
+
+            solver_options = pickle.dumps(recording_requester.options, self._pickle_version)
+
+            self._pending_meta.append(('solver_metadata/' + id, solver_options,
+                                       {'solver_class': solver_class}))
+
+    def _split_values(self, table, kind, values):
+        """
+        Split recorded values into numeric arrays and JSON encoded values.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        kind : str
+            Kind of data, e.g. 'outputs'.
+        values : dict or None
+            Dictionary mapping names to values.
+
+        Returns
+        -------
+        OrderedDict or None
+            Numeric values as float arrays, or None if there are no values.
+        str
+            JSON encoding of the values that aren't numeric, or an empty string.
+        """
+        if not values:
+            return None, ''
+
+        abs2meta = self._abs2meta
+        check_meta = kind not in _deriv_kinds
+        var_shapes = self._var_shapes
+        numeric = OrderedDict()
+        other = {}
+
+        for name, val in values.items():
+            if isinstance(val, np.ndarray) and val.dtype.kind in 'fiub' and val.size > 0 and \
+                    (not check_meta or (name in abs2meta and 'shape' in abs2meta[name])):
+                key = (table, kind, name)
+                shape = var_shapes.setdefault(key, val.shape)
+                if shape == val.shape:
+                    # copy, since the recorded arrays may be updated in place before the flush
+                    numeric[name] = np.array(val, dtype=float)
+                    continue
+            other[name] = make_serializable(val)
+
+        return numeric, json.dumps(other) if other else ''
+
+    def _record_case(self, table, columns, values, record_type=None, source=None):
+        """
+        Buffer a case, writing all buffered cases if the buffer is full.
+
+        When all procs write to a single file, this must be called on all procs.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        columns : tuple
+            Pairs of column names and values.
+        values : tuple
+            Pairs of the kind of data and dictionaries mapping names to values.
+        record_type : str or None
+            Type of record for the global iterations table.  If None, the case is not added
+            to the global iterations table.
+        source : str or None
+            Source of the case for the global iterations table.
+        """
+        if self._file is None:
+            return
+
+        if self._record_on_proc:
+            self._buffer_case(table, columns, values, record_type, source)
+
+        if self._comm is None:
+            if self._num_pending >= self._buffer_size:
+                self._flush()
+        else:
+            self._collective_flush(True)
+
+    def _buffer_case(self, table, columns, values, record_type, source):
+        """
+        Add a case to the buffer.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        columns : tuple
+            Pairs of column names and values.
+        values : tuple
+            Pairs of the kind of data and dictionaries mapping names to values.
+        record_type : str or None
+            Type of record for the global iterations table.
+        source : str or None
+            Source of the case for the global iterations table.
+        """
+        row = OrderedDict(columns)
+        for kind, vals in values:
+            row[kind] = self._split_values(table, kind, vals)
+
+        if table not in self._pending:
+            self._pending[table] = []
+        rows = self._pending[table]
+        rows.append(row)
+
+        if record_type is not None:
+            if 'global_iterations' not in self._pending:
+                self._pending['global_iterations'] = []
+            # the row id is filled in when the case is written
+            self._pending['global_iterations'].append(
+                OrderedDict([('record_type', record_type), ('rowid', (table, len(rows) - 1)),
+                             ('source', source)]))
+
+        self._num_pending += 1
+
+    def _collective_flush(self, recording):
+        """
+        Write the buffered cases of all procs if the buffer of any proc is full.
+
+        This must be called on all procs, once for every case recorded on any of them.  Procs
+        that have run out of cases keep calling it (through _finish_recording) until all procs
+        are done.
+
+        Parameters
+        ----------
+        recording : bool
+            True if this proc is still recording cases.
+
+        Returns
+        -------
+        bool
+            True if any proc is still recording cases.
+        """
+        status = np.array([self._num_pending, recording], dtype=int)
+        self._comm.Allreduce(MPI.IN_PLACE, status, op=MPI.MAX)
+
+        if status[0] >= self._buffer_size:
+            self._flush()
+
+        return bool(status[1])
+
+    def _finish_recording(self):
+        """
+        Wait until all procs are done recording cases when they write to a single file.
+
+        Procs may record different numbers of cases, e.g. when a DOEDriver runs cases in parallel,
+        so this must be called on all procs once they have recorded their last case.
+        """
+        if self._comm is not None and self._file is not None:
+            while self._collective_flush(False):
+                pass
+
+    def _get_batch_info(self, table, rows):
+        """
+        Describe a block of buffered cases so the datasets that hold them can be created.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        rows : list of OrderedDict
+            The buffered cases.
+
+        Returns
+        -------
+        dict
+            Number of cases, width of each string column, shape of each variable and the
+            variable layouts of the cases.
+        """
+        widths = {}
+        shapes = {}
+        layouts = []
+        seen = set()
+
+        for col in rows[0]:
+            if col in _table_kinds[table]:
+                kind = col
+                widths[kind + '_json'] = max(len(row[kind][1].encode('utf-8')) for row in rows)
+                for row in rows:
+                    numeric = row[kind][0]
+                    if numeric is not None:
+                        layout = tuple(numeric)
+                        if layout not in seen:
+                            seen.add(layout)
+                            layouts.append(layout)
+                        for name, val in numeric.items():
+                            shapes[kind, name] = val.shape
+            elif col not in _column_dtypes:
+                widths[col] = max(len(row[col].encode('utf-8')) for row in rows)
+
+        return {'n': len(rows), 'widths': widths, 'shapes': shapes, 'layouts': layouts}
+
+    def _create_dataset(self, group, name, shape, maxshape, chunks, dtype, **kwargs):
+        """
+        Create an extendable dataset.
+
+        Parameters
+        ----------
+        group : h5py.Group
+            Group in which to create the dataset.
+        name : str
+            Name of the dataset.
+        shape : tuple
+            Initial shape of the dataset.
+        maxshape : tuple
+            Maximum shape of the dataset.
+        chunks : tuple
+            Shape of the chunks of the dataset.
+        dtype : dtype
+            Data type of the dataset.
+        **kwargs : dict
+            Additional arguments for h5py.Group.create_dataset.
+
+        Returns
+        -------
+        h5py.Dataset
+            The dataset.
+        """
+        return group.create_dataset(name, shape=shape, maxshape=maxshape, chunks=chunks,
+                                    dtype=dtype, **kwargs)
+
+    def _get_chunk_rows(self, shape):
+        """
+        Get the number of cases in each chunk of a variable dataset.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the variable.
+
+        Returns
+        -------
+        int
+            Number of cases per chunk.
+        """
+        if self._chunk_size is not None:
+            return self._chunk_size
+        size = int(np.prod(shape))
+        return max(1, min(1024, _auto_chunk_bytes // (8 * size)))
+
+    def _write_table(self, table, rows, infos, rank, layout_ids):
+        """
+        Extend the datasets of a table with the buffered cases from all procs and write ours.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        rows : list of OrderedDict
+            The cases buffered on this proc.
+        infos : list of dict or None
+            Description of the cases buffered on each proc.
+        rank : int
+            Index of this proc in infos.
+        layout_ids : dict
+            Mapping of variable layouts to their ids in the file.
+
+        Returns
+        -------
+        int
+            Index of the first row written by this proc.
+        """
+        counts = [0 if info is None else info['n'] for info in infos]
+        start = self._num_rows.get(table, 0)
+        total = start + sum(counts)
+        offset = start + sum(counts[:rank])
+        nrows = counts[rank]
+
+        group = self._file.require_group(table)
+        table_vars = self._table_vars.setdefault(table, set())
+        kinds = _table_kinds[table]
+
+        widths = {}
+        shapes = {}
+        for info in infos:
+            if info is not None:
+                for col, width in info['widths'].items():
+                    widths[col] = max(widths.get(col, 1), width)
+                for key, shape in info['shapes'].items():
+                    shapes.setdefault(key, shape)
+
+        # scalar and string columns, all created and resized in the same order on all procs
+        columns = [info for info in infos if info is not None][0]['columns']
+        for col in columns:
+            if col in kinds:
+                continue
+            elif col in widths:
+                if col in group:
+                    ds = group[col]
+                    ds.resize((total, max(ds.shape[1], widths[col])))
+                else:
+                    self._create_dataset(group, col, (total, widths[col]), (None, None),
+                                         (256, 16), np.uint8)
+            elif col in group:
+                group[col].resize((total,))
+            else:
+                fill = -1 if col.endswith('_layout') else 0
+                self._create_dataset(group, col, (total,), (None,), (1024,),
+                                     _column_dtypes.get(col, np.int64), fillvalue=fill)
+
+        # variable datasets
+        for kind, name in sorted(shapes):
+            path = '%s/%s' % (kind, name)
+            if path not in table_vars:
+                shape = shapes[kind, name]
+                kwargs = {}
+                if self._compression is not None:
+                    kwargs = {'compression': self._compression,
+                              'compression_opts': self._compression_opts, 'shuffle': True}
+                self._create_dataset(group.require_group(kind), name, (total,) + shape,
+                                     (None,) + shape, (self._get_chunk_rows(shape),) + shape,
+                                     np.float64, fillvalue=np.nan, **kwargs)
+                table_vars.add(path)
+        for path in sorted(table_vars):
+            ds = group[path]
+            if ds.shape[0] != total:
+                ds.resize(total, axis=0)
+
+        self._num_rows[table] = total
+
+        if nrows == 0:
+            return offset
+
+        # write the cases from this proc
+        sl = slice(offset, offset + nrows)
+        for col in rows[0]:
+            if col in kinds:
+                layouts = np.empty(nrows, dtype=np.int64)
+                blocks = {}
+                for i, row in enumerate(rows):
+                    numeric = row[col][0]
+                    if numeric is None:
+                        layouts[i] = -1
+                        continue
+                    layouts[i] = layout_ids[tuple(numeric)]
+                    for name, val in numeric.items():
+                        if name not in blocks:
+                            blocks[name] = np.full((nrows,) + val.shape, np.nan)
+                        blocks[name][i] = val
+                group[col + '_layout'][sl] = layouts
+                json_col = col + '_json'
+                data = encode_strings([row[col][1] for row in rows])
+                group[json_col][sl, :data.shape[1]] = data
+                for name, block in blocks.items():
+                    group['%s/%s' % (col, name)][sl] = block
+            elif col in widths:
+                data = encode_strings([row[col] for row in rows])
+                group[col][sl, :data.shape[1]] = data
+            else:
+                vals = [np.nan if row[col] is None else row[col] for row in rows]
+                group[col][sl] = np.array(vals, dtype=_column_dtypes[col])
+
+        return offset
+
+    def _flush(self):
+        """
+        Write all buffered cases and metadata to the file.
+
+        When all procs write to a single file, this must be called on all procs.
+        """
+        pending = self._pending
+        pending_meta = self._pending_meta
+        self._pending = OrderedDict()
+        self._pending_meta = []
+        self._num_pending = 0
+
+        f = self._file
+        if f is None:
+            return
+
+        comm = self._comm
+
+        # describe the buffered cases so all procs can create the same datasets
+        local = {'tables': {}, 'meta': pending_meta, 'var_meta': None}
+        for table, rows in pending.items():
+            info = self._get_batch_info(table, rows)
+            columns = []
+            for col in rows[0]:
+                if col in _table_kinds[table]:
+                    columns.extend([col, col + '_layout', col + '_json'])
+                else:
+                    columns.append(col)
+            info['columns'] = columns
+            local['tables'][table] = info
+        if self._meta_changed:
+            local['var_meta'] = (self._abs2prom, self._prom2abs, self._abs2meta,
+                                 self._var_settings)
+            self._meta_changed = False
+
+        if comm is None:
+            all_local = [local]
+            rank = 0
+        else:
+            all_local = comm.allgather(local)
+            rank = comm.rank
+
+        # variable name maps and metadata, merged over all procs
+        var_meta = [loc['var_meta'] for loc in all_local if loc['var_meta'] is not None]
+        if var_meta:
+            abs2prom = {'input': {}, 'output': {}}
+            prom2abs = {'input': {}, 'output': {}}
+            abs2meta = {}
+            var_settings = {}
+            for a2p, p2a, a2m, settings in var_meta:
+                for io in ('input', 'output'):
+                    abs2prom[io].update(a2p[io])
+                    for prom, abs_names in p2a[io].items():
+                        names = prom2abs[io].setdefault(prom, [])
+                        names.extend([n for n in abs_names if n not in names])
+                abs2meta.update(a2m)
+                var_settings.update(settings)
+            for name, data in (('abs2prom', abs2prom), ('prom2abs', prom2abs),
+                               ('abs2meta', abs2meta), ('var_settings', var_settings)):
+                path = 'metadata/' + name
+                if path in f:
+                    del f[path]
+                f.create_dataset(path, data=np.frombuffer(json.dumps(data).encode('utf-8'),
+                                                          dtype=np.uint8))
+
+        # system, solver and viewer metadata
+        for loc in all_local:
+            for path, data, attrs in loc['meta']:
+                if path in f:
+                    if path.startswith('driver_metadata/') and rank == 0:
+                        print("Model viewer data has already been recorded for %s."
+                              % path.split('/', 1)[1])
+                    continue
+                ds = f.create_dataset(path, data=np.frombuffer(data, dtype=np.uint8))
+                for key, val in attrs.items():
+                    ds.attrs[key] = val
+
+        # new variable layouts, numbered consistently on all procs
+        new_layouts = []
+        for loc in all_local:
+            for table in sorted(loc['tables']):
+                for layout in loc['tables'][table]['layouts']:
+                    if layout not in self._layouts and layout not in new_layouts:
+                        new_layouts.append(layout)
+        if new_layouts:
+            first = len(self._layouts)
+            for i, layout in enumerate(new_layouts):
+                self._layouts[layout] = first + i
+            data = encode_strings([json.dumps(layout) for layout in new_layouts])
+            if 'var_layouts' in f:
+                ds = f['var_layouts']
+                ds.resize((first + len(new_layouts), max(ds.shape[1], data.shape[1])))
+            else:
+                ds = self._create_dataset(f, 'var_layouts', data.shape, (None, None), (256, 16),
+                                          np.uint8)
+            if rank == 0:
+                ds[first:, :data.shape[1]] = data
+
+        # write the case tables, then the global iterations that refer to their rows
+        tables = set()
+        for loc in all_local:
+            tables.update(loc['tables'])
+
+        offsets = {}
+        for table in _table_kinds:
+            if table in tables and table != 'global_iterations':
+                infos = [loc['tables'].get(table) for loc in all_local]
+                offsets[table] = self._write_table(table, pending.get(table, []), infos, rank,
+                                                   self._layouts)
+
+        if 'global_iterations' in tables:
+            rows = pending.get('global_iterations', [])
+            for row in rows:
+                table, idx = row['rowid']
+                row['rowid'] = offsets[table] + idx + 1
+            infos = [loc['tables'].get('global_iterations') for loc in all_local]
+            self._write_table('global_iterations', rows, infos, rank, self._layouts)
+
+        f.flush()
+
+    def shutdown(self):
+        """
+        Shut down the recorder.
+        """
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+            _open_recorders.discard(self)
@@ -1,8 +1,10 @@
 """
 Definition of the SqliteCaseReader.
 """
+import os
 import sqlite3
 from collections import OrderedDict
+from urllib.request import pathname2url
 
 from io import StringIO
 
@@ -14,7 +16,8 @@ from openmdao.recorders.case import Case, PromAbsDict
 
 from openmdao.utils.general_utils import simple_warning
 from openmdao.utils.variable_table import write_source_table
-from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system, \
+    layout_to_dtype
 
 from openmdao.recorders.sqlite_recorder import format_version
 
@@ -23,6 +26,30 @@ from json import loads as json_loads
 
 _DEFAULT_OUT_STREAM = object()
 
+# maximum number of parameters bound to a single query (SQLITE_MAX_VARIABLE_NUMBER is
+# 999 in older versions of sqlite)
+_MAX_QUERY_PARAMS = 500
+
+
+def _open_connection(filename):
+    """
+    Open a read-only connection to a recording database.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the recording database.
+
+    Returns
+    -------
+    sqlite3.Connection
+        The connection, returning rows as sqlite3.Row objects.
+    """
+    uri = 'file:{}?mode=ro'.format(pathname2url(os.path.abspath(filename)))
+    con = sqlite3.connect(uri, uri=True)
+    con.row_factory = sqlite3.Row
+    return con
+
 
 class SqliteCaseReader(BaseCaseReader):
     """
@@ -64,6 +91,8 @@ class SqliteCaseReader(BaseCaseReader):
         Helper object for accessing cases from the problem_cases table.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _con : sqlite3.Connection or None
+        Read-only connection to the recording database shared by all case tables.
     """
 
     def __init__(self, filename, pre_load=False):
@@ -89,35 +118,36 @@ class SqliteCaseReader(BaseCaseReader):
         self._output2meta = None
         self._input2meta = None
         self._global_iterations = None
+        self._con = None
 
-        # collect metadata from database
-        with sqlite3.connect(filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
+        # collect metadata from database using a read-only connection that is kept open
+        # and shared by the case tables for the lifetime of the reader
+        self._con = con = _open_connection(filename)
+        cur = con.cursor()
 
-            # collect data from the metadata table. this includes:
-            #   format_version
-            #   VOI metadata, which is added to problem_metadata
-            #   var name maps and metadata for all vars, which are saved as private attributes
-            self._collect_metadata(cur)
+        # collect data from the metadata table. this includes:
+        #   format_version
+        #   VOI metadata, which is added to problem_metadata
+        #   var name maps and metadata for all vars, which are saved as private attributes
+        self._collect_metadata(cur)
 
-            # collect data from the driver_metadata table. this includes:
-            #   model viewer data, which is added to problem_metadata
-            self._collect_driver_metadata(cur)
+        # collect data from the driver_metadata table. this includes:
+        #   model viewer data, which is added to problem_metadata
+        self._collect_driver_metadata(cur)
 
-            # collect data from the system_metadata table. this includes:
-            #   component metadata and scaling factors for each system,
-            #   which is added to system_options
-            self._collect_system_metadata(cur)
+        # collect data from the system_metadata table. this includes:
+        #   component metadata and scaling factors for each system,
+        #   which is added to system_options
+        self._collect_system_metadata(cur)
 
-            # collect data from the solver_metadata table. this includes:
-            #   solver class and options for each solver, which is saved as an attribute
-            self._collect_solver_metadata(cur)
+        # collect data from the solver_metadata table. this includes:
+        #   solver class and options for each solver, which is saved as an attribute
+        self._collect_solver_metadata(cur)
 
-            # get the global iterations table, and save it as an attribute
-            self._global_iterations = self._get_global_iterations(cur)
+        # get the global iterations table, and save it as an attribute
+        self._global_iterations = self._get_global_iterations(cur)
 
-        con.close()
+        cur.close()
 
         # create maps to facilitate accessing variable metadata using absolute or promoted name
         self._output2meta = PromAbsDict(self._abs2meta, self._prom2abs['output'],
@@ -129,22 +159,63 @@ class SqliteCaseReader(BaseCaseReader):
         # the problem cases table
         var_info = self.problem_metadata['variables']
         self._driver_cases = DriverCases(filename, self._format_version, self._global_iterations,
-                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info)
+                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info,
+                                         con)
         self._system_cases = SystemCases(filename, self._format_version, self._global_iterations,
-                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info)
+                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info,
+                                         con)
         self._solver_cases = SolverCases(filename, self._format_version, self._global_iterations,
-                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info)
+                                         self._prom2abs, self._abs2prom, self._abs2meta, var_info,
+                                         con)
         if self._format_version >= 2:
             self._problem_cases = ProblemCases(filename,
                                                self._format_version,
                                                self._global_iterations,
                                                self._prom2abs, self._abs2prom, self._abs2meta,
-                                               var_info)
+                                               var_info, con)
 
         # if requested, load all the iteration data into memory
         if pre_load:
             self._load_cases()
 
+    def close(self):
+        """
+        Close the connection to the recording database.
+        """
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def __enter__(self):
+        """
+        Return this reader for use in a 'with' block.
+
+        Returns
+        -------
+        SqliteCaseReader
+            This case reader.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Close the connection to the recording database at the end of a 'with' block.
+
+        Parameters
+        ----------
+        *args : array
+            Exception info, if an exception was raised in the 'with' block.
+        """
+        self.close()
+
+    def __del__(self):
+        """
+        Close the connection to the recording database when the reader is garbage collected.
+        """
+        # __init__ may have failed before the connection was opened
+        if getattr(self, '_con', None) is not None:
+            self.close()
+
     def _collect_metadata(self, cur):
         """
         Load data from the metadata table.
@@ -625,10 +696,78 @@ class SqliteCaseReader(BaseCaseReader):
         """
         case_ids = self.list_cases(source, recurse, flat, out_stream=None)
         if isinstance(case_ids, list):
-            return [self.get_case(case_id) for case_id in case_ids]
+            return self._get_case_list(case_ids)
         else:
             return self._get_cases_nested(case_ids, OrderedDict())
 
+    def _get_case_list(self, case_ids):
+        """
+        Get the cases identified by a list of case IDs, loading them in bulk from each table.
+
+        Parameters
+        ----------
+        case_ids : list of str
+            The iteration coordinates or names of the cases to return.
+
+        Returns
+        -------
+        list
+            The cases, in the same order as case_ids.
+        """
+        tables = [self._driver_cases, self._system_cases, self._solver_cases]
+        if self._format_version >= 2:
+            tables.append(self._problem_cases)
+
+        # assign each case to the first table that contains it
+        remaining = set(case_ids)
+        found = {}
+        for table in tables:
+            if not remaining:
+                break
+            keys = [key for key in table.list_cases() if key in remaining]
+            if keys:
+                remaining.difference_update(keys)
+                found.update(zip(keys, table._get_case_list(keys)))
+
+        if remaining:
+            raise RuntimeError('Case not found:', [c for c in case_ids if c in remaining][0])
+
+        return [found[case_id] for case_id in case_ids]
+
+    def get_val_history(self, var_names, source='driver'):
+        """
+        Get the recorded values of one or more variables over all cases from a source.
+
+        Values are read directly from the recorded data without creating Case objects.
+        Each row of the returned array holds the flattened values of the requested variables,
+        in the order given, for one case.
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables. Outputs take precedence over inputs.
+        source : {'problem', 'driver', <system hierarchy location>, <solver hierarchy location>}
+            Identifies the source of the cases.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (number of cases, total size of the variables).
+        """
+        if source == 'driver':
+            return self._driver_cases.get_val_history(var_names)
+        elif source == 'problem':
+            if self._format_version >= 2:
+                return self._problem_cases.get_val_history(var_names)
+            raise RuntimeError('No problem cases recorded (data format = %d).' %
+                               self._format_version)
+        elif source in self._system_cases.list_sources():
+            return self._system_cases.get_val_history(var_names, source)
+        elif source in self._solver_cases.list_sources():
+            return self._solver_cases.get_val_history(var_names, source)
+        else:
+            raise RuntimeError('Source not found: %s' % source)
+
     def _get_cases_nested(self, case_ids, cases):
         """
         Populate a nested dictionary of cases matching the provided dictionary of case IDs.
@@ -703,6 +842,24 @@ class SqliteCaseReader(BaseCaseReader):
         raise RuntimeError('Case not found:', case_id)
 
 
+def _get_layout_slices(dtype):
+    """
+    Get the position of each variable within packed binary case data.
+
+    Parameters
+    ----------
+    dtype : dtype
+        Structured dtype describing the packed data.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping variable names to their starting index in the packed float64 values.
+    """
+    itemsize = np.dtype(np.float64).itemsize
+    return {name: offset // itemsize for name, (_, offset) in dtype.fields.items()}
+
+
 class CaseTable(object):
     """
     Base class for wrapping case tables in a recording database.
@@ -735,9 +892,20 @@ class CaseTable(object):
         Dictionary mapping keys to cases that have already been loaded.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _var_layouts : dict or None
+        Dictionary mapping layout ids to structured dtypes for binary packed data.
+    _layout_slices : dict
+        Dictionary mapping layout ids to the (start, size) of each variable in the packed data.
+    _row_sources : dict or None
+        Dictionary mapping row ids in this table to the source of the case.
+    _con : sqlite3.Connection or None
+        Read-only connection to the recording database.
+    _data_columns : dict
+        Names of the columns holding the recorded inputs and outputs.
     """
 
-    def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, var_info):
+    def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, var_info,
+                 con=None):
         """
         Initialize.
 
@@ -761,6 +929,9 @@ class CaseTable(object):
             Dictionary mapping promoted names to absolute names.
         var_info : dict
             Dictionary with information about variables (scaling, indices, execution order).
+        con : sqlite3.Connection or None
+            Read-only connection to the recording database. If None, one will be opened
+            when first needed.
         """
         self._filename = fname
         self._format_version = ver
@@ -771,11 +942,81 @@ class CaseTable(object):
         self._abs2prom = abs2prom
         self._abs2meta = abs2meta
         self._var_info = var_info
+        self._con = con
+        self._data_columns = {'inputs': 'inputs', 'outputs': 'outputs'}
 
         # cached keys/cases
         self._sources = None
         self._keys = None
         self._cases = {}
+        self._var_layouts = None
+        self._layout_slices = {}
+        self._row_sources = None
+
+    def _get_connection(self):
+        """
+        Get the connection to the recording database, opening it if necessary.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Read-only connection to the recording database.
+        """
+        if self._con is None:
+            self._con = _open_connection(self._filename)
+        return self._con
+
+    def _query_keys(self, keys, fields='*', table=None, index=None):
+        """
+        Iterate over the rows of a table matching the given case keys.
+
+        Keys are bound to the query as parameters, in chunks that respect the sqlite limit
+        on the number of parameters of a query.
+
+        Parameters
+        ----------
+        keys : list of str
+            Values of the index column of the rows to fetch.
+        fields : str
+            The columns to select.
+        table : str or None
+            The name of the table to query. Defaults to this table.
+        index : str or None
+            The name of the column holding the keys. Defaults to the case index column.
+
+        Yields
+        ------
+        sqlite3.Row
+            Matching rows, in order of row id within each chunk.
+        """
+        con = self._get_connection()
+        table = self._table_name if table is None else table
+        index = self._index_name if index is None else index
+
+        for i in range(0, len(keys), _MAX_QUERY_PARAMS):
+            chunk = keys[i:i + _MAX_QUERY_PARAMS]
+            sql = "SELECT %s FROM %s WHERE %s IN (%s) ORDER BY id ASC" % \
+                (fields, table, index, ','.join(['?'] * len(chunk)))
+            for row in con.execute(sql, chunk):
+                yield row
+
+    def _get_var_layouts(self):
+        """
+        Get the layouts of binary packed case data, loading them if necessary.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping layout ids to structured dtypes.
+        """
+        if self._var_layouts is None:
+            self._var_layouts = {}
+            if self._format_version >= 11:
+                cur = self._get_connection().execute("SELECT id, layout FROM var_layouts")
+                for layout_id, layout in cur:
+                    self._var_layouts[layout_id] = layout_to_dtype(json_loads(layout))
+
+        return self._var_layouts
 
     def count(self):
         """
@@ -786,14 +1027,8 @@ class CaseTable(object):
         int
             The number of cases recorded in the table.
         """
-        with sqlite3.connect(self._filename) as con:
-            cur = con.cursor()
-            cur.execute("SELECT count(*) FROM %s" % self._table_name)
-            rows = cur.fetchall()
-
-        con.close()
-
-        return rows[0][0]
+        cur = self._get_connection().execute("SELECT count(*) FROM %s" % self._table_name)
+        return cur.fetchone()[0]
 
     def list_cases(self, source=None):
         """
@@ -811,16 +1046,8 @@ class CaseTable(object):
             The cases from the table from the specified source or parent case.
         """
         if not self._keys:
-            with sqlite3.connect(self._filename) as con:
-                cur = con.cursor()
-                cur.execute("SELECT %s FROM %s ORDER BY id ASC" %
-                            (self._index_name, self._table_name))
-                rows = cur.fetchall()
-
-            con.close()
-
             # cache case list for future use
-            self._keys = [row[0] for row in rows]
+            self._keys = self._read_keys()
 
         if not source:
             # return all cases
@@ -832,6 +1059,39 @@ class CaseTable(object):
             # source is a system or solver
             return [key for key in self._keys if self._get_source(key) == source]
 
+    def _list_source_cases(self, source):
+        """
+        Get list of case IDs for the cases that have exactly the given source.
+
+        Unlike list_cases, an iteration coordinate only matches its own case and not those
+        of its children.
+
+        Parameters
+        ----------
+        source : str
+            A source of cases or the iteration coordinate of a case.
+
+        Returns
+        -------
+        list
+            The cases from the table with the specified source or iteration coordinate.
+        """
+        return [key for key in self.list_cases()
+                if key == source or self._get_source(key) == source]
+
+    def _read_keys(self):
+        """
+        Read the keys of all cases in the table, in the order they were recorded.
+
+        Returns
+        -------
+        list
+            The keys of the cases.
+        """
+        cur = self._get_connection().execute("SELECT %s FROM %s ORDER BY id ASC" %
+                                             (self._index_name, self._table_name))
+        return [row[0] for row in cur]
+
     def get_cases(self, source=None, recurse=False, flat=False):
         """
         Get list of case names for cases in the table.
@@ -856,7 +1116,7 @@ class CaseTable(object):
 
         if not source:
             # return all cases
-            return [self.get_case(key) for key in self._keys]
+            return self._get_case_list(self._keys)
         elif '|' in source:
             # source is a coordinate
             if recurse and not flat:
@@ -866,15 +1126,15 @@ class CaseTable(object):
                         cases[key] = self.get_cases(key, recurse, flat)
                 return cases
             else:
-                return list([self.get_case(key) for key in self._keys if key.startswith(source)])
+                return self._get_case_list([key for key in self._keys if key.startswith(source)])
         else:
             # source is a system or solver
             if recurse:
                 if flat:
                     # return all cases under the source system
                     source_sys = source.replace('.nonlinear_solver', '')
-                    return list([self.get_case(key) for key in self._keys
-                                 if get_source_system(key).startswith(source_sys)])
+                    return self._get_case_list([key for key in self._keys
+                                                if get_source_system(key).startswith(source_sys)])
                 else:
                     cases = OrderedDict()
                     for key in self._keys:
@@ -883,8 +1143,83 @@ class CaseTable(object):
                             cases[key] = self.get_cases(key, recurse, flat)
                     return cases
             else:
-                return [self.get_case(key) for key in self._keys
-                        if self._get_source(key) == source]
+                return self._get_case_list([key for key in self._keys
+                                            if self._get_source(key) == source])
+
+    def _get_case_list(self, keys):
+        """
+        Get the cases with the given keys, fetching any that are not cached in bulk.
+
+        Parameters
+        ----------
+        keys : list of str
+            The string-identifiers of the cases to be retrieved.
+
+        Returns
+        -------
+        list
+            The cases, in the same order as keys.
+        """
+        cases = self._cases
+        missing = [key for key in keys if key not in cases]
+        loaded = self._load_rows(missing) if missing else {}
+
+        case_list = []
+        for key in keys:
+            if key in cases:
+                case_list.append(cases[key])
+            else:
+                case_list.append(self._make_case(loaded[key]))
+
+        return case_list
+
+    def _load_rows(self, keys):
+        """
+        Fetch the rows for the given case keys.
+
+        Parameters
+        ----------
+        keys : list of str
+            The string-identifiers of the cases to be retrieved.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping case keys to rows of the table.
+        """
+        rows = {}
+        for row in self._query_keys(keys):
+            rows.setdefault(row[self._index_name], row)
+        return rows
+
+    def _make_case(self, row):
+        """
+        Create a Case from a row of the table.
+
+        Parameters
+        ----------
+        row : sqlite3.Row or dict
+            The recorded data for the case.
+
+        Returns
+        -------
+        Case
+            The case.
+        """
+        if self._format_version >= 5:
+            source = self._get_row_source(row['id'])
+
+            # check for situations where parsing the iter coord doesn't work correctly
+            iter_source = self._get_source(row[self._index_name])
+            if iter_source != source:
+                simple_warning('Mismatched source for %d: %s = %s vs %s' %
+                               (row['id'], row[self._index_name], iter_source, source))
+        else:
+            source = self._get_source(row[self._index_name])
+
+        return Case(source, row,
+                    self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
+                    self._format_version, self._get_var_layouts())
 
     def get_case(self, case_id, cache=False):
         """
@@ -911,31 +1246,11 @@ class CaseTable(object):
             return self._cases[case_id]
 
         # we don't have it, so fetch it
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute("SELECT * FROM %s WHERE %s='%s'" %
-                        (self._table_name, self._index_name, case_id))
-            row = cur.fetchone()
-
-        con.close()
+        row = self._load_rows([case_id]).get(case_id)
 
         # if found, extract the data and optionally cache the Case
         if row is not None:
-            if self._format_version >= 5:
-                source = self._get_row_source(row['id'])
-
-                # check for situations where parsing the iter coord doesn't work correctly
-                iter_source = self._get_source(row[self._index_name])
-                if iter_source != source:
-                    simple_warning('Mismatched source for %d: %s = %s vs %s' %
-                                   (row['id'], row[self._index_name], iter_source, source))
-            else:
-                source = self._get_source(row[self._index_name])
-
-            case = Case(source, row,
-                        self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
-                        self._format_version)
+            case = self._make_case(row)
 
             # cache it if requested
             if cache:
@@ -965,6 +1280,20 @@ class CaseTable(object):
 
         return self._keys[case_idx]
 
+    def _iter_rows(self):
+        """
+        Iterate over all rows of the table in the order they were recorded.
+
+        Yields
+        ------
+        sqlite3.Row or dict
+            The recorded data for each case.
+        """
+        cur = self._get_connection().execute("SELECT * FROM %s ORDER BY id ASC" %
+                                             self._table_name)
+        for row in cur:
+            yield row
+
     def cases(self, cache=False):
         """
         Iterate over all cases, optionally caching them into memory.
@@ -974,22 +1303,15 @@ class CaseTable(object):
         cache : bool
             If True, cases will be cached for faster access by key.
         """
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table_name)
-            # rows = cur.fetchall()
-            for row in cur:
-                case_id = row[self._index_name]
-                source = self._get_source(case_id)
-                case = Case(source, row,
-                            self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
-                            self._format_version)
-                if cache:
-                    self._cases[case_id] = case
-                yield case
-
-        con.close()
+        for row in self._iter_rows():
+            case_id = row[self._index_name]
+            source = self._get_source(case_id)
+            case = Case(source, row,
+                        self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
+                        self._format_version, self._get_var_layouts())
+            if cache:
+                self._cases[case_id] = case
+            yield case
 
     def _load_cases(self):
         """
@@ -998,6 +1320,148 @@ class CaseTable(object):
         for case in self.cases(cache=True):
             pass
 
+    def get_val_history(self, var_names, source=None):
+        """
+        Get the recorded values of one or more variables over the cases in this table.
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables. Outputs take precedence over inputs.
+        source : str, optional
+            If not None, only cases whose source or iteration coordinate is exactly the
+            specified one are included.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (number of cases, total size of the variables).
+        """
+        var_specs, ncols = self._get_var_specs(var_names)
+
+        keys = self._list_source_cases(source) if source else None
+
+        if self._format_version < 3:
+            # older formats are not JSON or binary encoded, so go through Case objects
+            cases = self._get_case_list(keys if keys is not None else self.list_cases())
+            hist = np.empty((len(cases), ncols))
+            for i, case in enumerate(cases):
+                for _, _, prom_name, start, size in var_specs:
+                    hist[i, start:start + size] = np.ravel(case[prom_name])
+            return hist
+
+        columns = sorted(set(spec[0] for spec in var_specs))
+        fields = ', '.join([self._index_name] + [self._data_columns[c] for c in columns])
+        if keys is None:
+            cur = self._get_connection().execute("SELECT %s FROM %s ORDER BY id ASC" %
+                                                 (fields, self._table_name))
+        else:
+            cur = self._query_keys(keys, fields)
+
+        var_layouts = self._get_var_layouts()
+        layout_slices = self._layout_slices
+        rows = []
+
+        for row in cur:
+            vals = np.empty(ncols)
+            for col, column in enumerate(columns, 1):
+                data = row[col]
+                if isinstance(data, bytes):
+                    # packed binary data, so slice the values straight out of the blob
+                    layout_id = int(np.frombuffer(data, dtype=np.int64, count=1)[0])
+                    try:
+                        slices = layout_slices[layout_id]
+                    except KeyError:
+                        slices = layout_slices[layout_id] = _get_layout_slices(
+                            var_layouts[layout_id])
+                    packed = np.frombuffer(data, dtype=np.float64,
+                                           offset=np.dtype(np.int64).itemsize)
+                    for spec_col, abs_name, _, start, size in var_specs:
+                        if spec_col == column:
+                            if abs_name not in slices:
+                                raise KeyError("Variable '%s' not found in case '%s'." %
+                                               (abs_name, row[0]))
+                            offset = slices[abs_name]
+                            vals[start:start + size] = packed[offset:offset + size]
+                else:
+                    values = json_loads(data) if data is not None else None
+                    for spec_col, abs_name, prom_name, start, size in var_specs:
+                        if spec_col == column:
+                            if values is not None and abs_name in values:
+                                val = values[abs_name]
+                            elif values is not None and prom_name in values:
+                                val = values[prom_name]
+                            else:
+                                raise KeyError("Variable '%s' not found in case '%s'." %
+                                               (abs_name, row[0]))
+                            vals[start:start + size] = np.ravel(val)
+            rows.append(vals)
+
+        if rows:
+            return np.vstack(rows)
+        return np.empty((0, ncols))
+
+    def _get_var_specs(self, var_names):
+        """
+        Find where the values of each variable are recorded and where they go in a value history.
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables.
+
+        Returns
+        -------
+        list of tuple
+            The data column, absolute name, promoted name, starting column in the value history
+            and size of each variable.
+        int
+            The total size of the variables.
+        """
+        if isinstance(var_names, str):
+            var_names = [var_names]
+
+        var_specs = []
+        ncols = 0
+        for name in var_names:
+            column, abs_name, prom_name = self._resolve_var(name)
+            meta = self._abs2meta[abs_name]
+            if 'shape' not in meta:
+                raise TypeError("Can't get value history of '%s' because it is not a "
+                                "numeric variable." % name)
+            size = int(np.prod(meta['shape']))
+            var_specs.append((column, abs_name, prom_name, ncols, size))
+            ncols += size
+
+        return var_specs, ncols
+
+    def _resolve_var(self, name):
+        """
+        Find the recorded column, absolute name and promoted name of a variable.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        tuple
+            The data column ('outputs' or 'inputs'), absolute name and promoted name.
+        """
+        for io, column in (('output', 'outputs'), ('input', 'inputs')):
+            if name in self._abs2prom[io]:
+                return column, name, self._abs2prom[io][name]
+            if name in self._prom2abs[io]:
+                abs_names = self._prom2abs[io][name]
+                if len(abs_names) > 1:
+                    raise KeyError("The promoted name '%s' is invalid because it refers to "
+                                   "multiple inputs: %s. Access the value using an absolute "
+                                   "path name." % (name, abs_names))
+                return column, abs_names[0], name
+
+        raise KeyError("Variable name '%s' not found." % name)
+
     def list_sources(self):
         """
         Get the list of sources that recorded data in this table.
@@ -1054,14 +1518,16 @@ class CaseTable(object):
         str
             The source of the case.
         """
-        table = self._table_name.split('_')[0]  # remove "_iterations" from table name
+        if self._row_sources is None:
+            table = self._table_name.split('_')[0]  # remove "_iterations" from table name
 
-        for global_iter in self._global_iterations:
-            record_type, row, source = global_iter[1], global_iter[2], global_iter[3]
-            if record_type == table and row == row_id:
-                return source
+            self._row_sources = row_sources = {}
+            for global_iter in self._global_iterations:
+                record_type, row, source = global_iter[1], global_iter[2], global_iter[3]
+                if record_type == table and row not in row_sources:
+                    row_sources[row] = source
 
-        return None
+        return self._row_sources.get(row_id)
 
     def _get_first(self, source):
         """
@@ -1089,7 +1555,8 @@ class DriverCases(CaseTable):
     Cases specific to the entries that might be recorded in a Driver iteration.
     """
 
-    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info):
+    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info,
+                 con=None):
         """
         Initialize.
 
@@ -1109,110 +1576,133 @@ class DriverCases(CaseTable):
             Dictionary mapping promoted names to absolute names.
         var_info : dict
             Dictionary with information about variables (scaling, indices, execution order).
+        con : sqlite3.Connection or None
+            Read-only connection to the recording database.
         """
         super(DriverCases, self).__init__(filename, format_version,
                                           'driver_iterations', 'iteration_coordinate', giter,
-                                          prom2abs, abs2prom, abs2meta, var_info)
+                                          prom2abs, abs2prom, abs2meta, var_info, con)
         self._var_info = var_info
 
-    def cases(self, cache=False):
+    def _add_derivatives(self, row, derivs):
         """
-        Iterate over all cases, optionally caching them into memory.
-
-        Override base class to add derivatives from the derivatives table.
+        Add the associated derivative data, if available, to a row of driver iteration data.
 
         Parameters
         ----------
-        cache : bool
-            If True, cases will be cached for faster access by key.
+        row : sqlite3.Row
+            The driver iteration data.
+        derivs : dict
+            Dictionary mapping iteration coordinates to recorded derivatives.
+
+        Returns
+        -------
+        sqlite3.Row or dict
+            The row, converted to a dict with a 'jacobian' entry if derivatives were found.
         """
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table_name)
-            rows = cur.fetchall()
+        coord = row['iteration_coordinate']
+        if coord in derivs:
+            # convert row to a regular dict and add jacobian
+            row = {key: row[key] for key in row.keys()}
+            row['jacobian'] = derivs[coord]
+        return row
 
-            for row in rows:
-                if self._format_version > 1:
-                    # fetch associated derivative data, if available
-                    cur.execute("SELECT * FROM driver_derivatives WHERE iteration_coordinate='%s'"
-                                % row['iteration_coordinate'])
-                    derivs_row = cur.fetchone()
+    def _get_derivatives(self, keys=None):
+        """
+        Fetch the recorded derivatives for the given iteration coordinates.
 
-                    if derivs_row:
-                        # convert row to a regular dict and add jacobian
-                        row = dict(zip(row.keys(), row))
-                        row['jacobian'] = derivs_row['derivatives']
+        Parameters
+        ----------
+        keys : list of str or None
+            The iteration coordinates. If None, derivatives for all cases are fetched.
 
-                case = Case('driver', row,
-                            self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
-                            self._format_version)
+        Returns
+        -------
+        dict
+            Dictionary mapping iteration coordinates to recorded derivatives.
+        """
+        derivs = {}
+        if self._format_version > 1:
+            fields = 'iteration_coordinate, derivatives'
+            if keys is None:
+                rows = self._get_connection().execute("SELECT %s FROM driver_derivatives "
+                                                      "ORDER BY id ASC" % fields)
+            else:
+                rows = self._query_keys(keys, fields, 'driver_derivatives')
+            for coord, jac in rows:
+                derivs.setdefault(coord, jac)
+        return derivs
 
-                if cache:
-                    self._cases[case.name] = case
+    def _load_rows(self, keys):
+        """
+        Fetch the rows for the given case keys, along with any recorded derivatives.
 
-                yield case
+        Parameters
+        ----------
+        keys : list of str
+            The iteration coordinates of the cases to be retrieved.
 
-        con.close()
+        Returns
+        -------
+        dict
+            Dictionary mapping iteration coordinates to rows of driver iteration data.
+        """
+        rows = super(DriverCases, self)._load_rows(keys)
+        if rows:
+            derivs = self._get_derivatives(list(rows))
+            for key, row in rows.items():
+                rows[key] = self._add_derivatives(row, derivs)
+        return rows
 
-    def get_case(self, case_id, cache=False):
+    def _iter_rows(self):
         """
-        Get a case from the database.
+        Iterate over all rows of the table, along with any recorded derivatives.
+
+        Yields
+        ------
+        sqlite3.Row or dict
+            The recorded data for each case.
+        """
+        derivs = self._get_derivatives()
+        for row in super(DriverCases, self)._iter_rows():
+            yield self._add_derivatives(row, derivs)
+
+    def _make_case(self, row):
+        """
+        Create a Case from a row of the table.
 
         Parameters
         ----------
-        case_id : int or str
-            The integer index or string-identifier of the case to be retrieved.
-        cache : bool
-            If True, cache the case so it does not have to be fetched on next access.
+        row : sqlite3.Row or dict
+            The recorded data for the case.
 
         Returns
         -------
         Case
-            The specified case from the driver_iterations and driver_derivatives tables.
+            The case.
         """
-        # check to see if we've already cached this case
-        if isinstance(case_id, int):
-            case_id = self._get_iteration_coordinate(case_id)
+        return Case('driver', row,
+                    self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
+                    self._format_version, self._get_var_layouts())
 
-        # return cached case if present, else fetch it
-        if case_id in self._cases:
-            return self._cases[case_id]
+    def cases(self, cache=False):
+        """
+        Iterate over all cases, optionally caching them into memory.
+
+        Override base class to add derivatives from the derivatives table.
+
+        Parameters
+        ----------
+        cache : bool
+            If True, cases will be cached for faster access by key.
+        """
+        for row in self._iter_rows():
+            case = self._make_case(row)
 
-        # Get an unscaled case if does not already exist in _cases
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-
-            # fetch driver iteration data
-            cur.execute("SELECT * FROM driver_iterations WHERE "
-                        "iteration_coordinate=:iteration_coordinate",
-                        {"iteration_coordinate": case_id})
-            row = cur.fetchone()
-
-            # fetch associated derivative data, if available
-            if row and self._format_version > 1:
-                cur.execute("SELECT * FROM driver_derivatives WHERE "
-                            "iteration_coordinate=:iteration_coordinate",
-                            {"iteration_coordinate": case_id})
-                derivs_row = cur.fetchone()
-
-                if derivs_row:
-                    # convert row to a regular dict and add jacobian
-                    row = dict(zip(row.keys(), row))
-                    row['jacobian'] = derivs_row['derivatives']
-        con.close()
-
-        # if found, create Case object (and cache it if requested) else return None
-        if row:
-            case = Case('driver', row,
-                        self._prom2abs, self._abs2prom, self._abs2meta, self._var_info,
-                        self._format_version)
             if cache:
-                self._cases[case_id] = case
-            return case
-        else:
-            return None
+                self._cases[case.name] = case
+
+            yield case
 
     def list_sources(self):
         """
@@ -1263,7 +1753,8 @@ class SystemCases(CaseTable):
     Cases specific to the entries that might be recorded in a System iteration.
     """
 
-    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info):
+    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info,
+                 con=None):
         """
         Initialize.
 
@@ -1283,10 +1774,12 @@ class SystemCases(CaseTable):
             Dictionary mapping promoted names to absolute names.
         var_info : dict
             Dictionary with information about variables (scaling, indices, execution order).
+        con : sqlite3.Connection or None
+            Read-only connection to the recording database.
         """
         super(SystemCases, self).__init__(filename, format_version,
                                           'system_iterations', 'iteration_coordinate', giter,
-                                          prom2abs, abs2prom, abs2meta, var_info)
+                                          prom2abs, abs2prom, abs2meta, var_info, con)
 
 
 class SolverCases(CaseTable):
@@ -1294,7 +1787,8 @@ class SolverCases(CaseTable):
     Cases specific to the entries that might be recorded in a Solver iteration.
     """
 
-    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info):
+    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info,
+                 con=None):
         """
         Initialize.
 
@@ -1314,10 +1808,13 @@ class SolverCases(CaseTable):
             Dictionary mapping promoted names to absolute names.
         var_info : dict
             Dictionary with information about variables (scaling, indices, execution order).
+        con : sqlite3.Connection or None
+            Read-only connection to the recording database.
         """
         super(SolverCases, self).__init__(filename, format_version,
                                           'solver_iterations', 'iteration_coordinate', giter,
-                                          prom2abs, abs2prom, abs2meta, var_info)
+                                          prom2abs, abs2prom, abs2meta, var_info, con)
+        self._data_columns = {'inputs': 'solver_inputs', 'outputs': 'solver_output'}
 
     def _get_source(self, iteration_coordinate):
         """
@@ -1353,7 +1850,8 @@ class ProblemCases(CaseTable):
     Cases specific to the entries that might be recorded in a Driver iteration.
     """
 
-    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info):
+    def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, var_info,
+                 con=None):
         """
         Initialize.
 
@@ -1373,10 +1871,12 @@ class ProblemCases(CaseTable):
             Dictionary mapping promoted names to absolute names.
         var_info : dict
             Dictionary with information about variables (scaling, indices, execution order).
+        con : sqlite3.Connection or None
+            Read-only connection to the recording database.
         """
         super(ProblemCases, self).__init__(filename, format_version,
                                            'problem_cases', 'case_name', giter,
-                                           prom2abs, abs2prom, abs2meta, var_info)
+                                           prom2abs, abs2prom, abs2meta, var_info, con)
 
     def list_sources(self):
         """
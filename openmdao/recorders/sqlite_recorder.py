@@ -2,13 +2,14 @@
 Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 """
 
-from copy import deepcopy
 from io import BytesIO
 from collections import OrderedDict
 
 import os
 import sqlite3
-from itertools import chain
+import time
+import atexit
+import weakref
 
 import json
 import numpy as np
@@ -20,15 +21,14 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.record_util import dict_to_structured_array
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.general_utils import simple_warning, make_serializable
-from openmdao.core.driver import Driver
-from openmdao.core.system import System
-from openmdao.core.problem import Problem
-from openmdao.solvers.solver import Solver
 
 
 """
 SQL case database version history.
 ----------------------------------
+11-- OpenMDAO 3.2
+     Inputs, outputs and residuals made up entirely of float arrays are stored as packed
+     float64 blobs, prefixed by the id of their variable layout in the new var_layouts table.
 10-- OpenMDAO 3.0
      Added abs_err and rel_err recording to Problem recording
 9 -- OpenMDAO 3.0
@@ -52,7 +52,44 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 10
+format_version = 11
+
+# insert statements for the tables that cases are recorded to
+_insert_sql = {
+    'var_layouts': "INSERT INTO var_layouts(id, layout) VALUES(?,?)",
+    'global_iterations': "INSERT INTO global_iterations(record_type, rowid, source) "
+                         "VALUES(?,?,?)",
+    'driver_iterations': "INSERT INTO driver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?)",
+    'driver_derivatives': "INSERT INTO driver_derivatives(id, counter, iteration_coordinate, "
+                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?,?)",
+    'problem_cases': "INSERT INTO problem_cases(id, counter, case_name, timestamp, success, "
+                     "msg, inputs, outputs, residuals, jacobian, abs_err, rel_err) "
+                     "VALUES(?,?,?,?,?,?,?,?,?,?,?,?)",
+    'system_iterations': "INSERT INTO system_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?)",
+    'solver_iterations': "INSERT INTO solver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, abs_err, rel_err, solver_inputs, "
+                         "solver_output, solver_residuals) VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+}
+
+# recorders that buffer cases and haven't been shut down.  Weak references are used so that
+# recorders that are no longer in use can still be garbage collected.
+_open_recorders = weakref.WeakSet()
+
+
+def _flush_open_recorders():
+    """
+    Write the buffered cases of all recorders that haven't been shut down.
+    """
+    for recorder in list(_open_recorders):
+        recorder._flush()
+
+
+# make sure buffered cases make it to disk even if cleanup is never called
+atexit.register(_flush_open_recorders)
 
 
 def array_to_blob(array):
@@ -112,13 +149,6 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether to record data needed to generate N2 diagram.
     connection : sqlite connection object
         Connection to the sqlite3 database.
-    _abs2prom : {'input': dict, 'output': dict}
-        Dictionary mapping absolute names to promoted names.
-    _prom2abs : {'input': dict, 'output': dict}
-        Dictionary mapping promoted names to absolute names.
-    _abs2meta : {'name': {}}
-        Dictionary mapping absolute variable names to their metadata including units,
-        bounds, and scaling.
     _pickle_version : int
         The pickle protocol version to use when pickling metadata.
     _filepath : str
@@ -127,9 +157,26 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _record_on_proc : bool
         Flag indicating whether to record on this processor when running in parallel.
+    _buffer_size : int
+        Number of cases to buffer in memory before writing them to the database.
+    _flush_interval : float or None
+        If not None, buffered cases are written at least this often (in seconds).
+    _journal_mode : str or None
+        If not None, the sqlite journal mode to use, e.g. 'WAL'.
+    _pending : OrderedDict
+        Rows waiting to be written, keyed by table name.
+    _num_pending : int
+        Number of buffered cases waiting to be written.
+    _last_rowids : dict
+        Last row id assigned in each case table.
+    _last_flush : float
+        Time of the last write of buffered cases.
+    _var_layouts : dict
+        Mapping of variable layouts, as tuples of (name, shape), to their ids.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=2, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=2, record_viewer_data=True,
+                 buffer_size=1, flush_interval=None, journal_mode=None):
         """
         Initialize the SqliteRecorder.
 
@@ -143,16 +190,26 @@ class SqliteRecorder(CaseRecorder):
             The pickle protocol version to use when pickling metadata.
         record_viewer_data : bool, optional
             If True, record data needed for visualization.
+        buffer_size : int, optional
+            Number of cases to buffer in memory before writing them to the database in a single
+            transaction.  The default of 1 writes every case as soon as it is recorded.
+        flush_interval : float or None, optional
+            If not None, buffered cases are written to the database whenever this many seconds
+            have passed since the last write, even if the buffer isn't full.
+        journal_mode : str or None, optional
+            If not None, the sqlite journal mode to use, e.g. 'WAL'.  Note that 'WAL' requires
+            shared memory and will not work on network file systems.
         """
         if append:
             raise NotImplementedError("Append feature not implemented for SqliteRecorder")
 
+        if buffer_size < 1:
+            raise ValueError("SqliteRecorder buffer_size must be at least 1 but %s was given." %
+                             buffer_size)
+
         self.connection = None
         self._record_viewer_data = record_viewer_data
 
-        self._abs2prom = {'input': {}, 'output': {}}
-        self._prom2abs = {'input': {}, 'output': {}}
-        self._abs2meta = {}
         self._pickle_version = pickle_version
         self._filepath = filepath
         self._database_initialized = False
@@ -160,6 +217,15 @@ class SqliteRecorder(CaseRecorder):
         # default to record on all procs when running in parallel
         self._record_on_proc = True
 
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._journal_mode = journal_mode
+        self._pending = OrderedDict()
+        self._num_pending = 0
+        self._last_rowids = {}
+        self._last_flush = time.time()
+        self._var_layouts = {}
+
         super(SqliteRecorder, self).__init__(record_viewer_data)
 
     def _initialize_database(self):
@@ -187,6 +253,12 @@ class SqliteRecorder(CaseRecorder):
                 pass
 
             self.connection = sqlite3.connect(filepath)
+            if self._journal_mode is not None:
+                self.connection.execute("PRAGMA journal_mode=%s" % self._journal_mode)
+
+            if self._buffer_size > 1 or self._flush_interval is not None:
+                _open_recorders.add(self)
+
             with self.connection as c:
                 c.execute("CREATE TABLE metadata(format_version INT, "
                           "abs2prom TEXT, prom2abs TEXT, abs2meta TEXT, var_settings TEXT)")
@@ -197,6 +269,9 @@ class SqliteRecorder(CaseRecorder):
                 c.execute("CREATE TABLE global_iterations(id INTEGER PRIMARY KEY, "
                           "record_type TEXT, rowid INT, source TEXT)")
 
+                # order and shape of the variables in packed binary case data
+                c.execute("CREATE TABLE var_layouts(id INTEGER PRIMARY KEY, layout TEXT)")
+
                 c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
@@ -231,35 +306,6 @@ class SqliteRecorder(CaseRecorder):
 
         self._database_initialized = True
 
-    def _cleanup_abs2meta(self):
-        """
-        Convert all abs2meta variable properties to a form that can be dumped as JSON.
-        """
-        for name in self._abs2meta:
-            for prop in self._abs2meta[name]:
-                self._abs2meta[name][prop] = make_serializable(self._abs2meta[name][prop])
-
-    def _cleanup_var_settings(self, var_settings):
-        """
-        Convert all var_settings variable properties to a form that can be dumped as JSON.
-
-        Parameters
-        ----------
-        var_settings : dict
-            Dictionary mapping absolute variable names to variable settings.
-
-        Returns
-        -------
-        var_settings : dict
-            Dictionary mapping absolute variable names to var settings that are JSON compatible.
-        """
-        # otherwise we trample on values that are used elsewhere
-        var_settings = deepcopy(var_settings)
-        for name in var_settings:
-            for prop in var_settings[name]:
-                var_settings[name][prop] = make_serializable(var_settings[name][prop])
-        return var_settings
-
     def startup(self, recording_requester):
         """
         Prepare for a new run and create/update the abs2prom and prom2abs variables.
@@ -274,113 +320,17 @@ class SqliteRecorder(CaseRecorder):
         if not self._database_initialized:
             self._initialize_database()
 
-        driver = None
-
-        # grab the system
-        if isinstance(recording_requester, Driver):
-            system = recording_requester._problem().model
-            driver = recording_requester
-        elif isinstance(recording_requester, System):
-            system = recording_requester
-        elif isinstance(recording_requester, Problem):
-            system = recording_requester.model
-            driver = recording_requester.driver
-        elif isinstance(recording_requester, Solver):
-            system = recording_requester._system()
-        else:
-            raise ValueError('Driver encountered a recording_requester it cannot handle'
-                             ': {0}'.format(recording_requester))
+        system, driver = self._get_system_and_driver(recording_requester)
 
         states = system._list_states_allprocs()
 
         if self.connection:
-
-            if driver is None:
-                desvars = system.get_design_vars(True, get_sizes=False)
-                responses = system.get_responses(True, get_sizes=False)
-                objectives = OrderedDict()
-                constraints = OrderedDict()
-                for name, data in responses.items():
-                    if data['type'] == 'con':
-                        constraints[name] = data
-                    else:
-                        objectives[name] = data
-            else:
-                desvars = driver._designvars
-                constraints = driver._cons
-                objectives = driver._objs
-                responses = driver._responses
-
-            inputs = system._var_allprocs_abs_names['input'] + \
-                system._var_allprocs_abs_names_discrete['input']
-
-            outputs = system._var_allprocs_abs_names['output'] + \
-                system._var_allprocs_abs_names_discrete['output']
-
-            var_order = system._get_vars_exec_order(inputs=True, outputs=True)
-
-            full_var_set = [(outputs, 'output'),
-                            (desvars, 'desvar'), (responses, 'response'),
-                            (objectives, 'objective'), (constraints, 'constraint')]
-
-            # merge current abs2prom and prom2abs with this system's version
-            self._abs2prom['input'].update(system._var_abs2prom['input'])
-            self._abs2prom['output'].update(system._var_abs2prom['output'])
-            for v, abs_names in system._var_allprocs_prom2abs_list['input'].items():
-                if v not in self._prom2abs['input']:
-                    self._prom2abs['input'][v] = abs_names
-                else:
-                    self._prom2abs['input'][v] = list(set(chain(self._prom2abs['input'][v],
-                                                                abs_names)))
-
-            # for outputs, there can be only one abs name per promoted name
-            for v, abs_names in system._var_allprocs_prom2abs_list['output'].items():
-                self._prom2abs['output'][v] = abs_names
-
-            # absolute pathname to metadata mappings for continuous & discrete variables
-            # discrete mapping is sub-keyed on 'output' & 'input'
-            real_meta = system._var_allprocs_abs2meta
-            disc_meta = system._var_allprocs_discrete
-
-            for var_set, var_type in full_var_set:
-                for name in var_set:
-                    if name not in self._abs2meta:
-                        try:
-                            self._abs2meta[name] = real_meta[name].copy()
-                        except KeyError:
-                            self._abs2meta[name] = disc_meta['output'][name].copy()
-                        self._abs2meta[name]['type'] = []
-                        self._abs2meta[name]['explicit'] = name not in states
-
-                    if var_type not in self._abs2meta[name]['type']:
-                        self._abs2meta[name]['type'].append(var_type)
-
-            for name in inputs:
-                try:
-                    self._abs2meta[name] = real_meta[name].copy()
-                except KeyError:
-                    self._abs2meta[name] = disc_meta['input'][name].copy()
-                self._abs2meta[name]['type'] = ['input']
-                self._abs2meta[name]['explicit'] = True
-
-            # merge current abs2meta with this system's version
-            for name, meta in self._abs2meta.items():
-                if name in system._var_abs2meta:
-                    meta.update(system._var_abs2meta[name])
-
-            self._cleanup_abs2meta()
+            var_settings = self._update_var_metadata(system, driver, states)
 
             # store the updated abs2prom and prom2abs
             abs2prom = json.dumps(self._abs2prom)
             prom2abs = json.dumps(self._prom2abs)
             abs2meta = json.dumps(self._abs2meta)
-
-            var_settings = {}
-            var_settings.update(desvars)
-            var_settings.update(objectives)
-            var_settings.update(constraints)
-            var_settings = self._cleanup_var_settings(var_settings)
-            var_settings['execution_order'] = var_order
             var_settings_json = json.dumps(var_settings)
 
             with self.connection as c:
@@ -401,33 +351,15 @@ class SqliteRecorder(CaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            outputs = data['output']
-            inputs = data['input']
-            residuals = data['residual']
+            inputs_text = self._encode_values(data['input'])
+            outputs_text = self._encode_values(data['output'])
+            residuals_text = self._encode_values(data['residual'])
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, recording_requester._get_name()))
+            self._record_case('driver_iterations',
+                              (self._counter, self._iteration_coordinate,
+                               metadata['timestamp'], metadata['success'], metadata['msg'],
+                               inputs_text, outputs_text, residuals_text),
+                              'driver', recording_requester._get_name())
 
     def record_iteration_problem(self, recording_requester, data, metadata):
         """
@@ -456,34 +388,19 @@ class SqliteRecorder(CaseRecorder):
             totals_array = dict_to_structured_array(totals)
             totals_blob = array_to_blob(totals_array)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            inputs_text = self._encode_values(inputs)
+            outputs_text = self._encode_values(outputs)
+            residuals_text = self._encode_values(residuals)
 
             abs_err = data['abs']
             rel_err = data['rel']
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+            self._record_case('problem_cases',
+                              (self._counter, metadata['name'],
+                               metadata['timestamp'], metadata['success'], metadata['msg'],
+                               inputs_text, outputs_text, residuals_text, totals_blob,
+                               abs_err, rel_err),
+                              'problem', metadata['name'])
 
     def record_iteration_system(self, recording_requester, data, metadata):
         """
@@ -499,36 +416,20 @@ class SqliteRecorder(CaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                for var, dat in i_o_r.items():
-                    i_o_r[var] = make_serializable(dat)
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            inputs_text = self._encode_values(data['input'])
+            outputs_text = self._encode_values(data['output'])
+            residuals_text = self._encode_values(data['residual'])
 
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+            # get the pathname of the source system
+            source_system = recording_requester.pathname
+            if source_system == '':
+                source_system = 'root'
 
-                # get the pathname of the source system
-                source_system = recording_requester.pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+            self._record_case('system_iterations',
+                              (self._counter, self._iteration_coordinate,
+                               metadata['timestamp'], metadata['success'], metadata['msg'],
+                               inputs_text, outputs_text, residuals_text),
+                              'system', source_system)
 
     def record_iteration_solver(self, recording_requester, data, metadata):
         """
@@ -546,49 +447,30 @@ class SqliteRecorder(CaseRecorder):
         if self.connection:
             abs = data['abs']
             rel = data['rel']
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = make_serializable(i_o_r[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            inputs_text = self._encode_values(data['input'])
+            outputs_text = self._encode_values(data['output'])
+            residuals_text = self._encode_values(data['residual'])
+
+            # get the pathname of the source system
+            source_system = recording_requester._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = recording_requester.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % recording_requester.SOLVER)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = recording_requester._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = recording_requester.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % recording_requester.SOLVER)
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+            self._record_case('solver_iterations',
+                              (self._counter, self._iteration_coordinate,
+                               metadata['timestamp'], metadata['success'], metadata['msg'],
+                               abs, rel, inputs_text, outputs_text, residuals_text),
+                              'solver', source_solver)
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -698,14 +580,101 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
+            self._record_case('driver_derivatives',
+                              (self._counter, self._iteration_coordinate,
+                               metadata['timestamp'], metadata['success'], metadata['msg'],
+                               data_blob))
+
+    def _encode_values(self, values):
+        """
+        Encode a dict of variable values for storage in a case table.
+
+        If all of the values are float compatible arrays, they are packed into a float64 blob
+        preceded by the id of their layout.  Otherwise they are stored as JSON.
+
+        Parameters
+        ----------
+        values : dict or None
+            Dictionary mapping absolute variable names to values.
+
+        Returns
+        -------
+        str or sqlite3.Binary
+            The encoded values.
+        """
+        if values:
+            abs2meta = self._abs2meta
+            for name, val in values.items():
+                if not (isinstance(val, np.ndarray) and val.dtype.kind in 'fiub' and
+                        name in abs2meta and 'shape' in abs2meta[name]):
+                    break
+            else:
+                layout = tuple((name, val.shape) for name, val in values.items())
+                layout_id = self._var_layouts.get(layout)
+                if layout_id is None:
+                    layout_id = self._var_layouts[layout] = len(self._var_layouts) + 1
+                    if 'var_layouts' not in self._pending:
+                        self._pending['var_layouts'] = []
+                    self._pending['var_layouts'].append(
+                        (layout_id, json.dumps([[name, shape] for name, shape in layout])))
+
+                packed = np.concatenate([val.ravel() for val in values.values()])
+                return sqlite3.Binary(np.int64(layout_id).tobytes() +
+                                      packed.astype(np.float64, copy=False).tobytes())
+
+            values = {name: make_serializable(val) for name, val in values.items()}
+
+        return json.dumps(values)
+
+    def _record_case(self, table, row, record_type=None, source=None):
+        """
+        Add a row to the given case table, writing all buffered rows if the buffer is full.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        row : tuple
+            Values for all columns of the table except the id.
+        record_type : str or None
+            Type of record for the global_iterations table.  If None, the case is not added
+            to the global_iterations table.
+        source : str or None
+            Source of the case for the global_iterations table.
+        """
+        # row ids are assigned here rather than by sqlite so global_iterations entries can be
+        # buffered along with the cases they refer to
+        rowid = self._last_rowids.get(table, 0) + 1
+        self._last_rowids[table] = rowid
+
+        if table not in self._pending:
+            self._pending[table] = []
+        self._pending[table].append((rowid,) + row)
+
+        if record_type is not None:
+            if 'global_iterations' not in self._pending:
+                self._pending['global_iterations'] = []
+            self._pending['global_iterations'].append((record_type, rowid, source))
+
+        self._num_pending += 1
+
+        if self._num_pending >= self._buffer_size or \
+                (self._flush_interval is not None and
+                 time.time() - self._last_flush >= self._flush_interval):
+            self._flush()
+
+    def _flush(self):
+        """
+        Write all buffered cases to the database in a single transaction.
+        """
+        if self._num_pending > 0 and self.connection:
             with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+                for table, rows in self._pending.items():
+                    c.executemany(_insert_sql[table], rows)
 
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+        self._pending = OrderedDict()
+        self._num_pending = 0
+        self._last_flush = time.time()
 
     def shutdown(self):
         """
@@ -713,12 +682,22 @@ class SqliteRecorder(CaseRecorder):
         """
         # close database connection
         if self.connection:
+            self._flush()
             self.connection.close()
+            self.connection = None
+        _open_recorders.discard(self)
 
     def delete_recordings(self):
         """
         Delete all the recordings.
         """
+        # layouts are kept since they may be referenced by cases recorded later
+        pending_layouts = self._pending.get('var_layouts')
+        self._pending = OrderedDict()
+        if pending_layouts:
+            self._pending['var_layouts'] = pending_layouts
+        self._num_pending = 0
+
         if self.connection:
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
@@ -4,7 +4,8 @@ import json
 
 from contextlib import contextmanager
 
-from openmdao.utils.record_util import format_iteration_coordinate, deserialize
+from openmdao.utils.record_util import format_iteration_coordinate, deserialize, \
+    layout_to_dtype
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
 
@@ -45,12 +46,24 @@ def get_format_version_abs2meta(db_cur):
 
     return f_version, abs2meta
 
+
+def get_var_layouts(db_cur, f_version):
+    """
+        Return the layouts of binary packed case data in the case recorder file.
+    """
+    if f_version < 11:
+        return None
+
+    db_cur.execute("SELECT id, layout FROM var_layouts")
+    return {layout_id: layout_to_dtype(json.loads(layout)) for layout_id, layout in db_cur}
+
 def assertProblemDataRecorded(test, expected, tolerance):
     """
     Expected can be from multiple cases.
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for case, (t0, t1), outputs_expected in expected:
@@ -66,7 +79,7 @@ def assertProblemDataRecorded(test, expected, tolerance):
                 outputs_text, residuals_text, derivatives, abs_err, rel_err = row_actual
 
             if f_version >= 3:
-                outputs_actual = deserialize(outputs_text, abs2meta)
+                outputs_actual = deserialize(outputs_text, abs2meta, layouts)
             elif f_version in (1, 2):
                 outputs_actual = blob_to_array(outputs_text)
 
@@ -101,6 +114,7 @@ def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), outputs_expected, inputs_expected, residuals_expected in expected:
@@ -119,9 +133,9 @@ def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
                 inputs_text, outputs_text, residuals_text = row_actual
 
             if f_version >= 3:
-                inputs_actual = deserialize(inputs_text, abs2meta)
-                outputs_actual = deserialize(outputs_text, abs2meta)
-                residuals_actual = deserialize(residuals_text, abs2meta)
+                inputs_actual = deserialize(inputs_text, abs2meta, layouts)
+                outputs_actual = deserialize(outputs_text, abs2meta, layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, layouts)
             elif f_version in (1, 2):
                 inputs_actual = blob_to_array(inputs_text)
                 outputs_actual = blob_to_array(outputs_text)
@@ -260,6 +274,7 @@ def assertSystemIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), inputs_expected, outputs_expected, residuals_expected in expected:
@@ -277,9 +292,9 @@ def assertSystemIterDataRecorded(test, expected, tolerance, prefix=None):
                 outputs_text, residuals_text = row_actual
 
             if f_version >= 3:
-                inputs_actual = deserialize(inputs_text, abs2meta)
-                outputs_actual = deserialize(outputs_text, abs2meta)
-                residuals_actual = deserialize(residuals_text, abs2meta)
+                inputs_actual = deserialize(inputs_text, abs2meta, layouts)
+                outputs_actual = deserialize(outputs_text, abs2meta, layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, layouts)
             elif f_version in (1, 2):
                 inputs_actual = blob_to_array(inputs_text)
                 outputs_actual = blob_to_array(outputs_text)
@@ -320,6 +335,7 @@ def assertSolverIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), expected_abs_error, expected_rel_error, expected_output, \
@@ -339,8 +355,8 @@ def assertSolverIterDataRecorded(test, expected, tolerance, prefix=None):
                 abs_err, rel_err, input_blob, output_text, residuals_text = row_actual
 
             if f_version >= 3:
-                output_actual = deserialize(output_text, abs2meta)
-                residuals_actual = deserialize(residuals_text, abs2meta)
+                output_actual = deserialize(output_text, abs2meta, layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, layouts)
             elif f_version in (1, 2):
                 output_actual = blob_to_array(output_text)
                 residuals_actual = blob_to_array(residuals_text)
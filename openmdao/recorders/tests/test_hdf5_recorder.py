@@ -0,0 +1,218 @@
+""" Unit tests for the HDF5Recorder and HDF5CaseReader. """
+
+import gc
+import unittest
+import weakref
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+import openmdao.api as om
+from openmdao.recorders.hdf5_reader import HDF5CaseReader
+from openmdao.recorders.hdf5_recorder import _open_recorders
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
+
+
+class DiscreteTagComp(om.ExplicitComponent):
+    """
+    Component with a discrete output that can't be stored as numeric data.
+    """
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', np.zeros(3))
+        self.add_discrete_output('tag', 'a')
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        outputs['y'] = inputs['x'] * np.arange(3)
+        discrete_outputs['tag'] = 'v%d' % int(inputs['x'])
+
+
+def run_sellar(recorder):
+    """
+    Run the Sellar optimization, recording everything to the given recorder.
+    """
+    prob = SellarProblem(SellarDerivativesGrouped)
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+    prob.driver.recording_options['record_derivatives'] = True
+    prob.setup()
+
+    prob.add_recorder(recorder)
+    prob.driver.add_recorder(recorder)
+    prob.model.add_recorder(recorder)
+    prob.model.mda.nonlinear_solver.add_recorder(recorder)
+
+    prob.run_driver()
+    prob.record('final')
+    prob.cleanup()
+
+
+@unittest.skipUnless(h5py, "HDF5Recorder requires h5py")
+@use_tempdirs
+class TestHDF5Recorder(unittest.TestCase):
+
+    def test_same_as_sqlite(self):
+        run_sellar(om.SqliteRecorder('cases.sql'))
+        run_sellar(om.HDF5Recorder('cases.h5', buffer_size=7))
+
+        expected = om.CaseReader('cases.sql')
+        cr = om.CaseReader('cases.h5')
+        self.assertTrue(isinstance(cr, HDF5CaseReader))
+
+        self.assertEqual(cr.list_sources(out_stream=None),
+                         expected.list_sources(out_stream=None))
+        self.assertEqual(cr.list_cases(out_stream=None), expected.list_cases(out_stream=None))
+        self.assertEqual(cr.list_cases('root', recurse=True, flat=False, out_stream=None),
+                         expected.list_cases('root', recurse=True, flat=False, out_stream=None))
+        self.assertEqual(sorted(cr.system_options), sorted(expected.system_options))
+        self.assertEqual(sorted(cr.solver_metadata), sorted(expected.solver_metadata))
+        self.assertEqual(sorted(cr.problem_metadata), sorted(expected.problem_metadata))
+
+        for case, expected_case in zip(cr.get_cases(), expected.get_cases()):
+            self.assertEqual(case.name, expected_case.name)
+            self.assertEqual(case.source, expected_case.source)
+            for attr in ('inputs', 'outputs', 'residuals', 'derivatives'):
+                vals = getattr(case, attr)
+                expected_vals = getattr(expected_case, attr)
+                if expected_vals is None:
+                    self.assertIsNone(vals)
+                    continue
+                self.assertEqual(sorted(vals.keys()), sorted(expected_vals.keys()))
+                for name in expected_vals.absolute_names():
+                    assert_near_equal(vals[name], expected_vals[name], 1e-12)
+
+        for source in ('driver', 'root', 'problem'):
+            assert_near_equal(cr.get_val_history(['z', 'x', 'obj'], source),
+                              expected.get_val_history(['z', 'x', 'obj'], source), 1e-12)
+
+        final = cr.get_case('final')
+        assert_near_equal(final['obj'], expected.get_case('final')['obj'], 1e-12)
+
+        cr.close()
+
+    def test_chunked_datasets(self):
+        run_sellar(om.HDF5Recorder('cases.h5', chunk_size=4, compression='gzip',
+                                   compression_opts=2))
+
+        with h5py.File('cases.h5', 'r') as f:
+            ds = f['driver_iterations/outputs/pz.z']
+            self.assertEqual(ds.chunks, (4, 2))
+            self.assertEqual(ds.compression, 'gzip')
+            self.assertEqual(ds.maxshape, (None, 2))
+
+            cr = om.CaseReader('cases.h5')
+            self.assertEqual(ds.shape[0], len(cr.list_cases('driver', recurse=False, out_stream=None)))
+            cr.close()
+
+    def test_discrete(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', 1.0), promotes=['*'])
+        model.add_subsystem('comp', DiscreteTagComp(), promotes=['*'])
+        model.add_design_var('x', lower=0, upper=4)
+        model.add_objective('y', index=1)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=5))
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(om.HDF5Recorder('cases.h5', buffer_size=2))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.h5', pre_load=True)
+        cases = cr.get_cases()
+
+        self.assertEqual([case['tag'] for case in cases], ['v0', 'v1', 'v2', 'v3', 'v4'])
+        assert_near_equal(cr.get_val_history('y'),
+                          np.arange(5.)[:, np.newaxis] * np.arange(3.), 1e-12)
+
+        with self.assertRaises(TypeError) as cm:
+            cr.get_val_history('tag')
+        self.assertEqual(str(cm.exception),
+                         "Can't get value history of 'tag' because it is not a numeric variable.")
+
+    def test_shutdown(self):
+        recorders = []
+        for i in range(3):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            recorder = om.HDF5Recorder('cases%d.h5' % i, buffer_size=10000)
+            prob.driver.add_recorder(recorder)
+            prob.setup()
+            prob.run_driver()
+            self.assertIn(recorder, _open_recorders)
+
+            prob.cleanup()
+
+            # the recorder is no longer flushed at exit
+            self.assertNotIn(recorder, _open_recorders)
+            recorders.append(weakref.ref(recorder))
+
+            cr = om.CaseReader('cases%d.h5' % i)
+            self.assertEqual(len(cr.list_cases('driver', out_stream=None)), 1)
+            cr.close()
+
+        del prob, recorder
+        gc.collect()
+
+        # nothing keeps the recorders alive once they're shut down
+        self.assertEqual([ref() for ref in recorders], [None, None, None])
+
+    def test_bad_buffer_size(self):
+        with self.assertRaises(ValueError) as cm:
+            om.HDF5Recorder('cases.h5', buffer_size=0)
+        self.assertEqual(str(cm.exception),
+                         "HDF5Recorder buffer_size must be at least 1 but 0 was given.")
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+@unittest.skipUnless(h5py and h5py.get_config().mpi, "HDF5Recorder requires h5py with MPI support")
+@use_tempdirs
+class TestHDF5RecorderMPI(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_parallel_doe(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        # 9 cases, so 5 are run on rank 0 and 4 on rank 1
+        recorder = om.HDF5Recorder('cases.h5', buffer_size=2)
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3))
+        prob.driver.options['run_parallel'] = True
+        prob.driver.add_recorder(recorder)
+        prob.setup()
+        prob.run_driver()
+
+        # cases are written while the driver runs, not only at shutdown
+        self.assertLess(recorder._num_pending, 2)
+
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.h5')
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), 9)
+        self.assertEqual(sorted((case['x'][0], case['y'][0]) for case in cases),
+                         [(x, y) for x in (0., .5, 1.) for y in (0., .5, 1.)])
+
+
+if __name__ == '__main__':
+    unittest.main()
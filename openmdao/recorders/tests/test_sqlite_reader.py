@@ -1,8 +1,10 @@
 """ Unit tests for the SqliteCaseReader. """
 
 import errno
+import gc
 import os
 import unittest
+import sqlite3
 
 from shutil import rmtree
 from tempfile import mkdtemp, mkstemp
@@ -3096,6 +3098,241 @@ class TestSqliteCaseReader(unittest.TestCase):
         for i, line in enumerate(expected_cases):
             self.assertEqual(text[i], line)
 
+    def test_binary_case_data(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.setup()
+
+        prob.add_recorder(self.recorder)
+        prob.driver.add_recorder(self.recorder)
+        prob.model.add_recorder(self.recorder)
+        prob.model.mda.nonlinear_solver.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.record('final')
+        prob.cleanup()
+
+        # all case data is made up of float arrays, so it should be stored as packed binary
+        con = sqlite3.connect(self.filename)
+        for table, col in [('driver_iterations', 'outputs'), ('system_iterations', 'inputs'),
+                           ('system_iterations', 'residuals'), ('solver_iterations',
+                                                                'solver_output'),
+                           ('problem_cases', 'outputs')]:
+            for row in con.execute("SELECT %s FROM %s" % (col, table)):
+                self.assertIsInstance(row[0], bytes)
+
+        num_layouts = con.execute("SELECT COUNT(*) FROM var_layouts").fetchone()[0]
+        num_cases = con.execute("SELECT COUNT(*) FROM global_iterations").fetchone()[0]
+        self.assertTrue(num_layouts < num_cases)
+        con.close()
+
+        cr = om.CaseReader(self.filename)
+
+        case = cr.get_case('final')
+        for name in ('obj', 'con1', 'con2', 'x', 'z', 'y1', 'y2'):
+            assert_near_equal(case[name], prob[name], 1e-12)
+
+        # values can be modified like those of any other case
+        case.outputs['obj'][0] = 5.
+        assert_near_equal(case.outputs['obj'], 5., 1e-15)
+
+        # scaling doesn't modify the recorded values
+        last = cr.get_case(cr.list_cases('driver', recurse=False)[-1])
+        z = last.outputs['z'].copy()
+        last.get_design_vars(scaled=True)
+        assert_near_equal(last.outputs['z'], z, 1e-15)
+
+        solver_cases = cr.get_cases('root.mda.nonlinear_solver', recurse=False)
+        self.assertTrue(len(solver_cases) > 0)
+        assert_near_equal(solver_cases[-1].outputs['mda.d1.y1'], prob['y1'], 1e-6)
+
+    def test_binary_case_data_discrete(self):
+        model = om.Group()
+
+        indep = model.add_subsystem('indep', om.IndepVarComp())
+        indep.add_discrete_output('x', 11)
+        indep.add_output('y', 2.0)
+
+        model.add_subsystem('expl', ModCompEx(3))
+        model.connect('indep.x', 'expl.x')
+
+        model.add_recorder(self.recorder)
+
+        prob = om.Problem(model)
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        # discrete values can't be packed, so fall back to JSON
+        con = sqlite3.connect(self.filename)
+        outputs = con.execute("SELECT outputs FROM system_iterations").fetchone()[0]
+        con.close()
+        self.assertIsInstance(outputs, str)
+
+        case = om.CaseReader(self.filename).get_case(0)
+        self.assertEqual(case['indep.x'], 11)
+        assert_near_equal(case['indep.y'], 2.0, 1e-15)
+
+    def test_get_val_history(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.setup()
+
+        prob.add_recorder(self.recorder)
+        prob.driver.add_recorder(self.recorder)
+        prob.model.add_recorder(self.recorder)
+        prob.model.mda.nonlinear_solver.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.record('final')
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename)
+
+        for source in ('driver', 'root', 'problem'):
+            cases = cr.get_cases(source, recurse=False)
+            expected = np.array([np.hstack([case.outputs['z'], case.outputs['x'],
+                                            case.outputs['obj']])
+                                 for case in cases])
+
+            hist = cr.get_val_history(['z', 'x', 'obj'], source=source)
+            self.assertEqual(hist.shape, (len(cases), 4))
+            assert_near_equal(hist, expected, 1e-15)
+
+        # a single variable, by absolute name
+        hist = cr.get_val_history('mda.d1.y1', source='root.mda.nonlinear_solver')
+        cases = cr.get_cases('root.mda.nonlinear_solver', recurse=False)
+        assert_near_equal(hist, np.array([case['mda.d1.y1'] for case in cases]), 1e-15)
+
+        # inputs are found when there is no output with that name
+        hist = cr.get_val_history('obj_cmp.y1', source='root')
+        assert_near_equal(hist[-1], prob['y1'], 1e-6)
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo')
+        self.assertEqual(str(cm.exception), "\"Variable name 'foo' not found.\"")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('x', source='foo')
+        self.assertEqual(str(cm.exception), "Source not found: foo")
+
+        cr.close()
+
+    def test_get_val_history_coordinate(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=4))
+        prob.driver.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename)
+        cases = cr.list_cases('driver', out_stream=None)
+
+        # an iteration coordinate only matches its own case, not the ones it is a prefix of
+        coord = cases[1]
+        self.assertTrue(cases[10].startswith(coord))
+        hist = cr._driver_cases.get_val_history('f_xy', source=coord)
+        assert_near_equal(hist, [cr.get_case(coord)['f_xy']], 1e-15)
+
+        cr.close()
+
+    def test_get_val_history_json(self):
+        model = om.Group()
+
+        indep = model.add_subsystem('indep', om.IndepVarComp())
+        indep.add_discrete_output('x', 11)
+        indep.add_output('y', np.array([2.0, 3.0]))
+
+        model.add_subsystem('expl', ModCompEx(3))
+        model.connect('indep.x', 'expl.x')
+
+        model.add_recorder(self.recorder)
+
+        prob = om.Problem(model)
+        prob.setup()
+        prob.run_model()
+        prob['indep.y'] = np.array([4.0, 5.0])
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename)
+
+        # discrete data is recorded as JSON, numeric values can still be retrieved
+        assert_near_equal(cr.get_val_history('indep.y', source='root'),
+                          np.array([[2.0, 3.0], [4.0, 5.0]]), 1e-15)
+
+        with self.assertRaises(TypeError) as cm:
+            cr.get_val_history('indep.x', source='root')
+        self.assertEqual(str(cm.exception), "Can't get value history of 'indep.x' because "
+                         "it is not a numeric variable.")
+
+    def test_reader_connection(self):
+        prob = SellarProblem()
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.add_recorder(self.recorder)
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename)
+
+        # the tables share a single read-only connection
+        con = cr._con
+        for table in (cr._driver_cases, cr._system_cases, cr._solver_cases, cr._problem_cases):
+            self.assertIs(table._get_connection(), con)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            con.execute("DELETE FROM driver_iterations")
+
+        # case keys are passed as query parameters, so quotes don't break the lookup
+        self.assertIsNone(cr._driver_cases.get_case("rank0:'"))
+
+        # bulk loaded cases match cases loaded one at a time, including derivatives
+        cases = cr.get_cases('driver', recurse=False)
+        self.assertEqual(len(cases), cr._driver_cases.count())
+        num_derivs = 0
+        for case in cases:
+            single = cr.get_case(case.name)
+            self.assertEqual(case.name, single.name)
+            assert_near_equal(case['obj'], single['obj'], 1e-15)
+            if single.derivatives is None:
+                self.assertIsNone(case.derivatives)
+            else:
+                num_derivs += 1
+                assert_near_equal(case.derivatives['obj', 'z'], single.derivatives['obj', 'z'],
+                                  1e-15)
+        self.assertTrue(num_derivs > 0)
+
+        cr.close()
+        self.assertIsNone(cr._con)
+
+        # the connection is closed at the end of a with block
+        with om.CaseReader(self.filename) as cr:
+            con = cr._con
+            self.assertEqual(len(cr.list_cases('driver', out_stream=None)),
+                             cr._driver_cases.count())
+        self.assertIsNone(cr._con)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            con.execute("SELECT * FROM driver_iterations")
+
+        # and when the reader is garbage collected
+        cr = om.CaseReader(self.filename)
+        con = cr._con
+        del cr
+        gc.collect()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            con.execute("SELECT * FROM driver_iterations")
+
 @use_tempdirs
 class TestFeatureSqliteReader(unittest.TestCase):
 
@@ -3788,6 +4025,44 @@ class TestSqliteCaseReaderLegacy(unittest.TestCase):
             if e.errno not in (errno.ENOENT, errno.EACCES, errno.EPERM):
                 raise e
 
+    def test_driver_solver_system_v10(self):
+        # The change from v10 to v11 was storing float case data as packed binary blobs.
+        # Make sure JSON case data from v10 can still be read.
+
+        # Case file created using this code
+
+        # import openmdao.api as om
+        # from openmdao.test_suite.components.sellar import SellarProblem
+        #
+        # prob = SellarProblem()
+        # prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        #
+        # recorder = om.SqliteRecorder('case_driver_solver_system_v10.sql',
+        #                              record_viewer_data=False)
+        # prob.driver.add_recorder(recorder)
+        # prob.model.add_recorder(recorder)
+        # prob.model.nonlinear_solver.add_recorder(recorder)
+        #
+        # prob.setup()
+        # prob.run_driver()
+        # prob.cleanup()
+
+        filename = os.path.join(self.legacy_dir, 'case_driver_solver_system_v10.sql')
+        cr = om.CaseReader(filename)
+
+        self.assertEqual(sorted(cr.list_sources(out_stream=None)), ['driver', 'root'])
+
+        driver_cases = cr.list_cases('driver', recurse=False)
+        self.assertEqual(len(driver_cases), 7)
+
+        case = cr.get_case(driver_cases[-1])
+        assert_near_equal(case.outputs['obj'], 3.18339395, 1e-6)
+        assert_near_equal(case.outputs['z'], [1.97763888, 0.], 1e-6)
+
+        system_cases = cr.list_cases('root', recurse=False)
+        case = cr.get_case(system_cases[-1])
+        assert_near_equal(case.inputs['obj_cmp.x'], 0., 1e-6)
+
     def test_problem_v9(self):
 
         # The change from v9 to v10 was changing adding the abs_err and rel_err
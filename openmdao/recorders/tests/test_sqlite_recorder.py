@@ -1,7 +1,9 @@
 """ Unit test for the SqliteRecorder. """
 import errno
+import gc
 import os
 import unittest
+import weakref
 import numpy as np
 
 import sqlite3
@@ -26,6 +28,7 @@ from openmdao.recorders.tests.sqlite_recorder_test_utils import assertMetadataRe
     assertDriverDerivDataRecorded, assertProblemDerivDataRecorded
 
 from openmdao.recorders.tests.recorder_test_utils import run_driver
+from openmdao.recorders.sqlite_recorder import _open_recorders
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning, assert_equal_arrays
 from openmdao.utils.general_utils import determine_adder_scaler
 from openmdao.utils.testing_utils import use_tempdirs
@@ -1570,12 +1573,8 @@ class TestSqliteRecorder(unittest.TestCase):
 
     def test_recorder_cleanup(self):
         def assert_closed(self, recorder):
-            try:
-                recorder.connection.execute("SELECT * FROM metadata;")
-            except sqlite3.ProgrammingError as err:
-                self.assertEqual(str(err), 'Cannot operate on a closed database.')
-            else:
-                self.fail('SqliteRecorder database was not closed.')
+            # the connection is closed and released on shutdown
+            self.assertIsNone(recorder.connection, 'SqliteRecorder database was not closed.')
 
         prob = SellarProblem(SellarStateConnection)
         prob.setup()
@@ -2225,6 +2224,114 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertAlmostEqual((unscaled_y + adder) * scaler, scaled_y, places=12)
 
 
+    def _run_sellar_buffered(self, filename, **kwargs):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        recorder = om.SqliteRecorder(filename, record_viewer_data=False, **kwargs)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.add_recorder(recorder)
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.add_recorder(recorder)
+
+        prob.setup()
+
+        prob.model.add_recorder(recorder)
+        prob.model.nonlinear_solver.add_recorder(recorder)
+        prob.model.mda.nonlinear_solver.add_recorder(recorder)
+
+        prob.run_driver()
+        prob.record('final')
+
+        return prob
+
+    def _get_table_rows(self, filename, sql):
+        con = sqlite3.connect(filename)
+        rows = con.execute(sql).fetchall()
+        con.close()
+        return rows
+
+    def test_buffered_recording(self):
+        prob = self._run_sellar_buffered('unbuffered.sql')
+        prob.cleanup()
+
+        prob = self._run_sellar_buffered('buffered.sql', buffer_size=10000)
+
+        # nothing has been written yet
+        self.assertEqual(self._get_table_rows('buffered.sql',
+                                              "SELECT COUNT(*) FROM global_iterations"), [(0,)])
+        prob.cleanup()
+
+        sql = "SELECT record_type, rowid, source FROM global_iterations"
+        expected = self._get_table_rows('unbuffered.sql', sql)
+        self.assertTrue(len(expected) > 50)
+        self.assertEqual(self._get_table_rows('buffered.sql', sql), expected)
+
+        for table, cols in [('driver_iterations', 'id, counter, iteration_coordinate'),
+                            ('driver_derivatives', 'id, counter, iteration_coordinate'),
+                            ('system_iterations', 'id, counter, iteration_coordinate, outputs'),
+                            ('solver_iterations', 'id, counter, iteration_coordinate, abs_err'),
+                            ('problem_cases', 'id, counter, case_name')]:
+            sql = "SELECT %s FROM %s" % (cols, table)
+            self.assertEqual(self._get_table_rows('buffered.sql', sql),
+                             self._get_table_rows('unbuffered.sql', sql))
+
+        cr = om.CaseReader('buffered.sql')
+        self.assertEqual(cr.list_cases('root.nonlinear_solver', recurse=False),
+                         om.CaseReader('unbuffered.sql').list_cases('root.nonlinear_solver',
+                                                                    recurse=False))
+        case = cr.get_case('final')
+        assert_near_equal(case['obj'], prob['obj'], 1e-10)
+
+    def test_buffered_recording_flush_size(self):
+        prob = self._run_sellar_buffered('buffered.sql', buffer_size=5)
+
+        # only complete buffers have been written before cleanup
+        count = self._get_table_rows('buffered.sql', "SELECT COUNT(*) FROM global_iterations")
+        self.assertTrue(count[0][0] > 0)
+        prob.cleanup()
+
+        total = self._get_table_rows('buffered.sql', "SELECT COUNT(*) FROM global_iterations")
+        self.assertTrue(total[0][0] - count[0][0] < 5)
+
+    def test_buffered_recording_flush_interval(self):
+        prob = self._run_sellar_buffered('buffered.sql', buffer_size=10000, flush_interval=0.,
+                                         journal_mode='WAL')
+
+        # a zero flush interval writes every case
+        count = self._get_table_rows('buffered.sql', "SELECT COUNT(*) FROM global_iterations")
+        prob.cleanup()
+        self.assertEqual(self._get_table_rows('buffered.sql',
+                                              "SELECT COUNT(*) FROM global_iterations"), count)
+        self.assertEqual(self._get_table_rows('buffered.sql', "PRAGMA journal_mode"), [('wal',)])
+
+    def test_buffered_recording_shutdown(self):
+        recorders = []
+        for i in range(3):
+            prob = self._run_sellar_buffered('buffered%d.sql' % i, buffer_size=10000)
+            recorder = prob.driver._rec_mgr._recorders[0]
+            self.assertIn(recorder, _open_recorders)
+
+            prob.cleanup()
+
+            # the connection is released and the recorder is no longer flushed at exit
+            self.assertIsNone(recorder.connection)
+            self.assertNotIn(recorder, _open_recorders)
+            recorders.append(weakref.ref(recorder))
+
+        del prob, recorder
+        gc.collect()
+
+        # nothing keeps the recorders alive once they're shut down
+        self.assertEqual([ref() for ref in recorders], [None, None, None])
+
+    def test_bad_buffer_size(self):
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', buffer_size=0)
+
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder buffer_size must be at least 1 but 0 was given.")
+
+
 @use_tempdirs
 class TestFeatureSqliteRecorder(unittest.TestCase):
 
@@ -2334,7 +2441,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['name'], 'DOEDriver')
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'num_local_procs': 1})
 
         # Optimization
         driver = prob.driver = om.ScipyOptimizeDriver()
@@ -1,5 +1,6 @@
 """LinearSolver that uses linalg.solve or LU factor/solve."""
 
+import os
 import warnings
 
 import numpy as np
@@ -9,6 +10,7 @@ from scipy.sparse import csc_matrix
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.dense_matrix import DenseMatrix
+from openmdao.utils.coloring import Coloring, _compute_coloring, _DEF_COMP_SPARSITY_ARGS
 
 
 def index_to_varname(system, loc):
@@ -166,10 +168,47 @@ def format_nan_error(system, matrix):
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
+
+    Attributes
+    ----------
+    _coloring : Coloring or None
+        Coloring of the linear operator used to assemble the matrix when there is no assembled
+        jacobian and the 'use_coloring' option is True.
+    _color_inds : list of (ndarray, ndarray, ndarray) or None
+        Seed columns, nonzero rows and matrix data locations for each color.
+    _mtx_indices : ndarray or None
+        Row indices of the colored CSC matrix.
+    _mtx_indptr : ndarray or None
+        Column pointers of the colored CSC matrix.
+    _lu_perm : tuple or None
+        Column permutation of the sparse matrix computed by the first sparse LU factorization,
+        with the data locations, row indices and column pointers of the permuted matrix. Only
+        used when the 'reuse_ordering' option is True.
+    _lu_order : ndarray or None
+        Column order of the matrix factored by the current sparse LU factorization, or None if
+        its columns weren't permuted.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(DirectSolver, self).__init__(**kwargs)
+
+        self._coloring = None
+        self._color_inds = None
+        self._mtx_indices = None
+        self._mtx_indptr = None
+        self._lu_perm = None
+        self._lu_order = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -178,6 +217,24 @@ class DirectSolver(LinearSolver):
 
         self.options.declare('err_on_singular', types=bool, default=True,
                              desc="Raise an error if LU decomposition is singular.")
+        self.options.declare('use_coloring', types=bool, default=False,
+                             desc="If True and there is no assembled jacobian, assemble a sparse "
+                             "matrix using colored seed vectors instead of one matrix-vector "
+                             "product per column. The sparsity is computed from the declared "
+                             "partials the first time the solver linearizes, or loaded from "
+                             "'coloring_file'.")
+        self.options.declare('coloring_file', types=str, default=None, allow_none=True,
+                             desc="File used to store the coloring of the linear operator when "
+                             "'use_coloring' is True. If the file exists, the coloring is loaded "
+                             "from it, otherwise the computed coloring is saved to it.")
+        self.options.declare('multi_rhs_totals', types=bool, default=True,
+                             desc="If True and this is the linear solver of the model, total "
+                             "derivatives are computed by solving for all seeds (or colors) at "
+                             "once using a matrix right-hand side instead of one solve per seed.")
+        self.options.declare('reuse_ordering', types=bool, default=False,
+                             desc="If True, the column ordering computed by the first sparse LU "
+                             "factorization is reused by later factorizations. The sparsity "
+                             "pattern of the matrix must not change between factorizations.")
 
         # this solver does not iterate
         self.options.undeclare("maxiter")
@@ -203,6 +260,11 @@ class DirectSolver(LinearSolver):
         super(DirectSolver, self)._setup_solvers(system, depth)
         self._disallow_distrib_solve()
 
+        # sizes may have changed, so the coloring must be recomputed or reloaded
+        self._coloring = self._color_inds = None
+        self._mtx_indices = self._mtx_indptr = None
+        self._lu_perm = self._lu_order = None
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -255,6 +317,147 @@ class DirectSolver(LinearSolver):
 
         return mtx
 
+    def _compute_sparsity(self):
+        """
+        Compute the sparsity of the linear operator.
+
+        As for partial and total coloring, the matrix is assembled several times with the
+        declared partials replaced by random values, and all but the first time at randomly
+        perturbed inputs and outputs, so that partials that happen to be zero at the current
+        point aren't dropped.
+
+        Returns
+        -------
+        csc_matrix
+            Boolean sparsity of the linear operator.
+        """
+        system = self._system()
+        nmtx = system._vectors['output']['linear']._data.size
+        perturb_size = _DEF_COMP_SPARSITY_ARGS['perturb_size']
+
+        starting_inputs = system._inputs._data.copy()
+        in_offsets = starting_inputs.copy()
+        in_offsets[in_offsets == 0.0] = 1.0
+        in_offsets *= perturb_size
+
+        starting_outputs = system._outputs._data.copy()
+        out_offsets = starting_outputs.copy()
+        out_offsets[out_offsets == 0.0] = 1.0
+        out_offsets *= perturb_size
+
+        jacs = []
+        for subsys in system.system_iter(recurse=True, include_self=True):
+            jacs.extend(jac for jac in (subsys._jacobian, subsys._assembled_jac)
+                        if jac is not None)
+        for jac in jacs:
+            jac._randomize = True
+
+        sparsity = scipy.sparse.identity(nmtx, dtype=bool, format='csc')
+        try:
+            for i in range(_DEF_COMP_SPARSITY_ARGS['num_full_jacs']):
+                if i > 0:
+                    system._inputs._data[:] = \
+                        starting_inputs + in_offsets * np.random.random(in_offsets.size)
+                    system._outputs._data[:] = \
+                        starting_outputs + out_offsets * np.random.random(out_offsets.size)
+
+                # assembled jacobians of subsystems randomize their values when updated
+                system._linearize(None, sub_do_ln=False)
+                sparsity += csc_matrix(self._build_mtx() != 0.)
+        finally:
+            for jac in jacs:
+                jac._randomize = False
+            system._inputs._data[:] = starting_inputs
+            system._outputs._data[:] = starting_outputs
+            system._linearize(None, sub_do_ln=False)
+
+        return sparsity
+
+    def _setup_coloring(self, sparsity=None):
+        """
+        Compute or load the coloring of the linear operator and the colored matrix structure.
+
+        Parameters
+        ----------
+        sparsity : csc_matrix or None
+            Boolean sparsity of the linear operator. If None, the coloring is loaded from
+            'coloring_file'.
+        """
+        system = self._system()
+        fname = self.options['coloring_file']
+
+        if sparsity is None:
+            coloring = Coloring.load(fname)
+            nmtx = system._vectors['output']['linear']._data.size
+            if coloring._shape != (nmtx, nmtx):
+                raise RuntimeError("{}: Coloring loaded from '{}' has shape {} but the matrix has "
+                                   "shape {}.".format(self.msginfo, fname, coloring._shape,
+                                                      (nmtx, nmtx)))
+        else:
+            coloring = _compute_coloring(sparsity, 'fwd')
+            if fname is not None:
+                coloring.save(fname)
+
+        sparsity = csc_matrix((np.ones(coloring._nzrows.size, dtype=bool),
+                               (coloring._nzrows, coloring._nzcols)), shape=coloring._shape)
+        sparsity.sort_indices()
+        indptr = sparsity.indptr
+        indices = sparsity.indices
+
+        color_inds = []
+        for cols in coloring.color_iter('fwd'):
+            locs = np.concatenate([np.arange(indptr[c], indptr[c + 1]) for c in cols])
+            color_inds.append((np.asarray(cols), indices[locs], locs))
+
+        self._coloring = coloring
+        self._color_inds = color_inds
+        self._mtx_indices = indices
+        self._mtx_indptr = indptr
+
+    def _build_colored_mtx(self):
+        """
+        Assemble a sparse Jacobian matrix by matrix-vector-product with colored seed vectors.
+
+        Returns
+        -------
+        csc_matrix
+            Jacobian matrix.
+        """
+        if self._coloring is None:
+            fname = self.options['coloring_file']
+            if fname is not None and os.path.exists(fname):
+                self._setup_coloring()
+            else:
+                self._setup_coloring(self._compute_sparsity())
+
+        system = self._system()
+        bvec = system._vectors['residual']['linear']
+        xvec = system._vectors['output']['linear']
+
+        # First make a backup of the vectors
+        b_data = bvec._data.copy()
+        x_data = xvec._data.copy()
+
+        data = np.empty(self._mtx_indices.size, dtype=b_data.dtype)
+        scope_out, scope_in = system._get_scope()
+        vnames = ['linear']
+
+        # Assemble the Jacobian by running one seed vector per color through apply_linear
+        for cols, rows, locs in self._color_inds:
+            xvec._data[:] = 0.0
+            xvec._data[cols] = 1.0
+
+            system._apply_linear(self._assembled_jac, vnames, self._rel_systems, 'fwd',
+                                 scope_out, scope_in)
+
+            data[locs] = bvec._data[rows]
+
+        # Restore the backed-up vectors
+        bvec._data[:] = b_data
+        xvec._data[:] = x_data
+
+        return csc_matrix((data, self._mtx_indices, self._mtx_indptr), shape=self._coloring._shape)
+
     def _linearize(self):
         """
         Perform factorization.
@@ -271,13 +474,7 @@ class DirectSolver(LinearSolver):
 
             # Perform dense or sparse lu factorization.
             elif isinstance(matrix, csc_matrix):
-                try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
-                except RuntimeError as err:
-                    if 'exactly singular' in str(err):
-                        raise RuntimeError(format_singular_error(system, matrix))
-                    else:
-                        raise err
+                self._lu = self._sparse_lu_factor(matrix)
 
             elif isinstance(matrix, np.ndarray):  # dense
                 # During LU decomposition, detect singularities and warn user.
@@ -304,6 +501,15 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("DirectSolvers without an assembled jacobian are not supported "
                                    "when running under MPI if comm.size > 1.")
 
+            if self.options['use_coloring']:
+                mtx = self._build_colored_mtx()
+
+                if np.any(np.isnan(mtx.data)):
+                    raise RuntimeError(format_nan_error(system, mtx.toarray()))
+
+                self._lu = self._sparse_lu_factor(mtx)
+                return
+
             mtx = self._build_mtx()
 
             # During LU decomposition, detect singularities and warn user.
@@ -322,6 +528,118 @@ class DirectSolver(LinearSolver):
                 except ValueError as err:
                     raise RuntimeError(format_nan_error(system, mtx))
 
+    def _sparse_lu_factor(self, matrix):
+        """
+        Perform a sparse LU factorization, reusing the column ordering if requested.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            Matrix to factor.
+
+        Returns
+        -------
+        SuperLU
+            LU factorization of the matrix, or of the matrix with permuted columns if the
+            column ordering is reused.
+        """
+        perm = self._lu_perm
+        self._lu_order = None
+
+        try:
+            if perm is None:
+                lu = scipy.sparse.linalg.splu(matrix)
+
+                if self.options['reuse_ordering']:
+                    # store the locations of the data of the column permuted matrix so that
+                    # later factorizations can skip computing the ordering.
+                    perm_c = lu.perm_c
+                    indptr = matrix.indptr
+                    order = np.argsort(perm_c)
+                    counts = np.diff(indptr)[order]
+                    perm_indptr = np.zeros(indptr.size, dtype=indptr.dtype)
+                    np.cumsum(counts, out=perm_indptr[1:])
+                    locs = np.repeat(indptr[:-1][order] - perm_indptr[:-1], counts)
+                    locs += np.arange(locs.size)
+                    self._lu_perm = (order, locs, matrix.indices[locs], perm_indptr)
+            else:
+                order, locs, indices, indptr = perm
+                pmatrix = csc_matrix((matrix.data[locs], indices, indptr), shape=matrix.shape)
+                lu = scipy.sparse.linalg.splu(pmatrix, permc_spec='NATURAL')
+                self._lu_order = order
+
+        except RuntimeError as err:
+            if 'exactly singular' in str(err):
+                raise RuntimeError(format_singular_error(self._system(), matrix))
+            else:
+                raise err
+
+        return lu
+
+    def _sparse_lu_solve(self, b_vec, trans_splu):
+        """
+        Solve using the sparse LU factorization.
+
+        Parameters
+        ----------
+        b_vec : ndarray
+            Right-hand side.
+        trans_splu : str
+            'N' to solve with the matrix or 'T' to solve with its transpose.
+
+        Returns
+        -------
+        ndarray
+            Solution vector.
+        """
+        order = self._lu_order
+        if order is None:
+            return self._lu.solve(b_vec, trans_splu)
+
+        if trans_splu == 'N':
+            arr = np.empty(b_vec.shape, dtype=b_vec.dtype)
+            arr[order] = self._lu.solve(b_vec, trans_splu)
+            return arr
+
+        return self._lu.solve(b_vec[order], trans_splu)
+
+    def _solve_block(self, rhs, mode):
+        """
+        Solve the linear system for multiple right-hand sides using the current factorization.
+
+        The vectors of the owning system are not used, so the right-hand sides and solutions
+        are in the scaled state if there is no assembled jacobian and in the unscaled state
+        otherwise.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right-hand sides, one per column.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Solutions, one per column.
+        """
+        if mode == 'fwd':
+            trans_lu = 0
+            trans_splu = 'N'
+        else:  # rev
+            trans_lu = 1
+            trans_splu = 'T'
+
+        if self._assembled_jac is not None:
+            if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
+                return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+            return self._sparse_lu_solve(rhs, trans_splu)
+
+        elif self.options['use_coloring']:
+            return self._sparse_lu_solve(rhs, trans_splu)
+
+        return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+
     def _inverse(self):
         """
         Return the inverse Jacobian.
@@ -383,7 +701,10 @@ class DirectSolver(LinearSolver):
             if nproc > 1:
                 raise RuntimeError("BroydenSolvers without an assembled jacobian are not supported "
                                    "when running under MPI if comm.size > 1.")
-            mtx = self._build_mtx()
+            if self.options['use_coloring']:
+                mtx = self._build_colored_mtx().toarray()
+            else:
+                mtx = self._build_mtx()
 
             # During inversion detect singularities and warn user.
             with warnings.catch_warnings():
@@ -448,10 +769,12 @@ class DirectSolver(LinearSolver):
                 if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
                     arr = scipy.linalg.lu_solve(self._lup, full_b, trans=trans_lu)
                 else:
-                    arr = self._lu.solve(full_b, trans_splu)
+                    arr = self._sparse_lu_solve(full_b, trans_splu)
 
                 x_vec[:] = arr
 
         # matrix-vector-product generated jacobians are scaled.
+        elif self.options['use_coloring']:
+            x_vec[:] = self._sparse_lu_solve(b_vec, trans_splu)
         else:
             x_vec[:] = scipy.linalg.lu_solve(self._lup, b_vec, trans=trans_lu)
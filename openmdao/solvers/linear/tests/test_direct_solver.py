@@ -1,5 +1,6 @@
 """Test the DirectSolver linear solver class."""
 
+import os
 import unittest
 
 import numpy as np
@@ -13,6 +14,7 @@ from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 try:
     from openmdao.vectors.petsc_vector import PETScVector
 except ImportError:
@@ -83,6 +85,118 @@ class DupPartialsComp(om.ExplicitComponent):
         pass
 
 
+class TriDiagComp(om.ImplicitComponent):
+    """
+    Matrix-free implicit component with a tridiagonal residual jacobian.
+    """
+
+    def initialize(self):
+        self.options.declare('size', types=int, default=20)
+
+    def setup(self):
+        size = self.options['size']
+        self.add_input('b', np.ones(size))
+        self.add_output('x', np.ones(size))
+        self.nlin = 0
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        x = outputs['x']
+        residuals['x'] = 4.0 * x + x ** 3 - inputs['b']
+        residuals['x'][1:] -= x[:-1]
+        residuals['x'][:-1] -= x[1:]
+
+    def linearize(self, inputs, outputs, jacobian):
+        self.diag = 4.0 + 3.0 * outputs['x'] ** 2
+
+    def apply_linear(self, inputs, outputs, d_inputs, d_outputs, d_residuals, mode):
+        self.nlin += 1
+        if mode == 'fwd':
+            if 'x' in d_outputs:
+                dx = d_outputs['x']
+                d_residuals['x'] += self.diag * dx
+                d_residuals['x'][1:] -= dx[:-1]
+                d_residuals['x'][:-1] -= dx[1:]
+            if 'b' in d_inputs:
+                d_residuals['x'] -= d_inputs['b']
+        else:
+            dr = d_residuals['x']
+            if 'x' in d_outputs:
+                d_outputs['x'] += self.diag * dr
+                d_outputs['x'][:-1] -= dr[1:]
+                d_outputs['x'][1:] -= dr[:-1]
+            if 'b' in d_inputs:
+                d_inputs['b'] -= dr
+
+
+class TriDiagPartialsComp(om.ImplicitComponent):
+    """
+    Implicit component with the same residuals as TriDiagComp and declared partials.
+    """
+
+    def initialize(self):
+        self.options.declare('size', types=int, default=20)
+        self.options.declare('ref', default=1.0)
+
+    def setup(self):
+        size = self.options['size']
+        self.add_input('b', np.ones(size))
+        self.add_output('x', np.ones(size), ref=self.options['ref'])
+
+        ar = np.arange(size)
+        rows = np.concatenate([ar, ar[1:], ar[:-1]])
+        cols = np.concatenate([ar, ar[:-1], ar[1:]])
+        self.declare_partials('x', 'x', rows=rows, cols=cols)
+        self.declare_partials('x', 'b', rows=ar, cols=ar, val=-1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        x = outputs['x']
+        residuals['x'] = 4.0 * x + x ** 3 - inputs['b']
+        residuals['x'][1:] -= x[:-1]
+        residuals['x'][:-1] -= x[1:]
+
+    def linearize(self, inputs, outputs, partials):
+        size = self.options['size']
+        partials['x', 'x'][:size] = 4.0 + 3.0 * outputs['x'] ** 2
+        partials['x', 'x'][size:] = -1.0
+
+
+class ZeroStartComp(om.ImplicitComponent):
+    """
+    Implicit component with a partial, dR1/dx0 = x1, that is zero at the starting point.
+    """
+
+    def setup(self):
+        self.add_input('p', 1.0)
+        self.add_output('x', np.zeros(2))
+        self.declare_partials('x', 'x', rows=[0, 1, 1], cols=[0, 0, 1])
+        self.declare_partials('x', 'p', rows=[0], cols=[0], val=-1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        x = outputs['x']
+        residuals['x'] = [x[0] - inputs['p'][0], x[1] * (1.0 + x[0]) - 5.0]
+
+    def linearize(self, inputs, outputs, partials):
+        x = outputs['x']
+        partials['x', 'x'] = [1.0, x[1], 1.0 + x[0]]
+
+
+def _build_tridiag_problem(size=20, **solver_opts):
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('px', om.IndepVarComp('b', np.linspace(1., 2., size)))
+    sub = model.add_subsystem('sub', om.Group())
+    sub.add_subsystem('comp', TriDiagComp(size=size))
+    sub.add_subsystem('obj', om.ExecComp('y = 2.0 * x', x=np.zeros(size), y=np.zeros(size)))
+    sub.connect('comp.x', 'obj.x')
+    model.connect('px.b', 'sub.comp.b')
+
+    sub.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+    sub.linear_solver = om.DirectSolver(assemble_jac=False, **solver_opts)
+
+    prob.setup()
+    return prob
+
+
 class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_class = om.DirectSolver
@@ -195,6 +309,36 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
         J = prob.compute_totals(wrt=['indeps.x'], of=['comp.y'], return_format='array')
         np.testing.assert_almost_equal(J, np.eye(size) * 2.)
 
+    def test_reuse_ordering(self):
+        def build(reuse):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('px', om.IndepVarComp('b', np.linspace(1., 2., 30)))
+            model.add_subsystem('comp', TriDiagPartialsComp(size=30))
+            model.connect('px.b', 'comp.b')
+
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+            model.linear_solver = om.DirectSolver(reuse_ordering=reuse)
+            prob.setup()
+            return prob
+
+        expected = build(False)
+        expected.run_model()
+        Jexpected = expected.compute_totals('comp.x', 'px.b', return_format='array')
+
+        prob = build(True)
+        prob.run_model()
+        assert_near_equal(prob['comp.x'], expected['comp.x'], 1e-12)
+
+        for mode in ('fwd', 'rev'):
+            prob.setup(mode=mode)
+            prob.run_model()
+            J = prob.compute_totals('comp.x', 'px.b', return_format='array')
+            assert_near_equal(J, Jexpected, 1e-12)
+
+            # later factorizations use the stored column ordering
+            self.assertIsNotNone(prob.model.linear_solver._lu_order)
+
     def test_raise_error_on_singular(self):
         prob = om.Problem()
         model = prob.model
@@ -942,6 +1086,243 @@ class TestDirectSolverRemoteErrors(unittest.TestCase):
 
 
 
+@use_tempdirs
+class TestDirectSolverColored(unittest.TestCase):
+
+    def test_colored_assembly(self):
+        expected = _build_tridiag_problem()
+        expected.run_model()
+        Jexpected = expected.compute_totals('sub.obj.y', 'px.b', return_format='array')
+
+        prob = _build_tridiag_problem(use_coloring=True)
+        prob.run_model()
+        assert_near_equal(prob['sub.comp.x'], expected['sub.comp.x'], 1e-12)
+
+        J = prob.compute_totals('sub.obj.y', 'px.b', return_format='array')
+        assert_near_equal(J, Jexpected, 1e-12)
+
+        solver = prob.model.sub.linear_solver
+        coloring = solver._coloring
+
+        # tridiagonal block plus the diagonal obj block needs only 3 colors
+        self.assertEqual(coloring.total_solves(do_rev=False), 3)
+
+        # the colored matrix is the same as the column by column one
+        mtx = solver._build_colored_mtx()
+        assert_near_equal(mtx.toarray(), solver._build_mtx(), 1e-15)
+
+        comp = prob.model.sub.comp
+        comp.nlin = 0
+        solver._build_colored_mtx()
+        self.assertEqual(comp.nlin, 3)
+
+        # rev mode gives the same totals
+        prob.setup(mode='rev')
+        prob.run_model()
+        J = prob.compute_totals('sub.obj.y', 'px.b', return_format='array')
+        assert_near_equal(J, Jexpected, 1e-12)
+
+    def test_coloring_file(self):
+        prob = _build_tridiag_problem(use_coloring=True, coloring_file='direct_coloring.pkl')
+        prob.run_model()
+        J = prob.compute_totals('sub.obj.y', 'px.b', return_format='array')
+
+        self.assertTrue(os.path.exists('direct_coloring.pkl'))
+
+        prob = _build_tridiag_problem(use_coloring=True, coloring_file='direct_coloring.pkl')
+        comp = prob.model.sub.comp
+        prob.final_setup()
+        comp.nlin = 0
+        prob.run_model()
+
+        # loaded coloring, so no column by column assembly
+        self.assertEqual(comp.nlin, 3 * prob.model.sub.nonlinear_solver._iter_count)
+        assert_near_equal(prob.compute_totals('sub.obj.y', 'px.b', return_format='array'),
+                          J, 1e-12)
+
+        prob = _build_tridiag_problem(size=10, use_coloring=True,
+                                      coloring_file='direct_coloring.pkl')
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "DirectSolver in Group (sub): Coloring loaded from "
+                         "'direct_coloring.pkl' has shape (40, 40) but the matrix has shape "
+                         "(20, 20).")
+
+    def test_colored_singular(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', 1.0))
+        model.add_subsystem('comp', SingularComp())
+        model.connect('p.x', 'comp.x')
+
+        model.linear_solver = om.DirectSolver(assemble_jac=False, use_coloring=True)
+
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals('comp.y', 'p.x')
+
+        self.assertEqual(str(cm.exception),
+                         "Singular entry found in Group (<model>) for row associated with "
+                         "state/residual 'comp.y' index 0.")
+
+
+    def test_colored_zero_partial_at_start(self):
+        J = {}
+        for use_coloring in [False, True]:
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('p', om.IndepVarComp('p', 1.0))
+            model.add_subsystem('comp', ZeroStartComp())
+            model.connect('p.p', 'comp.p')
+
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+            model.linear_solver = om.DirectSolver(assemble_jac=False, use_coloring=use_coloring)
+
+            prob.setup()
+            prob.run_model()
+
+            assert_near_equal(prob['comp.x'], [1.0, 2.5], 1e-10)
+            J[use_coloring] = prob.compute_totals('comp.x', 'p.p', return_format='array')
+
+        # the coloring is computed at x = 0, where dR1/dx0 is zero, but the partial is kept
+        assert_near_equal(J[True], J[False], 1e-12)
+        assert_near_equal(J[True], [[1.0], [-1.25]], 1e-10)
+        self.assertEqual(model.linear_solver._coloring.total_solves(do_rev=False), 2)
+
+
+class TestDirectSolverMultiRHSTotals(unittest.TestCase):
+
+    def _build(self, multi_rhs, assemble_jac, mode, coloring=False, jac_type='csc', ref=1.0):
+        size = 10
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', np.linspace(1., 2., size)))
+        model.add_subsystem('py', om.IndepVarComp('y', 3.0))
+        if coloring:
+            # keep the total jacobian sparse so that coloring is used
+            model.add_subsystem('comp', om.ExecComp('x = 3.0 * b + b ** 2', x=np.ones(size),
+                                                    b=np.ones(size), has_diag_partials=True))
+        else:
+            model.add_subsystem('comp', TriDiagPartialsComp(size=size, ref=ref))
+        model.add_subsystem('con', om.ExecComp('c = 2.0 * x ** 2', c=np.ones(size),
+                                               x=np.ones(size), has_diag_partials=True))
+        model.add_subsystem('obj', om.ExecComp('f = 2.0 * y'))
+        model.connect('px.x', 'comp.b')
+        model.connect('py.y', 'obj.y')
+        model.connect('comp.x', 'con.x')
+
+        model.add_design_var('px.x', lower=-5., upper=5.)
+        model.add_design_var('py.y', lower=-5., upper=5.)
+        model.add_constraint('con.c', lower=0.)
+        model.add_objective('obj.f')
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac,
+                                              multi_rhs_totals=multi_rhs)
+        model.options['assembled_jac_type'] = jac_type
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', maxiter=0, disp=False)
+        if coloring:
+            prob.driver.declare_coloring(show_summary=False)
+
+        prob.setup(mode=mode)
+        prob.run_driver()
+
+        # count the single right-hand side solves
+        solver = model.linear_solver
+        solver.nsolves = 0
+        solve = solver.solve
+
+        def counting_solve(*args):
+            solver.nsolves += 1
+            return solve(*args)
+
+        solver.solve = counting_solve
+
+        return prob
+
+    def test_multi_rhs_totals(self):
+        for mode in ('fwd', 'rev'):
+            for assemble_jac, jac_type in ((True, 'csc'), (True, 'dense'), (False, 'csc')):
+                for coloring in (False, True):
+                    with self.subTest(mode=mode, assemble_jac=assemble_jac, jac_type=jac_type,
+                                      coloring=coloring):
+                        expected = self._build(False, assemble_jac, mode, coloring, jac_type)
+                        Jexpected = expected.compute_totals(return_format='array')
+                        self.assertTrue(expected.model.linear_solver.nsolves > 0)
+
+                        prob = self._build(True, assemble_jac, mode, coloring, jac_type)
+                        J = prob.compute_totals(return_format='array')
+                        if coloring:
+                            self.assertIsNotNone(prob.driver._coloring_info['coloring'])
+                        self.assertEqual(prob.model.linear_solver.nsolves, 0)
+
+                        assert_near_equal(J, Jexpected, 1e-12)
+
+    def test_scaled_assembled_jac(self):
+        expected = self._build(True, True, 'fwd')
+        Jexpected = expected.compute_totals(return_format='array')
+
+        # scaled models fall back to one solve per seed
+        prob = self._build(True, True, 'fwd', ref=2.0)
+        J = prob.compute_totals(return_format='array')
+        self.assertEqual(prob.model.linear_solver.nsolves, 11)
+        assert_near_equal(J, Jexpected, 1e-12)
+
+    def test_scaled_unassembled(self):
+        class ScaledComp(om.ExplicitComponent):
+            def initialize(self):
+                self.options.declare('coef', types=float)
+                self.options.declare('scaling', types=dict)
+
+            def setup(self):
+                self.add_input('x', 1.0)
+                self.add_output('y', 1.0, **self.options['scaling'])
+                self.declare_partials('y', 'x')
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = self.options['coef'] * inputs['x'] ** 2
+
+            def compute_partials(self, inputs, partials):
+                partials['y', 'x'] = 2.0 * self.options['coef'] * inputs['x']
+
+        def build(multi_rhs, mode):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('p', om.IndepVarComp('x', 1.5))
+            model.add_subsystem('c1', ScaledComp(coef=3.0,
+                                                 scaling={'ref': 7.0, 'ref0': 1.0, 'res_ref': 3.0}))
+            model.add_subsystem('c2', ScaledComp(coef=0.5, scaling={'ref': 0.2, 'res_ref': 11.0}))
+            model.add_subsystem('q', om.IndepVarComp('x', 2.0))
+            model.add_subsystem('c3', ScaledComp(coef=2.0, scaling={'ref': 5.0, 'res_ref': 0.5}))
+            model.connect('p.x', 'c1.x')
+            model.connect('c1.y', 'c2.x')
+            model.connect('q.x', 'c3.x')
+
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+            model.linear_solver = om.DirectSolver(assemble_jac=False,
+                                                  multi_rhs_totals=multi_rhs)
+
+            prob.setup(mode=mode)
+            prob.run_model()
+            return prob
+
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                of = ['c1.y', 'c2.y', 'c3.y']
+                wrt = ['p.x', 'q.x']
+                expected = build(False, mode).compute_totals(of, wrt, return_format='array')
+                J = build(True, mode).compute_totals(of, wrt, return_format='array')
+                assert_near_equal(J, expected, 1e-12)
+
+
 class TestDirectSolverFeature(unittest.TestCase):
 
     def test_specify_solver(self):
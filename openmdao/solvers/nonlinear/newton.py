@@ -22,6 +22,13 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_age : int
+        Number of consecutive iterations that have reused the current jacobian.
+    _num_jac_reuses : int
+        Number of iterations in the current solve that reused the jacobian instead of
+        linearizing and factoring it again.
+    _norms : list of float
+        Residual norms before and after the most recent iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -43,6 +50,10 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = BoundsEnforceLS()
 
+        self._jac_age = 0
+        self._num_jac_reuses = 0
+        self._norms = [0.0, 0.0]
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -60,6 +71,16 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('max_jac_reuses', types=int, default=0, lower=0,
+                             desc='Maximum number of consecutive iterations that reuse the '
+                             'jacobian and linear solver factorization of a previous iteration '
+                             'instead of linearizing again. The jacobian is always computed in '
+                             'the first iteration of each solve. Set to 0 to linearize every '
+                             'iteration.')
+        self.options.declare('jac_reuse_limit', default=1.0, lower=0.0,
+                             desc='Ratio of current residual to previous residual above which the '
+                             'jacobian is recomputed instead of reused. Only used when '
+                             'max_jac_reuses is greater than 0.')
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -141,6 +162,62 @@ class NewtonSolver(NonlinearSolver):
         # Enable local fd
         system._owns_approx_jac = approx_status
 
+    def _iter_get_norm(self):
+        """
+        Return the norm of the residual.
+
+        Returns
+        -------
+        float
+            norm.
+        """
+        norm = super(NewtonSolver, self)._iter_get_norm()
+        self._norms = [self._norms[1], norm]
+        return norm
+
+    def _reuse_jac(self):
+        """
+        Return True if this iteration can reuse the jacobian of a previous iteration.
+
+        Returns
+        -------
+        bool
+            True if the jacobian and linear solver factorization shouldn't be recomputed.
+        """
+        if self._iter_count == 0 or self._jac_age >= self.options['max_jac_reuses']:
+            return False
+
+        prev_norm, norm = self._norms
+        return prev_norm > 0.0 and norm / prev_norm <= self.options['jac_reuse_limit']
+
+    def _solve(self):
+        """
+        Run the iterative solver.
+        """
+        self._num_jac_reuses = 0
+
+        super(NewtonSolver, self)._solve()
+
+        if (self.options['max_jac_reuses'] > 0 and self.options['iprint'] > 0 and
+                self._system().comm.rank == 0):
+            print(self._solver_info.prefix + self.SOLVER +
+                  ' Reused the jacobian in {} of {} iterations'.format(self._num_jac_reuses,
+                                                                       self._iter_count))
+
+    def record_iteration(self, **kwargs):
+        """
+        Record an iteration of the current Solver.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Keyword arguments (used for abs and rel error).
+        """
+        if self._num_jac_reuses > 0:
+            kwargs['msg'] = '{} factorizations saved by reusing the jacobian'.format(
+                self._num_jac_reuses)
+        super(NewtonSolver, self).record_iteration(**kwargs)
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -224,10 +301,16 @@ class NewtonSolver(NonlinearSolver):
         system._vectors['residual']['linear'] *= -1.0
         my_asm_jac = self.linear_solver._assembled_jac
 
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
-            my_asm_jac._update(system)
-        self._linearize()
+        if self._reuse_jac():
+            # modified Newton step using the jacobian and factorization of a previous iteration
+            self._jac_age += 1
+            self._num_jac_reuses += 1
+        else:
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
+                my_asm_jac._update(system)
+            self._linearize()
+            self._jac_age = 0
 
         self.linear_solver.solve(['linear'], 'fwd')
 
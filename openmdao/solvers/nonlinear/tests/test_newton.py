@@ -2,6 +2,8 @@
 
 import unittest
 import warnings
+from io import StringIO
+from contextlib import redirect_stdout
 
 
 import numpy as np
@@ -16,6 +18,7 @@ from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, \
      SellarDis1withDerivatives, SellarDis2withDerivatives
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning, assert_no_warning
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -844,6 +847,84 @@ class TestNewton(unittest.TestCase):
         self.assertEqual(str(context.exception), msg)
 
 
+@use_tempdirs
+class TestNewtonJacReuse(unittest.TestCase):
+
+    def _run_sellar(self, **options):
+        prob = om.Problem(model=SellarStateConnection(
+            nonlinear_solver=om.NewtonSolver(solve_subsystems=False, **options),
+            linear_solver=om.DirectSolver()))
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        solver = prob.model.linear_solver
+        solver.nlinearize = 0
+        linearize = solver._linearize
+
+        def counting_linearize():
+            solver.nlinearize += 1
+            linearize()
+
+        solver._linearize = counting_linearize
+
+        prob.run_model()
+
+        return prob
+
+    def test_jac_reuse(self):
+        expected = self._run_sellar()
+        newton = expected.model.nonlinear_solver
+        self.assertEqual(expected.model.linear_solver.nlinearize, newton._iter_count)
+        self.assertEqual(newton._num_jac_reuses, 0)
+
+        prob = self._run_sellar(max_jac_reuses=2)
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        newton = prob.model.nonlinear_solver
+        self.assertTrue(newton._num_jac_reuses > 0)
+        self.assertEqual(prob.model.linear_solver.nlinearize + newton._num_jac_reuses,
+                         newton._iter_count)
+
+        # never more than 2 iterations in a row reuse the jacobian
+        self.assertTrue(prob.model.linear_solver.nlinearize >= newton._iter_count / 3)
+
+    def test_jac_reuse_limit(self):
+        # a limit of 0 means the residual never decreases enough to reuse the jacobian
+        prob = self._run_sellar(max_jac_reuses=2, jac_reuse_limit=0.0)
+
+        newton = prob.model.nonlinear_solver
+        self.assertEqual(newton._num_jac_reuses, 0)
+        self.assertEqual(prob.model.linear_solver.nlinearize, newton._iter_count)
+
+    def test_jac_reuse_output(self):
+        prob = om.Problem(model=SellarStateConnection(
+            nonlinear_solver=om.NewtonSolver(solve_subsystems=False, max_jac_reuses=2),
+            linear_solver=om.DirectSolver()))
+
+        prob.setup()
+        prob.model.nonlinear_solver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            prob.run_model()
+        prob.cleanup()
+
+        newton = prob.model.nonlinear_solver
+        self.assertIn('NL: Newton Reused the jacobian in {} of {} iterations'.format(
+            newton._num_jac_reuses, newton._iter_count), stdout.getvalue())
+
+        cr = om.CaseReader('cases.sql')
+        msgs = [cr.get_case(case).msg for case in cr.list_cases('root.nonlinear_solver',
+                                                                out_stream=None)]
+        # one case for the initial residual plus one per iteration
+        self.assertEqual(len(msgs), newton._iter_count + 1)
+        self.assertEqual(msgs[-1], '{} factorizations saved by reusing the jacobian'.format(
+            newton._num_jac_reuses))
+
+
 
 class TestNewtonFeatures(unittest.TestCase):
 
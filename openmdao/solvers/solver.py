@@ -486,12 +486,14 @@ class Solver(object):
         Parameters
         ----------
         **kwargs : dict
-            Keyword arguments (used for abs and rel error).
+            Keyword arguments (used for abs and rel error, and an optional message).
         """
         if not self._rec_mgr._recorders:
             return
 
         metadata = create_local_meta(self.SOLVER)
+        if 'msg' in kwargs:
+            metadata['msg'] = kwargs['msg']
 
         # Get the data
         data = {
@@ -1,9 +1,14 @@
 """Surrogate model based on Kriging."""
+import os
+
 import numpy as np
 import scipy.linalg as linalg
 from scipy.optimize import minimize
+from scipy.spatial.distance import pdist, squareform
 
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
+from openmdao.utils.concurrent import local_pool, concurrent_eval_pool
+from openmdao.utils.mpi import MPI
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
@@ -91,6 +96,27 @@ class KrigingSurrogate(SurrogateModel):
                                   "or 'gesvd' which is slower but more reliable."
                                   "'gesvd' is the default.")
 
+        self.options.declare('training_cholesky', types=bool, default=False,
+                             desc="If True, factor the correlation matrix with a Cholesky "
+                                  "decomposition instead of an SVD during training, and optimize "
+                                  "the hyperparameters using analytic gradients of the "
+                                  "likelihood. This is much faster for large training sets.")
+
+        self.options.declare('max_jitter', default=1e-6, lower=0.0,
+                             desc="Largest value that is added to the diagonal of the correlation "
+                                  "matrix when it is not numerically positive definite during "
+                                  "Cholesky training.")
+
+        self.options.declare('n_start', types=int, default=1, lower=1,
+                             desc="Number of starting points for the hyperparameter optimization. "
+                                  "The first one is the default starting point, and the rest are "
+                                  "spread randomly within the hyperparameter bounds.")
+
+        self.options.declare('num_local_procs', types=int, default=1, lower=0,
+                             desc="Number of local processes used to run the hyperparameter "
+                                  "optimizations from multiple starting points in parallel when "
+                                  "MPI is not active. If 0, one process is used per CPU.")
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -129,30 +155,180 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
+        # Squared distances between each pair of training points in each dimension, stored in
+        # condensed form (one row per pair) so the full n_samples x n_samples x n_dims array is
+        # never built.
+        sq_dists = np.empty((self.n_samples * (self.n_samples - 1) // 2, self.n_dims))
+        for i in range(self.n_dims):
+            sq_dists[:, i] = pdist(X[:, i:i + 1], 'sqeuclidean')
 
-        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
+        if self.options['training_cholesky']:
+            def _calcll(thetas):
+                """Calculate loglike and its gradient wrt log(thetas) (callback function)."""
+                loglike, _, grad = self._calculate_cholesky_params(np.exp(thetas), sq_dists,
+                                                                   compute_grad=True)
+                return -loglike, -grad
+
+            opt_args = {'jac': True}
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options={'eps': 1e-3},
-                             bounds=bounds)
+        else:
+            def _calcll(thetas):
+                """Calculate loglike (callback function)."""
+                loglike = self._calculate_reduced_likelihood_params(np.exp(thetas), sq_dists)[0]
+                return -loglike
 
-        if not optResult.success:
-            msg = 'Kriging Hyper-parameter optimization failed: {0}'.format(optResult.message)
+            opt_args = {'options': {'eps': 1e-3}}
+
+        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
+
+        def _optimize(x0):
+            """Optimize the hyperparameters from one starting point."""
+            result = minimize(_calcll, x0, method='slsqp', bounds=bounds, **opt_args)
+            return result.fun, result.x, result.success, result.message
+
+        # The extra starting points use a fixed seed so that training is repeatable.
+        starts = [1e-1 * np.ones(self.n_dims)]
+        n_start = self.options['n_start']
+        if n_start > 1:
+            lower, upper = np.array(bounds).T
+            rand = np.random.RandomState(0)
+            starts.extend(rand.uniform(lower, upper, (n_start - 1, self.n_dims)))
+
+        num_procs = self.options['num_local_procs'] or os.cpu_count() or 1
+        if MPI or len(starts) == 1 or num_procs == 1:
+            results = [_optimize(x0) for x0 in starts]
+        else:
+            pool = local_pool(_optimize, min(num_procs, len(starts)))
+            try:
+                results = []
+                for result, err in concurrent_eval_pool(pool, [((x0, ), None) for x0 in starts]):
+                    if err is not None:
+                        self._raise('Kriging Hyper-parameter optimization failed:\n{}'
+                                    .format(err), exc_type=ValueError)
+                    results.append(result)
+            finally:
+                pool.terminate()
+                pool.join()
+
+        successful = [result for result in results if result[2]]
+        if not successful:
+            msg = 'Kriging Hyper-parameter optimization failed: {0}'.format(results[0][3])
             self._raise(msg, exc_type=ValueError)
 
-        self.thetas = np.exp(optResult.x)
-        _, params = self._calculate_reduced_likelihood_params()
+        best = min(successful, key=lambda result: result[0])
+        self.thetas = np.exp(best[1])
+
+        if self.options['training_cholesky']:
+            _, params, _ = self._calculate_cholesky_params(self.thetas, sq_dists)
+        else:
+            _, params = self._calculate_reduced_likelihood_params(sq_dists=sq_dists)
         self.alpha = params['alpha']
         self.U = params['U']
         self.S_inv = params['S_inv']
         self.Vh = params['Vh']
         self.sigma2 = params['sigma2']
 
-    def _calculate_reduced_likelihood_params(self, thetas=None):
+    def update(self, x, y):
+        """
+        Add training points to the trained surrogate model.
+
+        The correlation coefficients and the normalization of the data are kept from the last
+        call to train, so the hyper-parameter optimization is skipped. When training_cholesky is
+        True, the factorization of the correlation matrix is extended with the new points rather
+        than recomputed.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        x, y = np.atleast_2d(x, y)
+
+        X_new = (x - self.X_mean) / self.X_std
+        Y_new = (y - self.Y_mean) / self.Y_std
+        n_old = self.n_samples
+        n_new = X_new.shape[0]
+
+        X = np.vstack((self.X, X_new))
+        self.X = X
+        self.Y = Y = np.vstack((self.Y, Y_new))
+        self.n_samples = n_samples = n_old + n_new
+
+        if not self.options['training_cholesky']:
+            _, params = self._calculate_reduced_likelihood_params()
+            self.alpha = params['alpha']
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
+            self.sigma2 = params['sigma2']
+            return
+
+        thetas = self.thetas
+
+        # Correlation between the new points and the old ones, and among the new points.
+        diff = X_new[:, np.newaxis, :] - X[np.newaxis, :n_old, :]
+        b = np.exp(-np.einsum('ijk,k->ij', diff ** 2, thetas)).T
+
+        sq_dists = np.empty((n_new * (n_new - 1) // 2, self.n_dims))
+        for i in range(self.n_dims):
+            sq_dists[:, i] = pdist(X_new[:, i:i + 1], 'sqeuclidean')
+        C = squareform(np.exp(-sq_dists.dot(thetas)), checks=False)
+        C[np.diag_indices_from(C)] = 1. + self.options['nugget']
+
+        # Block update of the inverse Cholesky factor:
+        #     R = [[L L^T, b], [b^T, C]]  ->  L_22 L_22^T = C - B^T B, with B = L^-1 b
+        L_inv_old = self.Vh
+        B = L_inv_old.dot(b)
+        L22 = self._cholesky(C - B.T.dot(B))
+        L22_inv = linalg.solve_triangular(L22, np.eye(n_new), lower=True)
+
+        L_inv = np.zeros((n_samples, n_samples))
+        L_inv[:n_old, :n_old] = L_inv_old
+        L_inv[n_old:, :n_old] = -L22_inv.dot(B.T).dot(L_inv_old)
+        L_inv[n_old:, n_old:] = L22_inv
+
+        alpha = L_inv.T.dot(L_inv.dot(Y))
+        sigma2 = np.sum(Y, axis=1).dot(alpha) / n_samples
+
+        self.alpha = alpha
+        self.sigma2 = sigma2 * np.square(self.Y_std)
+        self.S_inv = np.ones(n_samples)
+        self.U = L_inv.T
+        self.Vh = L_inv
+
+    def _correlation_matrix(self, thetas, sq_dists):
+        """
+        Compute the correlation matrix of the training points.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
+        sq_dists : ndarray or None
+            Condensed squared distances between the training points in each dimension. If None,
+            they are computed from the training points.
+
+        Returns
+        -------
+        ndarray
+            Condensed correlation between each pair of training points.
+        ndarray
+            Full correlation matrix, including the nugget on the diagonal.
+        """
+        if sq_dists is None:
+            sq_dists = np.empty((self.n_samples * (self.n_samples - 1) // 2, self.n_dims))
+            for i in range(self.n_dims):
+                sq_dists[:, i] = pdist(self.X[:, i:i + 1], 'sqeuclidean')
+
+        r = np.exp(-sq_dists.dot(thetas))
+        R = squareform(r, checks=False)
+        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
+
+        return r, R
+
+    def _calculate_reduced_likelihood_params(self, thetas=None, sq_dists=None):
         """
         Calculate quantity with same maximum location as the log-likelihood for a given theta.
 
@@ -161,7 +337,9 @@ class KrigingSurrogate(SurrogateModel):
         thetas : ndarray, optional
             Given input correlation coefficients. If none given, uses self.thetas
             from training.
-
+        sq_dists : ndarray, optional
+            Condensed squared distances between the training points in each dimension. If none
+            given, they are computed from the training points.
 
         Returns
         -------
@@ -173,17 +351,11 @@ class KrigingSurrogate(SurrogateModel):
         if thetas is None:
             thetas = self.thetas
 
-        X, Y = self.X, self.Y
+        Y = self.Y
         params = {}
 
         # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
-
-        R = np.exp(-thetas.dot(np.square(distances)))
-        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
+        _, R = self._correlation_matrix(thetas, sq_dists)
 
         [U, S, Vh] = linalg.svd(R, lapack_driver=self.options['lapack_driver'])
 
@@ -209,6 +381,100 @@ class KrigingSurrogate(SurrogateModel):
 
         return reduced_likelihood, params
 
+    def _calculate_cholesky_params(self, thetas, sq_dists, compute_grad=False):
+        """
+        Calculate the reduced likelihood using a Cholesky factorization of the correlation matrix.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
+        sq_dists : ndarray
+            Condensed squared distances between the training points in each dimension.
+        compute_grad : bool
+            If True, also compute the gradient of the reduced likelihood wrt log(thetas).
+
+        Returns
+        -------
+        float
+            Calculated reduced likelihood.
+        dict or None
+            Dictionary containing the parameters, or None if the gradient was requested.
+        ndarray or None
+            Gradient of the reduced likelihood wrt log(thetas), if requested.
+        """
+        Y = self.Y
+        n_samples = self.n_samples
+
+        r, R = self._correlation_matrix(thetas, sq_dists)
+        L = self._cholesky(R)
+
+        alpha = linalg.cho_solve((L, True), Y)
+        logdet = 2.0 * np.sum(np.log(np.diag(L)))
+
+        # Same definition of sigma2 as the SVD version, so both maximize the same likelihood.
+        sigma2 = np.sum(Y, axis=1).dot(alpha) / n_samples
+        sum_sigma2 = np.sum(sigma2)
+        reduced_likelihood = -(np.log(sum_sigma2) + logdet / n_samples)
+
+        if compute_grad:
+            # d(R)/d(log(theta_k)) = -theta_k * D_k * R, elementwise, where D_k holds the squared
+            # distances in dimension k. The gradient is the sum of that times
+            # W = (a a^T / sum_sigma2 - R^-1) / n_samples over all entries, where a is the sum of
+            # the columns of alpha.
+            R_inv = linalg.cho_solve((L, True), np.eye(n_samples))
+            a = np.sum(alpha, axis=1)
+            W = (np.outer(a, a) / sum_sigma2 - R_inv) / n_samples
+
+            # Both matrices are symmetric and d(R) has a zero diagonal, so only the upper
+            # triangle is needed.
+            w = squareform(W, checks=False) * r
+            grad = -2.0 * thetas * w.dot(sq_dists)
+            return reduced_likelihood, None, grad
+
+        # The rmse is computed with R^-1 = V S^-1 U^T, which is L^-T L^-1 here.
+        L_inv = linalg.solve_triangular(L, np.eye(n_samples), lower=True)
+
+        params = {}
+        params['alpha'] = alpha
+        params['sigma2'] = sigma2 * np.square(self.Y_std)
+        params['S_inv'] = np.ones(n_samples)
+        params['U'] = L_inv.T
+        params['Vh'] = L_inv
+
+        return reduced_likelihood, params, None
+
+    def _cholesky(self, R):
+        """
+        Compute the lower Cholesky factor of a correlation matrix.
+
+        Jitter is added to the diagonal if the matrix isn't numerically positive definite.
+
+        Parameters
+        ----------
+        R : ndarray
+            Symmetric correlation matrix. Its diagonal is modified if jitter is needed.
+
+        Returns
+        -------
+        ndarray
+            Lower triangular Cholesky factor.
+        """
+        diag = np.diag_indices_from(R)
+        R_diag = R[diag].copy()
+
+        jitter = 0.0
+        while True:
+            try:
+                return linalg.cholesky(R, lower=True)
+            except linalg.LinAlgError:
+                jitter = 1e-12 if jitter == 0.0 else jitter * 10.0
+                if jitter > self.options['max_jitter']:
+                    self._raise('Kriging correlation matrix is not positive definite, even '
+                                'with {0} added to its diagonal.'.format(jitter / 10.0),
+                                exc_type=ValueError)
+                R[diag] = R_diag + jitter
+
     def predict(self, x):
         """
         Calculate predicted value of the response based on the current trained model.
@@ -227,18 +493,14 @@ class KrigingSurrogate(SurrogateModel):
         """
         super(KrigingSurrogate, self).predict(x)
 
-        thetas = self.thetas
         if isinstance(x, list):
             x = np.array(x)
         x = np.atleast_2d(x)
-        n_eval = x.shape[0]
 
         # Normalize input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        r = self._correlation(x_n)
 
         # Scaled Predictor
         y_t = np.dot(r, self.alpha)
@@ -247,8 +509,10 @@ class KrigingSurrogate(SurrogateModel):
         y = self.Y_mean + self.Y_std * y_t
 
         if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            # Only the diagonal of r.V.S^-1.U^T.r^T is needed, one term per evaluation point.
+            rV = np.dot(r, self.Vh.T)
+            rU = np.dot(r, self.U) * self.S_inv
+            mse = (1. - np.sum(rV * rU, axis=1))[:, np.newaxis] * self.sigma2
 
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
@@ -256,6 +520,24 @@ class KrigingSurrogate(SurrogateModel):
 
         return y
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated. Each row is a point.
+
+        Returns
+        -------
+        ndarray
+            Kriging predictions, one row per point.
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction errors, one row per point.
+        """
+        return self.predict(x)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -270,17 +552,59 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(np.atleast_2d(x))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the Kriging surface at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated. Each row is a point.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_inputs).
+        """
         thetas = self.thetas
+        alpha = self.alpha
+        n_out = alpha.shape[1]
 
         # Normalize Input
-        x_n = (x - self.X_mean) / self.X_std
+        x_n = (np.atleast_2d(x) - self.X_mean) / self.X_std
+        r = self._correlation(x_n)
+
+        # The derivative of r[i, j] wrt normalized input k is -2 theta[k] (x[i, k] - X[j, k]),
+        # times r[i, j], so the sums over the training points can be done as matrix products.
+        r_alpha = r.dot(alpha)
+        alpha_X = np.einsum('jo,jk->jok', alpha, self.X).reshape((self.n_samples, -1))
+        r_alpha_X = r.dot(alpha_X).reshape((x_n.shape[0], n_out, self.n_dims))
+
+        jac = -2.0 * thetas * (r_alpha[:, :, np.newaxis] * x_n[:, np.newaxis, :] - r_alpha_X)
+
+        return jac * np.outer(self.Y_std, 1. / self.X_std)
+
+    def _correlation(self, x_n):
+        """
+        Compute the correlation between each evaluation point and each training point.
+
+        Parameters
+        ----------
+        x_n : ndarray
+            Normalized evaluation points, one per row.
+
+        Returns
+        -------
+        ndarray
+            Correlation matrix of shape (n_points, n_samples).
+        """
+        thetas = self.thetas
+        X = self.X
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        # Weighted squared distances, expanded so that the cross term is a single matrix product.
+        dist = np.square(x_n).dot(thetas)[:, np.newaxis] - 2.0 * (x_n * thetas).dot(X.T) + \
+            np.square(X).dot(thetas)
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
-        return jac
+        return np.exp(-dist)
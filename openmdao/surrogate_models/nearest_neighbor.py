@@ -5,6 +5,9 @@ https://github.com/SMarone/NDInterp
 """
 
 from collections import OrderedDict
+
+import numpy as np
+
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 from openmdao.surrogate_models.nn_interpolators.linear_interpolator import \
     LinearInterpolator
@@ -73,6 +76,19 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.options['interpolant_type']](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x, y):
+        """
+        Add training points to the trained surrogate model.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        self.interpolant.add_points(np.atleast_2d(x), np.atleast_2d(y))
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -92,6 +108,25 @@ class NearestNeighbor(SurrogateModel):
         super(NearestNeighbor, self).predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated. Each row is a point.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted values, one row per point.
+        """
+        super(NearestNeighbor, self).predict(x)
+        return self.interpolant(np.atleast_2d(x), **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -112,3 +147,21 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobian of the interpolant at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated. Each row is a point.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_inputs).
+        """
+        return self.interpolant.gradient(np.atleast_2d(x), **kwargs)
@@ -145,7 +145,7 @@ class LinearInterpolator(NNBase):
         normal, pc = self._find_hyperplane(nloc)
         if np.any(normal[:, -1, :]) == 0:
             return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+        gradient[:] = (-normal[:, :-1, :] / normal[:, -1:, :]).transpose((0, 2, 1))
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
@@ -38,6 +38,8 @@ class NNBase(object):
         Number of training points
     _KData : scipy.spatial.cKDTree
         KDTree used for finding the nearest neighbors.
+    _num_leaves : int
+        How many leaves the tree should have.
     _pt_cache : tuple(ndarray, ndarray, ndarray)
         Internal cache of the last found neighbors.
     _parent_name : str or None
@@ -81,6 +83,7 @@ class NNBase(object):
         self._ntpts = training_points.shape[0]
 
         # Make training data into a Tree
+        self._num_leaves = num_leaves
         leavesz = ceil(self._ntpts / float(num_leaves))
         self._KData = cKDTree(self._tp, leafsize=leavesz)
 
@@ -89,6 +92,30 @@ class NNBase(object):
 
         self._parent_name = parent_name
 
+    def add_points(self, training_points, training_values):
+        """
+        Add training points to the interpolant.
+
+        The new points are normalized with the scaling of the original training data, and the
+        tree is rebuilt since cKDTree doesn't support insertion.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            ndarray of shape (num_points x independent dims) containing new training input
+            locations.
+        training_values : ndarray
+            ndarray of shape (num_points x dependent dims) containing new training output values.
+        """
+        self._tp = np.vstack((self._tp, (training_points - self._tpm) / self._tpr))
+        self._tv = np.vstack((self._tv, (training_values - self._tvm) / self._tvr))
+        self._ntpts = self._tp.shape[0]
+
+        leavesz = ceil(self._ntpts / float(self._num_leaves))
+        self._KData = cKDTree(self._tp, leafsize=leavesz)
+
+        self._pt_cache = None
+
     def _raise(self, msg, exc_type=RuntimeError):
         """
         Raise the given exception type, with parent's name prepended to the message.
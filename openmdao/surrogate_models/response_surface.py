@@ -3,7 +3,7 @@
 Surrogate Model based on second order response surface equations.
 """
 
-from numpy import zeros, einsum
+from numpy import zeros, einsum, atleast_2d
 from numpy.dual import lstsq
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 
@@ -20,6 +20,11 @@ class ResponseSurface(SurrogateModel):
         Number of training points.
     n : int
         Number of independent variables.
+    _XtX : ndarray
+        Product of the transposed training basis matrix with itself, kept for updates.
+    _Xty : ndarray
+        Product of the transposed training basis matrix with the training responses, kept for
+        updates.
     """
 
     def __init__(self):
@@ -33,6 +38,9 @@ class ResponseSurface(SurrogateModel):
         # vector of response surface equation coefficients
         self.betas = zeros(0)
 
+        self._XtX = zeros(0)
+        self._Xty = zeros(0)
+
     def train(self, x, y):
         """
         Calculate response surface equation coefficients using least squares regression.
@@ -46,10 +54,58 @@ class ResponseSurface(SurrogateModel):
         """
         super(ResponseSurface, self).train(x, y)
 
-        m = self.m = x.shape[0]
-        n = self.n = x.shape[1]
+        self.m = x.shape[0]
+        self.n = x.shape[1]
+
+        X = self._basis(x)
+
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas, rs, r, s = lstsq(X, y)
+
+        self._XtX = X.T.dot(X)
+        self._Xty = X.T.dot(y)
+
+    def update(self, x, y):
+        """
+        Add training points to the trained response surface.
+
+        The normal equations of the least squares fit are accumulated, so the coefficients are
+        updated without revisiting the earlier training points.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        x = atleast_2d(x)
+        X = self._basis(x)
+
+        self.m += x.shape[0]
+        self._XtX += X.T.dot(X)
+        self._Xty += X.T.dot(y)
+
+        self.betas, rs, r, s = lstsq(self._XtX, self._Xty)
+
+    def _basis(self, x):
+        """
+        Compute the constant, linear, squared and cross terms of the response surface.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the terms are evaluated. Each row is a point.
+
+        Returns
+        -------
+        ndarray
+            Terms of the response surface equation, one row per point.
+        """
+        m, n = x.shape
 
-        X = zeros((m, ((n + 1) * (n + 2)) // 2))
+        X = zeros((m, ((self.n + 1) * (self.n + 2)) // 2), dtype=x.dtype)
 
         # Modify X to include constant, squared terms and cross terms
 
@@ -68,9 +124,7 @@ class ResponseSurface(SurrogateModel):
             X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
             X_offset = X_offset[:, n - i:]
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        return X
 
     def predict(self, x):
         """
@@ -109,6 +163,25 @@ class ResponseSurface(SurrogateModel):
         # Predict new_y using X and betas
         return X.dot(self.betas)
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated. Each row is a point.
+
+        Returns
+        -------
+        ndarray
+            Predicted responses, one row per point.
+        """
+        super(ResponseSurface, self).predict(x)
+
+        # Predict new_y using X and betas
+        return self._basis(atleast_2d(x)).dot(self.betas)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -136,3 +209,32 @@ class ResponseSurface(SurrogateModel):
             beta_offset = beta_offset[n - i:, :]
 
         return jac.T
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the response surface at multiple points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated. Each row is a point.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_inputs).
+        """
+        n = self.n
+        betas = self.betas
+
+        x = atleast_2d(x)
+
+        jac = zeros((x.shape[0], n, betas.shape[1]), dtype=x.dtype)
+        jac[:] = betas[1:n + 1, :]
+        beta_offset = betas[n + 1:, :]
+        for i in range(n):
+            jac[:, i, :] += x[:, i:].dot(beta_offset[:n - i, :])
+            jac[:, i:, :] += einsum('i,jk->ijk', x[:, i], beta_offset[:n - i, :])
+            beta_offset = beta_offset[n - i:, :]
+
+        return jac.transpose((0, 2, 1))
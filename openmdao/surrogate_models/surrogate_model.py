@@ -47,6 +47,21 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x, y):
+        """
+        Add training points to the surrogate model after it has been trained.
+
+        Surrogates that can incorporate new points without training from scratch override this.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        pass
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -68,7 +83,7 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Vectorized point(s) at which the surrogate is evaluated. Each row is a point.
         """
         pass
 
@@ -83,6 +98,19 @@ class SurrogateModel(object):
         """
         pass
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the interpolant at multiple points at once.
+
+        The returned array has one jacobian per point, with shape (n_points, n_outputs, n_inputs).
+
+        Parameters
+        ----------
+        x : array-like
+            Vectorized point(s) at which the surrogate Jacobian is evaluated. Each row is a point.
+        """
+        pass
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
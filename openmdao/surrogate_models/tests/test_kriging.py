@@ -148,5 +148,136 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_near_equal(jac, np.array([[1, 1], [1, -1], [1, 2]]), 5e-4)
 
+    def test_cholesky_training(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(0, 1, 7), repeat=2)])
+        y = np.array([[np.sin(2 * a + b), a * b] for a, b in x])
+
+        surrogate = KrigingSurrogate(training_cholesky=True, eval_rmse=True)
+        surrogate.train(x, y)
+
+        for x0, y0 in zip(x, y):
+            mu, sigma = surrogate.predict(x0)
+            assert_near_equal(mu, [y0], 1e-6)
+            assert_near_equal(sigma, [[0, 0]], 1e-5)
+
+        # Same likelihood as the SVD version, so the trained models should agree closely.
+        svd_surrogate = KrigingSurrogate(eval_rmse=True)
+        svd_surrogate.train(x, y)
+
+        new_x = np.array([[0.1, 0.2], [0.35, 0.8], [0.9, 0.45]])
+        mu, sigma = surrogate.predict(new_x)
+        svd_mu, svd_sigma = svd_surrogate.predict(new_x)
+        assert_near_equal(mu, svd_mu, 1e-3)
+
+        # The variance is tiny for such a smooth model, so it is dominated by roundoff.
+        self.assertTrue(np.all(sigma < 1e-3))
+        self.assertTrue(np.all(svd_sigma < 1e-3))
+
+    def test_cholesky_likelihood_gradient(self):
+        np.random.seed(0)
+        x = np.random.random((25, 3))
+        y = np.column_stack((np.sin(3 * x.sum(axis=1)), x[:, 0] * x[:, 1]))
+
+        surrogate = KrigingSurrogate(training_cholesky=True)
+        surrogate.train(x, y)
+
+        sq_dists = np.array([[(xi[k] - xj[k]) ** 2 for k in range(3)]
+                             for i, xi in enumerate(surrogate.X)
+                             for xj in surrogate.X[i + 1:]])
+
+        log_thetas = np.log(np.array([0.5, 2.0, 0.1]))
+        loglike, _, grad = surrogate._calculate_cholesky_params(np.exp(log_thetas), sq_dists,
+                                                                compute_grad=True)
+
+        # The likelihood is the same one that is maximized by the SVD version.
+        svd_loglike, _ = surrogate._calculate_reduced_likelihood_params(np.exp(log_thetas))
+        assert_near_equal(loglike, svd_loglike, 1e-7)
+
+        delta = 1e-6
+        fd = np.zeros(3)
+        for k in range(3):
+            step = np.zeros(3)
+            step[k] = delta
+            fwd = surrogate._calculate_cholesky_params(np.exp(log_thetas + step), sq_dists)[0]
+            bwd = surrogate._calculate_cholesky_params(np.exp(log_thetas - step), sq_dists)[0]
+            fd[k] = (fwd - bwd) / (2 * delta)
+
+        assert_near_equal(grad, fd, 1e-6)
+
+    def test_multistart(self):
+        np.random.seed(0)
+        x = np.random.random((20, 2))
+        y = np.sin(3 * x[:, :1]) * np.cos(5 * x[:, 1:])
+
+        single = KrigingSurrogate(training_cholesky=True)
+        single.train(x, y)
+
+        for num_procs in [1, 2]:
+            multi = KrigingSurrogate(training_cholesky=True, n_start=3,
+                                     num_local_procs=num_procs)
+            multi.train(x, y)
+
+            # The best of several starts is at least as good as the default start.
+            sq_dists = np.array([[(xi[k] - xj[k]) ** 2 for k in range(2)]
+                                 for i, xi in enumerate(multi.X)
+                                 for xj in multi.X[i + 1:]])
+            multi_ll = multi._calculate_cholesky_params(multi.thetas, sq_dists)[0]
+            single_ll = multi._calculate_cholesky_params(single.thetas, sq_dists)[0]
+            self.assertTrue(multi_ll >= single_ll - 1e-8)
+
+            for x0, y0 in zip(x, y):
+                assert_near_equal(multi.predict(x0), [y0], 1e-6)
+
+    def test_update(self):
+        np.random.seed(0)
+        x = np.random.random((20, 2))
+        y = np.hstack((np.sin(3 * x[:, :1]) * np.cos(5 * x[:, 1:]), x[:, :1] * x[:, 1:]))
+
+        # The SVD training is regularized, so it doesn't interpolate as closely.
+        for cholesky, tol in [(False, 1e-4), (True, 1e-9)]:
+            surrogate = KrigingSurrogate(training_cholesky=cholesky, eval_rmse=True)
+            surrogate.train(x[:15], y[:15])
+            thetas = surrogate.thetas.copy()
+
+            surrogate.update(x[15:], y[15:])
+
+            # The hyper-parameters are kept and the new points are interpolated.
+            assert_near_equal(surrogate.thetas, thetas, 1e-15)
+            self.assertEqual(surrogate.n_samples, 20)
+            for x0, y0 in zip(x, y):
+                mu, sigma = surrogate.predict(x0)
+                assert_near_equal(mu, [y0], tol)
+
+            if cholesky:
+                # Same parameters as factoring the full correlation matrix.
+                _, params, _ = surrogate._calculate_cholesky_params(thetas, None)
+                assert_near_equal(surrogate.alpha, params['alpha'], 1e-8)
+                assert_near_equal(surrogate.sigma2, params['sigma2'], 1e-8)
+                assert_near_equal(surrogate.Vh, params['Vh'], 1e-8)
+
+    def test_vectorized(self):
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        n = 8
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(0, 1, n), repeat=2)])
+        y = np.array([[np.sin(a + b), a * b] for a, b in x])
+
+        surrogate.train(x, y)
+
+        new_x = np.array([[0.1, 0.2], [0.35, 0.8], [0.9, 0.45], [0.6, 0.05]])
+        mu, sigma = surrogate.vectorized_predict(new_x)
+        jac = surrogate.vectorized_linearize(new_x)
+
+        self.assertEqual(mu.shape, (4, 2))
+        self.assertEqual(sigma.shape, (4, 2))
+        self.assertEqual(jac.shape, (4, 2, 2))
+
+        for i, x0 in enumerate(new_x):
+            mu0, sigma0 = surrogate.predict(x0)
+            assert_near_equal(mu[i], mu0[0], 1e-12)
+            assert_near_equal(sigma[i], sigma0[0], 1e-6)
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,49 @@ class TestNearestNeighbor(unittest.TestCase):
                        "['linear', 'weighted', 'rbf']."
         self.assertEqual(expected_msg, str(cm.exception))
 
+    def test_vectorized(self):
+        np.random.seed(11)
+        x = np.random.random((30, 3))
+        y = np.column_stack((np.sin(x.sum(axis=1)), x[:, 0] * x[:, 1]))
+        new_x = np.random.random((6, 3))
+
+        for interpolant_type in ['linear', 'weighted', 'rbf']:
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(x, y)
+
+            mu = surrogate.vectorized_predict(new_x.copy())
+            jac = surrogate.vectorized_linearize(new_x.copy())
+
+            self.assertEqual(mu.shape, (6, 2))
+            self.assertEqual(jac.shape, (6, 2, 3))
+
+            for i, x0 in enumerate(new_x):
+                assert_near_equal(mu[i], surrogate.predict(x0.copy())[0], 1e-12)
+                assert_near_equal(jac[i], surrogate.linearize(x0.copy()), 1e-12)
+
+
+    def test_update(self):
+        np.random.seed(11)
+        x = np.random.random((30, 3))
+        # Include the bounds of the data in the first batch so the normalization is unchanged.
+        x[0] = 0.
+        x[1] = 1.
+        y = np.column_stack((x.sum(axis=1), x[:, 0] - x[:, 1] - x[:, 2]))
+        new_x = np.random.random((6, 3))
+
+        for interpolant_type in ['linear', 'weighted', 'rbf']:
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(x[:25], y[:25])
+            surrogate.update(x[25:], y[25:])
+
+            full = NearestNeighbor(interpolant_type=interpolant_type)
+            full.train(x, y)
+
+            assert_near_equal(surrogate.vectorized_predict(new_x.copy()),
+                              full.vectorized_predict(new_x.copy()), 1e-12)
+            assert_near_equal(surrogate.vectorized_linearize(new_x.copy()),
+                              full.vectorized_linearize(new_x.copy()), 1e-12)
+
 
 class TestLinearInterpolator1D(unittest.TestCase):
     def setUp(self):
@@ -136,6 +136,42 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_near_equal(jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_vectorized(self):
+        surrogate = ResponseSurface()
+
+        x = array([[a, b, c] for a, b, c in
+                   itertools.product(linspace(0, 1, 4), repeat=3)])
+        y = array([[a * b + c ** 2, a - b * c] for a, b, c in x])
+
+        surrogate.train(x, y)
+
+        new_x = array([[0.1, 0.2, 0.3], [0.35, 0.8, 0.5], [0.9, 0.45, 0.15]])
+        mu = surrogate.vectorized_predict(new_x)
+        jac = surrogate.vectorized_linearize(new_x)
+
+        self.assertEqual(mu.shape, (3, 2))
+        self.assertEqual(jac.shape, (3, 2, 3))
+
+        for i, x0 in enumerate(new_x):
+            assert_near_equal(mu[i], surrogate.predict(x0), 1e-12)
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
+
+    def test_update(self):
+        x = array([[a, b, c] for a, b, c in
+                   itertools.product(linspace(0, 1, 4), repeat=3)])
+        y = array([[sin(a) * b + c ** 2, cos(a - b * c)] for a, b, c in x])
+
+        surrogate = ResponseSurface()
+        surrogate.train(x[:40], y[:40])
+        surrogate.update(x[40:], y[40:])
+
+        full = ResponseSurface()
+        full.train(x, y)
+
+        self.assertEqual(surrogate.m, 64)
+        assert_near_equal(surrogate.betas, full.betas, 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,16 +15,20 @@ from distutils.version import LooseVersion
 from contextlib import contextmanager
 from pprint import pprint
 from itertools import groupby
+from heapq import heappush, heappop
 
 import numpy as np
+from scipy.sparse import issparse, csc_matrix, csr_matrix, coo_matrix
 from scipy.sparse.compressed import get_index_dtype
+from scipy.sparse.csgraph import maximum_bipartite_matching
 
 from openmdao.jacobians.jacobian import Jacobian
-from openmdao.utils.array_utils import array_viz
+from openmdao.utils.array_utils import array_viz, convert_neg, _flatten_src_indices
 from openmdao.utils.general_utils import simple_warning
 import openmdao.utils.hooks as hooks
 from openmdao.utils.mpi import MPI
 from openmdao.utils.file_utils import _load_and_exec
+from openmdao.vectors.vector import INT_DTYPE
 
 
 CITATIONS = """
@@ -75,6 +79,11 @@ _DEF_COMP_SPARSITY_ARGS = {
 }
 
 
+# Jacobians with a dimension larger than this are colored using sparse (CSC/CSR) data structures
+# instead of dense column adjacency matrices.
+_SPARSE_COLORING_MIN_SIZE = 1000
+
+
 # A dict containing colorings that have been generated during the current execution.
 # When a dynamic coloring is specified for a particular class and per_instance is False,
 # this dict can be checked for an existing class version of the coloring that can be used
@@ -143,8 +152,8 @@ class Coloring(object):
 
         Parameters
         ----------
-        sparsity : ndarray
-            Full jacobian sparsity matrix (dense bool form).
+        sparsity : ndarray or sparse matrix
+            Full jacobian sparsity matrix (dense bool form or scipy sparse).
         row_vars : list of str or None
             Names of variables corresponding to rows.
         row_var_sizes : ndarray or None
@@ -155,9 +164,16 @@ class Coloring(object):
             Sizes of column variables.
         """
         # store the nonzero row and column indices if jac sparsity is provided
-        self._nzrows, self._nzcols = np.nonzero(sparsity)
+        if issparse(sparsity):
+            # convert to CSR with sorted indices so nonzeros are in the same order as np.nonzero
+            sparsity = csr_matrix(sparsity, dtype=bool)
+            sparsity.eliminate_zeros()
+            sparsity.sort_indices()
+            self._nzrows, self._nzcols = sparsity.nonzero()
+        else:
+            self._nzrows, self._nzcols = np.nonzero(sparsity)
         self._shape = sparsity.shape
-        self._pct_nonzero = np.count_nonzero(sparsity) / (self._shape[0] * self._shape[1]) * 100
+        self._pct_nonzero = self._nzrows.size / (self._shape[0] * self._shape[1]) * 100
 
         self._row_vars = row_vars
         self._row_var_sizes = row_var_sizes
@@ -529,6 +545,8 @@ class Coloring(object):
                       "of %d tolerances tested.\n" % (meta['J_size'] - meta['zero_entries'],
                                                       meta['J_size'],
                                                       meta['nz_matches'], meta['n_tested']))
+        elif meta.get('sparsity_method') == 'structural':
+            print("Sparsity computed structurally from declared partial derivative sparsity.")
 
         sparsity_time = meta.get('sparsity_time')
         if sparsity_time is not None:
@@ -812,7 +830,9 @@ class Coloring(object):
             Mapping of (of, wrt) keys to their corresponding (nzrows, nzcols, shape).
         """
         if self._row_vars and self._col_vars and self._row_var_sizes and self._col_var_sizes:
-            J = self.get_dense_sparsity()
+            J = csr_matrix((np.ones(self._nzrows.size, dtype=bool),
+                            (self._nzrows, self._nzcols)), shape=self._shape)
+            J.sort_indices()
             return _jac2subjac_sparsity(J, self._row_vars, self._col_vars,
                                         self._row_var_sizes, self._col_var_sizes)
 
@@ -979,6 +999,268 @@ def _order_by_ID(col_matrix):
         yield col
 
 
+def _order_by_ID_sparse(col_adj):
+    """
+    Return columns in order of incidence degree (ID) using a sparse column adjacency.
+
+    This gives the same ordering as _order_by_ID.  If the adjacency is sparse, a bucket queue
+    (one heap per incidence degree) is used instead of a full argmax over all columns for each
+    column.
+
+    Parameters
+    ----------
+    col_adj : _SparseColAdjacency
+        Sparse column adjacency.
+
+    Yields
+    ------
+    int
+        Column index.
+    ndarray
+        Indices of the columns adjacent to that column.
+    """
+    ncols = col_adj.shape[0]
+
+    if ncols == 0:
+        return
+
+    degrees = col_adj.degrees()
+
+    # use max degree column as a starting point instead of just choosing a random column
+    # since all have incidence degree of 0 when we start.
+    col = degrees.argmax()
+
+    colored_degrees = np.zeros(ncols, dtype=get_index_dtype(maxval=ncols))
+
+    # Updating the bucket queue costs a heap push per neighbor, so when columns have many
+    # neighbors (e.g. J has a dense row) an argmax over all columns is cheaper.
+    if degrees.sum() > ncols * ncols // 1000:
+        for i in range(ncols):
+            nbrs = col_adj.neighbors(col)
+            yield col, nbrs
+            colored_degrees[nbrs] += 1
+            colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
+            col = colored_degrees.argmax()
+        return
+
+    colored = np.zeros(ncols, dtype=bool)
+
+    # buckets[d] is a heap of columns that had incidence degree d when pushed.  Stale entries
+    # are skipped when popped.  Using heaps gives the same tie breaking (lowest column index)
+    # as argmax in the dense version.
+    buckets = [list(range(ncols))]
+    maxdeg = 0
+
+    for i in range(ncols):
+        nbrs = col_adj.neighbors(col)
+        yield col, nbrs
+
+        if i == ncols - 1:
+            break
+
+        colored[col] = True
+        nbrs = nbrs[~colored[nbrs]]
+        colored_degrees[nbrs] += 1
+        for nbr, deg in zip(nbrs, colored_degrees[nbrs]):
+            if deg == len(buckets):
+                buckets.append([])
+            heappush(buckets[deg], nbr)
+            if deg > maxdeg:
+                maxdeg = deg
+
+        while True:
+            bucket = buckets[maxdeg]
+            while bucket:
+                col = heappop(bucket)
+                if not colored[col] and colored_degrees[col] == maxdeg:
+                    break
+            else:
+                maxdeg -= 1
+                continue
+            break
+
+
+def _use_sparse_coloring(J):
+    """
+    Return True if the given jacobian sparsity should be colored using sparse data structures.
+
+    Parameters
+    ----------
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix.
+
+    Returns
+    -------
+    bool
+        True if J is sparse or too large for a dense column adjacency matrix.
+    """
+    return issparse(J) or max(J.shape) > _SPARSE_COLORING_MIN_SIZE
+
+
+def _to_bool_csc(J):
+    """
+    Convert the given jacobian sparsity to a boolean CSC matrix with sorted indices.
+
+    Parameters
+    ----------
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix.
+
+    Returns
+    -------
+    csc_matrix
+        Boolean sparsity matrix without explicit zeros.
+    """
+    J = csc_matrix(J, dtype=bool)
+    J.eliminate_zeros()
+    J.sort_indices()
+    return J
+
+
+def _gather_indices(mat, idx):
+    """
+    Return the concatenated nonzero indices of the given rows of a CSR (or columns of a CSC) matrix.
+
+    Parameters
+    ----------
+    mat : csr_matrix or csc_matrix
+        Compressed sparse matrix.
+    idx : ndarray
+        Indices of the compressed rows (or columns).
+
+    Returns
+    -------
+    ndarray
+        Nonzero column (or row) indices of the given rows (or columns), possibly with duplicates.
+    """
+    starts = mat.indptr[idx]
+    counts = mat.indptr[idx + 1] - starts
+    total = counts.sum()
+    if total == 0:
+        return mat.indices[:0]
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return mat.indices[offsets + np.arange(total)]
+
+
+class _SparseColAdjacency(object):
+    """
+    Column adjacency of a sparse jacobian sparsity, found from the nonzero structure of J.
+
+    The adjacency matrix (the nonzero pattern of J.T * J) is never formed.  The neighbors of a
+    column are instead gathered from the rows it shares with other columns whenever they are
+    needed, so memory use is proportional to the number of nonzeros in J.  Forming J.T * J would
+    require memory proportional to ncols**2 if J has even a single dense row.
+
+    Parameters
+    ----------
+    J : csc_matrix
+        Boolean jacobian sparsity matrix with sorted indices.
+    Jc : csc_matrix or None
+        If not None, boolean sparsity matrix of a partition of J.  Adjacency is then defined as
+        in _Jc2col_matrix_direct and only the columns that are nonzero in Jc are included,
+        numbered in order.
+
+    Attributes
+    ----------
+    shape : tuple
+        Shape of the square column adjacency matrix.
+    _J : csc_matrix
+        Column oriented nonzero structure of J.
+    _Jrows : csr_matrix
+        Row oriented nonzero structure of J.
+    _Jc : csc_matrix or None
+        Column oriented nonzero structure of the partition of J.
+    _Jcrows : csr_matrix or None
+        Row oriented nonzero structure of the partition of J.
+    _col_keep : ndarray or None
+        Boolean array marking the columns of J that are nonzero in the partition.
+    _idxmap : ndarray
+        Maps adjacency indices to columns of J.
+    _revmap : ndarray or None
+        Maps columns of J to adjacency indices.
+    _mark : ndarray
+        Boolean work array used to remove duplicate neighbors.
+    """
+
+    def __init__(self, J, Jc=None):
+        """
+        Initialize data structures.
+        """
+        ncols = J.shape[1]
+
+        self._J = J
+        self._Jrows = J.tocsr()
+
+        if Jc is None:
+            self._Jc = self._Jcrows = self._col_keep = self._revmap = None
+            self._idxmap = np.arange(ncols, dtype=int)
+        else:
+            assert J.shape == Jc.shape
+            self._Jc = Jc
+            self._Jcrows = Jc.tocsr()
+            self._col_keep = Jc.getnnz(axis=0) > 0
+            self._idxmap = np.nonzero(self._col_keep)[0]
+            self._revmap = np.full(ncols, -1, dtype=int)
+            self._revmap[self._idxmap] = np.arange(self._idxmap.size, dtype=int)
+
+        self.shape = (self._idxmap.size, self._idxmap.size)
+        self._mark = np.zeros(ncols, dtype=bool)
+
+    def neighbors(self, i):
+        """
+        Return the sorted indices of the columns adjacent to the given column.
+
+        Parameters
+        ----------
+        i : int
+            Column index.
+
+        Returns
+        -------
+        ndarray
+            Indices of adjacent columns.
+        """
+        col = self._idxmap[i]
+        rows = self._J.indices[self._J.indptr[col]:self._J.indptr[col + 1]]
+
+        if self._Jc is None:
+            cols = _gather_indices(self._Jrows, rows)
+        else:
+            # col1 and col2 are adjacent if they share a row of J where either one is nonzero
+            # in Jc, i.e. all kept columns of the Jc rows of col plus the Jc columns of its J rows.
+            crows = self._Jc.indices[self._Jc.indptr[col]:self._Jc.indptr[col + 1]]
+            cols = _gather_indices(self._Jrows, crows)
+            cols = np.concatenate((cols[self._col_keep[cols]],
+                                   _gather_indices(self._Jcrows, rows)))
+
+        # remove duplicates. A boolean mask is cheaper than sorting when the neighbors make up
+        # a significant fraction of all columns.
+        if cols.size * 8 > self._mark.size:
+            mark = self._mark
+            mark[cols] = True
+            mark[col] = False
+            cols = np.nonzero(mark)[0]
+            mark[cols] = False
+        else:
+            cols = np.unique(cols)
+            cols = cols[cols != col]
+
+        if self._revmap is not None:
+            return self._revmap[cols]
+        return cols
+
+    def degrees(self):
+        """
+        Return the number of neighbors of each column.
+
+        Returns
+        -------
+        ndarray
+            Degree of each column.
+        """
+        return np.array([self.neighbors(i).size for i in range(self.shape[0])], dtype=int)
+
+
 def _J2col_matrix(J):
     """
     Convert boolean jacobian sparsity matrix to a column adjacency matrix.
@@ -1058,7 +1340,7 @@ def _get_full_disjoint_cols(J):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or csc_matrix
         The total jacobian.
 
     Returns
@@ -1066,6 +1348,8 @@ def _get_full_disjoint_cols(J):
     list
         List of lists of disjoint columns
     """
+    if issparse(J):
+        return _get_full_disjoint_col_matrix_cols(_SparseColAdjacency(J))
     return _get_full_disjoint_col_matrix_cols(_J2col_matrix(J))
 
 
@@ -1075,7 +1359,7 @@ def _get_full_disjoint_col_matrix_cols(col_matrix):
 
     Parameters
     ----------
-    col_matrix : ndarray
+    col_matrix : ndarray or _SparseColAdjacency
         Column intersection matrix
 
     Returns
@@ -1089,16 +1373,22 @@ def _get_full_disjoint_col_matrix_cols(col_matrix):
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=get_index_dtype(maxval=ncols))
 
-    for col in _order_by_ID(col_matrix):
-        neighbor_colors = set(colors[col_matrix[col]])
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(col)
-                colors[col] = color
-                break
+    if isinstance(col_matrix, _SparseColAdjacency):
+        ordered = _order_by_ID_sparse(col_matrix)
+    else:
+        ordered = ((col, col_matrix[col]) for col in _order_by_ID(col_matrix))
+
+    for col, nbrs in ordered:
+        # use the lowest color not used by any neighbor
+        neighbor_colors = colors[nbrs]
+        used = np.zeros(len(color_groups) + 1, dtype=bool)
+        used[neighbor_colors[neighbor_colors >= 0]] = True
+        color = used.argmin()
+        if color < len(color_groups):
+            color_groups[color].append(col)
         else:
-            colors[col] = len(color_groups)
             color_groups.append([col])
+        colors[col] = color
 
     return color_groups
 
@@ -1111,9 +1401,9 @@ def _color_partition(J, Jpart):
 
     Parameters
     ----------
-    J : ndarray
-        Dense jacobian sparsity matrix
-    Jpart : ndarray
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix
+    Jpart : ndarray or sparse matrix
         Partition of the jacobian sparsity matrix.
 
     Returns
@@ -1124,17 +1414,29 @@ def _color_partition(J, Jpart):
         List of nonzero rows for each column.
     """
     ncols = Jpart.shape[1]
-    col_nonzeros = _count_nonzeros(Jpart, axis=0)
-    row_nonzeros = _count_nonzeros(Jpart, axis=1)
+    sparse = _use_sparse_coloring(J)
+
+    if sparse:
+        J = _to_bool_csc(J)
+        Jpart = _to_bool_csc(Jpart)
+        col_nonzeros = Jpart.getnnz(axis=0)
+        row_nonzeros = Jpart.getnnz(axis=1)
+    else:
+        col_nonzeros = _count_nonzeros(Jpart, axis=0)
+        row_nonzeros = _count_nonzeros(Jpart, axis=1)
     col_keep = col_nonzeros > 0
     row_keep = row_nonzeros > 0
 
     # use this to map indices back to the full J indices.
     idxmap = np.arange(ncols, dtype=int)[col_keep]
 
-    intersection_mat = _Jc2col_matrix_direct(J, Jpart)
-    intersection_mat = intersection_mat[col_keep]
-    intersection_mat = intersection_mat[:, col_keep]
+    if sparse:
+        # the sparse adjacency only includes the kept columns
+        intersection_mat = _SparseColAdjacency(J, Jpart)
+    else:
+        intersection_mat = _Jc2col_matrix_direct(J, Jpart)
+        intersection_mat = intersection_mat[col_keep]
+        intersection_mat = intersection_mat[:, col_keep]
 
     col_groups = _get_full_disjoint_col_matrix_cols(intersection_mat)
 
@@ -1143,8 +1445,15 @@ def _color_partition(J, Jpart):
     col_groups = _split_groups(col_groups)
 
     col2row = [None] * ncols
-    for col in idxmap:
-        col2row[col] = [r for r in np.nonzero(Jpart[:, col])[0] if row_keep[r]]
+    if sparse:
+        # every nonzero row in a column of Jpart is a kept row
+        indptr = Jpart.indptr
+        indices = Jpart.indices
+        for col in idxmap:
+            col2row[col] = list(indices[indptr[col]:indptr[col + 1]])
+    else:
+        for col in idxmap:
+            col2row[col] = [r for r in np.nonzero(Jpart[:, col])[0] if row_keep[r]]
 
     return [col_groups, col2row]
 
@@ -1159,8 +1468,8 @@ def MNCO_bidir(J):
 
     Parameters
     ----------
-    J : ndarray
-        Dense Jacobian sparsity matrix (boolean)
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix (boolean)
 
     Returns
     -------
@@ -1170,13 +1479,26 @@ def MNCO_bidir(J):
     start_time = time.time()
 
     nrows, ncols = J.shape
+    sparse = _use_sparse_coloring(J)
+
+    if sparse:
+        J = _to_bool_csc(J)
 
     coloring = Coloring(sparsity=J)
 
-    M_col_nonzeros = _count_nonzeros(J, axis=0)
-    M_row_nonzeros = _count_nonzeros(J, axis=1)
+    # row and column oriented nonzero structure of J, used to find the remaining nonzeros in a
+    # given row or column without searching through all of the nonzeros.
+    Jcsc = _to_bool_csc(J)
+    Jcsr = Jcsc.tocsr()
+    Jcsr.sort_indices()
+
+    M_col_nonzeros = Jcsc.getnnz(axis=0)
+    M_row_nonzeros = Jcsr.getnnz(axis=1)
 
-    M_rows, M_cols = coloring._nzrows, coloring._nzcols
+    # a nonzero (r, c) remains in M as long as neither row r nor column c has been removed
+    row_removed = np.zeros(nrows, dtype=bool)
+    col_removed = np.zeros(ncols, dtype=bool)
+    M_nnz = Jcsc.nnz
 
     Jc_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -1198,7 +1520,7 @@ def MNCO_bidir(J):
     Jc_nz_max = 0   # max row nonzeros in Jc
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size + M_cols.size > 0:
+    while M_nnz > 0:
         # what the algorithm is doing is basically minimizing the total of the max number of nonzero
         # columns in Jc + the max number of nonzero rows in Jr, so it's basically minimizing
         # the upper bound of the number of colors that will be needed.
@@ -1207,60 +1529,76 @@ def MNCO_bidir(J):
         # different sides of the inequality in order to prevent bad colorings when we have
         # matrices that have many more rows than columns or many more columns than rows.
         if ncols + Jr_nz_max + max(Jc_nz_max, nnz_r) < (nrows + Jc_nz_max + max(Jr_nz_max, nnz_c)):
-            Jc_rows[r] = M_cols[M_rows == r]
+            cols = Jcsr.indices[Jcsr.indptr[r]:Jcsr.indptr[r + 1]]
+            Jc_rows[r] = cols = cols[~col_removed[cols]]
             Jc_nz_max = max(nnz_r, Jc_nz_max)
 
             M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
-            M_col_nonzeros[Jc_rows[r]] -= 1
+            M_col_nonzeros[cols] -= 1
+            row_removed[r] = True
+            M_nnz -= cols.size
 
-            keep = M_rows != r
             r = M_row_nonzeros.argmin()
             c = M_col_nonzeros.argmin()
             nnz_r = M_row_nonzeros[r]
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            rows = Jcsc.indices[Jcsc.indptr[c]:Jcsc.indptr[c + 1]]
+            Jr_cols[c] = rows = rows[~row_removed[rows]]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
             M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1
+            M_row_nonzeros[rows] -= 1
+            col_removed[c] = True
+            M_nnz -= rows.size
 
-            keep = M_cols != c
             r = M_row_nonzeros.argmin()
             c = M_col_nonzeros.argmin()
             nnz_c = M_col_nonzeros[c]
 
             col_i += 1
 
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
-
     nnz_Jc = nnz_Jr = 0
-    jac = np.zeros(J.shape, dtype=bool)
+    if not sparse:
+        jac = np.zeros(J.shape, dtype=bool)
 
     if row_i > 0:
-        Jc = jac
         # build Jc and do fwd coloring on it
-        for i, cols in enumerate(Jc_rows):
-            if cols is not None:
-                Jc[i][cols] = True
-                nnz_Jc += len(cols)
+        Jc_r = [np.full(cols.size, i) for i, cols in enumerate(Jc_rows) if cols is not None]
+        Jc_c = [cols for cols in Jc_rows if cols is not None]
+        Jc_r = np.concatenate(Jc_r) if Jc_r else np.zeros(0, dtype=int)
+        Jc_c = np.concatenate(Jc_c) if Jc_c else np.zeros(0, dtype=int)
+        nnz_Jc = Jc_r.size
+
+        if sparse:
+            Jc = coo_matrix((np.ones(nnz_Jc, dtype=bool), (Jc_r, Jc_c)), shape=J.shape)
+        else:
+            Jc = jac
+            Jc[Jc_r, Jc_c] = True
 
         coloring._fwd = _color_partition(J, Jc)
-        jac[:] = False  # reset for use with Jr
+
+        if not sparse:
+            jac[:] = False  # reset for use with Jr
 
     if col_i > 0:
-        Jr = jac
         # build Jr and do rev coloring
-        for i, rows in enumerate(Jr_cols):
-            if rows is not None:
-                Jr[rows, i] = True
-                nnz_Jr += len(rows)
+        Jr_r = [rows for rows in Jr_cols if rows is not None]
+        Jr_c = [np.full(rows.size, i) for i, rows in enumerate(Jr_cols) if rows is not None]
+        Jr_r = np.concatenate(Jr_r) if Jr_r else np.zeros(0, dtype=int)
+        Jr_c = np.concatenate(Jr_c) if Jr_c else np.zeros(0, dtype=int)
+        nnz_Jr = Jr_r.size
+
+        if sparse:
+            Jr = coo_matrix((np.ones(nnz_Jr, dtype=bool), (Jr_r, Jr_c)), shape=J.shape)
+        else:
+            Jr = jac
+            Jr[Jr_r, Jr_c] = True
 
         coloring._rev = _color_partition(J.T, Jr.T)
 
-    if np.count_nonzero(J) != nnz_Jc + nnz_Jr:
+    if Jcsc.nnz != nnz_Jc + nnz_Jr:
         raise RuntimeError("Nonzero mismatch for J vs. Jc and Jr")
 
     # check_coloring(J, coloring)
@@ -1382,16 +1720,20 @@ def _compute_total_coloring_context(top):
 def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                         tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                         orders=_DEF_COMP_SPARSITY_ARGS['orders'], setup=False, run_model=False,
-                        of=None, wrt=None, use_abs_names=True):
+                        of=None, wrt=None, use_abs_names=True, sparsity_method='random'):
     """
     Return a boolean version of the total jacobian.
 
-    The jacobian is computed by calculating a total jacobian using _compute_totals 'num_full_jacs'
-    times and adding the absolute values of those together, then dividing by 'num_full_jacs',
-    then converting to a boolean array, specifying all entries below a tolerance as False and all
-    others as True.  Prior to calling _compute_totals, all of the partial jacobians in the
-    model are modified so that when any of their subjacobians are assigned a value, that
-    value is populated with positive random numbers in the range [1.0, 2.0).
+    If sparsity_method is 'random', the jacobian is computed by calculating a total jacobian
+    using _compute_totals 'num_full_jacs' times and adding the absolute values of those together,
+    then dividing by 'num_full_jacs', then converting to a boolean array, specifying all entries
+    below a tolerance as False and all others as True.  Prior to calling _compute_totals, all of
+    the partial jacobians in the model are modified so that when any of their subjacobians are
+    assigned a value, that value is populated with positive random numbers in the range [1.0, 2.0).
+
+    If sparsity_method is 'structural', a sparse boolean jacobian is computed from the declared
+    partial derivative sparsity of the model without computing any total jacobians.  If the
+    structural method can't be used for the given model, the 'random' method is used instead.
 
     Parameters
     ----------
@@ -1413,11 +1755,18 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
         Names of response variables.
     wrt : iter of str or None
         Names of design variables.
+    use_abs_names : bool
+        If True, use absolute naming for of and wrt variables.
+    sparsity_method : str
+        Method used to compute the sparsity.  Must be 'random' or 'structural'.
 
     Returns
     -------
-    ndarray
-        A boolean composite of 'num_full_jacs' total jacobians.
+    ndarray or csc_matrix
+        A boolean composite of 'num_full_jacs' total jacobians, or a sparse boolean jacobian
+        if the structural method was used.
+    dict
+        Metadata describing how the sparsity was computed.
     """
     # clear out any old simul coloring info
     driver = prob.driver
@@ -1442,6 +1791,27 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
     else:
         use_driver = False
 
+    if sparsity_method == 'structural':
+        start_time = time.time()
+        J, reason = _get_structural_bool_total_jac(prob, of, wrt, use_abs_names)
+        if J is not None:
+            elapsed = time.time() - start_time
+            info = {
+                'type': 'total',
+                'sparsity_method': 'structural',
+                'sparsity_time': elapsed,
+            }
+            print("Total jacobian sparsity was computed structurally, taking %f seconds." %
+                  elapsed)
+            print("Total jacobian shape:", J.shape, "\n")
+            return J, info
+
+        simple_warning("Structural total jacobian sparsity can't be computed because %s. "
+                       "Falling back to the 'random' method." % reason)
+    elif sparsity_method != 'random':
+        raise ValueError("Total jacobian sparsity_method must be 'random' or 'structural' but "
+                         "'%s' was given." % sparsity_method)
+
     with _compute_total_coloring_context(prob.model):
         start_time = time.time()
         fullJ = None
@@ -1475,13 +1845,209 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
     return boolJ, info
 
 
+def _get_structural_bool_total_jac(prob, of, wrt, use_abs_names=True):
+    """
+    Return a sparse boolean total jacobian computed from declared partial sparsity.
+
+    The nonzero structure of every declared subjacobian in the model is assembled into a
+    sparse boolean matrix of output-by-output dependencies, with connected inputs mapped onto
+    the output entries (after src_indices) that feed them.  The sparsity of the total jacobian
+    is then found by propagating each design variable entry through that dependency graph.
+    No numerical total jacobian is ever computed, so the memory used is proportional to the
+    number of nonzeros rather than to the size of the dense total jacobian.
+
+    The result is conservative: subjacobians declared without rows and cols, or having a
+    dense value, are treated as fully nonzero.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    of : list of str
+        Absolute names of response variables.
+    wrt : list of str
+        Absolute names of design variables.
+    use_abs_names : bool
+        If True, of and wrt are absolute names.  Otherwise they are promoted names.
+
+    Returns
+    -------
+    csc_matrix or None
+        Sparse boolean total jacobian, or None if the structural method is not applicable.
+    str
+        If the structural method is not applicable, the reason why, else None.
+    """
+    from openmdao.core.component import Component
+    from openmdao.core.group import Group
+
+    model = prob.model
+    driver = prob.driver
+
+    if model.comm.size > 1:
+        return None, "it is not supported under MPI"
+
+    if model._approx_schemes:
+        return None, "the model approximates its total derivatives"
+
+    if not use_abs_names:
+        prom2abs = model._var_allprocs_prom2abs_list['output']
+        of = [prom2abs[n][0] for n in of]
+        wrt = [prom2abs[n][0] for n in wrt]
+
+    out_slices = model._outputs.get_slice_dict()
+    in_slices = model._inputs.get_slice_dict()
+    nout = len(model._outputs)
+    abs2meta = model._var_abs2meta
+
+    # map each input entry to the output entry that it's connected to (-1 if unconnected)
+    in2out = np.full(len(model._inputs), -1, dtype=INT_DTYPE)
+    for abs_in, abs_out in model._conn_global_abs_in2out.items():
+        if abs_in not in in_slices or abs_out not in out_slices:
+            continue
+        meta_in = abs2meta[abs_in]
+        meta_out = abs2meta[abs_out]
+        src_indices = meta_in['src_indices']
+        if src_indices is None:
+            src_indices = np.arange(meta_in['size'], dtype=INT_DTYPE)
+        elif src_indices.ndim == 1:
+            src_indices = convert_neg(src_indices, meta_out['size'])
+        else:
+            src_indices = _flatten_src_indices(src_indices, meta_in['shape'],
+                                               meta_out['shape'], meta_out['size'])
+        in2out[in_slices[abs_in]] = src_indices + out_slices[abs_out].start
+
+    def _var_inds(names):
+        inds = [np.arange(out_slices[n].start, out_slices[n].stop, dtype=INT_DTYPE)
+                if n in out_slices else
+                in2out[np.arange(in_slices[n].start, in_slices[n].stop, dtype=INT_DTYPE)]
+                for n in names]
+        if inds:
+            inds = np.concatenate(inds)
+            return inds[inds >= 0]
+        return np.zeros(0, dtype=INT_DTYPE)
+
+    rows = []
+    cols = []
+
+    def _add_block(rinds, cinds):
+        rows.append(np.repeat(rinds, cinds.size))
+        cols.append(np.tile(cinds, rinds.size))
+
+    skip = None
+    for system in model.system_iter(recurse=True, include_self=True):
+        if skip is not None and system.pathname.startswith(skip):
+            continue
+
+        if isinstance(system, Group):
+            if system._owns_approx_jac:
+                # approximated group derivatives are treated as dense
+                skip = system.pathname + '.' if system.pathname else ''
+                outs = _var_inds(system._var_abs_names['output'])
+                _add_block(outs, np.concatenate((outs, _var_inds(system._var_abs_names['input']))))
+            continue
+
+        if not isinstance(system, Component):
+            continue
+
+        if system.matrix_free:
+            # no declared partials, so every output may depend on every input and output
+            outs = _var_inds(system._var_abs_names['output'])
+            _add_block(outs, np.concatenate((outs, _var_inds(system._var_abs_names['input']))))
+            continue
+
+        for (of_name, wrt_name), meta in system._subjacs_info.items():
+            if of_name not in out_slices:
+                continue
+            if wrt_name in out_slices:
+                offset = out_slices[wrt_name].start
+                colmap = None
+            elif wrt_name in in_slices:
+                colmap = in2out[in_slices[wrt_name]]
+            else:
+                continue
+
+            if meta['rows'] is not None:
+                r = meta['rows']
+                c = meta['cols']
+            elif 'sparsity' in meta:
+                r, c, _ = meta['sparsity']
+            elif issparse(meta['value']):
+                r, c = meta['value'].nonzero()
+            else:
+                nr, nc = meta['shape']
+                r = np.repeat(np.arange(nr, dtype=INT_DTYPE), nc)
+                c = np.tile(np.arange(nc, dtype=INT_DTYPE), nr)
+
+            r = np.asarray(r, dtype=INT_DTYPE) + out_slices[of_name].start
+            if colmap is None:
+                c = np.asarray(c, dtype=INT_DTYPE) + offset
+            else:
+                c = colmap[c]
+                mask = c >= 0
+                r = r[mask]
+                c = c[mask]
+
+            rows.append(r)
+            cols.append(c)
+
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = cols = np.zeros(0, dtype=INT_DTYPE)
+
+    M = coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(nout, nout)).tocsr()
+
+    # Permute rows so that every output has a structurally nonzero diagonal entry.  This is
+    # needed for implicit outputs whose residuals don't depend on the output itself.
+    perm = maximum_bipartite_matching(M, perm_type='row')
+    if np.any(perm < 0):
+        return None, "the model's linear system is structurally singular"
+
+    A = M[perm, :].astype(float)
+    inv_perm = np.empty(nout, dtype=INT_DTYPE)
+    inv_perm[perm] = np.arange(nout, dtype=INT_DTYPE)
+
+    desvars = driver._designvars
+    responses = driver._responses
+
+    def _voi_inds(names, meta):
+        lst = []
+        for n in names:
+            inds = _var_inds([n])
+            if n in meta and meta[n]['indices'] is not None:
+                inds = inds[meta[n]['indices']]
+            lst.append(inds)
+        return np.concatenate(lst)
+
+    seeds = _voi_inds(wrt, desvars)
+    ncols = seeds.size
+
+    # x[j] is nonzero if any residual that depends on it was seeded or if it depends on an
+    # already nonzero x entry, so propagate until no new entries are found.
+    X = csc_matrix((np.ones(ncols), (inv_perm[seeds], np.arange(ncols, dtype=INT_DTYPE))),
+                   shape=(nout, ncols))
+    frontier = X
+    while frontier.nnz > 0:
+        frontier = A.dot(frontier)
+        frontier.data[:] = 1.
+        frontier = frontier - frontier.multiply(X)
+        frontier.eliminate_zeros()
+        X = X + frontier
+
+    J = X.tocsr()[_voi_inds(of, responses), :].tocsc()
+    J.data = np.ones(J.data.size, dtype=bool)
+
+    return J, None
+
+
 def _jac2subjac_sparsity(J, ofs, wrts, of_sizes, wrt_sizes):
     """
     Given a boolean jacobian and variable names and sizes, compute subjac sparsity.
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean jacobian.
     ofs : list of str
         List of variables corresponding to rows.
@@ -1508,7 +2074,7 @@ def _jac2subjac_sparsity(J, ofs, wrts, of_sizes, wrt_sizes):
             col_end += wrt_size
 
             # save sparsity structure as  (rows, cols, shape)
-            irows, icols = np.nonzero(J[row_start:row_end, col_start:col_end])
+            irows, icols = J[row_start:row_end, col_start:col_end].nonzero()
             sparsity[of][wrt] = (irows, icols, (of_size, wrt_size))
 
             col_start = col_end
@@ -1674,8 +2240,9 @@ def _compute_coloring(J, mode):
 
     Parameters
     ----------
-    J : ndarray
-        The boolean total jacobian.
+    J : ndarray or sparse matrix
+        The boolean total jacobian.  Large or sparse jacobians are colored using sparse
+        data structures.
     mode : str
         The direction for solving for total derivatives.  Must be 'fwd', 'rev' or 'auto'.
         If 'auto', use bidirectional coloring.
@@ -1688,6 +2255,9 @@ def _compute_coloring(J, mode):
     start_time = time.time()
     nrows, ncols = J.shape
 
+    if _use_sparse_coloring(J):
+        J = _to_bool_csc(J)
+
     if mode == 'auto':  # use bidirectional coloring
         coloring = MNCO_bidir(J)
         fwdcoloring = _compute_coloring(J, 'fwd')
@@ -1706,6 +2276,8 @@ def _compute_coloring(J, mode):
 
     if rev:
         J = J.T
+        if issparse(J):
+            J = _to_bool_csc(J)
 
     col_groups = _split_groups(_get_full_disjoint_cols(J))
 
@@ -1713,7 +2285,10 @@ def _compute_coloring(J, mode):
     col2rows = [full_slice] * J.shape[1]  # will contain list of nonzero rows for each column
     for lst in col_groups:
         for col in lst:
-            col2rows[col] = np.nonzero(J[:, col])[0]
+            if issparse(J):
+                col2rows[col] = J.indices[J.indptr[col]:J.indptr[col + 1]]
+            else:
+                col2rows[col] = np.nonzero(J[:, col])[0]
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -1729,7 +2304,8 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
-                           setup=False, run_model=False, fname=None, use_abs_names=False):
+                           setup=False, run_model=False, fname=None, use_abs_names=False,
+                           sparsity_method='random'):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -1757,6 +2333,10 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         File where output coloring info will be written. If None, no info will be written.
     use_abs_names : bool
         If True, use absolute naming for of and wrt variables.
+    sparsity_method : str
+        Method used to compute the total jacobian sparsity.  'random' computes 'num_full_jacs'
+        total jacobians using random partials.  'structural' propagates the declared sparsity
+        of the partials through the model instead.
 
     Returns
     -------
@@ -1800,7 +2380,8 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         J, sparsity_info = _get_bool_total_jac(problem, num_full_jacs=num_full_jacs, tol=tol,
                                                orders=orders, setup=setup,
                                                run_model=run_model, of=abs_ofs, wrt=abs_wrts,
-                                               use_abs_names=True)
+                                               use_abs_names=True,
+                                               sparsity_method=sparsity_method)
         coloring = _compute_coloring(J, mode)
         if coloring is not None:
             coloring._row_vars = abs_ofs
@@ -1853,10 +2434,11 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
                                               _DEF_COMP_SPARSITY_ARGS['num_full_jacs'])
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
+    sparsity_method = driver._coloring_info.get('sparsity_method', 'random')
 
     coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol, orders=orders,
                                       setup=False, run_model=run_model, fname=fname,
-                                      use_abs_names=True)
+                                      use_abs_names=True, sparsity_method=sparsity_method)
 
     if coloring is not None:
         if driver._coloring_info['show_sparsity']:
@@ -1896,6 +2478,9 @@ def _total_coloring_setup_parser(parser):
                         help="Display a text-based visualization of the colored jacobian.")
     parser.add_argument('--profile', action='store_true', dest='profile',
                         help="Do profiling on the coloring process.")
+    parser.add_argument('--structural', action='store_true', dest='structural',
+                        help="Compute the total jacobian sparsity from the declared partial "
+                        "sparsity instead of from randomized total jacobians.")
 
 
 def _total_coloring_cmd(options, user_args):
@@ -1932,6 +2517,10 @@ def _total_coloring_cmd(options, user_args):
                 options.orders = color_info['orders']
             if options.num_jacs is None:
                 options.num_jacs = color_info['num_full_jacs']
+            if options.structural:
+                sparsity_method = 'structural'
+            else:
+                sparsity_method = color_info.get('sparsity_method', 'random')
 
             with profiling('coloring_profile.out') if options.profile else do_nothing_context():
                 coloring = compute_total_coloring(prob,
@@ -1939,7 +2528,8 @@ def _total_coloring_cmd(options, user_args):
                                                   tol=options.tolerance,
                                                   orders=options.orders,
                                                   setup=False, run_model=True, fname=outfile,
-                                                  use_abs_names=True)
+                                                  use_abs_names=True,
+                                                  sparsity_method=sparsity_method)
 
             if coloring is not None:
                 if options.show_sparsity_text:
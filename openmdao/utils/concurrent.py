@@ -1,7 +1,8 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in a pool of local processes.
 """
 import os
+import multiprocessing
 import traceback
 from itertools import chain, islice
 
@@ -9,6 +10,9 @@ from openmdao.utils.mpi import debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# function evaluated by a local pool worker process, set when the worker starts
+_pool_func = None
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
@@ -252,3 +256,110 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def local_pool(func, num_procs=None, initializer=None, initargs=()):
+    """
+    Create a pool of local worker processes that evaluate the given function.
+
+    The workers are forked from the current process, so they start with a copy of its state
+    (e.g., a fully set up model) and the function doesn't need to be picklable.  Only the
+    function arguments and return values are sent between processes.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    num_procs : int or None
+        The number of worker processes. If None, one worker per CPU is started.
+    initializer : function or None
+        If not None, a function that is called in each worker process when it starts.
+    initargs : tuple
+        Arguments for the initializer.
+
+    Returns
+    -------
+    multiprocessing.pool.Pool
+        The pool of worker processes.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("Evaluating cases in a pool of local processes requires the 'fork' "
+                           "start method, which is not available on this platform.")
+
+    ctx = multiprocessing.get_context('fork')
+    return ctx.Pool(num_procs, _init_pool_worker, (func, initializer, initargs))
+
+
+def _init_pool_worker(func, initializer, initargs):
+    """
+    Set up a local pool worker process.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in the worker.
+    initializer : function or None
+        If not None, a function that is called to initialize the worker.
+    initargs : tuple
+        Arguments for the initializer.
+    """
+    global _pool_func
+    _pool_func = func
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _pool_eval(case):
+    """
+    Evaluate the worker function for a single case.
+
+    Parameters
+    ----------
+    case : tuple
+        The function args in the form (args, kwargs) where kwargs is allowed to be None.
+
+    Returns
+    -------
+    tuple
+        Return value of the function, or None if it failed, and the formatted exception, or None
+        if it succeeded.
+    """
+    args, kwargs = case
+    try:
+        if kwargs:
+            retval = _pool_func(*args, **kwargs)
+        else:
+            retval = _pool_func(*args)
+    except Exception:
+        err = traceback.format_exc()
+        retval = None
+    else:
+        err = None
+
+    return retval, err
+
+
+def concurrent_eval_pool(pool, cases):
+    """
+    Evaluate the function of a local process pool for multiple cases with load balancing.
+
+    Each worker is given a new case as soon as it has finished its last one.  Results are
+    yielded as soon as they are available, in the same order as the cases.
+
+    Parameters
+    ----------
+    pool : multiprocessing.pool.Pool
+        A pool of worker processes created with local_pool.
+    cases : iter of function args
+        Entries are assumed to be of the form (args, kwargs) where
+        kwargs are allowed to be None and args should be a list or tuple.
+
+    Yields
+    ------
+    tuple
+        Return value of the function, or None if it failed, and the formatted exception, or None
+        if it succeeded.
+    """
+    for result in pool.imap(_pool_eval, cases, chunksize=1):
+        yield result
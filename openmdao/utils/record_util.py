@@ -164,25 +164,42 @@ def check_path(path, includes, excludes, include_all_path=False):
     return include_all_path
 
 
-def deserialize(json_data, abs2meta):
+def deserialize(json_data, abs2meta, var_layouts=None):
     """
-    Deserialize recorded data from a JSON formatted string.
+    Deserialize recorded data from a JSON formatted string or a packed binary blob.
 
     If all data values are arrays then a numpy structured array will be returned,
     otherwise a dictionary mapping variable names to values will be returned.
 
+    Binary blobs contain the id of their variable layout followed by the packed float64 values
+    of all variables.  They are unpacked into a writable structured array.
+
+    Values that have already been decoded, as a structured array or a dictionary, or that are
+    missing are returned unchanged.
+
     Parameters
     ----------
-    json_data : string
-        JSON encoded data
+    json_data : string, bytes, array, dict or None
+        JSON encoded data, packed binary data or already decoded values.
     abs2meta : dict
         Dictionary mapping absolute variable names to variable metadata
+    var_layouts : dict or None
+        Dictionary mapping layout ids to structured dtypes.  Required for binary data.
 
     Returns
     -------
     array or dict
         Variable names and values parsed from the JSON string
     """
+    if json_data is None or isinstance(json_data, (np.ndarray, dict)):
+        return json_data
+
+    if isinstance(json_data, bytes):
+        layout_id = int(np.frombuffer(json_data, dtype=np.int64, count=1)[0])
+        # copy, since an array that shares memory with the blob is read-only
+        return np.frombuffer(json_data, dtype=var_layouts[layout_id], count=1,
+                             offset=np.dtype(np.int64).itemsize).copy()
+
     values = json.loads(json_data)
     if values is None:
         return None
@@ -201,6 +218,23 @@ def deserialize(json_data, abs2meta):
         return values
 
 
+def layout_to_dtype(layout):
+    """
+    Convert a recorded variable layout into a numpy structured dtype.
+
+    Parameters
+    ----------
+    layout : list
+        List of [name, shape] entries giving the order and shape of the packed variables.
+
+    Returns
+    -------
+    dtype
+        Structured dtype with a float64 field for each variable.
+    """
+    return np.dtype([(str(name), np.float64, tuple(shape)) for name, shape in layout])
+
+
 def dict_to_structured_array(values):
     """
     Convert a dict of variable names and values into a numpy structured array.
@@ -5,8 +5,9 @@ import unittest
 
 # from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.units import NumberDict, PhysicalUnit, _find_unit, import_library, \
-    add_unit, add_offset_unit, unit_conversion, get_conversion
-from openmdao.utils.assert_utils import assert_warning
+    add_unit, add_offset_unit, unit_conversion, get_conversion, convert_units
+from openmdao.utils import units as units_mod
+from openmdao.utils.assert_utils import assert_warning, assert_near_equal
 
 
 class TestNumberDict(unittest.TestCase):
@@ -256,6 +257,20 @@ class TestPhysicalUnit(unittest.TestCase):
         else:
             self.fail("Expecting RuntimeError")
 
+    def test_unit_conversion_cache(self):
+        units_mod._CONVERSION_CACHE.clear()
+
+        conversion = unit_conversion('degC', 'degF')
+        assert_near_equal(conversion, (1.8, 160. / 9.), 1e-14)
+        self.assertIs(units_mod._CONVERSION_CACHE[('degC', 'degF')], conversion)
+        self.assertIs(unit_conversion('degC', 'degF'), conversion)
+        assert_near_equal(convert_units(100., 'degC', 'degF'), 212., 1e-14)
+
+        # incompatible units are not cached
+        with self.assertRaises(TypeError):
+            unit_conversion('m', 's')
+        self.assertNotIn(('m', 's'), units_mod._CONVERSION_CACHE)
+
     def test_get_conversion(self):
         msg = "'get_conversion' has been deprecated. Use 'unit_conversion' instead."
         with assert_warning(DeprecationWarning, msg):
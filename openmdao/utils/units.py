@@ -713,7 +713,9 @@ def import_library(libfilepointer):
     """
     global _UNIT_LIB
     global _UNIT_CACHE
+    global _CONVERSION_CACHE
     _UNIT_CACHE = {}
+    _CONVERSION_CACHE = {}
     _UNIT_LIB = ConfigParser()
     _UNIT_LIB.optionxform = _do_nothing
 
@@ -844,6 +846,9 @@ def _update_library(cfg):
 
 _UNIT_CACHE = {}
 
+# (factor, offset) for each (old_units, new_units) pair that has been converted so far
+_CONVERSION_CACHE = {}
+
 
 def _find_unit(unit):
     """
@@ -994,11 +999,19 @@ def unit_conversion(old_units, new_units):
     (float, float)
         Conversion factor and offset
     """
+    try:
+        return _CONVERSION_CACHE[old_units, new_units]
+    except KeyError:
+        pass
+
     new_physical_units = _find_unit(new_units)
     if new_physical_units is None:
         raise RuntimeError("Cannot convert to new units: %s" % str(new_units))
 
-    return _find_unit(old_units).conversion_tuple_to(new_physical_units)
+    conversion = _find_unit(old_units).conversion_tuple_to(new_physical_units)
+    _CONVERSION_CACHE[old_units, new_units] = conversion
+
+    return conversion
 
 
 def get_conversion(old_units, new_units):
@@ -1044,13 +1057,7 @@ def convert_units(val, old_units, new_units=None):
     if not old_units or not new_units:  # one side has no units
         return val
 
-    old_unit = _find_unit(old_units)
-    if new_units:
-        new_unit = _find_unit(new_units)
-    else:
-        new_unit = old_unit.in_base_units()
-
-    (factor, offset) = old_unit.conversion_tuple_to(new_unit)
+    (factor, offset) = unit_conversion(old_units, new_units)
     return (val + offset) * factor
 
 
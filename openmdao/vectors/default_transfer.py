@@ -12,6 +12,10 @@ from openmdao.utils.mpi import MPI
 
 _empty_idx_array = np.array([], dtype=INT_DTYPE)
 
+# contiguous runs of at least this many entries are transferred as slices instead of by
+# fancy indexing
+_MIN_BLOCK_SIZE = 64
+
 
 def _merge(indices_list):
     if len(indices_list) > 0:
@@ -20,11 +24,102 @@ def _merge(indices_list):
         return _empty_idx_array
 
 
+def _find_blocks(in_inds, out_inds, min_size=_MIN_BLOCK_SIZE):
+    """
+    Find the runs of consecutive indices that are contiguous in both index arrays.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        input indices for the transfer.
+    out_inds : int ndarray
+        output indices for the transfer.
+    min_size : int
+        Minimum length of a run to be returned as a block.
+
+    Returns
+    -------
+    list of (slice, slice)
+        Input and output slices of each run that has at least min_size entries.
+    int ndarray
+        Input indices that aren't part of any block.
+    int ndarray
+        Output indices that aren't part of any block.
+    """
+    if in_inds.size < min_size:
+        return [], in_inds, out_inds
+
+    # a new run starts wherever either index array doesn't increase by exactly 1
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [in_inds.size]))
+    is_block = ends - starts >= min_size
+
+    blocks = []
+    mask = np.ones(in_inds.size, dtype=bool)
+    for start, end in zip(starts[is_block], ends[is_block]):
+        blocks.append((slice(in_inds[start], in_inds[end - 1] + 1),
+                       slice(out_inds[start], out_inds[end - 1] + 1)))
+        mask[start:end] = False
+
+    if not blocks:
+        return blocks, in_inds, out_inds
+
+    return blocks, in_inds[mask], out_inds[mask]
+
+
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    Runs of indices that are contiguous in both the input and output vectors are transferred
+    as slices.  The remaining indices, e.g. those coming from src_indices, are transferred by
+    fancy indexing.
+
+    Attributes
+    ----------
+    _blocks : list of (slice, slice)
+        Input and output slices of the contiguous runs of the transfer.
+    _rem_in_inds : int ndarray
+        input indices that aren't part of a contiguous run.
+    _rem_out_inds : int ndarray
+        output indices that aren't part of a contiguous run.
+    _rem_out_uniq : tuple of (int ndarray, int ndarray) or None
+        If _rem_out_inds contains duplicates, the unique output indices and the index of each
+        entry of _rem_out_inds in them.  Used to sum the duplicates in rev mode.
+    _scratch : dict
+        Buffers, keyed by dtype, that the inputs are gathered into in rev mode.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        in_inds : int ndarray
+            input indices for the transfer.
+        out_inds : int ndarray
+            output indices for the transfer.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the system that owns this transfer.
+        """
+        super(DefaultTransfer, self).__init__(in_vec, out_vec, in_inds, out_inds, comm)
+
+        self._blocks, self._rem_in_inds, self._rem_out_inds = _find_blocks(in_inds, out_inds)
+
+        self._rem_out_uniq = None
+        if self._rem_out_inds.size > 0:
+            uniq, inv = np.unique(self._rem_out_inds, return_inverse=True)
+            if uniq.size < self._rem_out_inds.size:
+                self._rem_out_uniq = (uniq, inv)
+
+        self._scratch = {}
+
     @staticmethod
     def _setup_transfers(group):
         """
@@ -50,6 +145,12 @@ class DefaultTransfer(Transfer):
 
         vec_names = group._lin_rel_vec_name_list if group._use_derivatives else group._vec_names
 
+        # inputs aliased to their source outputs aren't transferred in the nonlinear vectors,
+        # so the nonlinear transfers can't be shared with the linear ones
+        aliased = vectors['input']['nonlinear']._aliased
+        if aliased and group._use_derivatives:
+            vec_names = ['nonlinear'] + vec_names
+
         mypathlen = len(group.pathname + '.' if group.pathname else '')
         sub_inds = group._subsystems_inds
 
@@ -79,6 +180,9 @@ class DefaultTransfer(Transfer):
                 if abs_out not in relvars_out or abs_in not in relvars_in:
                     continue
 
+                if vec_name == 'nonlinear' and abs_in in aliased:
+                    continue
+
                 # Only continue if the input exists on this processor
                 if abs_in in abs2meta:
 
@@ -162,7 +266,7 @@ class DefaultTransfer(Transfer):
                     else:
                         transfers[vec_name]['rev', isub] = None
 
-        if group._use_derivatives:
+        if group._use_derivatives and not aliased:
             transfers['nonlinear'] = transfers['linear']
 
     @staticmethod
@@ -258,13 +362,63 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
+        in_data = in_vec._data
+        out_data = out_vec._data
+
         if mode == 'fwd':
             # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec._data[self._in_inds] = out_vec._data[self._out_inds]
+            for in_slice, out_slice in self._blocks:
+                in_data[in_slice] = out_data[out_slice]
+            if self._rem_in_inds.size > 0:
+                in_data[self._rem_in_inds] = out_data[self._rem_out_inds]
 
         else:  # rev
-            if out_vec._ncol == 1:
-                out_vec._data[:] += np.bincount(self._out_inds, in_vec._data[self._in_inds],
-                                                minlength=out_vec._data.size)
-            else:  # matrix-matrix   (bincount only works with 1d arrays)
-                np.add.at(out_vec._data, self._out_inds, in_vec._data[self._in_inds])
+            for in_slice, out_slice in self._blocks:
+                out_data[out_slice] += in_data[in_slice]
+
+            rem_in_inds = self._rem_in_inds
+            if rem_in_inds.size == 0:
+                return
+
+            if self._rem_out_uniq is None:
+                out_data[self._rem_out_inds] += in_data[rem_in_inds]
+                return
+
+            # some outputs receive more than one input, so sum the duplicates over the
+            # unique output indices rather than over the whole output vector
+            shape = (rem_in_inds.size,) + in_data.shape[1:]
+            buf = self._scratch.get(in_data.dtype)
+            if buf is None or buf.shape != shape:
+                buf = self._scratch[in_data.dtype] = np.empty(shape, dtype=in_data.dtype)
+            np.take(in_data, rem_in_inds, axis=0, out=buf)
+
+            uniq, inv = self._rem_out_uniq
+            if buf.ndim == 1:
+                out_data[uniq] += _bincount(inv, buf, uniq.size)
+            else:  # bincount only works with 1d arrays
+                for i in range(buf.shape[1]):
+                    out_data[uniq, i] += _bincount(inv, buf[:, i], uniq.size)
+
+
+def _bincount(inds, weights, size):
+    """
+    Sum the weights that share the same index.
+
+    Parameters
+    ----------
+    inds : int ndarray
+        Index of each weight.
+    weights : ndarray
+        Weights to be summed, which may be complex.
+    size : int
+        Size of the result.
+
+    Returns
+    -------
+    ndarray
+        The sum of the weights for each index.
+    """
+    if np.iscomplexobj(weights):
+        return (np.bincount(inds, weights.real, minlength=size) +
+                np.bincount(inds, weights.imag, minlength=size) * 1j)
+    return np.bincount(inds, weights, minlength=size)
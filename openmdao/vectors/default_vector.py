@@ -151,6 +151,15 @@ class DefaultVector(Vector):
             offs = offs[0].copy()
         offsets_t = offs
 
+        # connected inputs that are aliased to their source outputs get views of the output data
+        self._aliased = aliased = {}
+        aliases = src_views = None
+        if kind == 'input' and self._name == 'nonlinear':
+            root_system = self._root_vector._system()
+            if root_system._input_aliases:
+                aliases = root_system._input_aliases
+                src_views = root_system._root_vecs['output']['nonlinear']._views_flat
+
         abs2meta = system._var_abs2meta
         for abs_name in system._var_relevant_names[self._name][type_]:
             idx = allprocs_abs2idx_t[abs_name]
@@ -169,6 +178,14 @@ class DefaultVector(Vector):
                 v.shape = shape
             views[abs_name] = v
 
+            if aliases is not None and abs_name in aliases:
+                aliased[abs_name] = (views_flat[abs_name], v)
+                views_flat[abs_name] = v = src_views[aliases[abs_name]]
+                if shape != v.shape:
+                    v = v.view()
+                    v.shape = shape
+                views[abs_name] = v
+
             if alloc_complex:
                 cplx_views_flat[abs_name] = v = self._cplx_data[ind1:ind2]
                 if shape != v.shape:
@@ -184,8 +201,27 @@ class DefaultVector(Vector):
                         vec[0][ind1:ind2] = scale0
                     vec[1][ind1:ind2] = scale1
 
+        if do_scaling:
+            self._simplify_scaling()
+
         self._names = frozenset(views)
 
+    def _simplify_scaling(self):
+        """
+        Find the scaling arrays that would leave the data unchanged.
+
+        Unit conversions without an offset result in an adder of all zeros, and variables that
+        only have scaling because some other variable in the model does result in a scaler of
+        all ones, so these are replaced with None in _active_scaling to be skipped in scale.
+        _scaling itself is left alone since it is recorded with the system metadata.
+        """
+        for scaleto, (adder, scaler) in self._scaling.items():
+            if adder is not None and not np.any(adder):
+                adder = None
+            if np.all(scaler == 1.0):
+                scaler = None
+            self._active_scaling[scaleto] = (adder, scaler)
+
     def _clone_data(self):
         """
         For each item in _data, replace it with a copy of the data.
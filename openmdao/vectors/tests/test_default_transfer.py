@@ -0,0 +1,249 @@
+"""Unit tests for DefaultTransfer."""
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.vectors.default_transfer import DefaultTransfer, _find_blocks
+from openmdao.vectors.vector import INT_DTYPE
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class VecStub(object):
+
+    def __init__(self, data):
+        self._data = data
+        self._ncol = data.shape[1] if data.ndim > 1 else 1
+
+
+def build_problem(mode):
+    # 'a' is connected to a contiguous block of the output, 'b' uses src_indices that
+    # contain both a contiguous run and duplicate indices
+    src_inds = np.concatenate((np.arange(100, 200), np.arange(30) % 10))
+
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('indep', om.IndepVarComp('x', np.arange(200, dtype=float)))
+    model.add_subsystem('ca', om.ExecComp('y = 2.0 * a', a=np.ones(200), y=np.ones(200)))
+    model.add_subsystem('cb', om.ExecComp('y = 3.0 * b', b=np.ones(130), y=np.ones(130)))
+    model.connect('indep.x', 'ca.a')
+    model.connect('indep.x', 'cb.b', src_indices=src_inds)
+
+    model.add_design_var('indep.x')
+    model.add_constraint('ca.y', lower=0.)
+    model.add_constraint('cb.y', lower=0.)
+
+    prob.setup(mode=mode)
+    prob.run_model()
+
+    expected_b = np.zeros((130, 200))
+    expected_b[np.arange(130), src_inds] = 3.0
+
+    return prob, src_inds, expected_b
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def test_find_blocks(self):
+        in_inds = np.array([0, 1, 2, 3, 4, 5, 10, 11, 12], dtype=INT_DTYPE)
+        out_inds = np.array([7, 8, 9, 10, 3, 4, 0, 1, 2], dtype=INT_DTYPE)
+
+        blocks, rem_in, rem_out = _find_blocks(in_inds, out_inds, min_size=3)
+        self.assertEqual(blocks, [(slice(0, 4), slice(7, 11)), (slice(10, 13), slice(0, 3))])
+        np.testing.assert_equal(rem_in, [4, 5])
+        np.testing.assert_equal(rem_out, [3, 4])
+
+        blocks, rem_in, rem_out = _find_blocks(in_inds, out_inds, min_size=10)
+        self.assertEqual(blocks, [])
+        np.testing.assert_equal(rem_in, in_inds)
+        np.testing.assert_equal(rem_out, out_inds)
+
+    def test_fwd_transfer(self):
+        prob, src_inds, _ = build_problem('fwd')
+
+        xfer = prob.model._transfers['nonlinear']['fwd', None]
+        self.assertEqual(len(xfer._blocks), 2)
+        self.assertEqual(xfer._rem_in_inds.size, 30)
+
+        assert_near_equal(prob['ca.a'], np.arange(200.), 1e-15)
+        assert_near_equal(prob['cb.b'], src_inds.astype(float), 1e-15)
+        assert_near_equal(prob['cb.y'], 3.0 * src_inds, 1e-15)
+
+    def test_derivs(self):
+        for mode in ('fwd', 'rev'):
+            prob, _, expected_b = build_problem(mode)
+            J = prob.compute_totals(of=['ca.y', 'cb.y'], wrt=['indep.x'])
+            assert_near_equal(J['ca.y', 'indep.x'], 2.0 * np.eye(200), 1e-15)
+            assert_near_equal(J['cb.y', 'indep.x'], expected_b, 1e-15)
+
+    def test_multi_column(self):
+        in_inds = np.concatenate((np.arange(100), np.arange(100, 110))).astype(INT_DTYPE)
+        out_inds = np.concatenate((np.arange(50, 150), np.arange(10) % 3)).astype(INT_DTYPE)
+
+        in_vec = VecStub(np.zeros((110, 3)))
+        out_vec = VecStub(np.arange(450.).reshape((150, 3)))
+        xfer = DefaultTransfer(in_vec, out_vec, in_inds, out_inds, None)
+        self.assertEqual(len(xfer._blocks), 1)
+
+        xfer._transfer(in_vec, out_vec, 'fwd')
+        assert_near_equal(in_vec._data, out_vec._data[out_inds], 1e-15)
+
+        in_vec._data[:] = np.arange(330.).reshape((110, 3))
+        out_vec._data[:] = 1.0
+        expected = np.ones((150, 3))
+        np.add.at(expected, out_inds, in_vec._data)
+
+        xfer._transfer(in_vec, out_vec, 'rev')
+        assert_near_equal(out_vec._data, expected, 1e-15)
+
+    def test_complex_step(self):
+        prob, src_inds, expected_b = build_problem('rev')
+        prob.setup(mode='rev', force_alloc_complex=True)
+        prob.run_model()
+
+        prob.model._outputs.set_complex_step_mode(True)
+        prob.model._inputs.set_complex_step_mode(True)
+        prob.model._outputs._data[:] += 1j
+        prob.model._transfer('nonlinear', 'fwd')
+        assert_near_equal(prob.model._inputs._data.imag, np.ones(330), 1e-15)
+
+        # in rev mode, the contributions of duplicated src_indices are summed
+        prob.model._outputs._data[:] = 0.
+        prob.model._inputs._data[:] = 1j
+        prob.model._transfer('nonlinear', 'rev')
+        expected = np.zeros(prob.model._outputs._data.size)
+        expected[:200] = 1. + np.bincount(src_inds, minlength=200)
+        assert_near_equal(prob.model._outputs._data.imag, expected, 1e-15)
+
+        prob.model._outputs.set_complex_step_mode(False)
+        prob.model._inputs.set_complex_step_mode(False)
+
+
+class ScaleComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('units', default=None)
+        self.options.declare('fd', types=bool, default=False)
+
+    def setup(self):
+        units = self.options['units']
+        self.add_input('x', np.ones(3), units=units)
+        self.add_output('y', np.ones(3), units=units)
+        if self.options['fd']:
+            self.declare_partials('y', 'x', method='fd')
+        else:
+            self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=2.0)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 2.0 * inputs['x']
+
+
+def build_alias_model(alias=True, **kwargs):
+    prob = om.Problem()
+    prob.options['alias_connected_inputs'] = alias
+    model = prob.model
+    model.add_subsystem('indep', om.IndepVarComp('x', np.arange(3.), units='m'))
+    model.add_subsystem('c1', ScaleComp(units='m'))
+    model.add_subsystem('c2', ScaleComp(**kwargs))
+    model.connect('indep.x', 'c1.x')
+    model.connect('c1.y', 'c2.x')
+    return prob
+
+
+class TestAliasConnectedInputs(unittest.TestCase):
+
+    def test_sellar(self):
+        results = []
+        for alias in (False, True):
+            prob = om.Problem(SellarDerivatives())
+            prob.options['alias_connected_inputs'] = alias
+            prob.model.nonlinear_solver = om.NonlinearBlockGS()
+            prob.setup()
+            prob.run_model()
+            J = prob.compute_totals(of=['obj', 'con1', 'con2'], wrt=['x', 'z'])
+            results.append((prob['y1'], prob['y2'], J))
+
+        aliases = prob.model._input_aliases
+        self.assertEqual(aliases['d1.y2'], 'd2.y2')
+        self.assertEqual(aliases['obj_cmp.z'], 'pz.z')
+        self.assertTrue(np.shares_memory(prob['d1.y2'], prob.model._outputs['d2.y2']))
+
+        assert_near_equal(results[1][0], results[0][0], 1e-12)
+        assert_near_equal(results[1][1], results[0][1], 1e-12)
+        for key, val in results[0][2].items():
+            assert_near_equal(results[1][2][key], val, 1e-12)
+
+    def test_no_transfer(self):
+        prob = build_alias_model()
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(prob.model._input_aliases, {'c1.x': 'indep.x', 'c2.x': 'c1.y'})
+        self.assertIsNone(prob.model._transfers['nonlinear']['fwd', None])
+        self.assertIsNotNone(prob.model._transfers['linear']['fwd', None])
+
+        # the input slots of the nonlinear vector are never written
+        assert_near_equal(prob.model._inputs._data, np.zeros(6), 1e-15)
+        assert_near_equal(prob['c2.y'], 4.0 * np.arange(3.), 1e-15)
+
+        # setting an aliased input sets its source
+        prob['c1.x'] = 3.0
+        assert_near_equal(prob['indep.x'], 3.0 * np.ones(3), 1e-15)
+        prob.run_model()
+        assert_near_equal(prob['c2.y'], 12.0 * np.ones(3), 1e-15)
+
+        J = prob.compute_totals(of=['c2.y'], wrt=['indep.x'])
+        assert_near_equal(J['c2.y', 'indep.x'], 4.0 * np.eye(3), 1e-15)
+
+    def test_not_aliased(self):
+        # unit conversion
+        prob = build_alias_model(units='cm')
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(prob.model._input_aliases, {'c1.x': 'indep.x'})
+        assert_near_equal(prob['c2.y'], 400.0 * np.arange(3.), 1e-12)
+
+        # component that approximates its partials
+        prob = build_alias_model(fd=True)
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(prob.model._input_aliases, {'c1.x': 'indep.x'})
+
+        # component that mutates its inputs
+        prob = build_alias_model()
+        prob.model.c2.options['mutates_inputs'] = True
+        prob.setup()
+        prob.final_setup()
+        self.assertEqual(prob.model._input_aliases, {'c1.x': 'indep.x'})
+
+        # complex step
+        prob = build_alias_model()
+        prob.setup(force_alloc_complex=True)
+        prob.final_setup()
+        self.assertEqual(prob.model._input_aliases, {})
+
+        # option not set
+        prob = build_alias_model(alias=False)
+        prob.setup()
+        prob.final_setup()
+        self.assertEqual(prob.model._input_aliases, {})
+        assert_near_equal(prob['c2.x'], np.ones(3), 1e-15)
+
+    def test_check_partials(self):
+        prob = build_alias_model()
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(len(prob.model._input_aliases), 2)
+
+        data = prob.check_partials(out_stream=None)
+        for comp in ('c1', 'c2'):
+            assert_near_equal(data[comp]['y', 'x']['J_fd'], 2.0 * np.eye(3), 1e-5)
+
+        # the finite difference perturbations don't change the sources
+        assert_near_equal(prob['indep.x'], np.arange(3.), 1e-15)
+        assert_near_equal(prob['c1.y'], 2.0 * np.arange(3.), 1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 """Define the base Vector and Transfer classes."""
 from copy import deepcopy
+from contextlib import contextmanager
 import os
 import weakref
 
@@ -82,10 +83,16 @@ class Vector(object):
         True if this vector performs scaling.
     _scaling : dict
         Contains scale factors to convert data arrays.
+    _active_scaling : dict
+        Same as _scaling, but with any scale factors that would leave the data unchanged
+        replaced by None so that they're skipped.
     read_only : bool
         When True, values in the vector cannot be changed via the user __setitem__ API.
     _under_complex_step : bool
         When True, self._data is replaced with self._cplx_data.
+    _aliased : dict
+        Mapping of each input whose views point into the memory of its source output to
+        its (flat view, view) in this vector's own data.
     """
 
     # Listing of relevant citations that should be referenced when
@@ -147,6 +154,8 @@ class Vector(object):
                             (kind == 'residual' and system._has_resid_scaling))
 
         self._scaling = {}
+        self._active_scaling = {}
+        self._aliased = {}
 
         if root_vector is None:
             self._root_vector = self
@@ -475,15 +484,14 @@ class Vector(object):
         scale_to : str
             Values are "phys" or "norm" to scale to physical or normalized.
         """
-        adder, scaler = self._scaling[scale_to]
-        if self._ncol == 1:
-            self._data *= scaler
-            if adder is not None:  # nonlinear only
-                self._data += adder
-        else:
-            self._data *= scaler[:, np.newaxis]
-            if adder is not None:  # nonlinear only
-                self._data += adder
+        adder, scaler = self._active_scaling[scale_to]
+        if scaler is not None:
+            if self._ncol == 1:
+                self._data *= scaler
+            else:
+                self._data *= scaler[:, np.newaxis]
+        if adder is not None:  # nonlinear only
+            self._data += adder
 
     def set_vec(self, vec):
         """
@@ -542,6 +550,34 @@ class Vector(object):
                                   type(self).__name__)
         return None  # silence lint warning about missing return value.
 
+    @contextmanager
+    def _unaliased_context(self):
+        """
+        Context where the aliased inputs of this vector use this vector's own data.
+
+        This is needed by anything that modifies input values through the data array, like
+        finite difference.  The values of the sources are copied in on entry.
+        """
+        if not self._aliased:
+            yield
+            return
+
+        views_flat = self._views_flat
+        views = self._views
+        alias_views = {}
+        for name, (flat, view) in self._aliased.items():
+            alias_views[name] = (views_flat[name], views[name])
+            flat[:] = views_flat[name]
+            views_flat[name] = flat
+            views[name] = view
+
+        try:
+            yield
+        finally:
+            for name, (flat, view) in alias_views.items():
+                views_flat[name] = flat
+                views[name] = view
+
     def set_complex_step_mode(self, active, keep_real=False):
         """
         Turn on or off complex stepping mode.
@@ -11,6 +11,9 @@ __version__ = re.findall(
 )[0]
 
 optional_dependencies = {
+    'hdf5': [
+        'h5py',
+    ],
     'docs': [
         'matplotlib',
         'mock',
@@ -159,9 +162,11 @@ setup(
         ],
         'openmdao_case_reader': [
             'sqlitereader=openmdao.recorders.sqlite_reader:SqliteCaseReader',
+            'hdf5reader=openmdao.recorders.hdf5_reader:HDF5CaseReader',
         ],
         'openmdao_case_recorder': [
             'sqliterecorder=openmdao.recorders.sqlite_recorder:SqliteRecorder',
+            'hdf5recorder=openmdao.recorders.hdf5_recorder:HDF5Recorder',
         ],
         'openmdao_component': [
             'addsubtractcomp=openmdao.components.add_subtract_comp:AddSubtractComp',